@@ -0,0 +1,136 @@
+"""Closed-form ascendant for the BTR hot loop.
+
+`btr_core.compute_sidereal_lagna` asks `swe.houses` for the full house
+system on every call even though only the ascendant is used.  For one
+birthplace the ascendant depends on time only through the apparent sidereal
+time (ARMC) and the true obliquity of the ecliptic, both of which vary
+smoothly.  `AscendantSolver` samples those two quantities once per request
+on a coarse anchor grid and evaluates the spherical-astronomy formula
+
+    Asc = atan2(cos ARMC, −(sin ARMC · cos ε + tan φ · sin ε))
+
+for any JD, scalar or vectorised.  Linear interpolation of sidereal time and
+obliquity over 22.5-minute anchors keeps the result within 1e-7° of the
+`swe.houses` ascendant (the regression tests require 1e-6°).
+
+The value returned is the same ecliptic ascendant `compute_sidereal_lagna`
+returns, so the two paths are interchangeable.  Inside the polar circles
+(|φ| ≥ 90° − ε) Swiss Ephemeris refuses the house calculation; the solver
+raises the same RuntimeError there instead of returning a value.
+"""
+
+import math
+
+import numpy as np
+import swisseph as swe
+
+# Anchor spacing for sidereal time / obliquity interpolation (days).  A power
+# of two keeps every anchor JD exactly representable, so interpolation adds no
+# rounding of its own near the polar circles where the ascendant is most
+# sensitive to ARMC.
+ANCHOR_STEP_DAYS = 1.0 / 64.0
+
+
+def _sidereal_anchor(jd_ut: float) -> tuple[float, float]:
+    """Apparent sidereal time (degrees) and true obliquity (degrees) at a JD."""
+    try:
+        sidereal_time_deg = swe.sidtime(jd_ut) * 15.0
+        true_obliquity = swe.calc_ut(jd_ut, swe.ECL_NUT)[0][0]
+    except Exception as e:
+        raise RuntimeError(f"Swiss Ephemeris house calculation failed: {e}") from e
+    return sidereal_time_deg, true_obliquity
+
+
+class AscendantSolver:
+    """Analytic ascendant for one location over a span of Julian Days.
+
+    Args:
+        latitude: Geographic latitude (north positive) in degrees.
+        longitude: Geographic longitude (east positive) in degrees.
+        jd_start: First JD (UT) the solver will be asked about.
+        jd_end: Last JD (UT) the solver will be asked about.
+        anchor_step_days: Spacing of the sidereal time / obliquity anchors.
+
+    JDs outside [jd_start, jd_end] are still answered exactly, by computing
+    the anchor quantities directly at that JD.
+    """
+
+    def __init__(self,
+                 latitude: float,
+                 longitude: float,
+                 jd_start: float,
+                 jd_end: float,
+                 anchor_step_days: float = ANCHOR_STEP_DAYS):
+        if jd_end < jd_start:
+            jd_start, jd_end = jd_end, jd_start
+        self.latitude = latitude
+        self.longitude = longitude
+        self._tan_lat = math.tan(math.radians(latitude))
+        self.step = anchor_step_days
+        self.jd0 = math.floor(jd_start / anchor_step_days) * anchor_step_days
+        count = int(math.ceil((jd_end - self.jd0) / anchor_step_days)) + 2
+        self.jd_last = self.jd0 + (count - 1) * anchor_step_days
+
+        anchors = [_sidereal_anchor(self.jd0 + k * anchor_step_days) for k in range(count)]
+        # Unwrap sidereal time so neighbouring anchors interpolate across 360°.
+        self._sidereal = np.unwrap(np.array([a[0] for a in anchors]), period=360.0)
+        self._obliquity = np.array([a[1] for a in anchors])
+        self._sidereal_list = self._sidereal.tolist()
+        self._obliquity_list = self._obliquity.tolist()
+
+    def _check_latitude(self, obliquity) -> None:
+        """Mirror swe.houses, which fails inside the polar circles."""
+        if np.any(abs(self.latitude) >= 90.0 - obliquity):
+            raise RuntimeError(
+                "Swiss Ephemeris house calculation failed: ascendant undefined "
+                f"within the polar circle (latitude {self.latitude})"
+            )
+
+    def _ascendant_from(self, sidereal_time_deg: np.ndarray, obliquity_deg: np.ndarray) -> np.ndarray:
+        """Apply the closed-form formula element-wise."""
+        self._check_latitude(obliquity_deg)
+        armc = np.radians(np.mod(sidereal_time_deg + self.longitude, 360.0))
+        eps = np.radians(obliquity_deg)
+        asc = np.degrees(np.arctan2(
+            np.cos(armc),
+            -(np.sin(armc) * np.cos(eps) + self._tan_lat * np.sin(eps))
+        ))
+        return np.mod(asc, 360.0)
+
+    def ascendant(self, jd_ut: float) -> float:
+        """Ascendant longitude in degrees (0–360) at one JD (UT)."""
+        if not (self.jd0 <= jd_ut <= self.jd_last):
+            sidereal_time_deg, obliquity = _sidereal_anchor(jd_ut)
+        else:
+            offset = (jd_ut - self.jd0) / self.step
+            k = min(int(offset), len(self._sidereal_list) - 2)
+            s = offset - k
+            st0, st1 = self._sidereal_list[k], self._sidereal_list[k + 1]
+            ob0, ob1 = self._obliquity_list[k], self._obliquity_list[k + 1]
+            sidereal_time_deg = st0 + (st1 - st0) * s
+            obliquity = ob0 + (ob1 - ob0) * s
+        self._check_latitude(obliquity)
+        armc = math.radians((sidereal_time_deg + self.longitude) % 360.0)
+        eps = math.radians(obliquity)
+        asc = math.degrees(math.atan2(
+            math.cos(armc),
+            -(math.sin(armc) * math.cos(eps) + self._tan_lat * math.sin(eps))
+        ))
+        return asc % 360.0
+
+    def ascendant_array(self, jd_ut_values) -> np.ndarray:
+        """Ascendant longitudes in degrees (0–360) for an array of JDs (UT)."""
+        jd = np.atleast_1d(np.asarray(jd_ut_values, dtype=np.float64))
+        inside = (jd >= self.jd0) & (jd <= self.jd_last)
+        sidereal_time_deg = np.empty_like(jd)
+        obliquity = np.empty_like(jd)
+
+        offset = (jd[inside] - self.jd0) / self.step
+        k = np.minimum(offset.astype(np.int64), len(self._sidereal) - 2)
+        s = offset - k
+        sidereal_time_deg[inside] = self._sidereal[k] + (self._sidereal[k + 1] - self._sidereal[k]) * s
+        obliquity[inside] = self._obliquity[k] + (self._obliquity[k + 1] - self._obliquity[k]) * s
+        for i in np.flatnonzero(~inside):
+            sidereal_time_deg[i], obliquity[i] = _sidereal_anchor(float(jd[i]))
+
+        return self._ascendant_from(sidereal_time_deg, obliquity)
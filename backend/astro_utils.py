@@ -81,6 +81,39 @@ def get_sign_lord(deg: float) -> str:
     """
     return get_sign_lord_from_index(int(deg / 30.0))
 
+def compound_relationship(planet: str, chart_positions: Dict[str, float]) -> str:
+    """Panchadha Maitri (compound) relationship of a planet to its sign lord.
+
+    Natural relationship (RELATIONSHIPS) plus temporary relationship in the
+    given chart: a lord in the 2nd, 3rd, 4th, 10th, 11th or 12th from the
+    planet is a temporary friend, otherwise a temporary enemy.
+
+    Args:
+        planet: Planet name.
+        chart_positions: Longitudes of the planets in one (divisional) chart.
+
+    Returns:
+        str: 'own', 'adhimitra', 'mitra', 'sama', 'satru' or 'adhisatru'.
+    """
+    return compound_relationship_from_signs(
+        planet, {name: int(deg / 30.0) % 12 for name, deg in chart_positions.items()}
+    )
+
+def compound_relationship_from_signs(planet: str, chart_signs: Dict[str, int]) -> str:
+    """`compound_relationship` from the sign indices (0=Aries) of one chart."""
+    p_sign = chart_signs[planet]
+    lord = get_sign_lord_from_index(p_sign)
+    if lord == planet:
+        return 'own'
+    if lord not in chart_signs:
+        # Lords are always Sun..Saturn, so this is only a safety net
+        return 'sama'
+    count = ((chart_signs[lord] - p_sign) % 12) + 1
+    temp_rel_val = 1 if count in (2, 3, 4, 10, 11, 12) else -1
+    total_rel = RELATIONSHIPS[planet].get(lord, 0) + temp_rel_val
+    # Friend+Friend = Adhi Mitra ... Enemy+Enemy = Adhi Satru
+    return {2: 'adhimitra', 1: 'mitra', 0: 'sama', -1: 'satru'}.get(total_rel, 'adhisatru')
+
 def angular_difference(deg1: float, deg2: float) -> float:
     """Compute the minimum angular difference between two degrees on a circle.
 
@@ -25,6 +25,8 @@ from .astro_utils import (
     PLANETS, EXALTATION_DEGREES as EXALTATION_DEG, RELATIONSHIPS,
     get_sign_lord, get_house_from_lagna, is_retrograde, angular_difference
 )
+from .chart_context import ChartContext
+from . import ephemeris
 
 # Constants
 LAGNA = 'lagna'
@@ -274,7 +276,8 @@ def calculate_amsayu(planets_deg: Dict[str, float], lagna_deg: float) -> Dict[st
 def calculate_final_longevity(jd_ut: float, 
                              lagna_deg: float, 
                              planets_deg: Dict[str, float],
-                             shadbala_rupas: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+                             shadbala_rupas: Optional[Dict[str, float]] = None,
+                             context: Optional[ChartContext] = None) -> Dict[str, Any]:
     """Calculate Final Validated Longevity.
     
     1. Compute Raw Pindayu, Nisargayu, Amsayu.
@@ -286,16 +289,13 @@ def calculate_final_longevity(jd_ut: float,
     - If Sun is strongest -> Pindayu
     - If Moon is strongest -> Nisargayu
     - If Lagna Lord is strongest -> Amsayu
+
+    ``context`` is the candidate's shared chart context; its speeds are
+    reused when Cheshta Bala already fetched them.
     """
     # 1. Get Speeds for Harana (Retrograde check)
-    speeds = {}
-    planet_ids = {
-        SUN: swe.SUN, MOON: swe.MOON, MARS: swe.MARS, MERCURY: swe.MERCURY,
-        JUPITER: swe.JUPITER, VENUS: swe.VENUS, SATURN: swe.SATURN
-    }
-    for p, pid in planet_ids.items():
-        res = swe.calc_ut(jd_ut, pid)
-        speeds[p] = res[0][3]
+    all_speeds = context.speeds if context is not None else ephemeris.get_service().speeds(jd_ut)
+    speeds = {p: all_speeds[p] for p in PLANETS}
         
     # 2. Calculate Raw Years
     pindayu_raw = calculate_pindayu(planets_deg, lagna_deg)
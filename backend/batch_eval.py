@@ -0,0 +1,266 @@
+"""Vectorised BPHS candidate evaluation.
+
+`btr_core.search_candidate_times` scans a window of candidate birth times.
+The per-time BPHS Chapter 4 quantities (Ishta-kāla, Madhya/Sphuṭa Prāṇa-pada,
+special lagnas, Nisheka and the hard-filter verdicts) are pure arithmetic on
+the ascendant, the planetary longitudes and the time since sunrise, so this
+module evaluates them for a whole window at once as NumPy arrays.
+
+Every kernel mirrors its scalar counterpart in `btr_core` operation for
+operation (same floor/modulo conventions, same tolerance comparisons), so a
+verdict computed here is identical to the one `apply_bphs_hard_filters`
+returns for the same inputs.  Ephemeris lookups stay in `btr_core`; this
+module only sees arrays.
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+# Verse 4.9 time-match tolerance used by apply_moon_purification (degrees)
+MOON_PURIFICATION_TOLERANCE_DEG = 2.0
+# Verse 4.9 fallback threshold used by apply_bphs_hard_filters
+MOON_VERSE9_THRESHOLD = 60.0
+# 'purification_anchor' codes of classify_hard_filters, in BPHS 4.8/4.9 order
+# (code 3 is reported as 'gulika_7th' when the 7th from lagna is nearer)
+PURIFICATION_ANCHORS = (None, 'pranapada', 'moon', 'gulika', 'moon_verse9')
+
+
+def angular_difference(deg1: np.ndarray, deg2: np.ndarray) -> np.ndarray:
+    """Element-wise minimum angular difference (0–180), as astro_utils."""
+    diff = np.abs(np.mod(deg1 - deg2, 360.0))
+    return np.minimum(diff, 360.0 - diff)
+
+
+def sign_index(deg: np.ndarray) -> np.ndarray:
+    """Element-wise rāśi index (0–11) of a longitude array."""
+    return np.mod(np.floor(deg / 30.0).astype(np.int64), 12)
+
+
+def ishta_kala_arrays(elapsed_seconds: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Ishta-kāla for an array of seconds since sunrise (see calculate_ishta_kala).
+
+    Args:
+        elapsed_seconds: Candidate time minus sunrise, in seconds.
+
+    Returns:
+        tuple: (ghatis, palas, total_palas) arrays.
+    """
+    delta_sec = np.where(elapsed_seconds < 0, elapsed_seconds + 24 * 3600.0, elapsed_seconds)
+    total_palas = delta_sec / 24.0
+    ghatis = np.floor_divide(total_palas, 60).astype(np.int64)
+    palas = np.mod(total_palas, 60).astype(np.int64)
+    return ghatis, palas, total_palas
+
+
+def madhya_pranapada_array(ghatis: np.ndarray, palas: np.ndarray) -> np.ndarray:
+    """Madhya Prāṇa-pada longitudes (BPHS 4.5, see calculate_madhya_pranapada)."""
+    rashi_index = np.mod(ghatis * 4 + np.floor_divide(palas, 15), 12)
+    degrees = np.mod(palas, 15) * 2.0
+    return np.mod(rashi_index * 30.0 + degrees, 360.0)
+
+
+def sphuta_pranapada_array(total_palas: np.ndarray, sun_deg: np.ndarray) -> np.ndarray:
+    """Sphuṭa Prāṇa-pada longitudes (BPHS 4.7, see calculate_sphuta_pranapada)."""
+    rashi_fraction = total_palas / 15.0
+    sign_offset = np.floor(rashi_fraction).astype(np.int64)
+    fraction_of_sign = rashi_fraction - sign_offset
+    sun_sign = sign_index(sun_deg)
+    # Chara: own sign, Sthira: 9th (+8), Dvisvabhava: 5th (+4)
+    base_shift = np.array([0, 8, 4], dtype=np.int64)[np.mod(sun_sign, 3)]
+    final_sign = np.mod(sun_sign + base_shift + sign_offset, 12)
+    return np.mod(final_sign * 30.0 + fraction_of_sign * 30.0, 360.0)
+
+
+def special_lagnas_arrays(ghatis: np.ndarray,
+                          palas: np.ndarray,
+                          sun_deg: np.ndarray,
+                          lagna_deg: np.ndarray) -> Dict[str, np.ndarray]:
+    """Bhava, Hora, Ghati and Varnada lagnas (BPHS 4.18-28, see calculate_special_lagnas)."""
+    bhava_lagna = np.mod(sun_deg + (ghatis / 5.0) * 30.0, 360.0)
+    hora_lagna = np.mod(sun_deg + (ghatis / 2.5) * 30.0, 360.0)
+    ghati_lagna = np.mod(sun_deg + (ghatis * 30.0 + palas * 2.0), 360.0)
+
+    janma_num = np.floor(lagna_deg / 30.0).astype(np.int64) + 1
+    hora_num = np.floor(hora_lagna / 30.0).astype(np.int64) + 1
+    same_parity = np.mod(janma_num, 2) == np.mod(hora_num, 2)
+
+    # Both odd or both even: add (wrapping past 12)
+    added = janma_num + hora_num
+    added = np.where(added > 12, np.mod(added, 12), added)
+    added = np.where(added == 0, 12, added)
+    # One odd, one even: subtract against the odd equivalent of Hora
+    hora_adjusted = np.where(np.mod(hora_num, 2) == 0, 13 - hora_num, hora_num)
+    subtracted = np.abs(janma_num - hora_adjusted)
+    subtracted = np.where(subtracted == 0, 1, subtracted)
+
+    varnada_num = np.where(same_parity, added, subtracted)
+    # Result must be an odd sign
+    varnada_num = np.where(np.mod(varnada_num, 2) == 0, 12 - varnada_num, varnada_num)
+    varnada_num = np.where(varnada_num == 0, 1, varnada_num)
+    varnada_lagna = np.mod((varnada_num - 1) * 30.0, 360.0)
+
+    return {
+        'bhava_lagna': bhava_lagna,
+        'hora_lagna': hora_lagna,
+        'ghati_lagna': ghati_lagna,
+        'varnada_lagna': varnada_lagna
+    }
+
+
+def nisheka_arrays(saturn_deg: np.ndarray,
+                   gulika_deg: np.ndarray,
+                   lagna_deg: np.ndarray) -> Dict[str, np.ndarray]:
+    """Nisheka lagna and gestation realism (BPHS 4.12-16, see calculate_nisheka_lagna)."""
+    lagna_rashi = sign_index(lagna_deg)
+    diff_a = np.mod(sign_index(saturn_deg) - sign_index(gulika_deg), 12)
+    diff_b = np.mod(lagna_rashi - np.mod(lagna_rashi + 8, 12), 12)
+    total_rashis = np.mod(diff_a + diff_b, 12)
+    total_rashis = np.where(total_rashis == 0, 12, total_rashis)
+
+    gestation_months = total_rashis.astype(np.float64)
+    is_realistic = (gestation_months >= 5.0) & (gestation_months <= 10.5)
+    near_realistic = (gestation_months >= 4.0) & (gestation_months <= 11.0)
+    gestation_score = np.where(is_realistic, 100.0, np.where(near_realistic, 50.0, 0.0))
+
+    return {
+        'nisheka_lagna_deg': np.mod(lagna_deg - total_rashis * 30.0, 360.0),
+        'gestation_months': gestation_months,
+        'is_realistic': is_realistic,
+        'gestation_score': gestation_score
+    }
+
+
+def moon_purification_arrays(moon_deg: np.ndarray,
+                             lagna_deg: np.ndarray,
+                             total_palas: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Verse 4.9 derived ishta-kāla and time-based purification score (see apply_moon_purification)."""
+    derived_ishta_kala_deg = np.mod(lagna_deg - np.mod(moon_deg - 210.0, 360.0), 360.0)
+    actual_motion_deg = np.mod(total_palas / 10.0, 360.0)
+    delta = angular_difference(derived_ishta_kala_deg, actual_motion_deg)
+    score = np.maximum(0.0, 100.0 * (1.0 - (delta / MOON_PURIFICATION_TOLERANCE_DEG)))
+    return derived_ishta_kala_deg, np.where(delta <= MOON_PURIFICATION_TOLERANCE_DEG, score, 0.0)
+
+
+def moon_purification_score_array(moon_deg: np.ndarray,
+                                  lagna_deg: np.ndarray,
+                                  total_palas: np.ndarray) -> np.ndarray:
+    """Verse 4.9 time-based purification score (see apply_moon_purification)."""
+    return moon_purification_arrays(moon_deg, lagna_deg, total_palas)[1]
+
+
+def hard_filter_deltas(lagna_deg: np.ndarray,
+                       sphuta_pp_deg: np.ndarray,
+                       madhya_pp_deg: Optional[np.ndarray],
+                       gulika_deg: np.ndarray,
+                       moon_deg: np.ndarray,
+                       total_palas: np.ndarray) -> Dict[str, np.ndarray]:
+    """Tolerance-independent part of the hard filters: trine verdict and raw deltas.
+
+    Returns:
+        Dict with the lagna's sign distance from Prāṇa-pada 'sign_diff' and
+        'passes_trine', the angular deltas to Sphuṭa/Madhya Prāṇa-pada,
+        Gulika (nearer of direct and 7th, 'gulika_direct' when direct) and
+        Moon, and the Verse 4.9 'ishta_kala_deg', 'moon_purification_score'
+        and verdict 'moon_verse9'.
+    """
+    sign_diff = np.mod(sign_index(lagna_deg) - sign_index(sphuta_pp_deg), 12)
+    delta_madhya = angular_difference(lagna_deg, madhya_pp_deg) if madhya_pp_deg is not None else None
+    direct_gulika = angular_difference(lagna_deg, gulika_deg)
+    delta_gulika = np.minimum(direct_gulika, angular_difference(np.mod(lagna_deg + 180.0, 360.0), gulika_deg))
+    ishta_kala_deg, moon_purification_score = moon_purification_arrays(moon_deg, lagna_deg, total_palas)
+    return {
+        'sign_diff': sign_diff,
+        'passes_trine': np.isin(sign_diff, (0, 4, 8)),
+        'delta_pranapada_deg': angular_difference(lagna_deg, sphuta_pp_deg),
+        'delta_madhya_pranapada_deg': delta_madhya,
+        'delta_gulika_deg': delta_gulika,
+        'gulika_direct': delta_gulika == direct_gulika,
+        'delta_moon_deg': angular_difference(lagna_deg, moon_deg),
+        'ishta_kala_deg': ishta_kala_deg,
+        'moon_purification_score': moon_purification_score,
+        'moon_verse9': moon_purification_score > MOON_VERSE9_THRESHOLD
+    }
+
+
+def classify_hard_filters(deltas: Dict[str, np.ndarray],
+                          *,
+                          alignment_orb: float,
+                          padekyata_tolerance_sphuta: float,
+                          padekyata_tolerance_madhya: float) -> Dict[str, np.ndarray]:
+    """Apply one set of tolerances to `hard_filter_deltas` output.
+
+    Returns:
+        Dict of boolean verdict arrays ('passes_trine', 'passes_padekyata',
+        'passes_padekyata_sphuta', 'passes_padekyata_madhya',
+        'passes_purification', 'accepted'), the score arrays of
+        `classify_bphs_deltas` ('degree_match', 'gulika_alignment',
+        'moon_alignment', 'combined_verification' and the
+        `PURIFICATION_ANCHORS` code 'purification_anchor'), the tolerances
+        and every `hard_filter_deltas` array.
+    """
+    delta_madhya = deltas['delta_madhya_pranapada_deg']
+    delta_gulika = deltas['delta_gulika_deg']
+    delta_moon = deltas['delta_moon_deg']
+    passes_padekyata_sphuta = deltas['delta_pranapada_deg'] <= padekyata_tolerance_sphuta
+    degree_match = np.where(passes_padekyata_sphuta, 100.0, 0.0)
+    if delta_madhya is not None:
+        passes_padekyata_madhya = delta_madhya <= padekyata_tolerance_madhya
+        passes_padekyata = passes_padekyata_sphuta | passes_padekyata_madhya
+    else:
+        passes_padekyata_madhya = np.ones_like(passes_padekyata_sphuta)
+        passes_padekyata = passes_padekyata_sphuta
+
+    gulika_alignment = np.minimum(100.0, np.maximum(0.0, (alignment_orb - delta_gulika) / alignment_orb) * 100.0)
+    moon_alignment = np.minimum(100.0, np.maximum(0.0, (alignment_orb - delta_moon) / alignment_orb) * 100.0)
+
+    # Purification sequence: Prāṇa-pada → Moon (direct) → Gulika → Moon (Verse 4.9)
+    anchors = [passes_padekyata, delta_moon <= alignment_orb, delta_gulika <= alignment_orb, deltas['moon_verse9']]
+    purification_anchor = np.select(anchors, [1, 2, 3, 4], 0)
+    combined_verification = np.select(
+        anchors, [degree_match, moon_alignment, gulika_alignment, deltas['moon_purification_score']], 0.0
+    )
+    passes_purification = purification_anchor > 0
+
+    return {
+        **deltas,
+        'passes_padekyata': passes_padekyata,
+        'passes_padekyata_sphuta': passes_padekyata_sphuta,
+        'passes_padekyata_madhya': passes_padekyata_madhya,
+        'passes_purification': passes_purification,
+        'accepted': deltas['passes_trine'] & passes_padekyata & passes_purification,
+        'degree_match': degree_match,
+        'gulika_alignment': gulika_alignment,
+        'moon_alignment': moon_alignment,
+        'combined_verification': combined_verification,
+        'purification_anchor': purification_anchor,
+        'padekyata_tolerance_sphuta': padekyata_tolerance_sphuta,
+        'padekyata_tolerance_madhya': padekyata_tolerance_madhya
+    }
+
+
+def hard_filter_arrays(lagna_deg: np.ndarray,
+                       sphuta_pp_deg: np.ndarray,
+                       madhya_pp_deg: Optional[np.ndarray],
+                       gulika_deg: np.ndarray,
+                       moon_deg: np.ndarray,
+                       total_palas: np.ndarray,
+                       *,
+                       alignment_orb: float,
+                       padekyata_tolerance_sphuta: float,
+                       padekyata_tolerance_madhya: float) -> Dict[str, np.ndarray]:
+    """BPHS 4.6/4.8/4.10 verdicts for every candidate (see apply_bphs_hard_filters).
+
+    Tolerances are resolved by the caller exactly as the scalar filter
+    resolves them from ``strict_bphs``/``orb_tolerance``.
+
+    Returns:
+        Dict of boolean verdict arrays ('passes_trine', 'passes_padekyata',
+        'passes_purification', 'accepted') plus the raw deltas.
+    """
+    return classify_hard_filters(
+        hard_filter_deltas(lagna_deg, sphuta_pp_deg, madhya_pp_deg, gulika_deg, moon_deg, total_palas),
+        alignment_orb=alignment_orb,
+        padekyata_tolerance_sphuta=padekyata_tolerance_sphuta,
+        padekyata_tolerance_madhya=padekyata_tolerance_madhya
+    )
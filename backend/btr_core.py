@@ -13,11 +13,14 @@ not tropical. Swiss Ephemeris is used for high‑precision planetary positions,
 sunrise/sunset, and house cusps.
 """
 
+import bisect
+import concurrent.futures
 import math
 import datetime
 import logging
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Iterator, Sequence
 
+import numpy as np
 import swisseph as swe
 
 from . import config
@@ -26,6 +29,20 @@ from . import ayurdaya  # Import new Ayurdaya module
 from . import astro_utils  # Import astro utils
 from . import vargas  # Import new Vargas module
 from . import dashas  # Import new Dashas module
+from . import batch_eval  # Vectorised window evaluation
+from . import stage9_batch  # Vectorised Stage-9 validation
+from . import ephemeris  # Sampled ephemeris service
+from . import padekyata  # Root-finding padekyatā solver
+from . import compute_pool  # Process pools for sharded window scans
+from .ascendant import AscendantSolver  # Closed-form ascendant fast path
+from .evaluation_store import EvaluationStore, timestamp_key  # Per-request evaluation reuse
+from .chart_context import ChartContext  # Per-candidate Stage-9 memo
+from . import day_context  # Cross-request sunrise/sunset/Gulika cache
+from .day_context import DayContext
+from . import candidate_record
+from .candidate_record import CandidateRecord, epoch_seconds  # Compact accepted-candidate records
+from .rejection_aggregator import RejectionAggregator  # Bounded rejection diagnostics
+from .cancellation import CancellationToken, SearchCancelled  # Cooperative search cancellation
 
 logger = logging.getLogger("btr.core")
 
@@ -35,6 +52,10 @@ if config.EPHE_PATH:
 # Set Lahiri ayanamsa for sidereal zodiac
 swe.set_sid_mode(swe.SIDM_LAHIRI)
 
+# Engine identifier reported by the API; part of every result-cache key, so
+# bump it whenever search results change for the same inputs
+ENGINE_VERSION = "bphs-btr-prototype-v2"
+
 # Default strict BPHS orb (in degrees) for Gulika/Moon alignments
 # 1° keeps alignments tight while avoiding false negatives at palā resolution.
 STRICT_ORB_TOLERANCE = 1.0
@@ -45,9 +66,17 @@ VIPALA_DEGREES = PALA_DEGREES / 60.0  # 1 vipala = 1/60 pala
 # Default tolerance: 1 palā (2°) resolution; strict mode: ~1/10 palā (~0.2°)
 PADA_EPSILON_DEGREES = PALA_DEGREES
 STRICT_PADA_EPSILON_DEGREES = PALA_DEGREES / 10.0
+# Named hard-filter tolerance profiles, strictest first.  'default' matches
+# the apply_bphs_hard_filters/search_candidate_times defaults; 'relaxed'
+# allows two palās for sphuṭa padekyatā and the Gulika/Moon orb.
+TOLERANCE_PROFILES: dict[str, dict[str, Any]] = {
+    'strict': {'strict_bphs': True, 'orb_tolerance': 2.0},
+    'default': {'strict_bphs': False, 'orb_tolerance': 2.0},
+    'relaxed': {'strict_bphs': False, 'orb_tolerance': 2 * PADA_EPSILON_DEGREES}
+}
 # Time resolution: 1 palā = 24 seconds (BPHS traditional unit)
 PALA_SECONDS = 24.0
-# Runtime safety cap for palā-by-palā śodhana adjustments (150 palās ≈ 60 minutes)
+# Runtime safety cap for per-step śodhana reach (150 palās ≈ 60 minutes)
 MAX_RUNTIME_SHODHANA_PALAS = 150
 
 # Enhanced constants for palā-level precision 
@@ -105,7 +134,9 @@ def compute_sidereal_lagna(jd_ut: float, latitude: float, longitude: float) -> f
     """Compute the sidereal ascendant (lagna) in degrees.
 
     Uses Swiss Ephemeris house calculation to obtain the ascendant.  The
-    sidereal ayanamsa has already been set globally.
+    sidereal ayanamsa has already been set globally.  Candidate scans use
+    `AscendantSolver` (backend.ascendant), which reproduces this value
+    analytically without computing the house cusps.
 
     Args:
         jd_ut: Julian Day in UT.
@@ -139,43 +170,15 @@ def compute_sun_moon_longitudes(jd_ut: float) -> tuple[float, float]:
     Raises:
         RuntimeError: If Swiss Ephemeris calculation fails.
     """
-    try:
-        ayan = swe.get_ayanamsa_ut(jd_ut)
-        if not isinstance(ayan, (int, float)) or math.isnan(ayan) or math.isinf(ayan):
-            raise RuntimeError(f"Swiss Ephemeris returned invalid ayanamsa: {ayan}")
-        
-        sun_result = swe.calc_ut(jd_ut, swe.SUN)
-        if sun_result[1] < 0:
-            raise RuntimeError(f"Swiss Ephemeris Sun calculation failed with error code: {sun_result[1]}")
-        sun_longitude = (sun_result[0][0] - ayan) % 360.0
-        
-        moon_result = swe.calc_ut(jd_ut, swe.MOON)
-        if moon_result[1] < 0:
-            raise RuntimeError(f"Swiss Ephemeris Moon calculation failed with error code: {moon_result[1]}")
-        moon_longitude = (moon_result[0][0] - ayan) % 360.0
-        
-        if math.isnan(sun_longitude) or math.isinf(sun_longitude):
-            raise RuntimeError(f"Invalid sun longitude: {sun_longitude}")
-        if math.isnan(moon_longitude) or math.isinf(moon_longitude):
-            raise RuntimeError(f"Invalid moon longitude: {moon_longitude}")
-        
-        return sun_longitude, moon_longitude
-    except RuntimeError:
-        raise
-    except Exception as e:
-        raise RuntimeError(f"Swiss Ephemeris planet calculation failed: {e}") from e
-
-# Cache for planet positions to avoid redundant calculations
-# Planets move slowly enough that we can reuse positions for small time deltas (e.g. 15 mins)
-_PLANET_CACHE: dict[int, dict[str, float]] = {}
-_PLANET_CACHE_RESOLUTION_JD = 0.0104  # ~15 minutes in days (15/1440)
+    positions = get_planet_positions(jd_ut)
+    return positions['sun'], positions['moon']
 
 def get_planet_positions(jd_ut: float) -> dict[str, float]:
     """Get all planet positions (sidereal, Lahiri ayanamsa).
     
-    Uses a cache with ~15-minute resolution since planetary positions 
-    (except Moon) change very slowly. Moon changes ~0.13° in 15 mins,
-    which is acceptable for initial filtering.
+    Positions are served by the sampled ephemeris service
+    (`backend.ephemeris`), which interpolates Swiss Ephemeris samples to
+    well under 1 arc-second for every graha.
     
     Args:
         jd_ut: Julian Day in UT.
@@ -186,50 +189,8 @@ def get_planet_positions(jd_ut: float) -> dict[str, float]:
     Raises:
         RuntimeError: If Swiss Ephemeris calculation fails.
     """
-    # Round JD to resolution for caching key
-    cache_key = int(jd_ut / _PLANET_CACHE_RESOLUTION_JD)
-    
-    if cache_key in _PLANET_CACHE:
-        # logger.debug(f"Cache hit for JD {jd_ut}")
-        return _PLANET_CACHE[cache_key]
-
     try:
-        ayan = swe.get_ayanamsa_ut(jd_ut)
-        if not isinstance(ayan, (int, float)) or math.isnan(ayan) or math.isinf(ayan):
-            raise RuntimeError(f"Swiss Ephemeris returned invalid ayanamsa: {ayan}")
-        
-        positions = {}
-        
-        planets = {
-            'sun': swe.SUN,
-            'moon': swe.MOON,
-            'mars': swe.MARS,
-            'mercury': swe.MERCURY,
-            'jupiter': swe.JUPITER,
-            'venus': swe.VENUS,
-            'saturn': swe.SATURN,
-            'rahu': swe.MEAN_NODE
-        }
-        
-        for name, planet_id in planets.items():
-            calc_result = swe.calc_ut(jd_ut, planet_id)
-            if calc_result[1] < 0:
-                raise RuntimeError(f"Swiss Ephemeris {name} calculation failed with error code: {calc_result[1]}")
-            calc = calc_result[0]
-            longitude = (calc[0] - ayan) % 360.0
-            if math.isnan(longitude) or math.isinf(longitude):
-                raise RuntimeError(f"Invalid {name} longitude: {longitude}")
-            positions[name] = longitude
-        
-        # Ketu is 180° from Rahu
-        positions['ketu'] = (positions['rahu'] + 180.0) % 360.0
-        
-        # Update cache (simple size limit to prevent memory leak)
-        if len(_PLANET_CACHE) > 1000:
-            _PLANET_CACHE.clear()
-        _PLANET_CACHE[cache_key] = positions
-        
-        return positions
+        return ephemeris.get_service().sidereal_positions(jd_ut)
     except RuntimeError:
         raise
     except Exception as e:
@@ -348,7 +309,22 @@ def calculate_gulika(date_local: datetime.date,
     # Next day's sunrise for night calculations
     next_day = date_local + datetime.timedelta(days=1)
     next_sunrise_local, _ = compute_sunrise_sunset(next_day, latitude, longitude, tz_offset)
+    return _gulika_from_day_bounds(
+        date_local, sunrise_local, sunset_local, next_sunrise_local, latitude, longitude, tz_offset
+    )
 
+def _gulika_from_day_bounds(date_local: datetime.date,
+                            sunrise_local: datetime.datetime,
+                            sunset_local: datetime.datetime,
+                            next_sunrise_local: datetime.datetime,
+                            latitude: float,
+                            longitude: float,
+                            tz_offset: float) -> dict[str, Any]:
+    """Gulika-lagna from already resolved sunrise, sunset and next sunrise.
+
+    See `calculate_gulika` for the BPHS rules; this is its body, shared with
+    `build_day_context` so a day's rise/set events are resolved only once.
+    """
     # Daytime gulika (BPHS Verse 4.1)
     # Divide day duration into 8 equal parts (khandas)
     # Count from weekday lord: Sun, Moon, Mars, Mercury, Jupiter, Venus, Saturn
@@ -409,6 +385,45 @@ def calculate_gulika(date_local: datetime.date,
         'night_gulika_time_local': gulika_night_start
     }
 
+def build_day_context(date_local: datetime.date,
+                      latitude: float,
+                      longitude: float,
+                      tz_offset: float) -> DayContext:
+    """Resolve sunrise, sunset, next sunrise and Gulika for one day (uncached).
+
+    Args:
+        date_local: Calendar date in local time zone.
+        latitude: Geographic latitude (north positive).
+        longitude: Geographic longitude (east positive).
+        tz_offset: Hours offset from UTC.
+
+    Returns:
+        DayContext: The day's astronomical context.
+    """
+    sunrise_local, sunset_local = compute_sunrise_sunset(date_local, latitude, longitude, tz_offset)
+    next_day = date_local + datetime.timedelta(days=1)
+    next_sunrise_local, _ = compute_sunrise_sunset(next_day, latitude, longitude, tz_offset)
+    gulika = _gulika_from_day_bounds(
+        date_local, sunrise_local, sunset_local, next_sunrise_local, latitude, longitude, tz_offset
+    )
+    return DayContext(date_local, latitude, longitude, tz_offset,
+                      sunrise_local, sunset_local, next_sunrise_local, gulika)
+
+def get_day_context(date_local: datetime.date,
+                    latitude: float,
+                    longitude: float,
+                    tz_offset: float) -> DayContext:
+    """Day context for a date and place, served from the process-wide LRU.
+
+    Raises:
+        RuntimeError: When Swiss Ephemeris cannot resolve the day's rise/set
+            events (e.g. polar day/night); failures are not cached.
+    """
+    return day_context.get_cache().get(
+        day_context.day_key(date_local, latitude, longitude, tz_offset),
+        lambda: build_day_context(date_local, latitude, longitude, tz_offset)
+    )
+
 def calculate_ishta_kala(candidate_local: datetime.datetime,
                          sunrise_local: datetime.datetime) -> tuple[int, int, float]:
     """Compute the Ishta‑kāla between sunrise and the candidate time.
@@ -840,6 +855,91 @@ def apply_bphs_hard_filters(lagna_deg: float,
         - is_accepted: True if candidate passes all mandatory filters
         - scores: Dictionary with verification scores (0-100) for each check
     """
+    deltas = measure_bphs_deltas(
+        lagna_deg, pranapada_deg, gulika_deg, moon_deg,
+        madhya_pranapada_deg=madhya_pranapada_deg,
+        total_palas=total_palas
+    )
+    alignment_orb, padekyata_tolerance_sphuta, padekyata_tolerance_madhya = resolve_tolerances(
+        strict_bphs, orb_tolerance, has_madhya=madhya_pranapada_deg is not None
+    )
+    return classify_bphs_deltas(
+        deltas,
+        alignment_orb=alignment_orb,
+        padekyata_tolerance_sphuta=padekyata_tolerance_sphuta,
+        padekyata_tolerance_madhya=padekyata_tolerance_madhya
+    )
+
+def apply_bphs_hard_filters_profiles(lagna_deg: float,
+                                     pranapada_deg: float,
+                                     gulika_deg: float,
+                                     moon_deg: float,
+                                     *,
+                                     madhya_pranapada_deg: Optional[float] = None,
+                                     total_palas: Optional[float] = None,
+                                     profiles: Sequence[str] = tuple(TOLERANCE_PROFILES)
+                                     ) -> dict[str, tuple[bool, dict[str, float]]]:
+    """Apply the BPHS hard filters under several tolerance profiles at once.
+
+    The trine rule, angular deltas and Verse 4.9 Moon purification are
+    computed once; each profile only re-applies its thresholds.  Each
+    profile's verdict equals `apply_bphs_hard_filters` called with that
+    profile's ``strict_bphs``/``orb_tolerance``.
+
+    Args:
+        lagna_deg: Ascendant longitude in degrees.
+        pranapada_deg: Sphuṭa Prāṇa‑pada longitude in degrees.
+        gulika_deg: Gulika‑lagna longitude (choose appropriate day/night).
+        moon_deg: Moon's longitude in degrees.
+        madhya_pranapada_deg: Madhya Prāṇa‑pada longitude in degrees (BPHS 4.5).
+        total_palas: Total palas elapsed since sunrise (for Verse 4.9 verification).
+        profiles: Names from `TOLERANCE_PROFILES`.
+
+    Returns:
+        dict: Profile name → (is_accepted, scores).
+    """
+    deltas = measure_bphs_deltas(
+        lagna_deg, pranapada_deg, gulika_deg, moon_deg,
+        madhya_pranapada_deg=madhya_pranapada_deg,
+        total_palas=total_palas
+    )
+    verdicts = {}
+    for name in profiles:
+        alignment_orb, padekyata_tolerance_sphuta, padekyata_tolerance_madhya = resolve_tolerances(
+            **TOLERANCE_PROFILES[name], has_madhya=madhya_pranapada_deg is not None
+        )
+        verdicts[name] = classify_bphs_deltas(
+            deltas,
+            alignment_orb=alignment_orb,
+            padekyata_tolerance_sphuta=padekyata_tolerance_sphuta,
+            padekyata_tolerance_madhya=padekyata_tolerance_madhya
+        )
+    return verdicts
+
+def resolve_tolerances(strict_bphs: bool,
+                       orb_tolerance: float,
+                       has_madhya: bool = True) -> tuple[float, float, float]:
+    """Resolve (alignment orb, sphuṭa padekyatā, madhya padekyatā) tolerances in degrees."""
+    alignment_orb = STRICT_ORB_TOLERANCE if strict_bphs else orb_tolerance
+    # Use strict epsilon (0.2°) for Padekyata if strict_bphs is True, else standard 2.0°
+    padekyata_tolerance_sphuta = STRICT_PADA_EPSILON_DEGREES if strict_bphs else orb_tolerance
+    padekyata_tolerance_madhya = STRICT_PADA_EPSILON_DEGREES if has_madhya else padekyata_tolerance_sphuta
+    return alignment_orb, padekyata_tolerance_sphuta, padekyata_tolerance_madhya
+
+def measure_bphs_deltas(lagna_deg: float,
+                        pranapada_deg: float,
+                        gulika_deg: float,
+                        moon_deg: float,
+                        *,
+                        madhya_pranapada_deg: Optional[float] = None,
+                        total_palas: Optional[float] = None) -> dict[str, Any]:
+    """Tolerance-independent inputs of the BPHS hard filters.
+
+    Returns:
+        dict: Trine verdict and sign distance, raw angular deltas to
+        Prāṇa‑pada (sphuṭa and madhya), Gulika and Moon, and the Verse 4.9
+        Moon purification score.
+    """
     # BPHS Verse 4.10: Trine Rule (MANDATORY for human birth)
     # प्राणपदं को राशि से त्रिकोण राशि मे मनुष्यों के जन्मलग्न की राशि होती है।
     # "From Pranapada's rashi, the birth lagna of humans is in TRINE position (1st, 5th, or 9th)."
@@ -852,26 +952,10 @@ def apply_bphs_hard_filters(lagna_deg: float,
     # BPHS Verse 4.6: Degree Matching (padekyata)
     # लग्नांशप्राणांशपदैक्यता स्यात्
     # "Lagna degrees and Pranapada degrees should be equal (पदैक्यता)"
-    alignment_orb = STRICT_ORB_TOLERANCE if strict_bphs else orb_tolerance
-    # Use strict epsilon (0.2°) for Padekyata if strict_bphs is True, else standard 2.0°
-    padekyata_tolerance_sphuta = STRICT_PADA_EPSILON_DEGREES if strict_bphs else orb_tolerance
-    padekyata_tolerance_madhya = STRICT_PADA_EPSILON_DEGREES if madhya_pranapada_deg is not None else padekyata_tolerance_sphuta
     delta_sphuta_pp = astro_utils.angular_difference(lagna_deg, pranapada_deg)
-    passes_padekyata_sphuta = delta_sphuta_pp <= padekyata_tolerance_sphuta
-    degree_match_score = 100.0 if passes_padekyata_sphuta else 0.0
-
-    delta_madhya_pp: Optional[float]
+    delta_madhya_pp: Optional[float] = None
     if madhya_pranapada_deg is not None:
         delta_madhya_pp = astro_utils.angular_difference(lagna_deg, madhya_pranapada_deg)
-        passes_padekyata_madhya = delta_madhya_pp <= padekyata_tolerance_madhya
-    else:
-        delta_madhya_pp = None
-        passes_padekyata_madhya = True
-
-    # Accept equality when either sphuṭa OR madhya Pranapada matches lagna.
-    passes_padekyata = passes_padekyata_sphuta or (
-        madhya_pranapada_deg is not None and passes_padekyata_madhya
-    )
 
     # BPHS Verse 4.8: Triple Verification
     # विना प्राणपदाच्छुद्धो गुलिकाद्वा निशाकराद्
@@ -880,20 +964,59 @@ def apply_bphs_hard_filters(lagna_deg: float,
     direct_gulika_delta = astro_utils.angular_difference(lagna_deg, gulika_deg)
     gulika_7th_delta = astro_utils.angular_difference((lagna_deg + 180.0) % 360.0, gulika_deg)
     delta_gulika = min(direct_gulika_delta, gulika_7th_delta)
-    gulika_anchor = 'gulika' if delta_gulika == direct_gulika_delta else 'gulika_7th'
+
+    # BPHS Verse 4.9: Moon-based Purification Fallback
+    # दयोहीनबलेऽप्येवं गुलिकात्परिचिन्तयेत्‌ तस्मात्तत्सप्तमस्थात्तदं शाच्च कलत्रतः
+    # "Even when not verified by Pranapada and Gulika, consider from Moon"
+    ishta_kala_deg, moon_purification_score = apply_moon_purification(moon_deg, lagna_deg, total_palas)
+
+    return {
+        'sign_diff': sign_diff,
+        'passes_trine': passes_trine,
+        'delta_sphuta_pp': delta_sphuta_pp,
+        'delta_madhya_pp': delta_madhya_pp,
+        'delta_gulika': delta_gulika,
+        'gulika_anchor': 'gulika' if delta_gulika == direct_gulika_delta else 'gulika_7th',
+        'delta_moon': astro_utils.angular_difference(lagna_deg, moon_deg),
+        'ishta_kala_deg': ishta_kala_deg,
+        'moon_purification_score': moon_purification_score
+    }
+
+def classify_bphs_deltas(deltas: dict[str, Any],
+                         *,
+                         alignment_orb: float,
+                         padekyata_tolerance_sphuta: float,
+                         padekyata_tolerance_madhya: float) -> tuple[bool, dict[str, float]]:
+    """Accept/reject verdict and scores for `measure_bphs_deltas` output under one set of tolerances.
+
+    Returns:
+        tuple[bool, dict[str, float]]: (is_accepted, scores) as `apply_bphs_hard_filters`.
+    """
+    sign_diff = deltas['sign_diff']
+    passes_trine = deltas['passes_trine']
+    delta_sphuta_pp = deltas['delta_sphuta_pp']
+    delta_madhya_pp = deltas['delta_madhya_pp']
+    delta_gulika = deltas['delta_gulika']
+    gulika_anchor = deltas['gulika_anchor']
+    delta_moon = deltas['delta_moon']
+    ishta_kala_deg = deltas['ishta_kala_deg']
+    moon_purification_score = deltas['moon_purification_score']
+    has_madhya = delta_madhya_pp is not None
+
+    passes_padekyata_sphuta = delta_sphuta_pp <= padekyata_tolerance_sphuta
+    degree_match_score = 100.0 if passes_padekyata_sphuta else 0.0
+    passes_padekyata_madhya = delta_madhya_pp <= padekyata_tolerance_madhya if has_madhya else True
+
+    # Accept equality when either sphuṭa OR madhya Pranapada matches lagna.
+    passes_padekyata = passes_padekyata_sphuta or (has_madhya and passes_padekyata_madhya)
+
     gulika_score = max(0.0, (alignment_orb - delta_gulika) / alignment_orb) * 100.0
     gulika_score = min(100.0, gulika_score)
 
     # Check Moon alignment (निशाकराद्)
-    delta_moon = astro_utils.angular_difference(lagna_deg, moon_deg)
     moon_score = max(0.0, (alignment_orb - delta_moon) / alignment_orb) * 100.0
     moon_score = min(100.0, moon_score)
 
-    # BPHS Verse 4.9: Moon-based Purification Fallback
-    # दयोहीनबलेऽप्येवं गुलिकात्परिचिन्तयेत्‌ तस्मात्तत्सप्तमस्थात्तदं शाच्च कलत्रतः
-    # "Even when not verified by Pranapada and Gulika, consider from Moon"
-    ishta_kala_deg, moon_purification_score = apply_moon_purification(moon_deg, lagna_deg, total_palas)
-
     purification_anchor = None
     anchor_score = 0.0
 
@@ -911,7 +1034,83 @@ def apply_bphs_hard_filters(lagna_deg: float,
         purification_anchor = 'moon_verse9'
         anchor_score = moon_purification_score
 
-    combined_verification = anchor_score
+    return _hard_filter_verdict(
+        sign_diff=sign_diff,
+        passes_trine=passes_trine,
+        passes_padekyata_sphuta=passes_padekyata_sphuta,
+        passes_padekyata_madhya=passes_padekyata_madhya,
+        has_madhya=has_madhya,
+        purification_anchor=purification_anchor,
+        gulika_anchor=gulika_anchor,
+        degree_match_score=degree_match_score,
+        gulika_score=gulika_score,
+        moon_score=moon_score,
+        combined_verification=anchor_score,
+        moon_purification_score=moon_purification_score,
+        ishta_kala_deg=ishta_kala_deg,
+        padekyata_tolerance_sphuta=padekyata_tolerance_sphuta,
+        padekyata_tolerance_madhya=padekyata_tolerance_madhya,
+        delta_sphuta_pp=delta_sphuta_pp,
+        delta_madhya_pp=delta_madhya_pp,
+        delta_gulika=delta_gulika,
+        delta_moon=delta_moon
+    )
+
+def batch_hard_filter_verdict(filters: dict[str, Any], pos: int) -> tuple[bool, dict[str, Any]]:
+    """(is_accepted, scores) of element `pos` of a batch's 'filters' (see `apply_batch_filters`).
+
+    Reads the vectorised verdict and score arrays; equal to
+    `apply_bphs_hard_filters` on the element's values.
+    """
+    delta_madhya = filters['delta_madhya_pranapada_deg']
+    gulika_anchor = 'gulika' if filters['gulika_direct'][pos] else 'gulika_7th'
+    purification_anchor = batch_eval.PURIFICATION_ANCHORS[int(filters['purification_anchor'][pos])]
+    if purification_anchor == 'gulika':
+        purification_anchor = gulika_anchor
+    return _hard_filter_verdict(
+        sign_diff=int(filters['sign_diff'][pos]),
+        passes_trine=bool(filters['passes_trine'][pos]),
+        passes_padekyata_sphuta=bool(filters['passes_padekyata_sphuta'][pos]),
+        passes_padekyata_madhya=bool(filters['passes_padekyata_madhya'][pos]),
+        has_madhya=delta_madhya is not None,
+        purification_anchor=purification_anchor,
+        gulika_anchor=gulika_anchor,
+        degree_match_score=float(filters['degree_match'][pos]),
+        gulika_score=float(filters['gulika_alignment'][pos]),
+        moon_score=float(filters['moon_alignment'][pos]),
+        combined_verification=float(filters['combined_verification'][pos]),
+        moon_purification_score=float(filters['moon_purification_score'][pos]),
+        ishta_kala_deg=float(filters['ishta_kala_deg'][pos]),
+        padekyata_tolerance_sphuta=filters['padekyata_tolerance_sphuta'],
+        padekyata_tolerance_madhya=filters['padekyata_tolerance_madhya'],
+        delta_sphuta_pp=float(filters['delta_pranapada_deg'][pos]),
+        delta_madhya_pp=float(delta_madhya[pos]) if delta_madhya is not None else None,
+        delta_gulika=float(filters['delta_gulika_deg'][pos]),
+        delta_moon=float(filters['delta_moon_deg'][pos])
+    )
+
+def _hard_filter_verdict(*,
+                         sign_diff: int,
+                         passes_trine: bool,
+                         passes_padekyata_sphuta: bool,
+                         passes_padekyata_madhya: bool,
+                         has_madhya: bool,
+                         purification_anchor: Optional[str],
+                         gulika_anchor: str,
+                         degree_match_score: float,
+                         gulika_score: float,
+                         moon_score: float,
+                         combined_verification: float,
+                         moon_purification_score: float,
+                         ishta_kala_deg: float,
+                         padekyata_tolerance_sphuta: float,
+                         padekyata_tolerance_madhya: float,
+                         delta_sphuta_pp: float,
+                         delta_madhya_pp: Optional[float],
+                         delta_gulika: float,
+                         delta_moon: float) -> tuple[bool, dict[str, Any]]:
+    """Verdict, rejection reason and scores dict shared by the scalar and batch filters."""
+    passes_padekyata = passes_padekyata_sphuta or (has_madhya and passes_padekyata_madhya)
     passes_purification = purification_anchor is not None
 
     # Accept only when the Trine Rule AND padekyata AND purification anchor are present.
@@ -930,9 +1129,9 @@ def apply_bphs_hard_filters(lagna_deg: float,
         non_human_classification = classification
     elif not passes_padekyata:
         # Distinguish whether sphuṭa or madhya alignment failed.
-        if not passes_padekyata_sphuta and (madhya_pranapada_deg is not None and passes_padekyata_madhya):
+        if not passes_padekyata_sphuta and (has_madhya and passes_padekyata_madhya):
             rejection_reason = "Fails BPHS 4.6 sphuta padekyata; madhya matches but sphuta does not"
-        elif passes_padekyata_sphuta and madhya_pranapada_deg is not None and not passes_padekyata_madhya:
+        elif passes_padekyata_sphuta and has_madhya and not passes_padekyata_madhya:
             rejection_reason = "Fails BPHS 4.6 madhya padekyata; sphuta matches but madhya does not"
         else:
             rejection_reason = "Fails BPHS 4.6 padekyata (Lagna != Pranapada at palā resolution)"
@@ -969,6 +1168,155 @@ def apply_bphs_hard_filters(lagna_deg: float,
 
     return is_accepted, scores
 
+def compute_candidate_batch(jd_ut_values: list[float],
+                            elapsed_seconds: list[float],
+                            latitude: float,
+                            longitude: float,
+                            gulika_deg_values: list[float],
+                            *,
+                            ascendant_solver: Optional[AscendantSolver] = None) -> dict[str, Any]:
+    """Tolerance-independent BPHS Chapter 4 quantities for a window of candidates.
+
+    Lagna, graha longitudes, Ishta-kāla, Madhya/Sphuṭa Prāṇa-pada, special
+    lagnas and Nisheka depend only on the instant, so they can be computed
+    once and filtered under any tolerance with `apply_batch_filters`.
+
+    Args:
+        jd_ut_values: Julian Days (UT) of the candidates.
+        elapsed_seconds: Seconds since local sunrise for each candidate.
+        latitude: Birthplace latitude.
+        longitude: Birthplace longitude.
+        gulika_deg_values: Day/night Gulika longitude applicable to each candidate.
+        ascendant_solver: Closed-form ascendant solver for this location;
+            built for the span of `jd_ut_values` when omitted.
+
+    Returns:
+        Dict of NumPy arrays ('lagna_deg', 'sun_deg', 'moon_deg', 'saturn_deg',
+        'ghatis', 'palas', 'total_palas', 'madhya_pp', 'sphuta_pp',
+        'gulika_deg', ...) plus 'planets' (dict of per-graha longitude arrays),
+        'special_lagnas' and 'nisheka' (dicts of arrays).
+    """
+    planets = ephemeris.get_service().sidereal_positions_array(jd_ut_values)
+    if ascendant_solver is None:
+        ascendant_solver = AscendantSolver(latitude, longitude, min(jd_ut_values), max(jd_ut_values))
+    lagna = ascendant_solver.ascendant_array(jd_ut_values)
+    sun = planets['sun']
+    saturn = planets['saturn']
+    gulika = np.asarray(gulika_deg_values, dtype=np.float64)
+
+    ghatis, palas, total_palas = batch_eval.ishta_kala_arrays(np.asarray(elapsed_seconds, dtype=np.float64))
+    madhya_pp = batch_eval.madhya_pranapada_array(ghatis, palas)
+    sphuta_pp = batch_eval.sphuta_pranapada_array(total_palas, sun)
+
+    return {
+        'jd_ut': np.asarray(jd_ut_values, dtype=np.float64),
+        'lagna_deg': lagna,
+        'planets': planets,
+        'sun_deg': sun,
+        'moon_deg': planets['moon'],
+        'saturn_deg': saturn,
+        'gulika_deg': gulika,
+        'ghatis': ghatis,
+        'palas': palas,
+        'total_palas': total_palas,
+        'madhya_pp': madhya_pp,
+        'sphuta_pp': sphuta_pp,
+        'special_lagnas': batch_eval.special_lagnas_arrays(ghatis, palas, sun, lagna),
+        'nisheka': batch_eval.nisheka_arrays(saturn, gulika, lagna)
+    }
+
+def apply_batch_filters(batch: dict[str, Any],
+                        *,
+                        orb_tolerance: float = 2.0,
+                        strict_bphs: bool = False) -> dict[str, Any]:
+    """Hard-filter verdicts for a `compute_candidate_batch` result.
+
+    Args:
+        batch: Raw batch arrays.
+        orb_tolerance: Allowed orb (degrees) for Gulika/Moon anchors.
+        strict_bphs: Use strict padekyatā tolerance and orb.
+
+    Returns:
+        A new dict with the raw arrays plus 'filters' (dict of arrays) and 'accepted'.
+    """
+    return apply_batch_filter_profiles(
+        batch, {'': {'strict_bphs': strict_bphs, 'orb_tolerance': orb_tolerance}}
+    )['']
+
+def apply_batch_filter_profiles(batch: dict[str, Any],
+                                profiles: dict[str, dict[str, Any]] = TOLERANCE_PROFILES) -> dict[str, dict[str, Any]]:
+    """Hard-filter verdicts for a raw batch under several tolerance profiles.
+
+    The trine verdict and raw deltas are computed once for the batch; each
+    profile only re-applies its thresholds.
+
+    Args:
+        batch: Raw batch arrays from `compute_candidate_batch`.
+        profiles: Profile name → ``{'strict_bphs', 'orb_tolerance'}``.
+
+    Returns:
+        dict: Profile name → batch dict with 'filters' and 'accepted' added.
+    """
+    deltas = batch_eval.hard_filter_deltas(
+        batch['lagna_deg'], batch['sphuta_pp'], batch['madhya_pp'], batch['gulika_deg'],
+        batch['moon_deg'], batch['total_palas']
+    )
+    results = {}
+    for name, profile in profiles.items():
+        # Resolved exactly as apply_bphs_hard_filters does (madhya is always supplied here)
+        alignment_orb, padekyata_tolerance_sphuta, padekyata_tolerance_madhya = resolve_tolerances(
+            profile['strict_bphs'], profile['orb_tolerance']
+        )
+        filters = batch_eval.classify_hard_filters(
+            deltas,
+            alignment_orb=alignment_orb,
+            padekyata_tolerance_sphuta=padekyata_tolerance_sphuta,
+            padekyata_tolerance_madhya=padekyata_tolerance_madhya
+        )
+        results[name] = {**batch, 'filters': filters, 'accepted': filters['accepted']}
+    return results
+
+def evaluate_candidate_batch(jd_ut_values: list[float],
+                             elapsed_seconds: list[float],
+                             latitude: float,
+                             longitude: float,
+                             gulika_deg_values: list[float],
+                             *,
+                             orb_tolerance: float = 2.0,
+                             strict_bphs: bool = False,
+                             ascendant_solver: Optional[AscendantSolver] = None) -> dict[str, Any]:
+    """Evaluate BPHS Chapter 4 quantities for a whole window of candidates.
+
+    Array counterpart of the per-candidate pipeline used by
+    `search_candidate_times`: lagna, Ishta-kāla, Madhya/Sphuṭa Prāṇa-pada,
+    special lagnas, Nisheka and the hard-filter verdicts are computed for
+    every JD in one pass.  Verdicts match `apply_bphs_hard_filters` exactly;
+    only the survivors need the full scores dictionary and Stage-9 work.
+
+    Args:
+        jd_ut_values: Julian Days (UT) of the candidates.
+        elapsed_seconds: Seconds since local sunrise for each candidate.
+        latitude: Birthplace latitude.
+        longitude: Birthplace longitude.
+        gulika_deg_values: Day/night Gulika longitude applicable to each candidate.
+        orb_tolerance: Allowed orb (degrees) for Gulika/Moon anchors.
+        strict_bphs: Use strict padekyatā tolerance and orb.
+        ascendant_solver: Closed-form ascendant solver for this location;
+            built for the span of `jd_ut_values` when omitted.
+
+    Returns:
+        Dict of NumPy arrays keyed like the scalar evaluation ('lagna_deg',
+        'sun_deg', 'moon_deg', 'saturn_deg', 'ghatis', 'palas', 'total_palas',
+        'madhya_pp', 'sphuta_pp', 'gulika_deg', 'accepted', ...) plus
+        'planets' (dict of per-graha longitude arrays), 'special_lagnas',
+        'nisheka' and 'filters' (dicts of arrays).
+    """
+    batch = compute_candidate_batch(
+        jd_ut_values, elapsed_seconds, latitude, longitude, gulika_deg_values,
+        ascendant_solver=ascendant_solver
+    )
+    return apply_batch_filters(batch, orb_tolerance=orb_tolerance, strict_bphs=strict_bphs)
+
 # ============================================================================
 # Vimshottari Dasha Calculation (BPHS - Dasha System)
 # ============================================================================
@@ -986,7 +1334,8 @@ def calculate_planetary_strengths(jd_ut: float,
                                   birth_dt: datetime.datetime,
                                   latitude: float,
                                   longitude: float,
-                                  tz_offset: float) -> dict[str, dict[str, float]]:
+                                  tz_offset: float,
+                                  context: Optional[ChartContext] = None) -> dict[str, dict[str, float]]:
     """Calculate comprehensive Shadbala (Six-Fold Strength) for all planets.
     
     This function delegates to the dedicated shadbala module to compute:
@@ -1007,13 +1356,15 @@ def calculate_planetary_strengths(jd_ut: float,
         latitude: Geographic latitude.
         longitude: Geographic longitude.
         tz_offset: Local time zone offset.
+        context: Shared chart context of this candidate; its sunrise/sunset
+            (or DayContext) are used when set.
         
     Returns:
         Dict with Shadbala scores (total and breakdown) for each planet.
     """
-    # Calculate sunrise/sunset for Kaala Bala (Natonnata)
-    # Use the date from birth_dt
-    sunrise, sunset = compute_sunrise_sunset(birth_dt.date(), latitude, longitude, tz_offset)
+    if context is None:
+        context = ChartContext(jd_ut, lagna_deg, planets_deg, birth_dt)
+    _resolve_sun_times(context, birth_dt, latitude, longitude, tz_offset)
     
     # Delegate to Shadbala module
     strengths = shadbala.calculate_shadbala(
@@ -1021,12 +1372,97 @@ def calculate_planetary_strengths(jd_ut: float,
         lagna_deg=lagna_deg,
         planets_deg=planets_deg,
         birth_dt=birth_dt,
-        sunrise=sunrise,
-        sunset=sunset
+        sunrise=context.sunrise,
+        sunset=context.sunset,
+        context=context
     )
     
     return strengths
 
+def _resolve_sun_times(context: ChartContext,
+                       birth_dt: datetime.datetime,
+                       latitude: float,
+                       longitude: float,
+                       tz_offset: float) -> None:
+    """Set a context's sunrise/sunset for Kaala Bala when not already known.
+
+    They come from the birth date's cached DayContext, resolved once per day
+    rather than per candidate.
+    """
+    if context.sunrise is None or context.sunset is None:
+        if context.day is None:
+            context.day = get_day_context(birth_dt.date(), latitude, longitude, tz_offset)
+        context.sunrise, context.sunset = context.day.sunrise, context.day.sunset
+
+
+def calculate_stage9_batch(contexts: Sequence[ChartContext],
+                           latitude: float,
+                           longitude: float,
+                           tz_offset: float) -> list[tuple[dict[str, dict[str, float]], dict[str, Any]]]:
+    """Shadbala and Āyurdāya of several accepted charts in one array pass.
+
+    Equal, chart for chart, to `calculate_planetary_strengths` followed by
+    `calculate_longevity_span` (see `stage9_batch`).
+
+    Args:
+        contexts: Chart contexts of the accepted times; each needs its birth
+            datetime.
+        latitude: Geographic latitude.
+        longitude: Geographic longitude.
+        tz_offset: Local time zone offset.
+
+    Returns:
+        One (shadbala, ayurdaya) pair per context.
+    """
+    for context in contexts:
+        _resolve_sun_times(context, context.birth_dt, latitude, longitude, tz_offset)
+    return stage9_batch.evaluate_contexts(contexts)
+
+
+def validate_candidate(dob: datetime.date,
+                       latitude: float,
+                       longitude: float,
+                       tz_offset: float,
+                       candidate_local: datetime.datetime,
+                       day_context: Optional[DayContext] = None) -> dict[str, Any]:
+    """Stage-9 validation of one candidate time, on demand.
+
+    Under BPHS-only ordering `search_candidate_times` validates only its
+    ``stage9_top_k`` best candidates; this computes Shadbala and Āyurdāya
+    for any other candidate of the same search.
+
+    Args:
+        dob: The date of birth (local date) the search ran for.
+        latitude: Birthplace latitude.
+        longitude: Birthplace longitude.
+        tz_offset: Time zone offset from UTC in hours.
+        candidate_local: Candidate time (local), e.g. its ``time_local`` or
+            ``padekyata_instant_local``.
+        day_context: DayContext of ``dob``; looked up when omitted.
+
+    Returns:
+        Dict with 'shadbala' and 'ayurdaya' (full results) and the
+        'shadbala_summary' / 'ayurdaya_summary' a candidate dict carries.
+    """
+    if day_context is None:
+        day_context = get_day_context(dob, latitude, longitude, tz_offset)
+    jd_ut = _datetime_to_jd_ut(candidate_local, tz_offset)
+    on_birth_date = candidate_local.date() == dob
+    context = ChartContext(
+        jd_ut, AscendantSolver(latitude, longitude, jd_ut, jd_ut).ascendant(jd_ut),
+        get_planet_positions(jd_ut), candidate_local,
+        sunrise=day_context.sunrise if on_birth_date else None,
+        sunset=day_context.sunset if on_birth_date else None,
+        day=day_context if on_birth_date else None
+    )
+    (shadbala_val, ayurdaya_val), = calculate_stage9_batch([context], latitude, longitude, tz_offset)
+    return {
+        'shadbala': shadbala_val,
+        'ayurdaya': ayurdaya_val,
+        'shadbala_summary': candidate_record.shadbala_summary(shadbala_val),
+        'ayurdaya_summary': candidate_record.ayurdaya_summary(ayurdaya_val)
+    }
+
 # ============================================================================
 # Divisional Charts (Varga Charts)
 # ============================================================================
@@ -1048,7 +1484,8 @@ def calculate_planetary_strengths(jd_ut: float,
 def calculate_longevity_span(jd_ut: float,
                                lagna_deg: float,
                                planets_deg: dict[str, float],
-                               shadbala_strengths: Optional[dict[str, dict[str, float]]] = None) -> dict[str, Any]:
+                               shadbala_strengths: Optional[dict[str, dict[str, float]]] = None,
+                               context: Optional[ChartContext] = None) -> dict[str, Any]:
     """Calculate Ayurdaya (Longevity) using Pindayu, Nisargayu, and Amsayu.
     
     Required for Stage 9 "Ultimate Validation".
@@ -1058,6 +1495,7 @@ def calculate_longevity_span(jd_ut: float,
         lagna_deg: Ascendant longitude.
         planets_deg: Planet longitudes.
         shadbala_strengths: Optional comprehensive Shadbala breakdown.
+        context: Shared chart context of this candidate.
         
     Returns:
         Dict with final longevity years and breakdown.
@@ -1070,7 +1508,9 @@ def calculate_longevity_span(jd_ut: float,
             if isinstance(data, dict)
         }
         
-    return ayurdaya.calculate_final_longevity(jd_ut, lagna_deg, planets_deg, shadbala_rupas=shadbala_summary)
+    return ayurdaya.calculate_final_longevity(
+        jd_ut, lagna_deg, planets_deg, shadbala_rupas=shadbala_summary, context=context
+    )
 
 # ============================================================================
 # Physical Traits Scoring (BPHS Chapter 2)
@@ -1447,9 +1887,23 @@ def apply_tattwa_shodhana(lagna_deg: float, gender: str) -> float:
 # Life Events Verification (BPHS Chapter 12 + Dashas)
 # ============================================================================
 
+def _strength_factor(shadbala_scores: Optional[dict[str, dict[str, float]]], planet_name: str) -> float:
+    """Strength factor (0.5 to 1.5) of a lord based on its Shadbala Rupas."""
+    if not shadbala_scores or planet_name not in shadbala_scores:
+        return 1.0
+    rupas = shadbala_scores[planet_name].get('rupa', 0.0)
+    # BPHS Standard: Average strength ~5-6 Rupas. 
+    # Factor: <4 -> 0.5, 4-5 -> 0.8, 5-7 -> 1.0, 7-8 -> 1.2, >8 -> 1.5
+    if rupas < 4.0: return 0.5
+    if rupas < 5.0: return 0.8
+    if rupas < 7.0: return 1.0
+    if rupas < 8.0: return 1.2
+    return 1.5
+
 def verify_life_events(jd_ut_birth: float, lagna_deg: float, planets: dict[str, float], 
                        events: dict[str, Any], moon_longitude: float,
-                       shadbala_scores: Optional[dict[str, dict[str, float]]] = None) -> dict[str, float]:
+                       shadbala_scores: Optional[dict[str, dict[str, float]]] = None,
+                       context: Optional[ChartContext] = None) -> dict[str, float]:
     """Verify life events using dashas, divisional charts, and planetary strength.
     
     BPHS Chapter 12: Life events timing and verification.
@@ -1462,25 +1916,21 @@ def verify_life_events(jd_ut_birth: float, lagna_deg: float, planets: dict[str,
         events: Dict with 'marriage', 'children', 'career', 'siblings', 'parents' keys.
         moon_longitude: Moon's sidereal longitude at birth.
         shadbala_scores: Optional Shadbala strength dictionary for weighting.
+        context: Shared chart context of this candidate (divisional charts are reused).
         
     Returns:
         Dict with scores (0-100) for each event category.
     """
     scores = {}
     events = events or {}
+    if context is None:
+        context = ChartContext(jd_ut_birth, lagna_deg, planets)
+    # One timeline answers every event date of this chart
+    dasha_timeline = context.memo(('dasha_timeline', jd_ut_birth, moon_longitude),
+                                  lambda: dashas.DashaTimeline(jd_ut_birth, moon_longitude))
     
-    # Helper to get strength factor (0.5 to 1.5) based on Rupas
     def _get_strength_factor(planet_name: str) -> float:
-        if not shadbala_scores or planet_name not in shadbala_scores:
-            return 1.0
-        rupas = shadbala_scores[planet_name].get('rupa', 0.0)
-        # BPHS Standard: Average strength ~5-6 Rupas. 
-        # Factor: <4 -> 0.5, 4-5 -> 0.8, 5-7 -> 1.0, 7-8 -> 1.2, >8 -> 1.5
-        if rupas < 4.0: return 0.5
-        if rupas < 5.0: return 0.8
-        if rupas < 7.0: return 1.0
-        if rupas < 8.0: return 1.2
-        return 1.5
+        return _strength_factor(shadbala_scores, planet_name)
 
     def _first_date(item: Any) -> Optional[str]:
         if isinstance(item, str):
@@ -1506,13 +1956,11 @@ def verify_life_events(jd_ut_birth: float, lagna_deg: float, planets: dict[str,
     if marriage_date_str:
         try:
             marriage_date = datetime.datetime.strptime(marriage_date_str, '%d-%m-%Y').date()
-            dasha_at_marriage = get_dasha_at_date(jd_ut_birth, marriage_date, moon_longitude)
+            dasha_at_marriage = dasha_timeline.at(marriage_date)
             
             # Calculate D-9 chart
-            d9 = calculate_divisional_chart(lagna_deg, planets, 9)
-            d9_lagna = d9['lagna']
-            d9_7th_house = (d9_lagna + 180.0) % 360.0  # 7th from lagna
-            d9_7th_sign = int(math.floor(d9_7th_house / 30.0)) % 12
+            d9_lagna_sign = context.varga_signs(9)['lagna']
+            d9_7th_sign = (d9_lagna_sign + 6) % 12  # 7th from lagna
             d9_7th_lord = astro_utils.get_sign_lord_from_index(d9_7th_sign)
             
             # Favorable dashas for marriage: Venus, Jupiter, Moon
@@ -1556,17 +2004,15 @@ def verify_life_events(jd_ut_birth: float, lagna_deg: float, planets: dict[str,
         children_dates = child_dates
         
         if children_count > 0 and children_dates:
-            d7 = calculate_divisional_chart(lagna_deg, planets, 7)
-            d7_lagna = d7['lagna']
-            d7_5th_house = (d7_lagna + 120.0) % 360.0  # 5th from lagna
-            d7_5th_sign = int(math.floor(d7_5th_house / 30.0)) % 12
+            d7_lagna_sign = context.varga_signs(7)['lagna']
+            d7_5th_sign = (d7_lagna_sign + 4) % 12  # 5th from lagna
             d7_5th_lord = astro_utils.get_sign_lord_from_index(d7_5th_sign)
             
             child_scores = []
             for child_date_str in children_dates[:children_count]:
                 try:
                     child_date = datetime.datetime.strptime(child_date_str, '%d-%m-%Y').date()
-                    dasha_at_birth = get_dasha_at_date(jd_ut_birth, child_date, moon_longitude)
+                    dasha_at_birth = dasha_timeline.at(child_date)
                     
                     md_lord = dasha_at_birth['mahadasha'].lower()
                     favorable_dashas = ['jupiter', 'moon', 'venus']
@@ -1602,19 +2048,16 @@ def verify_life_events(jd_ut_birth: float, lagna_deg: float, planets: dict[str,
             career_dates = career_dates_raw if isinstance(career_dates_raw, list) else []
         
         if career_dates:
-            d10 = calculate_divisional_chart(lagna_deg, planets, 10)
-            d10_lagna = d10['lagna']
-            d10_10th_house = d10_lagna  # 10th house = lagna in D-10 (Wait, 10th from Lagna)
-            # D-10 10th house is 270 deg from Lagna
-            d10_10th_house = (d10_lagna + 270.0) % 360.0 
-            d10_10th_sign = int(math.floor(d10_10th_house / 30.0)) % 12
+            d10_lagna_sign = context.varga_signs(10)['lagna']
+            # D-10 10th house is 9 signs from Lagna
+            d10_10th_sign = (d10_lagna_sign + 9) % 12
             d10_10th_lord = astro_utils.get_sign_lord_from_index(d10_10th_sign)
             
             career_scores = []
             for career_date_str in career_dates:
                 try:
                     career_date = datetime.datetime.strptime(career_date_str, '%d-%m-%Y').date()
-                    dasha_at_event = get_dasha_at_date(jd_ut_birth, career_date, moon_longitude)
+                    dasha_at_event = dasha_timeline.at(career_date)
                     
                     md_lord = dasha_at_event['mahadasha'].lower()
                     favorable_dashas = ['sun', 'jupiter', 'mercury', 'saturn', 'mars']
@@ -1640,10 +2083,8 @@ def verify_life_events(jd_ut_birth: float, lagna_deg: float, planets: dict[str,
     # Siblings verification (D-3 Drekkana, 3rd house)
     if 'siblings' in events and events['siblings']:
         siblings_data = events['siblings']
-        d3 = calculate_divisional_chart(lagna_deg, planets, 3)
-        d3_lagna = d3['lagna']
-        d3_3rd_house = (d3_lagna + 60.0) % 360.0 
-        d3_3rd_sign = int(math.floor(d3_3rd_house / 30.0)) % 12
+        d3_lagna_sign = context.varga_signs(3)['lagna']
+        d3_3rd_sign = (d3_lagna_sign + 2) % 12
         d3_3rd_lord = astro_utils.get_sign_lord_from_index(d3_3rd_sign)
         
         has_siblings = False
@@ -1672,7 +2113,7 @@ def verify_life_events(jd_ut_birth: float, lagna_deg: float, planets: dict[str,
                 if death_date:
                      try:
                         dd = datetime.datetime.strptime(death_date, '%d-%m-%Y').date()
-                        dasha = get_dasha_at_date(jd_ut_birth, dd, moon_longitude)
+                        dasha = dasha_timeline.at(dd)
                         md_lord = dasha['mahadasha'].lower()
                         malefic_dashas = ['saturn', 'rahu', 'ketu', 'mars']
                         base_p = 80.0 if md_lord in malefic_dashas else 50.0
@@ -1706,7 +2147,7 @@ def verify_life_events(jd_ut_birth: float, lagna_deg: float, planets: dict[str,
             for major_date in major_dates:
                 try:
                     event_date = datetime.datetime.strptime(major_date, '%d-%m-%Y').date()
-                    dasha = get_dasha_at_date(jd_ut_birth, event_date, moon_longitude)
+                    dasha = dasha_timeline.at(event_date)
                     md_lord = dasha['mahadasha'].lower()
                     benefic_dashas = ['jupiter', 'venus', 'moon', 'mercury']
                     base_score = 80.0 if md_lord in benefic_dashas else 60.0
@@ -1728,24 +2169,167 @@ def verify_life_events(jd_ut_birth: float, lagna_deg: float, planets: dict[str,
     
     return scores
 
+# Event categories, the divisional chart they read and the house (signs from its lagna) whose lord they weigh
+_EVENT_HOUSES = (('marriage', 9, 6), ('marriages', 9, 6), ('children', 7, 4), ('career', 10, 9), ('siblings', 3, 2))
+# Lowercase names of the Vimshottari lords (the keys strength factors are read under)
+_DASHA_LORD_NAMES = tuple(lord.lower() for lord in dashas.DASHA_SEQUENCE)
+
+
+class LifeEventClasses:
+    """Per-request memo of `verify_life_events` over equivalent candidates.
+
+    Event scoring depends on a candidate only through the mahadasha lord
+    running at each event date, the lords of the houses the events read in
+    D-3, D-7, D-9 and D-10, and the Shadbala strength factors of those lords
+    (and of Mars for siblings).  Across a search window these change rarely:
+    the Moon moves about 3° in six hours, so long runs of candidates share
+    every event's mahadasha.  Candidates are keyed by those discrete inputs
+    and each key (equivalence class) is scored once; later members get a
+    copy of its scores.
+
+    Event dates are parsed once per request.  Every string in the events
+    that parses as a date is included, a superset of the dates scoring
+    reads, so equal keys always mean equal scores.
+
+    Args:
+        events: The request's life events (as for `verify_life_events`).
+    """
+
+    def __init__(self, events: Optional[dict[str, Any]]):
+        self.events = events or {}
+        dates = set()
+        for text in _event_strings(self.events):
+            try:
+                dates.add(datetime.datetime.strptime(text, '%d-%m-%Y').date())
+            except ValueError:
+                continue
+        self._event_jds = [swe.julday(d.year, d.month, d.day, 0.0) for d in sorted(dates)]
+        self._houses = tuple(sorted({(division, house) for name, division, house in _EVENT_HOUSES
+                                     if self.events.get(name)}))
+        self._weighs_mars = bool(self.events.get('siblings'))
+        self._scores: dict[tuple, dict[str, float]] = {}
+        self.candidates = 0
+
+    def __len__(self) -> int:
+        """Number of equivalence classes scored so far."""
+        return len(self._scores)
+
+    def key(self, jd_ut_birth: float, moon_longitude: float,
+            shadbala_scores: Optional[dict[str, dict[str, float]]],
+            context: ChartContext) -> tuple:
+        """Equivalence class of a candidate."""
+        mahadashas: tuple[str, ...] = ()
+        if self._event_jds:
+            timeline = context.memo(('dasha_timeline', jd_ut_birth, moon_longitude),
+                                    lambda: dashas.DashaTimeline(jd_ut_birth, moon_longitude))
+            mahadashas = tuple(_DASHA_LORD_NAMES[lord] for lord in timeline.mahadashas(self._event_jds))
+        house_lords = tuple(
+            astro_utils.get_sign_lord_from_index(context.varga_signs(division)['lagna'] + house)
+            for division, house in self._houses
+        )
+        weighed = {*mahadashas, *house_lords, *(('mars',) if self._weighs_mars else ())}
+        factors = tuple(_strength_factor(shadbala_scores, lord) for lord in sorted(weighed))
+        return mahadashas, house_lords, factors
+
+    def verify(self, jd_ut_birth: float, lagna_deg: float, planets: dict[str, float], moon_longitude: float,
+               shadbala_scores: Optional[dict[str, dict[str, float]]] = None,
+               context: Optional[ChartContext] = None) -> dict[str, float]:
+        """`verify_life_events` for this request's events, scored once per class."""
+        if context is None:
+            context = ChartContext(jd_ut_birth, lagna_deg, planets)
+        self.candidates += 1
+        key = self.key(jd_ut_birth, moon_longitude, shadbala_scores, context)
+        scores = self._scores.get(key)
+        if scores is None:
+            scores = self._scores[key] = verify_life_events(
+                jd_ut_birth, lagna_deg, planets, self.events, moon_longitude,
+                shadbala_scores=shadbala_scores, context=context
+            )
+        return dict(scores)
+
+
+def _event_strings(value: Any) -> Iterator[str]:
+    """Every string nested anywhere in a life-events structure."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _event_strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _event_strings(item)
+
+
+def find_padekyata_instants(window_start_dt: datetime.datetime,
+                            window_end_dt: datetime.datetime,
+                            sunrise_local: datetime.datetime,
+                            tz_offset: float,
+                            latitude: float,
+                            longitude: float,
+                            ascendant_solver: Optional[AscendantSolver] = None) -> list[datetime.datetime]:
+    """Every instant in a window where lagna equals Sphuṭa Prāṇa-pada (BPHS 4.6).
+
+    The wrapped difference lagna − Sphuṭa Prāṇa-pada is bracketed on a coarse
+    grid and each crossing is refined with Brent's method (see
+    `padekyata.find_roots`), so the returned times are exact to well under
+    one vipala rather than snapped to the palā grid.
+
+    Args:
+        window_start_dt: Window start (local naive datetime).
+        window_end_dt: Window end (local naive datetime).
+        sunrise_local: Sunrise used for Ishta-kāla.
+        tz_offset: Time zone offset from UTC in hours.
+        latitude: Birthplace latitude.
+        longitude: Birthplace longitude.
+        ascendant_solver: Closed-form ascendant solver for this location
+            (built for the window when omitted)
+
+    Returns:
+        list[datetime.datetime]: Sorted local padekyatā instants.
+    """
+    if window_end_dt < window_start_dt:
+        return []
+    jd_start = _datetime_to_jd_ut(window_start_dt, tz_offset)
+    if ascendant_solver is None:
+        ascendant_solver = AscendantSolver(
+            latitude, longitude, jd_start, _datetime_to_jd_ut(window_end_dt, tz_offset)
+        )
+    seconds_from_sunrise = (window_start_dt - sunrise_local).total_seconds()
+    service = ephemeris.get_service()
+
+    def delta_array(t: np.ndarray) -> np.ndarray:
+        jd = jd_start + t / 86400.0
+        lagna = ascendant_solver.ascendant_array(jd)
+        sun = service.sidereal_positions_array(jd)['sun']
+        _, _, total_palas = batch_eval.ishta_kala_arrays(seconds_from_sunrise + t)
+        sphuta = batch_eval.sphuta_pranapada_array(total_palas, sun)
+        return padekyata.wrap_degrees(lagna - sphuta)
+
+    roots = padekyata.find_roots(delta_array, 0.0, (window_end_dt - window_start_dt).total_seconds())
+    return [window_start_dt + datetime.timedelta(seconds=root) for root in roots]
+
 def palashodhana_search(candidate_record: dict[str, Any], 
                         dob: datetime.date,
                         latitude: float,
                         longitude: float,
                         tz_offset: float,
-                        sunrise_local: datetime.datetime,
-                        gulika_info: dict[str, float],
+                        sunrise_local: Optional[datetime.datetime],
+                        gulika_info: Optional[dict[str, float]],
                         optional_traits: Optional[dict[str, str]] = None,
                         optional_events: Optional[dict[str, Any]] = None,
                         max_palas: int = PALA_LEVEL_SHODHANA_PALAS,
                         strict_palā_precision: bool = True,
                         window_start_dt: Optional[datetime.datetime] = None,
-                        window_end_dt: Optional[datetime.datetime] = None) -> dict[str, Any]:
-    """Perform enhanced palā-by-palā śodhana with binary search optimization.
+                        window_end_dt: Optional[datetime.datetime] = None,
+                        ascendant_solver: Optional[AscendantSolver] = None,
+                        day_context: Optional[DayContext] = None,
+                        cancel_token: Optional[CancellationToken] = None) -> dict[str, Any]:
+    """Perform palā-level śodhana by solving for exact padekyatā instants.
     
     BPHS 4.6 suggests palā-level precision for लग्नांशप्राणांशपदैक्यता (degree equality).
-    This function uses a hybrid approach: initial binary search to find optimal range,
-    then fine-grained linear search within that range at 24-second resolution.
+    Rather than scanning palā by palā, this function finds every instant within
+    ±max_palas where lagna equals Sphuṭa Prāṇa-pada (`find_padekyata_instants`)
+    and returns the nearest one that passes the strict BPHS filters.
     
     Args:
         candidate_record: Original candidate record that failed or needs refinement
@@ -1753,16 +2337,31 @@ def palashodhana_search(candidate_record: dict[str, Any],
         latitude: Birthplace latitude  
         longitude: Birthplace longitude
         tz_offset: Time zone offset from UTC in hours
-        sunrise_local: Sunrise time for the date
-        gulika_info: Precomputed gulika information
+        sunrise_local: Sunrise time for the date (from ``day_context`` when None)
+        gulika_info: Precomputed gulika information (from ``day_context`` when None)
         optional_traits: Optional physical traits dict
         optional_events: Optional life events dict
         max_palas: Maximum palas to search in each direction (default: 720 = full day)
         strict_palā_precision: Whether to use strict 0.2° tolerance or 2° tolerance
+        ascendant_solver: Closed-form ascendant solver for this location
+            (built for the ±max_palas span when omitted)
+        day_context: DayContext of ``dob`` (looked up in the day cache when
+            it is needed and omitted)
+        cancel_token: Checked before each root is evaluated.
         
     Returns:
         dict: Enhanced candidate record with palā-level precision analysis
+
+    Raises:
+        SearchCancelled: If ``cancel_token`` is cancelled.
     """
+    if sunrise_local is None or gulika_info is None:
+        if day_context is None:
+            day_context = get_day_context(dob, latitude, longitude, tz_offset)
+        if sunrise_local is None:
+            sunrise_local = day_context.sunrise
+        if gulika_info is None:
+            gulika_info = day_context.gulika
     base_time_str = candidate_record['time_local']
     base_lagna_deg = candidate_record['lagna_deg']
     base_sphuta_pp = candidate_record['pranapada_deg']
@@ -1775,23 +2374,27 @@ def palashodhana_search(candidate_record: dict[str, Any],
     
     # Determine tolerance based on precision mode
     tolerance_deg = STRICT_PADA_EPSILON_DEGREES if strict_palā_precision else PADA_EPSILON_DEGREES
+
+    span = datetime.timedelta(seconds=max_palas * PALA_SECONDS)
+    search_start = base_time_local - span
+    search_end = base_time_local + span
+    # IMPORTANT: Adjusted times must stay within user's requested search window
+    if window_start_dt and window_end_dt:
+        search_start = max(search_start, window_start_dt)
+        search_end = min(search_end, window_end_dt)
+
+    if ascendant_solver is None:
+        ascendant_solver = AscendantSolver(
+            latitude, longitude,
+            _datetime_to_jd_ut(base_time_local - span, tz_offset),
+            _datetime_to_jd_ut(base_time_local + span, tz_offset)
+        )
     
-    def evaluate_pala_offset(pala_offset: int) -> tuple[bool, float, Optional[dict[str, Any]]]:
+    def evaluate_instant(adjusted_time_local: datetime.datetime) -> tuple[bool, float, Optional[dict[str, Any]]]:
         """Single evaluation function for cleaner code."""
-        if pala_offset == 0:
-            return False, 999.0, None
-            
-        # Calculate adjusted time
-        adjusted_time_local = base_time_local + datetime.timedelta(seconds=pala_offset * PALA_SECONDS)
-        
-        # IMPORTANT: Check if adjusted time stays within user's requested search window
-        if window_start_dt and window_end_dt:
-            if not (window_start_dt <= adjusted_time_local <= window_end_dt):
-                return False, 999.0, None
-        
         # Re-evaluate this time with full precision
         jd_ut_val = _datetime_to_jd_ut(adjusted_time_local, tz_offset)
-        lagna_val = compute_sidereal_lagna(jd_ut_val, latitude, longitude)
+        lagna_val = ascendant_solver.ascendant(jd_ut_val)
         planets_val = get_planet_positions(jd_ut_val)
         sun_val = planets_val['sun']
         moon_val = planets_val['moon']
@@ -1812,111 +2415,72 @@ def palashodhana_search(candidate_record: dict[str, Any],
         
         if accepted_val:
             current_delta = astro_utils.angular_difference(lagna_val, sphuta_pp_val)
-            return True, current_delta, (adjusted_time_local, lagna_val, sphuta_pp_val, madhya_pp_val, scores_val)
+            return True, current_delta, (lagna_val, sphuta_pp_val, madhya_pp_val, scores_val)
         else:
             return False, 999.0, None
     
-    # Phase 1: Binary search to find promising regions
     best_candidate = candidate_record.copy()
-    best_delta = astro_utils.angular_difference(base_lagna_deg, base_sphuta_pp)
+    base_delta = astro_utils.angular_difference(base_lagna_deg, base_sphuta_pp)
+    best_delta = base_delta
     improved = False
-    promising_regions = []
-    
-    # Binary search in both directions
-    search_space = [(-max_palas, 0), (0, max_palas)]
-    
-    for left, right in search_space:
-        if left == 0:  # Skip if this is the base candidate
+
+    # Exact padekyatā instants in range, nearest to the base time first
+    instants = find_padekyata_instants(
+        search_start, search_end, sunrise_local, tz_offset, latitude, longitude,
+        ascendant_solver=ascendant_solver
+    )
+    instants.sort(key=lambda t: abs((t - base_time_local).total_seconds()))
+
+    evaluations = 0
+    for adjusted_time_local in instants:
+        if cancel_token is not None:
+            cancel_token.check()
+        evaluations += 1
+        accepted, current_delta, eval_data = evaluate_instant(adjusted_time_local)
+        if not (accepted and current_delta < best_delta):
             continue
-            
-        # Binary search over the range
-        iterations = 0
-        max_iterations = int(math.log2(abs(right - left))) + 1
-        
-        while iterations < max_iterations and (right - left) >= 4:  # Stop when range is small enough
-            mid_left = left + (right - left) // 3
-            mid_right = right - (right - left) // 3
-            
-            left_ok, left_delta, _ = evaluate_pala_offset(mid_left)
-            right_ok, right_delta, _ = evaluate_pala_offset(mid_right)
-            
-            # Choose the better half
-            if left_ok and (not right_ok or left_delta <= right_delta):
-                right = mid_right
-            elif right_ok:
-                left = mid_left
-            else:
-                break  # No candidates in this region
-                
-            iterations += 1
-        
-        # Record promising region if found
-        if iterations > 0 and (right - left) < 50:
-            promising_regions.append((left, right))
-            logger.debug(f"Found promising region: {left} to {right} palās after {iterations} iterations")
-    
-    # If no promising regions found, fall back to linear search with limited range
-    if not promising_regions:
-        promising_regions = [(-30, 0), (0, 30)]
-        logger.debug("No promising regions via binary search, using limited linear range")
-    
-    # Phase 2: Fine-grained linear search within promising regions
-    for region_left, region_right in promising_regions:
-        for pala_offset in range(region_left, region_right + 1):
-            if pala_offset == 0:
-                continue
-                
-            accepted, current_delta, eval_data = evaluate_pala_offset(pala_offset)
-            
-            if accepted and current_delta < best_delta:
-                # Early termination if we achieve very high precision
-                if current_delta < 0.05:  # Less than 0.05° = excellent alignment
-                    logger.debug(f"Early termination: Found excellent alignment at {current_delta:.3f}°")
-                
-                best_delta = current_delta
-                improved = True
-                
-                # Extract evaluation data
-                adjusted_time_local, lagna_val, sphuta_pp_val, madhya_pp_val, scores_val = eval_data
-                
-                # Create new candidate record
-                enhanced_candidate = candidate_record.copy()
-                enhanced_candidate.update({
-                    'time_local': adjusted_time_local.strftime('%Y-%m-%dT%H:%M:%S'),
-                    'lagna_deg': round(lagna_val, 2),
-                    'pranapada_deg': round(sphuta_pp_val, 2),
-                    'madhya_pranapada_deg': round(madhya_pp_val, 2),
-                    'delta_pp_deg': scores_val.get('delta_pranapada_deg', 0.0),
-                    'shodhana_delta_palas': abs(pala_offset),
-                    'shodhana_applied': True,
-                    'shodhana_mode': 'enhanced_binary',
-                    'shodhana_iterations': iterations if 'iterations' in locals() else 0,
-                    'scores': scores_val
-                })
-                
-                best_candidate = enhanced_candidate
-                
-                logger.debug(f"Enhanced Palā śodhana: offset {pala_offset:+d} palās, "
-                            f"delta {current_delta:.3f}° -> better than previous {best_delta:.3f}°")
-                
-                # Break if we achieve target tolerance
-                if current_delta <= tolerance_deg:
-                    logger.debug(f"Target tolerance achieved: {current_delta:.3f}° <= {tolerance_deg:.3f}°")
-                    break
+
+        best_delta = current_delta
+        improved = True
+        lagna_val, sphuta_pp_val, madhya_pp_val, scores_val = eval_data
+        pala_offset = (adjusted_time_local - base_time_local).total_seconds() / PALA_SECONDS
+
+        # Create new candidate record
+        enhanced_candidate = candidate_record.copy()
+        enhanced_candidate.update({
+            'time_local': adjusted_time_local.strftime('%Y-%m-%dT%H:%M:%S'),
+            'padekyata_instant_local': adjusted_time_local.isoformat(timespec='microseconds'),
+            'lagna_deg': round(lagna_val, 2),
+            'pranapada_deg': round(sphuta_pp_val, 2),
+            'madhya_pranapada_deg': round(madhya_pp_val, 2),
+            'delta_pp_deg': scores_val.get('delta_pranapada_deg', 0.0),
+            'shodhana_delta_palas': abs(int(round(pala_offset))),
+            'shodhana_applied': True,
+            'shodhana_mode': 'root_finding',
+            'shodhana_iterations': evaluations,
+            'scores': scores_val
+        })
+        best_candidate = enhanced_candidate
+
+        logger.debug(f"Enhanced Palā śodhana: offset {pala_offset:+.2f} palās, delta {current_delta:.4f}°")
+
+        # Roots are exact, so the nearest accepted one is the answer
+        if current_delta <= tolerance_deg:
+            logger.debug(f"Target tolerance achieved: {current_delta:.4f}° <= {tolerance_deg:.3f}°")
+            break
     
     if improved:
         best_candidate['shodhana_success'] = True
-        improvement_amount = (best_delta - astro_utils.angular_difference(base_lagna_deg, base_sphuta_pp))
+        improvement_amount = best_delta - base_delta
         best_candidate['overall_improvement'] = f"Delta improved by {improvement_amount:.3f}°"
         
         # Add performance metrics
-        if 'iterations' in locals():
-            best_candidate['shodhana_iterations'] = iterations
-        best_candidate['shodhana_regions_searched'] = len(promising_regions)
+        best_candidate['shodhana_iterations'] = evaluations
+        best_candidate['shodhana_regions_searched'] = len(instants)
         
         logger.info(f"Enhanced Palā-level śodhana SUCCESS: "
                     f"{best_candidate['time_local']} at {best_delta:.3f}° delta "
-                    f"(improvement: {improvement_amount:.3f}°, regions: {len(promising_regions)})")
+                    f"(improvement: {improvement_amount:.3f}°, roots: {len(instants)})")
     else:
         best_candidate['shodhana_success'] = False
         best_candidate['shodhana_result'] = "No enhanced palā-level improvement found"
@@ -1924,138 +2488,368 @@ def palashodhana_search(candidate_record: dict[str, Any],
     
     return best_candidate
 
-def search_candidate_times(dob: datetime.date,
-                           latitude: float,
-                           longitude: float,
-                           tz_offset: float,
-                           start_time_str: str,
-                           end_time_str: str,
-                           step_minutes: Optional[float] = None,
-                           step_palas: float = 1.0,
-                           strict_bphs: bool = False,
-                           orb_tolerance: float = 2.0,
-                           enable_shodhana: bool = False,
-                           max_shodhana_palas: int = 3600,
-                           bphs_only_ordering: bool = True,
-                           collect_rejections: bool = False,
-                           sunrise_local: Optional[datetime.datetime] = None,
-                           sunset_local: Optional[datetime.datetime] = None,
-                           gulika_info: Optional[dict[str, float]] = None,
-                           optional_traits: Optional[dict[str, str]] = None,
-                           optional_events: Optional[dict[str, Any]] = None
-                           ) -> list[dict[str, Any]]:
-    """Search a range of times on a given date and filter by BPHS rules.
+# Minimum grid points per shard; smaller shards spend more on setup than they save
+SHARD_MIN_GRID_POINTS = 64
+# Shards per worker, so shards with dense acceptance runs balance out
+SHARD_OVERSUBSCRIPTION = 2
+
+def _shard_count(grid_points: int, workers: int) -> int:
+    """Number of contiguous shards to split a search grid into."""
+    if workers <= 1:
+        return 1
+    return max(1, min(workers * SHARD_OVERSUBSCRIPTION, grid_points // SHARD_MIN_GRID_POINTS))
+
+class GridSearch:
+    """One `search_candidate_times` request over one search window.
+
+    Holds what the request's scan, śodhana and Stage-9 validation share:
+    the resolved day bounds and Gulika, the window's time grid and its
+    `AscendantSolver`, the `EvaluationStore`, the padekyatā instants, the
+    per-time `ChartContext` memo and the rejections filed so far.  A serial
+    search scans the whole grid with `scan_grid`; a shard worker builds its
+    own instance (see `_scan_shard`) and scans its slice.
+
+    Takes the arguments of `search_candidate_times` except ``shard_workers``.
 
     Args:
-        dob: The date of birth (local date).
-        latitude: Birthplace latitude.
-        longitude: Birthplace longitude.
-        tz_offset: Time zone offset from UTC in hours.
-        start_time_str: Starting local time ("HH:MM").
-        end_time_str: Ending local time ("HH:MM").
-        step_minutes: Step size between candidate times in minutes (optional override).
-        step_palas: Palā-based step size (1 palā = 24 seconds). Used when step_minutes is None.
-        sunrise_local: Optionally precomputed sunrise time.
-        sunset_local: Optionally precomputed sunset time.
-        gulika_info: Optionally precomputed gulika calculation dictionary.
-        optional_traits: Optional physical traits dict with 'height', 'build', 'complexion'.
-        optional_events: Optional life events dict with 'marriage', 'children', 'career'.
+        padekyata_instants: Exact padekyatā instants of the window when
+            already found (shards receive the parent's, so every shard sees
+            identical instants); found here when omitted and
+            ``enable_shodhana`` is set.
 
-    Returns:
-        list[Dict]: List of candidate dictionaries that satisfy BPHS hard rules.
+    Raises:
+        ValueError: If the step size is not positive.
     """
-    if sunrise_local is None or sunset_local is None:
-        sunrise_local, sunset_local = compute_sunrise_sunset(dob, latitude, longitude, tz_offset)
-    if gulika_info is None:
-        gulika_info = calculate_gulika(dob, latitude, longitude, tz_offset)
-    day_gulika_deg = gulika_info['day_gulika_deg']
-    night_gulika_deg = gulika_info['night_gulika_deg']
-
-    def gulika_for_time(dt: datetime.datetime) -> float:
+
+    def __init__(self,
+                 dob: datetime.date,
+                 latitude: float,
+                 longitude: float,
+                 tz_offset: float,
+                 start_time_str: str,
+                 end_time_str: str,
+                 step_minutes: Optional[float] = None,
+                 step_palas: float = 1.0,
+                 strict_bphs: bool = False,
+                 orb_tolerance: float = 2.0,
+                 enable_shodhana: bool = False,
+                 max_shodhana_palas: int = 3600,
+                 bphs_only_ordering: bool = True,
+                 collect_rejections: bool = False,
+                 sunrise_local: Optional[datetime.datetime] = None,
+                 sunset_local: Optional[datetime.datetime] = None,
+                 gulika_info: Optional[dict[str, float]] = None,
+                 optional_traits: Optional[dict[str, str]] = None,
+                 optional_events: Optional[dict[str, Any]] = None,
+                 evaluation_store: Optional[EvaluationStore] = None,
+                 day_context: Optional[DayContext] = None,
+                 rejection_aggregator: Optional[RejectionAggregator] = None,
+                 on_event: Optional[Callable[[dict[str, Any]], None]] = None,
+                 cancel_token: Optional[CancellationToken] = None,
+                 stage9_top_k: Optional[int] = None,
+                 padekyata_instants: Optional[list[datetime.datetime]] = None):
+        if day_context is None and (sunrise_local is None or sunset_local is None or gulika_info is None):
+            day_context = get_day_context(dob, latitude, longitude, tz_offset)
+        if sunrise_local is None or sunset_local is None:
+            sunrise_local, sunset_local = day_context.sunrise, day_context.sunset
+        if gulika_info is None:
+            gulika_info = day_context.gulika
+        if day_context is not None and (day_context.sunrise, day_context.sunset) != (sunrise_local, sunset_local):
+            # Explicit day bounds that disagree with the context win; drop the context
+            day_context = None
+        self.dob = dob
+        self.latitude = latitude
+        self.longitude = longitude
+        self.tz_offset = tz_offset
+        self.start_time_str = start_time_str
+        self.end_time_str = end_time_str
+        self.step_minutes = step_minutes
+        self.step_palas = step_palas
+        self.strict_bphs = strict_bphs
+        self.orb_tolerance = orb_tolerance
+        self.enable_shodhana = enable_shodhana
+        self.max_shodhana_palas = max_shodhana_palas
+        self.bphs_only_ordering = bphs_only_ordering
+        self.sunrise_local = sunrise_local
+        self.sunset_local = sunset_local
+        self.gulika_info = gulika_info
+        self.day_gulika_deg = gulika_info['day_gulika_deg']
+        self.night_gulika_deg = gulika_info['night_gulika_deg']
+        self.optional_traits = optional_traits
+        self.optional_events = optional_events
+        self.day_context = day_context
+        self.on_event = on_event
+        self.cancel_token = cancel_token
+        if evaluation_store is None:
+            evaluation_store = EvaluationStore()
+        evaluation_store.bind((dob, latitude, longitude, tz_offset, sunrise_local, sunset_local,
+                               self.day_gulika_deg, self.night_gulika_deg))
+        self.evaluation_store = evaluation_store
+
+        self.rejection_aggregator = rejection_aggregator
+        self.collect_rejections = collect_rejections or rejection_aggregator is not None
+        # Rejected steps go to the bounded aggregator when given, else to a list
+        self.rejections: Any = rejection_aggregator if rejection_aggregator is not None else []
+        # Seconds already reported through on_event (a śodhana instant can repeat a grid second)
+        self.streamed_keys: set[int] = set()
+
+        self.chart_contexts: dict[int, ChartContext] = {}
+        # Life events are scored once per equivalence class of accepted candidates
+        self.event_classes = LifeEventClasses(optional_events) if optional_events else None
+        # Ranking by BPHS score ignores Stage 9: validate only the top of the ranking
+        if stage9_top_k is None:
+            stage9_top_k = config.STAGE9_TOP_K
+        self.stage9_top_k = stage9_top_k
+        self.defer_stage9 = bphs_only_ordering and stage9_top_k > 0
+        # Grid index → its `perform_shodhana` result (also consulted by neighbours' palā steps)
+        self.root_candidates: dict[int, Optional[CandidateRecord]] = {}
+
+        start_hour, start_min = map(int, start_time_str.split(':'))
+        end_hour, end_min = map(int, end_time_str.split(':'))
+        start_dt = datetime.datetime.combine(dob, datetime.time(start_hour, start_min))
+        end_dt = datetime.datetime.combine(dob, datetime.time(end_hour, end_min))
+        wrap_midnight = False
+        if end_dt <= start_dt:
+            wrap_midnight = True
+            end_dt = end_dt + datetime.timedelta(days=1)
+        self.start_dt = start_dt
+        self.end_dt = end_dt
+
+        # Cap per-step shodhana reach to avoid redundant overlapping searches.
+        # The search step is `step_seconds`. We should not search further than half the step
+        # in each direction, otherwise we are re-evaluating the same times multiple times.
+        # 1 palā = 24 seconds.
+
+        # Calculate optimal shodhana range based on step size
+        # We want range to cover +/- (step/2) so that ranges just touch or slightly overlap
+        if step_minutes is not None:
+            step_seconds_calc = step_minutes * 60.0
+        else:
+            step_seconds_calc = step_palas * PALA_SECONDS
+
+        optimal_shodhana_palas = int(math.ceil((step_seconds_calc / 2.0) / PALA_SECONDS))
+
+        # Allow a small overlap (e.g. +1 palā) to ensure no gaps
+        optimal_shodhana_palas += 1
+
+        window_seconds = max(0.0, (end_dt - start_dt).total_seconds())
+        window_palas = int(window_seconds // PALA_SECONDS) if window_seconds else 0
+
+        # Use the smaller of: calculated optimal range, user limit, window size, or safety cap
+        self.effective_shodhana_palas = max(
+            0,
+            min(max_shodhana_palas, window_palas, MAX_RUNTIME_SHODHANA_PALAS, optimal_shodhana_palas)
+        )
+
+        if step_minutes is not None:
+            if step_minutes <= 0:
+                raise ValueError("step_minutes must be positive")
+            step_seconds = step_minutes * 60.0
+        else:
+            if step_palas <= 0:
+                raise ValueError("step_palas must be positive")
+            step_seconds = step_palas * PALA_SECONDS
+        self.total_steps = max(
+            1,
+            int(((end_dt - start_dt).total_seconds() // step_seconds) + 1)
+        )
+        logger.info(
+            "search_candidate_times | window=%s-%s wrap_midnight=%s step_seconds=%.1f total_steps=%d strict_bphs=%s shodhana=%s",
+            start_dt.isoformat(),
+            end_dt.isoformat(),
+            wrap_midnight,
+            step_seconds,
+            self.total_steps,
+            strict_bphs,
+            enable_shodhana
+        )
+        self.progress_log_interval = max(1, self.total_steps // 10)
+
+        # Evaluate the whole grid in one vectorised pass; only survivors go through
+        # the per-candidate Stage-9 / trait / event scoring.
+        self.step_delta = datetime.timedelta(seconds=step_seconds)
+        self.grid_times = [start_dt + self.step_delta * k
+                           for k in range((end_dt - start_dt) // self.step_delta + 1)]
+        self.grid_jd = [_datetime_to_jd_ut(t, tz_offset) for t in self.grid_times]
+        # One solver serves the grid, the per-step shodhana and palā-level shodhana.
+        shodhana_margin_jd = MAX_RUNTIME_SHODHANA_PALAS * PALA_SECONDS / 86400.0
+        self.ascendant_solver = AscendantSolver(
+            latitude, longitude, self.grid_jd[0] - shodhana_margin_jd, self.grid_jd[-1] + shodhana_margin_jd
+        )
+        # Exact lagna = Sphuṭa Prāṇa-pada instants for per-step śodhana
+        if padekyata_instants is None:
+            if enable_shodhana:
+                padekyata_instants = evaluation_store.instants(
+                    start_dt, end_dt,
+                    lambda: find_padekyata_instants(
+                        start_dt, end_dt, sunrise_local, tz_offset, latitude, longitude,
+                        ascendant_solver=self.ascendant_solver
+                    )
+                )
+            else:
+                padekyata_instants = []
+        self.padekyata_instants = padekyata_instants
+
+    def shard_kwargs(self) -> dict[str, Any]:
+        """Constructor arguments of this search's shard workers (see `_scan_shard`)."""
+        return {
+            'dob': self.dob, 'latitude': self.latitude, 'longitude': self.longitude, 'tz_offset': self.tz_offset,
+            'start_time_str': self.start_time_str, 'end_time_str': self.end_time_str,
+            'step_minutes': self.step_minutes, 'step_palas': self.step_palas,
+            'strict_bphs': self.strict_bphs, 'orb_tolerance': self.orb_tolerance,
+            'enable_shodhana': self.enable_shodhana, 'max_shodhana_palas': self.max_shodhana_palas,
+            'bphs_only_ordering': self.bphs_only_ordering, 'stage9_top_k': self.stage9_top_k,
+            'collect_rejections': self.collect_rejections,
+            'sunrise_local': self.sunrise_local, 'sunset_local': self.sunset_local,
+            'gulika_info': self.gulika_info,
+            'optional_traits': self.optional_traits, 'optional_events': self.optional_events,
+            'day_context': self.day_context,
+            'rejection_aggregator': (
+                self.rejection_aggregator.spawn() if self.rejection_aggregator is not None else None
+            )
+        }
+
+    def gulika_for_time(self, dt: datetime.datetime) -> float:
         """Pick day/night Gulika based on local time."""
-        return day_gulika_deg if sunrise_local <= dt <= sunset_local else night_gulika_deg
+        return self.day_gulika_deg if self.sunrise_local <= dt <= self.sunset_local else self.night_gulika_deg
 
-    def evaluate_candidate(candidate_dt: datetime.datetime, gulika_deg_value: float) -> dict[str, Any]:
-        """Compute all dependent values for a candidate time."""
-        jd_ut_val = _datetime_to_jd_ut(candidate_dt, tz_offset)
-        lagna_val = compute_sidereal_lagna(jd_ut_val, latitude, longitude)
-        planets_val = get_planet_positions(jd_ut_val)
-        sun_val = planets_val['sun']
-        moon_val = planets_val['moon']
-        saturn_val = planets_val['saturn']
+    def is_within_window(self, dt: datetime.datetime) -> bool:
+        """Check if a datetime lies inside the requested search window."""
+        return self.start_dt <= dt <= self.end_dt
+
+    def nearest_grid_index(self, dt: datetime.datetime) -> int:
+        """Index of the grid time nearest to `dt` (the later one on a tie)."""
+        return min(len(self.grid_times) - 1,
+                   max(0, math.floor((dt - self.start_dt) / self.step_delta + 0.5)))
+
+    def chart_context_for(self, candidate_dt: datetime.datetime, jd_ut_val: float, lagna_val: float,
+                          planets_val: dict[str, float]) -> ChartContext:
+        """One ChartContext per accepted time, shared by Stage 9 and event scoring."""
+        key = timestamp_key(candidate_dt)
+        context = self.chart_contexts.get(key)
+        if context is None:
+            on_birth_date = candidate_dt.date() == self.dob
+            context = self.chart_contexts[key] = ChartContext(
+                jd_ut_val, lagna_val, planets_val, candidate_dt,
+                sunrise=self.sunrise_local if on_birth_date else None,
+                sunset=self.sunset_local if on_birth_date else None,
+                day=self.day_context if on_birth_date else None
+            )
+        return context
 
-        ghatis, palas, total_palas = calculate_ishta_kala(candidate_dt, sunrise_local)
-        madhya_pp_val = calculate_madhya_pranapada(ghatis, palas)
-        sphuta_pp_val = calculate_sphuta_pranapada(total_palas, sun_val)
-        special_lagnas_val = calculate_special_lagnas((ghatis, palas, total_palas), sun_val, lagna_val)
-        nisheka_val = calculate_nisheka_lagna(saturn_val, gulika_deg_value, lagna_val)
+    def stage9_for(self, candidate_dt: datetime.datetime, jd_ut_val: float, lagna_val: float,
+                   planets_val: dict[str, float]) -> tuple[Any, Any]:
+        """Shadbala and Āyurdāya for an accepted time (memoized per request)."""
+        def compute() -> tuple[Any, Any]:
+            context = self.chart_context_for(candidate_dt, jd_ut_val, lagna_val, planets_val)
+            shadbala_val = calculate_planetary_strengths(
+                jd_ut_val, lagna_val, planets_val, candidate_dt, self.latitude, self.longitude, self.tz_offset,
+                context=context
+            )
+            ayurdaya_val = calculate_longevity_span(
+                jd_ut_val, lagna_val, planets_val, shadbala_strengths=shadbala_val, context=context
+            )
+            return shadbala_val, ayurdaya_val
+        return self.evaluation_store.stage9(timestamp_key(candidate_dt), compute)
+
+    def stage9_for_grid(self, batch: dict[str, Any], lo: int, positions: Sequence[int]) -> None:
+        """Stage 9 of several accepted grid times in one batch, memoized like `stage9_for`."""
+        def compute(missing: list[int]) -> list[tuple[Any, Any]]:
+            contexts = []
+            for pos in (positions[i] for i in missing):
+                index = lo + pos
+                contexts.append(self.chart_context_for(
+                    self.grid_times[index], self.grid_jd[index], float(batch['lagna_deg'][pos]),
+                    {name: float(values[pos]) for name, values in batch['planets'].items()}
+                ))
+            return calculate_stage9_batch(contexts, self.latitude, self.longitude, self.tz_offset)
+        self.evaluation_store.stage9_many(
+            [timestamp_key(self.grid_times[lo + pos]) for pos in positions], compute
+        )
 
-        accepted_val, scores_val = apply_bphs_hard_filters(
-            lagna_val, sphuta_pp_val, gulika_deg_value, moon_val,
-            madhya_pranapada_deg=madhya_pp_val,
-            orb_tolerance=orb_tolerance,
-            strict_bphs=strict_bphs,
-            total_palas=total_palas
+    def evaluate_candidate(self, candidate_dt: datetime.datetime, gulika_deg_value: float,
+                           with_stage9: bool = True) -> dict[str, Any]:
+        """Compute all dependent values for a candidate time."""
+        def compute_raw() -> dict[str, Any]:
+            jd_ut_val = _datetime_to_jd_ut(candidate_dt, self.tz_offset)
+            lagna_val = self.ascendant_solver.ascendant(jd_ut_val)
+            planets_val = get_planet_positions(jd_ut_val)
+            ghatis, palas, total_palas = calculate_ishta_kala(candidate_dt, self.sunrise_local)
+            madhya_pp_val = calculate_madhya_pranapada(ghatis, palas)
+            sphuta_pp_val = calculate_sphuta_pranapada(total_palas, planets_val['sun'])
+            return {
+                'jd_ut': jd_ut_val,
+                'lagna_deg': lagna_val,
+                'planets': planets_val,
+                'sun_deg': planets_val['sun'],
+                'moon_deg': planets_val['moon'],
+                'saturn_deg': planets_val['saturn'],
+                'ghatis': ghatis,
+                'palas': palas,
+                'total_palas': total_palas,
+                'madhya_pp': madhya_pp_val,
+                'sphuta_pp': sphuta_pp_val,
+                'special_lagnas': calculate_special_lagnas((ghatis, palas, total_palas), planets_val['sun'], lagna_val),
+                'nisheka': calculate_nisheka_lagna(planets_val['saturn'], gulika_deg_value, lagna_val),
+                'bphs_deltas': measure_bphs_deltas(
+                    lagna_val, sphuta_pp_val, gulika_deg_value, planets_val['moon'],
+                    madhya_pranapada_deg=madhya_pp_val,
+                    total_palas=total_palas
+                )
+            }
+
+        # Raw values and deltas are tolerance-independent; only the verdict is per pass
+        raw = dict(self.evaluation_store.point(timestamp_key(candidate_dt), compute_raw))
+        alignment_orb, padekyata_tolerance_sphuta, padekyata_tolerance_madhya = resolve_tolerances(
+            self.strict_bphs, self.orb_tolerance
         )
-        
-        # Compute Shadbala & Longevity if accepted (optimization: don't compute if rejected?)
-        # But accepted status might change if we strictly enforced Shadbala/Longevity thresholds?
-        # Currently, Stage 9 validation is post-filter.
-        
+        accepted_val, scores_val = classify_bphs_deltas(
+            raw.pop('bphs_deltas'),
+            alignment_orb=alignment_orb,
+            padekyata_tolerance_sphuta=padekyata_tolerance_sphuta,
+            padekyata_tolerance_madhya=padekyata_tolerance_madhya
+        )
+
+        # Stage 9 validation is post-filter: only accepted times need it
         shadbala_val = None
         ayurdaya_val = None
-        
-        if accepted_val:
-            # Compute Shadbala
-            shadbala_val = calculate_planetary_strengths(
-                jd_ut_val, lagna_val, planets_val, candidate_dt, latitude, longitude, tz_offset
-            )
-            
-            # Compute Ayurdaya
-            ayurdaya_val = calculate_longevity_span(jd_ut_val, lagna_val, planets_val, shadbala_strengths=shadbala_val)
+        if accepted_val and with_stage9:
+            shadbala_val, ayurdaya_val = self.stage9_for(candidate_dt, raw['jd_ut'], raw['lagna_deg'], raw['planets'])
 
         return {
-            'jd_ut': jd_ut_val,
-            'lagna_deg': lagna_val,
-            'planets': planets_val,
-            'sun_deg': sun_val,
-            'moon_deg': moon_val,
-            'saturn_deg': saturn_val,
-            'ghatis': ghatis,
-            'palas': palas,
-            'total_palas': total_palas,
-            'madhya_pp': madhya_pp_val,
-            'sphuta_pp': sphuta_pp_val,
-            'special_lagnas': special_lagnas_val,
-            'nisheka': nisheka_val,
+            **raw,
             'accepted': accepted_val,
             'scores': scores_val,
             'shadbala': shadbala_val,
             'ayurdaya': ayurdaya_val
         }
 
-    def evaluate_and_score(candidate_dt: datetime.datetime) -> dict[str, Any]:
-        """Evaluate candidate and attach optional trait/event scores."""
-        gulika_deg_value = gulika_for_time(candidate_dt)
-        eval_result = evaluate_candidate(candidate_dt, gulika_deg_value)
-
+    def score_evidence(self, candidate_dt: datetime.datetime,
+                       eval_result: dict[str, Any]) -> tuple[dict[str, float], dict[str, float]]:
+        """Optional trait and life-event scores of an evaluation (events weighted by its Shadbala)."""
         traits_scores: dict[str, float] = {}
-        if optional_traits and eval_result['accepted']:
-            traits_scores = score_physical_traits(eval_result['lagna_deg'], eval_result['planets'], optional_traits)
+        if self.optional_traits and eval_result['accepted']:
+            traits_scores = score_physical_traits(eval_result['lagna_deg'], eval_result['planets'], self.optional_traits)
 
         events_scores: dict[str, float] = {}
-        if optional_events and eval_result['accepted']:
+        if self.optional_events and eval_result['accepted']:
             jd_ut_birth = eval_result['jd_ut']
             # Pass shadbala scores if available
-            events_scores = verify_life_events(
-                jd_ut_birth, 
-                eval_result['lagna_deg'], 
-                eval_result['planets'], 
-                optional_events, 
+            events_scores = self.event_classes.verify(
+                jd_ut_birth,
+                eval_result['lagna_deg'],
+                eval_result['planets'],
                 eval_result['moon_deg'],
-                shadbala_scores=eval_result['shadbala']
+                shadbala_scores=eval_result['shadbala'],
+                context=self.chart_context_for(candidate_dt, jd_ut_birth, eval_result['lagna_deg'], eval_result['planets'])
             )
+        return traits_scores, events_scores
 
+    def evaluate_and_score(self, candidate_dt: datetime.datetime, with_stage9: bool = True) -> dict[str, Any]:
+        """Evaluate candidate and attach optional trait/event scores."""
+        gulika_deg_value = self.gulika_for_time(candidate_dt)
+        eval_result = self.evaluate_candidate(candidate_dt, gulika_deg_value, with_stage9)
+        traits_scores, events_scores = self.score_evidence(candidate_dt, eval_result)
         return {
             'eval': eval_result,
             'traits_scores': traits_scores,
@@ -2063,27 +2857,28 @@ def search_candidate_times(dob: datetime.date,
             'gulika_deg': gulika_deg_value
         }
 
-    def compose_candidate_record(candidate_dt: datetime.datetime,
+    def compose_candidate_record(self,
+                                 candidate_dt: datetime.datetime,
                                  eval_result: dict[str, Any],
                                  traits_scores: dict[str, float],
                                  events_scores: dict[str, float],
                                  special_lagnas_val: dict[str, float],
                                  nisheka_val: dict[str, Any],
-                                 shodhana_delta_palas: Optional[int] = None) -> dict[str, Any]:
-        """Create the candidate payload with composite scoring."""
+                                 shodhana_delta_palas: Optional[int] = None) -> CandidateRecord:
+        """Create the candidate record with composite scoring."""
         scores = eval_result['scores']
         bphs_score = (
             (100.0 if scores['passes_trine_rule'] else 0.0) * 0.40 +
             scores['degree_match'] * 0.30 +
             scores['combined_verification'] * 0.30
         )
-        
+
         heuristic_base = (
             (traits_scores.get('overall', 0.0) if traits_scores else 0.0) * 0.40 +
             (events_scores.get('overall', 0.0) if events_scores else 0.0) * 0.40 +
             nisheka_val['gestation_score'] * 0.20
         )
-        
+
         # Enhance heuristic score with Shadbala and Longevity confidence
         # Stage 9 Validation Bonus
         validation_bonus = 0.0
@@ -2092,19 +2887,19 @@ def search_candidate_times(dob: datetime.date,
             total_rupas = sum(p['rupa'] for p in eval_result['shadbala'].values())
             avg_rupa = total_rupas / 7.0
             if avg_rupa > 6.0: validation_bonus += 5.0
-        
+
         if eval_result['ayurdaya']:
             # Plausible longevity (e.g. matches current age +)
             # Hard to score without death date. Just presence adds confidence in completeness.
             pass
-            
+
         heuristic_score = min(100.0, heuristic_base + validation_bonus)
 
         # Keep BPHS compliance primary but let real-world evidence influence ordering.
         # Penalize "One-Legged" candidates (single weak purification)
         corroboration_factor = 1.0
         purification_anchor = scores.get('purification_anchor')
-        
+
         # If only one anchor and it's not Pranapada (strongest) or direct Moon/Gulika
         # Verse 4.9 (moon_verse9) is a fallback and should ideally be corroborated.
         if purification_anchor == 'moon_verse9':
@@ -2112,325 +2907,1010 @@ def search_candidate_times(dob: datetime.date,
             has_heuristic_evidence = (heuristic_base > 30.0)
             if not has_heuristic_evidence:
                 corroboration_factor = 0.9  # Cap score at 90% max if uncorroborated
-        
+
         composite_score = ((bphs_score * 0.7) + (heuristic_score * 0.3)) * corroboration_factor
 
-        candidate_record = {
-            'time_local': candidate_dt.strftime('%Y-%m-%dT%H:%M:%S'),
-            'lagna_deg': round(eval_result['lagna_deg'], 2),
-            'pranapada_deg': round(eval_result['sphuta_pp'], 2),
-            'madhya_pranapada_deg': round(eval_result['madhya_pp'], 2),
-            'delta_pp_deg': scores['delta_pranapada_deg'],
-            'delta_madhya_pp_deg': scores.get('delta_madhya_pranapada_deg'),
-            'passes_trine_rule': scores['passes_trine_rule'],
-            'purification_anchor': scores.get('purification_anchor'),
-            'verification_scores': {
-                'degree_match': scores['degree_match'],
-                'gulika_alignment': scores['gulika_alignment'],
-                'moon_alignment': scores['moon_alignment'],
-                'combined_verification': scores['combined_verification'],
-                'passes_padekyata_sphuta': scores['passes_padekyata_sphuta'],
-                'passes_padekyata_madhya': scores['passes_padekyata_madhya']
-            },
-            'bphs_score': round(bphs_score, 2),
-            'heuristic_score': round(heuristic_score, 2),
-            'special_lagnas': {
-                'bhava_lagna': round(special_lagnas_val['bhava_lagna'], 2),
-                'hora_lagna': round(special_lagnas_val['hora_lagna'], 2),
-                'ghati_lagna': round(special_lagnas_val['ghati_lagna'], 2),
-                'varnada_lagna': round(special_lagnas_val['varnada_lagna'], 2)
-            },
+        # Raw values only; the public dict is formatted once the result set is final
+        return CandidateRecord(
+            epoch_seconds(candidate_dt),
+            eval_result['lagna_deg'],
+            eval_result['sphuta_pp'],
+            eval_result['madhya_pp'],
+            scores,
+            bphs_score,
+            heuristic_score,
+            composite_score,
+            special_lagnas_val,
+            nisheka_val,
+            shadbala=eval_result['shadbala'],
+            ayurdaya=eval_result['ayurdaya'],
+            traits_scores=traits_scores,
+            events_scores=events_scores,
+            shodhana_delta_palas=shodhana_delta_palas,
+            evaluated_at=candidate_dt,
+            # Scored without Stage 9 until `validate_records` recomposes it
+            stage9_deferred=self.defer_stage9 and eval_result['shadbala'] is None
+        )
+
+    def grid_record(self, candidate_local: datetime.datetime, eval_result: dict[str, Any]) -> CandidateRecord:
+        """Score an accepted, realistic grid time."""
+        lagna_deg = eval_result['lagna_deg']
+
+        # Calculate physical traits scores if provided
+        traits_scores = {}
+        if self.optional_traits:
+            traits_scores = score_physical_traits(lagna_deg, eval_result['planets'], self.optional_traits)
+
+        # Calculate life events scores if provided
+        events_scores = {}
+        if self.optional_events:
+            jd_ut_birth = eval_result['jd_ut']
+            events_scores = self.event_classes.verify(
+                jd_ut_birth, lagna_deg, eval_result['planets'], eval_result['moon_deg'],
+                context=self.chart_context_for(candidate_local, jd_ut_birth, lagna_deg, eval_result['planets'])
+            )
+
+        return self.compose_candidate_record(
+            candidate_local,
+            eval_result,
+            traits_scores,
+            events_scores,
+            eval_result['special_lagnas'],
+            eval_result['nisheka']
+        )
+
+    def batch_result_at(self, batch: dict[str, Any], pos: int, candidate_dt: datetime.datetime,
+                        with_stage9: bool) -> dict[str, Any]:
+        """Expand one batch element (a grid time or palā step) into the payload `evaluate_candidate` returns."""
+        jd_ut_val = float(batch['jd_ut'][pos])
+        lagna_val = float(batch['lagna_deg'][pos])
+        planets_val = {name: float(values[pos]) for name, values in batch['planets'].items()}
+        total_palas = float(batch['total_palas'][pos])
+        madhya_pp_val = float(batch['madhya_pp'][pos])
+        sphuta_pp_val = float(batch['sphuta_pp'][pos])
+        # Verdict and scores were already computed for the whole block
+        accepted_val, scores_val = batch_hard_filter_verdict(batch['filters'], pos)
+
+        shadbala_val = None
+        ayurdaya_val = None
+        if with_stage9 and accepted_val:
+            shadbala_val, ayurdaya_val = self.stage9_for(candidate_dt, jd_ut_val, lagna_val, planets_val)
+
+        nisheka_arrays = batch['nisheka']
+        return {
+            'jd_ut': jd_ut_val,
+            'lagna_deg': lagna_val,
+            'planets': planets_val,
+            'sun_deg': planets_val['sun'],
+            'moon_deg': planets_val['moon'],
+            'saturn_deg': planets_val['saturn'],
+            'ghatis': int(batch['ghatis'][pos]),
+            'palas': int(batch['palas'][pos]),
+            'total_palas': total_palas,
+            'madhya_pp': madhya_pp_val,
+            'sphuta_pp': sphuta_pp_val,
+            'special_lagnas': {name: float(values[pos]) for name, values in batch['special_lagnas'].items()},
             'nisheka': {
-                'nisheka_lagna_deg': round(nisheka_val['nisheka_lagna_deg'], 2),
-                'gestation_months': round(nisheka_val['gestation_months'], 2),
-                'is_realistic': nisheka_val['is_realistic'],
-                'gestation_score': round(nisheka_val['gestation_score'], 2)
+                'nisheka_lagna_deg': float(nisheka_arrays['nisheka_lagna_deg'][pos]),
+                'gestation_months': float(nisheka_arrays['gestation_months'][pos]),
+                'is_realistic': bool(nisheka_arrays['is_realistic'][pos]),
+                'gestation_score': float(nisheka_arrays['gestation_score'][pos])
             },
-            'composite_score': round(composite_score, 2)
+            'accepted': accepted_val,
+            'scores': scores_val,
+            'shadbala': shadbala_val,
+            'ayurdaya': ayurdaya_val
         }
-        
-        # Add Shadbala Summary
-        if eval_result['shadbala']:
-            candidate_record['shadbala_summary'] = {
-                k: v['rupa'] for k, v in eval_result['shadbala'].items()
-            }
-            
-        # Add Ayurdaya Summary
-        if eval_result['ayurdaya']:
-            candidate_record['ayurdaya_summary'] = {
-                'pindayu': eval_result['ayurdaya']['pindayu_years'],
-                'nisargayu': eval_result['ayurdaya']['nisargayu_years'],
-                'amsayu': eval_result['ayurdaya']['amsayu_years'],
-                'final': eval_result['ayurdaya']['final_longevity']
-            }
 
-        if traits_scores:
-            candidate_record['physical_traits_scores'] = {
-                k: round(v, 2) if isinstance(v, (int, float)) else v for k, v in traits_scores.items()
-            }
+    def compute_raw_for(self, times: list[datetime.datetime], jd_ut_values: list[float]) -> dict[str, Any]:
+        """Raw batch arrays of local times with their Julian Days."""
+        return compute_candidate_batch(
+            jd_ut_values,
+            [(t - self.sunrise_local).total_seconds() for t in times],
+            self.latitude,
+            self.longitude,
+            [self.gulika_for_time(t) for t in times],
+            ascendant_solver=self.ascendant_solver
+        )
 
-        if events_scores:
-            candidate_record['life_events_scores'] = {
-                k: round(v, 2) if isinstance(v, (int, float)) else v for k, v in events_scores.items()
-            }
-            candidate_record['heuristic_components'] = {
-                'traits_overall': round(traits_scores.get('overall', 0.0), 2) if traits_scores else 0.0,
-                'events_overall': round(events_scores.get('overall', 0.0), 2),
-                'gestation_score': round(nisheka_val['gestation_score'], 2)
-            }
+    def compute_grid_raw(self, indices: list[int]) -> dict[str, Any]:
+        """Raw batch arrays of the grid times at `indices`."""
+        return self.compute_raw_for([self.grid_times[i] for i in indices], [self.grid_jd[i] for i in indices])
 
-        if shodhana_delta_palas is not None:
-            candidate_record['shodhana_delta_palas'] = shodhana_delta_palas
+    def evaluate_times(self, times: list[datetime.datetime]) -> dict[str, Any]:
+        """Filtered batch of arbitrary local times (palā steps), sharing the store's raw rows."""
+        raw = self.evaluation_store.batch(
+            [timestamp_key(t) for t in times],
+            lambda positions: self.compute_raw_for(
+                [times[i] for i in positions], [_datetime_to_jd_ut(times[i], self.tz_offset) for i in positions]
+            )
+        )
+        return apply_batch_filters(raw, orb_tolerance=self.orb_tolerance, strict_bphs=self.strict_bphs)
 
-        return candidate_record
+    def perform_shodhana(self, index: int) -> Optional[CandidateRecord]:
+        """Nearest accepted padekyatā instant within the śodhana reach of a grid time.
 
-    def perform_shodhana(base_dt: datetime.datetime) -> Optional[dict[str, Any]]:
-        """Deterministic palā-by-palā shodhana search for padekyatā + trine compliance."""
-        best_candidate: Optional[dict[str, Any]] = None
-        if effective_shodhana_palas <= 0:
+        An instant refines only the grid time nearest to it, so each rejected
+        grid time still yields its own candidate (see `step_shodhana`).
+        """
+        if self.effective_shodhana_palas <= 0:
             return None
-        for delta_palas in range(1, effective_shodhana_palas + 1):
-            for direction in (-1, 1):
-                adj_dt = base_dt + datetime.timedelta(seconds=direction * delta_palas * PALA_SECONDS)
-                if not is_within_window(adj_dt):
-                    continue  # Do not return times outside user-specified window
-                adj_bundle = evaluate_and_score(adj_dt)
-                adj_eval = adj_bundle['eval']
-                if adj_eval['accepted']:
-                    best_candidate = compose_candidate_record(
-                        adj_dt,
-                        adj_eval,
-                        adj_bundle['traits_scores'],
-                        adj_bundle['events_scores'],
-                        adj_eval['special_lagnas'],
-                        adj_eval['nisheka'],
-                        shodhana_delta_palas=direction * delta_palas
-                    )
-                    break
-            if best_candidate is not None:
+        if index in self.root_candidates:
+            return self.root_candidates[index]
+        base_dt = self.grid_times[index]
+        reach = datetime.timedelta(seconds=self.effective_shodhana_palas * PALA_SECONDS)
+        lo = bisect.bisect_left(self.padekyata_instants, base_dt - reach)
+        hi = bisect.bisect_right(self.padekyata_instants, base_dt + reach)
+        # Instants come from the search window, so none escape it
+        nearby = sorted(
+            (t for t in self.padekyata_instants[lo:hi] if self.nearest_grid_index(t) == index),
+            key=lambda t: abs((t - base_dt).total_seconds())
+        )
+        best_candidate = None
+        for adj_dt in nearby:
+            adj_bundle = self.evaluate_and_score(adj_dt, not self.defer_stage9)
+            adj_eval = adj_bundle['eval']
+            if adj_eval['accepted']:
+                pala_offset = (adj_dt - base_dt).total_seconds() / PALA_SECONDS
+                best_candidate = self.compose_candidate_record(
+                    adj_dt,
+                    adj_eval,
+                    adj_bundle['traits_scores'],
+                    adj_bundle['events_scores'],
+                    adj_eval['special_lagnas'],
+                    adj_eval['nisheka'],
+                    shodhana_delta_palas=abs(int(round(pala_offset)))
+                )
+                best_candidate.instant = adj_dt
                 break
+        self.root_candidates[index] = best_candidate
         return best_candidate
 
-    start_hour, start_min = map(int, start_time_str.split(':'))
-    end_hour, end_min = map(int, end_time_str.split(':'))
-    start_dt = datetime.datetime.combine(dob, datetime.time(start_hour, start_min))
-    end_dt = datetime.datetime.combine(dob, datetime.time(end_hour, end_min))
-    wrap_midnight = False
-    if end_dt <= start_dt:
-        wrap_midnight = True
-        end_dt = end_dt + datetime.timedelta(days=1)
-
-    # Cap palā-by-palā shodhana to avoid redundant overlapping searches.
-    # The search step is `step_seconds`. We should not search further than half the step
-    # in each direction, otherwise we are re-evaluating the same times multiple times.
-    # 1 palā = 24 seconds.
-    
-    # Calculate optimal shodhana range based on step size
-    # We want range to cover +/- (step/2) so that ranges just touch or slightly overlap
-    if step_minutes is not None:
-        step_seconds_calc = step_minutes * 60.0
-    else:
-        step_seconds_calc = step_palas * PALA_SECONDS
-        
-    optimal_shodhana_palas = int(math.ceil((step_seconds_calc / 2.0) / PALA_SECONDS))
-    
-    # Allow a small overlap (e.g. +1 palā) to ensure no gaps
-    optimal_shodhana_palas += 1
-    
-    window_seconds = max(0.0, (end_dt - start_dt).total_seconds())
-    window_palas = int(window_seconds // PALA_SECONDS) if window_seconds else 0
-    
-    # Use the smaller of: calculated optimal range, user limit, window size, or safety cap
-    effective_shodhana_palas = max(
-        0,
-        min(max_shodhana_palas, window_palas, MAX_RUNTIME_SHODHANA_PALAS, optimal_shodhana_palas)
-    )
+    def pala_steps(self, indices: list[int]) -> tuple[list[datetime.datetime], dict[str, Any], dict[int, list[tuple[int, int]]]]:
+        """Palā steps within śodhana reach of the grid times at `indices`, evaluated in one batch.
+
+        Returns:
+            (step times, their filtered batch, grid index → [(palā offset,
+            batch position)] in palā-by-palā śodhana order: -1, +1, -2, +2, ...).
+        """
+        times: list[datetime.datetime] = []
+        positions: dict[int, int] = {}
+        offsets: dict[int, list[tuple[int, int]]] = {}
+        for index in indices:
+            own = offsets[index] = []
+            for delta_palas in range(1, self.effective_shodhana_palas + 1):
+                for direction in (-1, 1):
+                    adj_dt = self.grid_times[index] + datetime.timedelta(seconds=direction * delta_palas * PALA_SECONDS)
+                    if not self.is_within_window(adj_dt):
+                        continue  # Do not return times outside user-specified window
+                    key = timestamp_key(adj_dt)
+                    if key not in positions:
+                        positions[key] = len(times)
+                        times.append(adj_dt)
+                    own.append((direction * delta_palas, positions[key]))
+        return times, self.evaluate_times(times) if times else {}, offsets
+
+    def claimed_by_root(self, step_dt: datetime.datetime, index: int,
+                        grid_accepted: Callable[[int], bool]) -> bool:
+        """Whether another grid time's padekyatā root within one palā of a step is that time's candidate.
+
+        Such a step lies on the same crossing as the root, which the
+        neighbouring grid time already reports.
+        """
+        near = datetime.timedelta(seconds=PALA_SECONDS)
+        lo = bisect.bisect_left(self.padekyata_instants, step_dt - near)
+        hi = bisect.bisect_right(self.padekyata_instants, step_dt + near)
+        for other in sorted({self.nearest_grid_index(t) for t in self.padekyata_instants[lo:hi]} - {index}):
+            if grid_accepted(other):
+                continue  # The grid time itself is the candidate; its roots go unused
+            root_candidate = self.perform_shodhana(other)
+            if root_candidate is not None and abs(root_candidate.instant - step_dt) <= near:
+                return True
+        return False
+
+    def step_shodhana(self, index: int,
+                      steps: tuple[list[datetime.datetime], dict[str, Any], dict[int, list[tuple[int, int]]]],
+                      grid_accepted: Callable[[int], bool]) -> Optional[CandidateRecord]:
+        """Nearest palā step of a grid time accepted under the active tolerances.
+
+        Covers the times no padekyatā root reaches: acceptance inside the
+        padekyatā tolerance band, through Madhya Prāṇa-pada or through the
+        Gulika/Moon anchors.  Steps on a crossing a neighbouring grid time
+        reports through its root are skipped.
+        """
+        step_times, step_batch, offsets = steps
+        for offset, pos in offsets[index]:
+            if step_batch['accepted'][pos] and not self.claimed_by_root(step_times[pos], index, grid_accepted):
+                adj_dt = step_times[pos]
+                adj_eval = self.batch_result_at(step_batch, pos, adj_dt, not self.defer_stage9)
+                traits_scores, events_scores = self.score_evidence(adj_dt, adj_eval)
+                return self.compose_candidate_record(
+                    adj_dt,
+                    adj_eval,
+                    traits_scores,
+                    events_scores,
+                    adj_eval['special_lagnas'],
+                    adj_eval['nisheka'],
+                    shodhana_delta_palas=abs(offset)
+                )
+        return None
 
-    if step_minutes is not None:
-        if step_minutes <= 0:
-            raise ValueError("step_minutes must be positive")
-        step_seconds = step_minutes * 60.0
-    else:
-        if step_palas <= 0:
-            raise ValueError("step_palas must be positive")
-        step_seconds = step_palas * PALA_SECONDS
-    total_steps = max(
-        1,
-        int(((end_dt - start_dt).total_seconds() // step_seconds) + 1)
-    )
-    logger.info(
-        "search_candidate_times | window=%s-%s wrap_midnight=%s step_seconds=%.1f total_steps=%d strict_bphs=%s shodhana=%s",
-        start_dt.isoformat(),
-        end_dt.isoformat(),
-        wrap_midnight,
-        step_seconds,
-        total_steps,
-        strict_bphs,
-        enable_shodhana
-    )
-    progress_log_interval = max(1, total_steps // 10)
+    def reject(self, batch: dict[str, Any], pos: int, candidate_local: datetime.datetime,
+               unrealistic: bool = False) -> None:
+        """File the rejection of a grid time (one whose gestation fails BPHS 4.12-4.16 when ``unrealistic``)."""
+        eval_result = self.batch_result_at(batch, pos, candidate_local, with_stage9=False)
+        scores = eval_result['scores']
+        entry = {
+            'time_local': candidate_local.strftime('%Y-%m-%dT%H:%M:%S'),
+            'lagna_deg': round(eval_result['lagna_deg'], 2),
+            'pranapada_deg': round(eval_result['sphuta_pp'], 2),
+            'delta_pp_deg': scores.get('delta_pranapada_deg'),
+            'delta_madhya_pp_deg': scores.get('delta_madhya_pranapada_deg'),
+            'delta_gulika_deg': scores.get('delta_gulika_deg'),
+            'delta_moon_deg': scores.get('delta_moon_deg'),
+            'passes_trine_rule': scores.get('passes_trine_rule', False)
+        }
+        if unrealistic:
+            entry.update({
+                'passes_purification': False,
+                'non_human_classification': 'sthavara',
+                'rejection_reason': 'Unrealistic gestation (<5 or >10.5 months) per BPHS 4.12-4.16'
+            })
+        else:
+            entry.update({
+                'passes_purification': scores.get('passes_purification', False),
+                'non_human_classification': scores.get('non_human_classification'),
+                'rejection_reason': scores.get('rejection_reason')
+            })
+        if self.rejection_aggregator is not None:
+            self.rejections.add(entry)
+        else:
+            self.rejections.append(entry)
+
+    def stream_candidates(self, new_records: list[CandidateRecord]) -> None:
+        """Report candidates the first time their second is accepted."""
+        for new_record in new_records:
+            if new_record.key not in self.streamed_keys:
+                self.streamed_keys.add(new_record.key)
+                self.on_event({'event': 'candidate', 'candidate': new_record.to_dict()})
+
+    def stream_progress(self, step: int) -> None:
+        """Report how far the scan has got."""
+        self.on_event({
+            'event': 'progress',
+            'step': step,
+            'total_steps': self.total_steps,
+            'candidates': len(self.streamed_keys),
+            'rejections': len(self.rejections)
+        })
+
+    def scan_grid(self, lo: int, hi: int) -> list[CandidateRecord]:
+        """Scan grid[lo:hi]: return its candidate records in grid order, file its rejections."""
+        grid_times = self.grid_times
+        # Only timestamps no earlier pass evaluated are computed; this pass's
+        # tolerances are then applied to the stored raw values
+        raw = self.evaluation_store.batch(
+            [timestamp_key(t) for t in grid_times[lo:hi]],
+            lambda positions: self.compute_grid_raw([lo + i for i in positions])
+        )
+        batch = apply_batch_filters(raw, orb_tolerance=self.orb_tolerance, strict_bphs=self.strict_bphs)
+        if not self.defer_stage9:
+            # Stage 9 of the block's accepted, realistic times in one array pass
+            self.stage9_for_grid(batch, lo, np.flatnonzero(batch['accepted'] & batch['nisheka']['is_realistic']).tolist())
+        if self.enable_shodhana:
+            # Palā steps around every rejected grid time, evaluated together
+            steps = self.pala_steps([lo + int(pos) for pos in np.flatnonzero(~batch['accepted'])])
+
+            def grid_accepted(index: int) -> bool:
+                """Hard-filter verdict of any grid time (outside this block: from the store)."""
+                if lo <= index < hi:
+                    return bool(batch['accepted'][index - lo])
+                return bool(self.evaluate_times([grid_times[index]])['accepted'][0])
+        records: list[CandidateRecord] = []
+        for index in range(lo, hi):
+            if self.cancel_token is not None:
+                self.cancel_token.check()
+            pos = index - lo
+            candidate_local = grid_times[index]
+
+            if batch['accepted'][pos]:
+                # Reject candidates that violate BPHS conception realism (Adhyāya 4.12-4.16)
+                if not batch['nisheka']['is_realistic'][pos]:
+                    if self.collect_rejections:
+                        self.reject(batch, pos, candidate_local, unrealistic=True)
+                    continue
 
-    def is_within_window(dt: datetime.datetime) -> bool:
-        """Check if a datetime lies inside the requested search window."""
-        return start_dt <= dt <= end_dt
+                records.append(self.grid_record(
+                    candidate_local,
+                    self.batch_result_at(batch, pos, candidate_local, with_stage9=not self.defer_stage9)
+                ))
+                if self.on_event is not None:
+                    self.stream_candidates(records[-1:])
+            else:
+                if self.enable_shodhana:
+                    # Exact padekyatā roots first, then the palā steps within reach
+                    shodhana_candidate = (self.perform_shodhana(index)
+                                          or self.step_shodhana(index, steps, grid_accepted))
+                    if shodhana_candidate:
+                        records.append(shodhana_candidate)
+                        if self.on_event is not None:
+                            self.stream_candidates(records[-1:])
+                        continue
+                if self.collect_rejections:
+                    self.reject(batch, pos, candidate_local)
+            if (index + 1) % self.progress_log_interval == 0 or index == len(grid_times) - 1:
+                logger.debug(
+                    "search_candidate_times progress | step=%d/%d (%.1f%%) candidates=%d rejections=%d current=%s",
+                    index + 1,
+                    self.total_steps,
+                    ((index + 1) / self.total_steps) * 100.0,
+                    len(records),
+                    len(self.rejections),
+                    candidate_local.isoformat()
+                )
+                if self.on_event is not None:
+                    self.stream_progress(index + 1)
+        return records
+
+    def validate_records(self, ranked: list[CandidateRecord]) -> list[CandidateRecord]:
+        """Stage-9 validate deferred records, recomposed as an eager search builds them."""
+        # Batch-evaluated times (grid and palā steps) apart from śodhana instants,
+        # so each Stage-9 batch sees one graha order
+        batch_records = [record for record in ranked if record.instant is None]
+        instant_records = [record for record in ranked if record.instant is not None]
+        times_batch = self.evaluate_times([record.evaluated_at for record in batch_records]) if batch_records else {}
+        batch_evals = [self.batch_result_at(times_batch, pos, record.evaluated_at, with_stage9=False)
+                       for pos, record in enumerate(batch_records)]
+        instant_evals = [self.evaluate_candidate(record.instant, self.gulika_for_time(record.instant), with_stage9=False)
+                         for record in instant_records]
+        for group, evals in ((batch_records, batch_evals), (instant_records, instant_evals)):
+            self.evaluation_store.stage9_many(
+                [timestamp_key(record.evaluated_at) for record in group],
+                lambda missing: calculate_stage9_batch(
+                    [self.chart_context_for(group[i].evaluated_at, evals[i]['jd_ut'], evals[i]['lagna_deg'],
+                                            evals[i]['planets'])
+                     for i in missing],
+                    self.latitude, self.longitude, self.tz_offset
+                )
+            )
 
-    candidates = []
-    rejections: list[dict[str, Any]] = []
-    seen_times: set[str] = set()
-    current_dt = start_dt
-    iteration = 0
-    while current_dt <= end_dt:
-        iteration += 1
-        candidate_local = current_dt
-        gulika_deg = gulika_for_time(candidate_local)
-
-        eval_result = evaluate_candidate(candidate_local, gulika_deg)
-        accepted = eval_result['accepted']
-        scores = eval_result['scores']
-        sphuta_pp = eval_result['sphuta_pp']
-        lagna_deg = eval_result['lagna_deg']
-        special_lagnas = eval_result['special_lagnas']
-        nisheka = eval_result['nisheka']
-        
-        if accepted:
-            # Calculate physical traits scores if provided
-            traits_scores = {}
-            if optional_traits:
-                traits_scores = score_physical_traits(lagna_deg, eval_result['planets'], optional_traits)
-            
-            # Calculate life events scores if provided
-            events_scores = {}
-            if optional_events:
-                jd_ut_birth = eval_result['jd_ut']
-                events_scores = verify_life_events(jd_ut_birth, lagna_deg, eval_result['planets'], optional_events, eval_result['moon_deg'])
-            
-            # Reject candidates that violate BPHS conception realism (Adhyāya 4.12-4.16)
-            if not nisheka.get('is_realistic', False):
-                if collect_rejections:
-                    rejections.append({
-                        'time_local': candidate_local.strftime('%Y-%m-%dT%H:%M:%S'),
-                        'lagna_deg': round(lagna_deg, 2),
-                        'pranapada_deg': round(sphuta_pp, 2),
-                        'delta_pp_deg': scores.get('delta_pranapada_deg'),
-                        'delta_madhya_pp_deg': scores.get('delta_madhya_pranapada_deg'),
-                        'delta_gulika_deg': scores.get('delta_gulika_deg'),
-                        'delta_moon_deg': scores.get('delta_moon_deg'),
-                        'passes_trine_rule': scores.get('passes_trine_rule', False),
-                        'passes_purification': False,
-                        'non_human_classification': 'sthavara',
-                        'rejection_reason': 'Unrealistic gestation (<5 or >10.5 months) per BPHS 4.12-4.16'
-                    })
-                current_dt += datetime.timedelta(seconds=step_seconds)
+        validated: dict[int, CandidateRecord] = {}
+        for pos, record in enumerate(batch_records):
+            t = record.evaluated_at
+            eval_result = self.batch_result_at(times_batch, pos, t, with_stage9=True)
+            if record.shodhana_delta_palas is None:
+                validated[record.key] = self.grid_record(t, eval_result)
                 continue
-
-            candidate_record = compose_candidate_record(
-                candidate_local,
+            traits_scores, events_scores = self.score_evidence(t, eval_result)
+            validated[record.key] = self.compose_candidate_record(
+                t,
                 eval_result,
                 traits_scores,
                 events_scores,
-                special_lagnas,
-                nisheka
+                eval_result['special_lagnas'],
+                eval_result['nisheka'],
+                shodhana_delta_palas=record.shodhana_delta_palas
             )
-            time_key = candidate_record['time_local']
-            if time_key not in seen_times:
-                seen_times.add(time_key)
-                candidates.append(candidate_record)
-        else:
-            if enable_shodhana:
-                shodhana_candidate = perform_shodhana(candidate_local)
-                if shodhana_candidate:
-                    time_key = shodhana_candidate['time_local']
-                    if time_key not in seen_times:
-                        seen_times.add(time_key)
-                        candidates.append(shodhana_candidate)
-                    current_dt += datetime.timedelta(seconds=step_seconds)
-                    continue
-            if collect_rejections:
-                rejections.append({
-                    'time_local': candidate_local.strftime('%Y-%m-%dT%H:%M:%S'),
-                    'lagna_deg': round(lagna_deg, 2),
-                    'pranapada_deg': round(sphuta_pp, 2),
-                    'delta_pp_deg': scores.get('delta_pranapada_deg'),
-                    'delta_madhya_pp_deg': scores.get('delta_madhya_pranapada_deg'),
-                    'delta_gulika_deg': scores.get('delta_gulika_deg'),
-                    'delta_moon_deg': scores.get('delta_moon_deg'),
-                    'passes_trine_rule': scores.get('passes_trine_rule', False),
-                    'passes_purification': scores.get('passes_purification', False),
-                    'non_human_classification': scores.get('non_human_classification'),
-                    'rejection_reason': scores.get('rejection_reason')
-                })
-        current_dt += datetime.timedelta(seconds=step_seconds)
-        if iteration % progress_log_interval == 0 or current_dt > end_dt:
-            logger.debug(
-                "search_candidate_times progress | step=%d/%d (%.1f%%) candidates=%d rejections=%d current=%s",
-                iteration,
-                total_steps,
-                (iteration / total_steps) * 100.0,
-                len(candidates),
-                len(rejections),
-                candidate_local.isoformat()
+        for record in instant_records:
+            t = record.instant
+            bundle = self.evaluate_and_score(t, with_stage9=True)
+            validated[record.key] = self.compose_candidate_record(
+                t,
+                bundle['eval'],
+                bundle['traits_scores'],
+                bundle['events_scores'],
+                bundle['eval']['special_lagnas'],
+                bundle['eval']['nisheka'],
+                shodhana_delta_palas=record.shodhana_delta_palas
             )
-    
-    # Sort candidates by BPHS-only score when requested, else composite score.
-    key_field = 'bphs_score' if bphs_only_ordering else 'composite_score'
-    candidates.sort(key=lambda x: x.get(key_field, 0.0), reverse=True)
-    logger.info(
-        "search_candidate_times complete | candidates=%d rejections=%d iterations=%d total_steps=%d",
-        len(candidates),
-        len(rejections),
-        iteration,
-        total_steps
-    )
-    
-    # Enhanced palā-level śodhana for best candidates
-    if enable_shodhana and len(candidates) > 0 and strict_bphs:
+            validated[record.key].instant = t
+        return [validated[record.key] for record in ranked]
+
+    def rank(self, grid_records: list[CandidateRecord]) -> list[CandidateRecord]:
+        """Dedupe scanned records by second, order them and Stage-9 validate the top of the ranking."""
+        # Merge in grid order; the first occurrence of a second wins, as in a serial scan
+        records: list[CandidateRecord] = []
+        seen_keys: set[int] = set()
+        for record in grid_records:
+            if record.key not in seen_keys:
+                seen_keys.add(record.key)
+                records.append(record)
+
+        # Sort candidates by BPHS-only score when requested, else composite score.
+        key_field = 'bphs_score' if self.bphs_only_ordering else 'composite_score'
+        records.sort(key=lambda record: record.sort_score(key_field), reverse=True)
+        if self.defer_stage9:
+            # Stage 9 does not move a record in a BPHS-score ranking
+            records[:self.stage9_top_k] = self.validate_records(records[:self.stage9_top_k])
+        return records
+
+    def refine_top_candidates(self, candidates: list[dict[str, Any]]) -> None:
+        """Palā-level śodhana of the top candidates (strict mode), replacing them in place."""
         logger.info(f"Applying palā-level śodhana to top candidates (strict mode)")
-        
+
         # Apply palā-level śodhana to best candidate
         best_candidate = candidates[0]
         enhanced_best = palashodhana_search(
-            best_candidate, dob, latitude, longitude, tz_offset,
-            sunrise_local, gulika_info, optional_traits, optional_events,
+            best_candidate, self.dob, self.latitude, self.longitude, self.tz_offset,
+            self.sunrise_local, self.gulika_info, self.optional_traits, self.optional_events,
             max_palas=min(120, FULL_DAY_PALAS),  # Conservative limit for performance
             strict_palā_precision=True,
-            window_start_dt=start_dt,
-            window_end_dt=end_dt
+            window_start_dt=self.start_dt,
+            window_end_dt=self.end_dt,
+            ascendant_solver=self.ascendant_solver,
+            day_context=self.day_context,
+            cancel_token=self.cancel_token
         )
-        
+
         if enhanced_best.get('shodhana_success', False):
             # Check for duplicates before replacing candidate
             existing_times = {c['time_local'] for c in candidates}
             if enhanced_best['time_local'] not in existing_times:
                 # Replace the first candidate with enhanced version
                 candidates[0] = enhanced_best
+                if self.on_event is not None:
+                    self.on_event({'event': 'shodhana', 'rank': 0, 'candidate': enhanced_best})
                 logger.info(f"Best candidate enhanced via palā-level śodhana: "
                            f"{enhanced_best['time_local']} (delta: {enhanced_best.get('delta_pp_deg', 0):.3f}°)")
             else:
                 logger.debug(f"Shodhana produced duplicate timestamp {enhanced_best['time_local']}, skipping")
-        
+
         # Try to improve other top candidates if needed
         for i in range(1, min(3, len(candidates))):
             candidate = candidates[i]
             if candidate.get('delta_pp_deg', 999) > 0.5:  # Only improve candidates with notable delta
                 enhanced_candidate = palashodhana_search(
-                    candidate, dob, latitude, longitude, tz_offset,
-                    sunrise_local, gulika_info, optional_traits, optional_events,
+                    candidate, self.dob, self.latitude, self.longitude, self.tz_offset,
+                    self.sunrise_local, self.gulika_info, self.optional_traits, self.optional_events,
                     max_palas=60,  # Smaller range for subsequent candidates
                     strict_palā_precision=True,
-                    window_start_dt=start_dt,
-                    window_end_dt=end_dt
+                    window_start_dt=self.start_dt,
+                    window_end_dt=self.end_dt,
+                    ascendant_solver=self.ascendant_solver,
+                    day_context=self.day_context,
+                    cancel_token=self.cancel_token
                 )
                 if enhanced_candidate.get('shodhana_success', False):
                     # Check for duplicates before replacing
                     existing_times = {c['time_local'] for c in candidates}
                     if enhanced_candidate['time_local'] not in existing_times:
                         candidates[i] = enhanced_candidate
+                        if self.on_event is not None:
+                            self.on_event({'event': 'shodhana', 'rank': i, 'candidate': enhanced_candidate})
                         logger.debug(f"Candidate {i+1} enhanced via palā-level śodhana: "
                                     f"{enhanced_candidate['time_local']} "
                                     f"(delta: {enhanced_candidate.get('delta_pp_deg', 0):.3f}°)")
                     else:
                         logger.debug(f"Shodhana produced duplicate timestamp {enhanced_candidate['time_local']}, skipping")
-    
+
+def _scan_shard(search_kwargs: dict[str, Any],
+                grid_slice: tuple[int, int],
+                padekyata_instants: list[datetime.datetime],
+                evaluation_store: EvaluationStore
+                ) -> tuple[list[CandidateRecord], Any, EvaluationStore]:
+    """Process-pool entry point: scan one contiguous slice of a search grid.
+
+    Returns:
+        tuple: The slice's raw candidate records, its rejections and the
+        shard's `EvaluationStore` (for the parent to merge).
+    """
+    search = GridSearch(**search_kwargs, evaluation_store=evaluation_store,
+                        padekyata_instants=padekyata_instants)
+    return search.scan_grid(*grid_slice), search.rejections, search.evaluation_store
+
+def _scan_shards(search_kwargs: dict[str, Any],
+                 grid_times: list[datetime.datetime],
+                 shard_count: int,
+                 workers: int,
+                 padekyata_instants: list[datetime.datetime],
+                 evaluation_store: EvaluationStore,
+                 rejections: Any,
+                 on_shard: Optional[Callable[[int, list[CandidateRecord]], None]] = None,
+                 cancel_token: Optional[CancellationToken] = None
+                 ) -> list[CandidateRecord]:
+    """Scan a search grid as contiguous shards in parallel.
+
+    Each shard receives the stored rows for its slice and returns what it
+    evaluated, which is merged back into ``evaluation_store``.  Shard
+    rejections are folded into ``rejections`` (a list or a
+    `RejectionAggregator`) in grid order.  ``on_shard`` is called with the
+    grid position reached and the shard's records as each shard is merged.
+
+    Shards check a process-shared token of their own
+    (`compute_pool.shard_cancellation_token`), so any ``cancel_token`` works,
+    thread-mode ones included.  While waiting, ``cancel_token`` is polled; on
+    cancellation, or when a shard fails, the shard token is set so running
+    shards stop at their next check, shards that have not started are
+    dropped, and the error (`SearchCancelled` on cancellation) is raised.
+
+    Returns:
+        list: Every shard's candidate records, concatenated in grid order.
+    """
+    grid_points = len(grid_times)
+    bounds = [grid_points * i // shard_count for i in range(shard_count + 1)]
+    executor = compute_pool.get_shard_executor(workers)
+    shard_token = compute_pool.shard_cancellation_token()
+    shard_kwargs = {**search_kwargs, 'cancel_token': shard_token}
+    futures = []
+    for i in range(shard_count):
+        keys = [timestamp_key(t) for t in grid_times[bounds[i]:bounds[i + 1]]]
+        futures.append(executor.submit(
+            _scan_shard, shard_kwargs, (bounds[i], bounds[i + 1]), padekyata_instants,
+            evaluation_store.subset(keys)
+        ))
+    records: list[CandidateRecord] = []
+    finished = False
+    try:
+        for i, future in enumerate(futures):
+            if cancel_token is not None:
+                while True:
+                    if cancel_token.cancelled:
+                        raise SearchCancelled("Search cancelled")
+                    try:
+                        future.result(timeout=shard_token.poll_interval)
+                        break
+                    except concurrent.futures.TimeoutError:
+                        pass
+            shard_records, shard_rejections, shard_store = future.result()
+            records.extend(shard_records)
+            if isinstance(rejections, RejectionAggregator):
+                rejections.merge(shard_rejections)
+            else:
+                rejections.extend(shard_rejections)
+            evaluation_store.merge(shard_store)
+            if on_shard is not None:
+                on_shard(bounds[i + 1], shard_records)
+        finished = True
+    finally:
+        if not finished:
+            # Stop the running shards at their next check; drop those not started
+            shard_token.cancel()
+            for pending in futures:
+                pending.cancel()
+    return records
+
+def search_candidate_times(dob: datetime.date,
+                           latitude: float,
+                           longitude: float,
+                           tz_offset: float,
+                           start_time_str: str,
+                           end_time_str: str,
+                           step_minutes: Optional[float] = None,
+                           step_palas: float = 1.0,
+                           strict_bphs: bool = False,
+                           orb_tolerance: float = 2.0,
+                           enable_shodhana: bool = False,
+                           max_shodhana_palas: int = 3600,
+                           bphs_only_ordering: bool = True,
+                           collect_rejections: bool = False,
+                           sunrise_local: Optional[datetime.datetime] = None,
+                           sunset_local: Optional[datetime.datetime] = None,
+                           gulika_info: Optional[dict[str, float]] = None,
+                           optional_traits: Optional[dict[str, str]] = None,
+                           optional_events: Optional[dict[str, Any]] = None,
+                           shard_workers: Optional[int] = None,
+                           evaluation_store: Optional[EvaluationStore] = None,
+                           day_context: Optional[DayContext] = None,
+                           rejection_aggregator: Optional[RejectionAggregator] = None,
+                           on_event: Optional[Callable[[dict[str, Any]], None]] = None,
+                           cancel_token: Optional[CancellationToken] = None,
+                           stage9_top_k: Optional[int] = None
+                           ) -> list[dict[str, Any]]:
+    """Search a range of times on a given date and filter by BPHS rules.
+
+    Args:
+        dob: The date of birth (local date).
+        latitude: Birthplace latitude.
+        longitude: Birthplace longitude.
+        tz_offset: Time zone offset from UTC in hours.
+        start_time_str: Starting local time ("HH:MM").
+        end_time_str: Ending local time ("HH:MM").
+        step_minutes: Step size between candidate times in minutes (optional override).
+        step_palas: Palā-based step size (1 palā = 24 seconds). Used when step_minutes is None.
+        sunrise_local: Optionally precomputed sunrise time.
+        sunset_local: Optionally precomputed sunset time.
+        gulika_info: Optionally precomputed gulika calculation dictionary.
+        optional_traits: Optional physical traits dict with 'height', 'build', 'complexion'.
+        optional_events: Optional life events dict with 'marriage', 'children', 'career'.
+        shard_workers: Worker processes to split the grid across (defaults to
+            config.SEARCH_SHARD_WORKERS; 0 or 1 scans serially).  Sharded
+            results are identical to a serial scan.
+        evaluation_store: Store shared with earlier passes of the same request;
+            timestamps it already holds are not re-evaluated.
+        day_context: DayContext of ``dob`` (see `get_day_context`); supplies
+            sunrise, sunset and Gulika when those are not given and is handed
+            on to palā śodhana and Kaala Bala.  Looked up in the day cache
+            when omitted and anything is missing.
+        rejection_aggregator: Collect rejections into this bounded
+            `RejectionAggregator` (implies ``collect_rejections``) instead of
+            a list of one dict per rejected step.
+        on_event: Called with live event dicts while the window is scanned:
+            ``{'event': 'progress', 'step', 'total_steps', 'candidates',
+            'rejections'}``, ``{'event': 'candidate', 'candidate'}`` the
+            first time an accepted second is found (public dict shape) and
+            ``{'event': 'shodhana', 'rank', 'candidate'}`` when palā-level
+            śodhana replaces a top candidate.
+        cancel_token: Checked on every grid step, during palā-level śodhana
+            and while waiting on shards (which stop through a process-shared
+            token of their own when it is cancelled).
+        stage9_top_k: With ``bphs_only_ordering``, Stage-9 validation
+            (Shadbala and Āyurdāya) runs only for this many top-ranked
+            candidates, after ranking, and those score as in an eager
+            search.  The rest are marked ``'stage9_validated': False`` and
+            publish no Stage-9 summaries and no Stage-9-dependent scores
+            (``composite_score`` and ``heuristic_score`` are None, life-event
+            scores are left out).  Defaults to
+            config.STAGE9_TOP_K; 0 validates every accepted candidate (see
+            `validate_candidate` for the others).
+
+    Returns:
+        list[Dict]: List of candidate dictionaries that satisfy BPHS hard rules.
+        With ``collect_rejections``: a (candidates, rejections) tuple, where
+        rejections is ``rejection_aggregator`` when one was given.
+
+    Raises:
+        SearchCancelled: If ``cancel_token`` is cancelled.
+    """
+    search = GridSearch(
+        dob, latitude, longitude, tz_offset, start_time_str, end_time_str,
+        step_minutes=step_minutes, step_palas=step_palas,
+        strict_bphs=strict_bphs, orb_tolerance=orb_tolerance,
+        enable_shodhana=enable_shodhana, max_shodhana_palas=max_shodhana_palas,
+        bphs_only_ordering=bphs_only_ordering, collect_rejections=collect_rejections,
+        sunrise_local=sunrise_local, sunset_local=sunset_local, gulika_info=gulika_info,
+        optional_traits=optional_traits, optional_events=optional_events,
+        evaluation_store=evaluation_store, day_context=day_context,
+        rejection_aggregator=rejection_aggregator, on_event=on_event,
+        cancel_token=cancel_token, stage9_top_k=stage9_top_k
+    )
+
+    if shard_workers is None:
+        shard_workers = config.SEARCH_SHARD_WORKERS
+    shard_count = _shard_count(len(search.grid_times), shard_workers)
+    if shard_count > 1:
+        grid_records = _scan_shards(
+            search.shard_kwargs(),
+            search.grid_times,
+            shard_count,
+            shard_workers,
+            search.padekyata_instants,
+            search.evaluation_store,
+            search.rejections,
+            on_shard=None if on_event is None else (
+                lambda step, shard_records: (search.stream_candidates(shard_records), search.stream_progress(step))
+            ),
+            cancel_token=cancel_token
+        )
+    else:
+        grid_records = search.scan_grid(0, len(search.grid_times))
+
+    candidates = [record.to_dict() for record in search.rank(grid_records)]
+    logger.info(
+        "search_candidate_times complete | candidates=%d rejections=%d iterations=%d total_steps=%d",
+        len(candidates),
+        len(search.rejections),
+        len(search.grid_times),
+        search.total_steps
+    )
+
+    # Enhanced palā-level śodhana for best candidates
+    if enable_shodhana and len(candidates) > 0 and strict_bphs:
+        search.refine_top_candidates(candidates)
+
+    if search.collect_rejections:
+        return candidates, search.rejections
+    return candidates
+
+def search_tolerance_profiles(profiles: Sequence[str],
+                              evaluation_store: Optional[EvaluationStore] = None,
+                              rejection_aggregator: Optional[RejectionAggregator] = None,
+                              **search_kwargs: Any) -> dict[str, Any]:
+    """Run one search per tolerance profile, reusing raw evaluations.
+
+    This is sequential reuse, not a single pass: every profile runs a full
+    `search_candidate_times` (grid filters, śodhana, ranking, Stage 9).  The
+    searches share one `EvaluationStore`, so each timestamp's raw ephemeris
+    and lagna values are computed by the first profile that needs them and
+    later profiles only re-apply their thresholds to them.  Classifying
+    evaluations under several profiles at once is
+    `apply_bphs_hard_filters_profiles` / `apply_batch_filter_profiles`.
+
+    Args:
+        profiles: Names from `TOLERANCE_PROFILES`.
+        evaluation_store: Store shared by the searches (created when omitted).
+        rejection_aggregator: Template aggregator; each profile collects its
+            rejections into its own `spawn`.
+        **search_kwargs: Remaining `search_candidate_times` arguments, except
+            ``strict_bphs`` and ``orb_tolerance``.
+
+    Returns:
+        dict: Profile name → that profile's `search_candidate_times` result.
+    """
+    if evaluation_store is None:
+        evaluation_store = EvaluationStore()
+    return {
+        name: search_candidate_times(
+            evaluation_store=evaluation_store,
+            rejection_aggregator=rejection_aggregator.spawn() if rejection_aggregator is not None else None,
+            **search_kwargs,
+            **TOLERANCE_PROFILES[name]
+        )
+        for name in profiles
+    }
+
+# search_candidate_times arguments a multi-day search takes from each day's DayContext
+DAY_ARGUMENTS = ('dob', 'latitude', 'longitude', 'tz_offset', 'sunrise_local', 'sunset_local',
+                 'gulika_info', 'day_context')
+
+def search_candidate_days(day_contexts: Sequence[DayContext],
+                          start_time_str: str,
+                          end_time_str: str,
+                          bphs_only_ordering: bool = False,
+                          collect_rejections: bool = False,
+                          rejection_aggregator: Optional[RejectionAggregator] = None,
+                          evaluation_stores: Optional[dict[datetime.date, EvaluationStore]] = None,
+                          on_event: Optional[Callable[[dict[str, Any]], None]] = None,
+                          **search_kwargs: Any) -> Any:
+    """Search the same local window on several days and rank all candidates together.
+
+    Records with an uncertain date (old registrations are often off by a day
+    or two) used to need one request per date.  Here every day is scanned
+    with its own `DayContext` (sunrise, sunset, Gulika) and `EvaluationStore`
+    after sampling the ephemeris once over the whole span, so consecutive
+    days read one contiguous run of sample blocks.
+
+    Args:
+        day_contexts: One context per date to search (any order).
+        start_time_str: Window start on each day ("HH:MM").
+        end_time_str: Window end on each day ("HH:MM"); wraps past midnight
+            as in `search_candidate_times`.
+        bphs_only_ordering: Rank by BPHS score instead of composite score.
+        collect_rejections: Also return the rejections of every day.
+        rejection_aggregator: Aggregator shared by all days (implies
+            ``collect_rejections``).
+        evaluation_stores: Per-date stores, filled and reused across calls
+            (fallback passes); new stores are added for unseen dates.
+        on_event: Live event callback; each event gains a ``'date'`` key.
+        **search_kwargs: Remaining `search_candidate_times` arguments, except
+            those in ``DAY_ARGUMENTS``.
+
+    Returns:
+        Candidates of all days ranked together (ties keep date order), plus
+        the rejections when ``collect_rejections`` is set.
+    """
+    if evaluation_stores is None:
+        evaluation_stores = {}
+    if rejection_aggregator is not None:
+        collect_rejections = True
+    days = sorted(day_contexts, key=lambda context: context.date)
+    if days:
+        # One contiguous ephemeris span, through the wrap into the day after the last
+        ephemeris.get_service().prefetch(
+            _datetime_to_jd_ut(datetime.datetime.combine(days[0].date, datetime.time.min), days[0].tz_offset),
+            _datetime_to_jd_ut(
+                datetime.datetime.combine(days[-1].date + datetime.timedelta(days=2), datetime.time.min),
+                days[-1].tz_offset
+            )
+        )
+
+    candidates: list[dict[str, Any]] = []
+    rejections: list[dict[str, Any]] = []
+    for context in days:
+        day_event = None
+        if on_event is not None:
+            day_event = lambda event, date=context.date.isoformat(): on_event({**event, 'date': date})
+        found = search_candidate_times(
+            dob=context.date,
+            latitude=context.latitude,
+            longitude=context.longitude,
+            tz_offset=context.tz_offset,
+            start_time_str=start_time_str,
+            end_time_str=end_time_str,
+            bphs_only_ordering=bphs_only_ordering,
+            collect_rejections=collect_rejections,
+            sunrise_local=context.sunrise,
+            sunset_local=context.sunset,
+            gulika_info=context.gulika,
+            day_context=context,
+            evaluation_store=evaluation_stores.setdefault(context.date, EvaluationStore()),
+            rejection_aggregator=rejection_aggregator,
+            on_event=day_event,
+            **search_kwargs
+        )
+        if collect_rejections:
+            found, returned = found
+            if returned is not rejection_aggregator:
+                # A search that hands back a plain list of rejection dicts
+                if rejection_aggregator is not None:
+                    rejection_aggregator.extend(returned)
+                else:
+                    rejections.extend(returned)
+        candidates.extend(found)
+
+    key_field = 'bphs_score' if bphs_only_ordering else 'composite_score'
+    candidates.sort(key=lambda candidate: round(candidate.get(key_field) or 0.0, 2), reverse=True)
+    logger.info("search_candidate_days complete | days=%d candidates=%d", len(days), len(candidates))
     if collect_rejections:
-        return candidates, rejections
+        return candidates, rejection_aggregator if rejection_aggregator is not None else rejections
     return candidates
+
+# Window the fallback chain widens a narrowed search to
+FULL_DAY_WINDOW = ("00:00", "23:59")
+
+def search_with_fallbacks(start_time_str: str,
+                          end_time_str: str,
+                          keep_all_rejections: bool = False,
+                          on_event: Optional[Callable[[dict[str, Any]], None]] = None,
+                          evaluation_store: Optional[EvaluationStore] = None,
+                          dob_uncertainty_days: int = 0,
+                          **search_kwargs: Any) -> dict[str, Any]:
+    """Run the strict search and the API's fallback passes as one job.
+
+    1. Strict BPHS over the requested window.
+    2. If nothing passes and the window is narrower than the full day,
+       strict BPHS over 00:00–23:59.
+    3. If still nothing passes, relaxed palā tolerance (``strict_bphs=False``)
+       over the last window; the BPHS trine rule stays intact.
+
+    All passes share one `EvaluationStore`, so the widened and relaxed passes
+    evaluate only timestamps the earlier passes did not cover and re-apply
+    their own tolerances to the stored raw values.
+
+    Rejections are aggregated per pass (`RejectionAggregator`), so the result
+    stays the same size however wide the window is.
+
+    Args:
+        start_time_str: Requested window start ("HH:MM").
+        end_time_str: Requested window end ("HH:MM").
+        keep_all_rejections: Also keep every rejected record of the last
+            pass (opt-in full dump, paged by the caller).
+        on_event: Live event callback (see `search_candidate_times`); each
+            pass is announced with ``{'event': 'pass', 'window',
+            'strict_bphs', 'note'}`` before its own events.
+        evaluation_store: Store to evaluate into; a fresh one when omitted.
+            Passing the store of an earlier search with the same birth
+            context (see `search_group`) reuses its evaluations.
+        dob_uncertainty_days: Also search this many days either side of
+            ``dob``; every pass then covers all days at once
+            (`search_candidate_days`) with one store per day.
+        **search_kwargs: Remaining `search_candidate_times` arguments
+            (``strict_bphs`` and ``rejection_aggregator`` are set per pass).
+
+    Returns:
+        dict: 'candidates' of the last pass, 'rejections' (the last pass's
+        `RejectionAggregator.to_dict`), 'attempts'
+        (one summary per pass), 'window' ({'start', 'end'} of the last pass)
+        and 'strict_bphs_used'; multi-day searches add 'dates' (ISO dates
+        searched).
+    """
+    store = evaluation_store if evaluation_store is not None else EvaluationStore()
+    attempts: list[dict[str, Any]] = []
+    day_contexts: Optional[list[DayContext]] = None
+    day_stores: dict[datetime.date, EvaluationStore] = {}
+    if dob_uncertainty_days > 0:
+        dob = search_kwargs['dob']
+        nominal_context = search_kwargs.get('day_context')
+        day_contexts = [
+            nominal_context if offset == 0 and nominal_context is not None else get_day_context(
+                dob + datetime.timedelta(days=offset),
+                search_kwargs['latitude'], search_kwargs['longitude'], search_kwargs['tz_offset']
+            )
+            for offset in range(-dob_uncertainty_days, dob_uncertainty_days + 1)
+        ]
+        for name in DAY_ARGUMENTS:
+            search_kwargs.pop(name, None)
+
+    def run_pass(window_start: str, window_end: str, strict_bphs: bool,
+                 note: Optional[str] = None) -> tuple[list[dict[str, Any]], RejectionAggregator]:
+        rejected = RejectionAggregator(keep_all=keep_all_rejections)
+        if on_event is not None:
+            on_event({
+                'event': 'pass',
+                'window': {'start': window_start, 'end': window_end},
+                'strict_bphs': strict_bphs,
+                'note': note
+            })
+        pass_kwargs = dict(
+            start_time_str=window_start,
+            end_time_str=window_end,
+            strict_bphs=strict_bphs,
+            collect_rejections=True,
+            rejection_aggregator=rejected,
+            on_event=on_event,
+            **search_kwargs
+        )
+        if day_contexts is None:
+            found, returned = search_candidate_times(evaluation_store=store, **pass_kwargs)
+        else:
+            found, returned = search_candidate_days(day_contexts, evaluation_stores=day_stores, **pass_kwargs)
+        if returned is not rejected:
+            # A search that hands back a plain list of rejection dicts
+            rejected.extend(returned)
+        attempt = {
+            "window": {"start": window_start, "end": window_end},
+            "strict_bphs": strict_bphs,
+            "candidates": len(found),
+            "rejections": len(rejected)
+        }
+        if note:
+            attempt["note"] = note
+        attempts.append(attempt)
+        return found, rejected
+
+    window_start, window_end = start_time_str, end_time_str
+    strict_bphs_used = True
+    candidates, rejections = run_pass(window_start, window_end, strict_bphs=True)
+
+    # Fallback 1: widen to full-day window if the caller narrowed the search
+    if not candidates and (window_start, window_end) != FULL_DAY_WINDOW:
+        window_start, window_end = FULL_DAY_WINDOW
+        candidates, rejections = run_pass(window_start, window_end, strict_bphs=True,
+                                          note="expanded_window_full_day")
+
+    # Fallback 2: relax palā tolerance while keeping the BPHS trine rule intact
+    if not candidates:
+        candidates, rejections = run_pass(window_start, window_end, strict_bphs=False,
+                                          note="relaxed_padekyata_tolerance")
+        if candidates:
+            strict_bphs_used = False
+
+    stores = [store] if day_contexts is None else list(day_stores.values())
+    logger.info(
+        "search_with_fallbacks complete | passes=%d evaluations computed=%d reused=%d",
+        len(attempts), sum(part.computed for part in stores), sum(part.reused for part in stores)
+    )
+    result = {
+        'candidates': candidates,
+        'rejections': rejections.to_dict(),
+        'attempts': attempts,
+        'window': {'start': window_start, 'end': window_end},
+        'strict_bphs_used': strict_bphs_used
+    }
+    if day_contexts is not None:
+        result['dates'] = [context.date.isoformat() for context in day_contexts]
+    return result
+
+
+def search_group(searches: list[dict[str, Any]],
+                 day_context: Optional[DayContext] = None,
+                 cancel_token: Optional[CancellationToken] = None) -> list[dict[str, Any]]:
+    """Run several `search_with_fallbacks` jobs that share one birth context.
+
+    Subjects born on the same date at the same place (hospital cohorts,
+    families) differ only in their windows, traits and events, none of which
+    the raw evaluations depend on.  The searches therefore run back to back
+    on one `EvaluationStore`: each evaluates only the timestamps, padekyatā
+    instants and Stage-9 strengths the earlier ones did not cover.
+
+    Args:
+        searches: `search_with_fallbacks` keyword arguments, one dict per
+            subject; all must share date, place, time zone and day bounds.
+        day_context: Day context shared by every search.
+        cancel_token: Checked throughout; cancellation aborts the whole group.
+
+    Returns:
+        list: Per search, ``{'result': ...}`` with the `search_with_fallbacks`
+        output or ``{'error': message}`` if that search raised.
+
+    Raises:
+        SearchCancelled: If ``cancel_token`` is cancelled.
+    """
+    store = EvaluationStore()
+    outcomes: list[dict[str, Any]] = []
+    for search_kwargs in searches:
+        try:
+            result = search_with_fallbacks(
+                evaluation_store=store, day_context=day_context, cancel_token=cancel_token, **search_kwargs
+            )
+        except SearchCancelled:
+            raise
+        except Exception as e:
+            logger.warning("search_group item failed: %s", e)
+            outcomes.append({'error': str(e)})
+        else:
+            outcomes.append({'result': result})
+    logger.info(
+        "search_group complete | searches=%d evaluations computed=%d reused=%d",
+        len(searches), store.computed, store.reused
+    )
+    return outcomes
@@ -0,0 +1,79 @@
+"""Cooperative cancellation for long-running searches.
+
+A search submitted to the compute tier used to run to completion even after
+its HTTP request timed out or the client went away: nothing told the worker
+to stop, so abandoned rectifications kept a CPU busy.
+
+`CancellationToken` is a flag the API side sets and the search checks: once
+per grid step in `btr_core.search_candidate_times`, per root in
+`btr_core.palashodhana_search` and while waiting on window shards.  A set
+token makes `check` raise `SearchCancelled`, which unwinds the search.
+
+The flag is an event object.  A ``threading.Event`` serves thread-mode jobs;
+for worker processes the event comes from a ``multiprocessing.Manager``
+(`compute_pool.ComputePool.cancellation_token`), whose proxy pickles into
+the worker.  `check` polls the event at most every ``poll_interval``
+seconds, so checking on every step costs a clock read, not an IPC round
+trip.
+"""
+
+import threading
+import time
+from typing import Any, Optional
+
+# Default minimum seconds between polls of the underlying event
+DEFAULT_POLL_INTERVAL = 0.05
+
+
+class SearchCancelled(Exception):
+    """Raised inside a search whose cancellation token was set."""
+
+
+class CancellationToken:
+    """Cooperative cancellation flag checked by long-running searches.
+
+    Args:
+        event: Event-like object (``set``/``is_set``); a new
+            ``threading.Event`` when omitted.
+        poll_interval: Minimum seconds between polls of ``event`` in `check`.
+    """
+
+    __slots__ = ('_event', 'poll_interval', '_next_poll')
+
+    def __init__(self, event: Optional[Any] = None, poll_interval: float = DEFAULT_POLL_INTERVAL):
+        self._event = event if event is not None else threading.Event()
+        self.poll_interval = poll_interval
+        self._next_poll = 0.0
+
+    def __getstate__(self) -> tuple[Any, float]:
+        return self._event, self.poll_interval
+
+    def __setstate__(self, state: tuple[Any, float]) -> None:
+        self._event, self.poll_interval = state
+        self._next_poll = 0.0
+
+    @property
+    def shareable(self) -> bool:
+        """Whether the token can be handed to worker processes."""
+        return not isinstance(self._event, threading.Event)
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation was requested (polls the event)."""
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Request cancellation."""
+        self._event.set()
+
+    def check(self) -> None:
+        """Raise `SearchCancelled` if cancellation was requested.
+
+        The event is polled at most every ``poll_interval`` seconds.
+        """
+        now = time.monotonic()
+        if now < self._next_poll:
+            return
+        self._next_poll = now + self.poll_interval
+        if self._event.is_set():
+            raise SearchCancelled("Search cancelled")
@@ -0,0 +1,186 @@
+"""Compact internal representation of accepted candidates.
+
+The grid scan used to build the public candidate dict for every accepted
+time as soon as it was found: a ``strftime``, about twenty ``round`` calls
+and four nested dicts each, and dedup on the formatted time strings.
+Duplicates (a grid time and a śodhana instant landing on the same second)
+were then thrown away, and shard workers pickled the full nested dicts back
+to the parent.
+
+`CandidateRecord` keeps only the raw values in ``__slots__`` and an integer
+epoch-seconds key.  `search_candidate_times` dedups and orders records, and
+`CandidateRecord.to_dict` formats the public payload once, for the
+candidates actually returned.
+"""
+
+import datetime
+from typing import Any, Optional
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def epoch_seconds(dt: datetime.datetime) -> int:
+    """Whole seconds since 1970-01-01 of a local naive datetime.
+
+    Two datetimes share a key exactly when their ``%Y-%m-%dT%H:%M:%S``
+    strings are equal.
+    """
+    return (dt - _EPOCH) // datetime.timedelta(seconds=1)
+
+
+def shadbala_summary(shadbala: dict[str, dict[str, float]]) -> dict[str, float]:
+    """Public Shadbala summary: total rupas per graha."""
+    return {k: v['rupa'] for k, v in shadbala.items()}
+
+
+def ayurdaya_summary(ayurdaya: dict[str, Any]) -> dict[str, float]:
+    """Public Āyurdāya summary: the three spans and the final longevity."""
+    return {
+        'pindayu': ayurdaya['pindayu_years'],
+        'nisargayu': ayurdaya['nisargayu_years'],
+        'amsayu': ayurdaya['amsayu_years'],
+        'final': ayurdaya['final_longevity']
+    }
+
+
+class CandidateRecord:
+    """One accepted candidate, unformatted.
+
+    Attributes:
+        key: Epoch seconds of the candidate time (dedup key).
+        instant: Exact padekyatā instant when found by śodhana, else None.
+        evaluated_at: Local time that was evaluated (grid time, palā step or instant).
+        lagna_deg / sphuta_pp / madhya_pp: Raw longitudes.
+        scores: Hard-filter scores dict (`classify_bphs_deltas`).
+        bphs_score / heuristic_score / composite_score: Unrounded scores.
+        special_lagnas / nisheka: Raw special lagna and Nisheka values.
+        shadbala / ayurdaya: Stage 9 results (None when not computed).
+        traits_scores / events_scores: Optional evidence scores.
+        shodhana_delta_palas: Palā offset from the grid time (śodhana only).
+        stage9_deferred: Scored without Stage 9 (validation deferred); its
+            Stage-9-dependent scores are not published.
+    """
+
+    __slots__ = ('key', 'instant', 'evaluated_at', 'lagna_deg', 'sphuta_pp', 'madhya_pp', 'scores',
+                 'bphs_score', 'heuristic_score', 'composite_score', 'special_lagnas', 'nisheka',
+                 'shadbala', 'ayurdaya', 'traits_scores', 'events_scores', 'shodhana_delta_palas',
+                 'stage9_deferred')
+
+    def __init__(self,
+                 key: int,
+                 lagna_deg: float,
+                 sphuta_pp: float,
+                 madhya_pp: float,
+                 scores: dict[str, Any],
+                 bphs_score: float,
+                 heuristic_score: float,
+                 composite_score: float,
+                 special_lagnas: dict[str, float],
+                 nisheka: dict[str, Any],
+                 shadbala: Optional[dict[str, dict[str, float]]] = None,
+                 ayurdaya: Optional[dict[str, Any]] = None,
+                 traits_scores: Optional[dict[str, Any]] = None,
+                 events_scores: Optional[dict[str, Any]] = None,
+                 shodhana_delta_palas: Optional[int] = None,
+                 instant: Optional[datetime.datetime] = None,
+                 evaluated_at: Optional[datetime.datetime] = None,
+                 stage9_deferred: bool = False):
+        self.key = key
+        self.instant = instant
+        self.evaluated_at = evaluated_at
+        self.lagna_deg = lagna_deg
+        self.sphuta_pp = sphuta_pp
+        self.madhya_pp = madhya_pp
+        self.scores = scores
+        self.bphs_score = bphs_score
+        self.heuristic_score = heuristic_score
+        self.composite_score = composite_score
+        self.special_lagnas = special_lagnas
+        self.nisheka = nisheka
+        self.shadbala = shadbala
+        self.ayurdaya = ayurdaya
+        self.traits_scores = traits_scores
+        self.events_scores = events_scores
+        self.shodhana_delta_palas = shodhana_delta_palas
+        self.stage9_deferred = stage9_deferred
+
+    def sort_score(self, field: str) -> float:
+        """Ordering value of 'bphs_score' or 'composite_score', as published (2 dp)."""
+        return round(getattr(self, field), 2)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Public candidate payload (the shape returned by `search_candidate_times`)."""
+        scores = self.scores
+        special_lagnas = self.special_lagnas
+        nisheka = self.nisheka
+        record = {
+            'time_local': (_EPOCH + datetime.timedelta(seconds=self.key)).strftime('%Y-%m-%dT%H:%M:%S'),
+            'lagna_deg': round(self.lagna_deg, 2),
+            'pranapada_deg': round(self.sphuta_pp, 2),
+            'madhya_pranapada_deg': round(self.madhya_pp, 2),
+            'delta_pp_deg': scores['delta_pranapada_deg'],
+            'delta_madhya_pp_deg': scores.get('delta_madhya_pranapada_deg'),
+            'passes_trine_rule': scores['passes_trine_rule'],
+            'purification_anchor': scores.get('purification_anchor'),
+            'verification_scores': {
+                'degree_match': scores['degree_match'],
+                'gulika_alignment': scores['gulika_alignment'],
+                'moon_alignment': scores['moon_alignment'],
+                'combined_verification': scores['combined_verification'],
+                'passes_padekyata_sphuta': scores['passes_padekyata_sphuta'],
+                'passes_padekyata_madhya': scores['passes_padekyata_madhya']
+            },
+            'bphs_score': round(self.bphs_score, 2),
+            'heuristic_score': round(self.heuristic_score, 2),
+            'special_lagnas': {
+                'bhava_lagna': round(special_lagnas['bhava_lagna'], 2),
+                'hora_lagna': round(special_lagnas['hora_lagna'], 2),
+                'ghati_lagna': round(special_lagnas['ghati_lagna'], 2),
+                'varnada_lagna': round(special_lagnas['varnada_lagna'], 2)
+            },
+            'nisheka': {
+                'nisheka_lagna_deg': round(nisheka['nisheka_lagna_deg'], 2),
+                'gestation_months': round(nisheka['gestation_months'], 2),
+                'is_realistic': nisheka['is_realistic'],
+                'gestation_score': round(nisheka['gestation_score'], 2)
+            },
+            'composite_score': round(self.composite_score, 2)
+        }
+
+        if self.stage9_deferred:
+            # Stage 9 feeds the heuristic (validation bonus, Shadbala-weighted
+            # events), so these would not compare with validated candidates
+            record['heuristic_score'] = None
+            record['composite_score'] = None
+            record['stage9_validated'] = False
+
+        if self.shadbala:
+            record['shadbala_summary'] = shadbala_summary(self.shadbala)
+
+        if self.ayurdaya:
+            record['ayurdaya_summary'] = ayurdaya_summary(self.ayurdaya)
+
+        traits_scores = self.traits_scores
+        events_scores = self.events_scores
+        if traits_scores:
+            record['physical_traits_scores'] = {
+                k: round(v, 2) if isinstance(v, (int, float)) else v for k, v in traits_scores.items()
+            }
+
+        if events_scores and not self.stage9_deferred:
+            record['life_events_scores'] = {
+                k: round(v, 2) if isinstance(v, (int, float)) else v for k, v in events_scores.items()
+            }
+            record['heuristic_components'] = {
+                'traits_overall': round(traits_scores.get('overall', 0.0), 2) if traits_scores else 0.0,
+                'events_overall': round(events_scores.get('overall', 0.0), 2),
+                'gestation_score': round(nisheka['gestation_score'], 2)
+            }
+
+        if self.shodhana_delta_palas is not None:
+            record['shodhana_delta_palas'] = self.shodhana_delta_palas
+
+        if self.instant is not None:
+            record['padekyata_instant_local'] = self.instant.isoformat(timespec='microseconds')
+
+        return record
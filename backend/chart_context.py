@@ -0,0 +1,132 @@
+"""Per-candidate chart context shared by the Stage-9 calculations.
+
+Shadbala, Ayurdaya and life-event verification all derive from the same
+chart: divisional positions, declinations, speeds and Panchadha Maitri
+relationships.  Before this module each of them rebuilt what it needed, e.g.
+Saptavarga Bala and Sthaana Bala each built all 16 vargas and Ayana Bala ran
+once for Kaala Bala and again for Cheshta Bala.
+
+`ChartContext` is built once per candidate and computes each quantity on
+first use; every later consumer gets the memoized value.  Divisional charts
+are built per division on demand, so a consumer needing D-7, D-9 and D-10
+never pays for the other thirteen.  Consumers that only need the sign a body
+occupies in a varga (relationships, houses counted from a varga lagna) read
+`varga_signs`, answered by the memory-mapped arc-second index
+(`backend.varga_index`) when one is configured.  All functions that
+accept a ``context`` argument build a throwaway one when it is omitted, so
+their standalone behaviour is unchanged.
+"""
+
+import datetime
+from functools import cached_property
+from typing import Any, Callable, Iterable, Optional
+
+from . import ephemeris, varga_index
+from .astro_utils import compound_relationship_from_signs
+from .day_context import DayContext
+from .vargas import SHODASA_DIVISIONS, calculate_vargas
+
+
+class ChartContext:
+    """Lazily memoized chart quantities for one candidate birth time.
+
+    Args:
+        jd_ut: Julian Day (UT) of the birth.
+        lagna_deg: Sidereal ascendant longitude.
+        planets_deg: Sidereal graha longitudes.
+        birth_dt: Local birth datetime (for Kaala Bala).
+        sunrise: Local sunrise for the birth date, when already known.
+        sunset: Local sunset for the birth date, when already known.
+        day: DayContext of the birth date; supplies sunrise/sunset when
+            those are not given, and the weekday/hora lords for Kaala Bala.
+    """
+
+    def __init__(self,
+                 jd_ut: float,
+                 lagna_deg: float,
+                 planets_deg: dict[str, float],
+                 birth_dt: Optional[datetime.datetime] = None,
+                 sunrise: Optional[datetime.datetime] = None,
+                 sunset: Optional[datetime.datetime] = None,
+                 day: Optional[DayContext] = None):
+        self.jd_ut = jd_ut
+        self.lagna_deg = lagna_deg
+        self.planets_deg = planets_deg
+        self.birth_dt = birth_dt
+        self.day = day
+        self.sunrise = sunrise if sunrise is not None or day is None else day.sunrise
+        self.sunset = sunset if sunset is not None or day is None else day.sunset
+        self._memo: dict[Any, Any] = {}
+        self._vargas: dict[int, dict[str, float]] = {}
+        self._varga_signs: dict[int, dict[str, int]] = {}
+        self._relationships: dict[int, dict[str, str]] = {}
+
+    def vargas_for(self, divisions: Iterable[int]) -> dict[int, dict[str, float]]:
+        """Divisional charts by division number, building only those not yet built."""
+        divisions = tuple(divisions)
+        missing = [division for division in divisions if division not in self._vargas]
+        if missing:
+            self._vargas.update(calculate_vargas(self.lagna_deg, self.planets_deg, missing))
+        return {division: self._vargas[division] for division in divisions}
+
+    def varga(self, division: int) -> dict[str, float]:
+        """One divisional chart (see `vargas_for`)."""
+        chart = self._vargas.get(division)
+        if chart is None:
+            chart = self.vargas_for((division,))[division]
+        return chart
+
+    def varga_signs_for(self, divisions: Iterable[int]) -> dict[int, dict[str, int]]:
+        """Sign index (0=Aries) of every body in each divisional chart.
+
+        Read from the varga index when configured and covering the divisions,
+        otherwise derived from the divisional charts (`vargas_for`).
+        """
+        divisions = tuple(divisions)
+        missing = [division for division in divisions if division not in self._varga_signs]
+        if missing:
+            index = varga_index.get_index()
+            if index is not None and index.covers(missing):
+                self._varga_signs.update(index.chart_signs(self.lagna_deg, self.planets_deg, missing))
+            else:
+                for division, chart in self.vargas_for(missing).items():
+                    self._varga_signs[division] = {name: int(deg / 30.0) % 12 for name, deg in chart.items()}
+        return {division: self._varga_signs[division] for division in divisions}
+
+    def varga_signs(self, division: int) -> dict[str, int]:
+        """Signs of one divisional chart (see `varga_signs_for`)."""
+        signs = self._varga_signs.get(division)
+        if signs is None:
+            signs = self.varga_signs_for((division,))[division]
+        return signs
+
+    @property
+    def vargas(self) -> dict[str, dict[str, float]]:
+        """All 16 Shodasa Vargas keyed 'D-1' … 'D-60' (see `vargas.calculate_shodasa_vargas`)."""
+        return {f'D-{division}': chart for division, chart in self.vargas_for(SHODASA_DIVISIONS).items()}
+
+    @cached_property
+    def declinations(self) -> dict[str, float]:
+        """Equatorial declination of each graha (Ayana Bala)."""
+        return ephemeris.get_service().declinations(self.jd_ut)
+
+    @cached_property
+    def speeds(self) -> dict[str, float]:
+        """Longitude speed of each graha in degrees/day (Cheshta Bala, haranas)."""
+        return ephemeris.get_service().speeds(self.jd_ut)
+
+    def relationship(self, division: int, planet: str) -> str:
+        """Compound (Panchadha Maitri) relationship of a planet to its sign lord in a varga."""
+        chart = self._relationships.get(division)
+        if chart is None:
+            chart = self._relationships[division] = {}
+        if planet not in chart:
+            chart[planet] = compound_relationship_from_signs(planet, self.varga_signs(division))
+        return chart[planet]
+
+    def memo(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Memoize any other per-chart quantity (e.g. Ayana Bala) under a key."""
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
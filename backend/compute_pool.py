@@ -0,0 +1,298 @@
+"""Compute tier for CPU-bound BTR work.
+
+`/api/btr` is an async endpoint, but the candidate search is pure CPU work.
+Running it inside the coroutine blocks the event loop, so cheap endpoints
+(`/api/geocode`, `/api/client-log`) queue behind the slowest rectification.
+`ComputePool` moves that work off the loop:
+
+* ``config.COMPUTE_WORKERS > 0`` (the default is one per CPU) runs jobs in
+  a `ProcessPoolExecutor` of that many workers.  Each worker configures
+  Swiss Ephemeris once at start-up (`set_ephe_path`, `set_sid_mode`) and
+  keeps its sampled ephemeris warm across jobs.  Searches then hold the GIL
+  of their own process, so they cannot stall the API's tail latency.
+* ``config.COMPUTE_WORKERS == 0`` runs jobs on a thread pool in the API
+  process.  This still frees the event loop and keeps module-level patching
+  effective, so the test suite opts into it (see ``tests/conftest.py``).
+
+At most ``config.COMPUTE_MAX_PENDING`` jobs may be running or queued at once.
+Beyond that `submit` raises `ComputePoolSaturated`, which the API turns into
+a 503 with a Retry-After header instead of letting latency grow without
+bound.  `run` awaits a job with a timeout; on expiry the job is cancelled if
+it has not started yet.  `stream` runs a job that reports progress through
+an ``on_event`` callback and yields those events as they happen (a plain
+queue in thread mode, a `multiprocessing.Manager` queue in process mode).
+`cancellation_token` hands out tokens that reach the job the same way, so
+an abandoned job can be told to stop.
+
+`get_shard_executor` provides the separate process pools that
+`btr_core.search_candidate_times` uses to scan one window as parallel
+shards.  Shard jobs belong to a search that was already admitted, so they
+bypass the backpressure above and never wait behind the searches that
+spawned them.  `shard_cancellation_token` gives each sharded search a
+process-shared token, so its running shards can be stopped whatever kind
+of token the search itself was given.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Optional
+
+import swisseph as swe
+
+from . import config
+from .cancellation import CancellationToken
+
+logger = logging.getLogger("btr.compute")
+
+# Queued after a streamed job's last event (picklable for manager queues)
+_JOB_DONE = None
+# Longest a streamed job's event read blocks a helper thread (seconds)
+_EVENT_POLL_SECONDS = 0.1
+
+
+class ComputePoolSaturated(Exception):
+    """Raised when the pool already holds its maximum number of pending jobs."""
+
+
+def _init_worker(ephe_path: Optional[str]) -> None:
+    """Pool initializer: configure Swiss Ephemeris once per worker.
+
+    Runs for worker threads too: pyswisseph keeps the sidereal mode per
+    thread, so a fresh thread would otherwise use the default ayanamsa.
+    """
+    if ephe_path:
+        swe.set_ephe_path(ephe_path)
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    # Importing the core pulls in the ephemeris service and Shadbala tables
+    # before the first job arrives.
+    from . import btr_core  # noqa: F401
+
+
+class ComputePool:
+    """Bounded executor front-end for CPU-bound jobs.
+
+    Args:
+        workers: Number of worker processes; 0 runs jobs on threads in-process.
+        max_pending: Maximum jobs running or queued before rejecting new ones.
+    """
+
+    def __init__(self,
+                 workers: int = config.COMPUTE_WORKERS,
+                 max_pending: int = config.COMPUTE_MAX_PENDING):
+        self.workers = max(0, workers)
+        self.max_pending = max(1, max_pending)
+        self._executor: Optional[concurrent.futures.Executor] = None
+        self._manager: Optional[Any] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Jobs currently running or queued."""
+        return self._pending
+
+    def _get_executor(self) -> concurrent.futures.Executor:
+        """Create the executor on first use (the API may run without lifespan)."""
+        with self._lock:
+            if self._executor is None:
+                if self.workers > 0:
+                    self._executor = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        initializer=_init_worker,
+                        initargs=(config.EPHE_PATH,)
+                    )
+                else:
+                    self._executor = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=min(self.max_pending, os.cpu_count() or 1),
+                        thread_name_prefix="btr-compute",
+                        initializer=_init_worker,
+                        initargs=(config.EPHE_PATH,)
+                    )
+                logger.info(
+                    "Compute pool started | mode=%s workers=%d max_pending=%d",
+                    "process" if self.workers > 0 else "thread",
+                    self.workers,
+                    self.max_pending
+                )
+            return self._executor
+
+    def _release(self, _future: concurrent.futures.Future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> concurrent.futures.Future:
+        """Queue a job, or raise ComputePoolSaturated when the pool is full.
+
+        In process mode ``fn`` and its arguments must be picklable, so pass
+        module-level functions rather than closures.
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise ComputePoolSaturated(
+                    f"Compute pool saturated ({self._pending}/{self.max_pending} jobs pending)"
+                )
+            self._pending += 1
+        try:
+            future = self._get_executor().submit(fn, *args, **kwargs)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    async def run(self, fn: Callable[..., Any], *args: Any,
+                  timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """Run a job off the event loop and await its result.
+
+        Raises:
+            ComputePoolSaturated: If the pool is full.
+            asyncio.TimeoutError: If the job does not finish within ``timeout``.
+        """
+        future = self.submit(fn, *args, **kwargs)
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+
+    def _get_manager(self) -> Any:
+        """Manager whose proxies reach worker processes (started on first use)."""
+        with self._lock:
+            if self._manager is None:
+                self._manager = multiprocessing.Manager()
+            return self._manager
+
+    def _event_queue(self) -> Any:
+        """Queue a job can report events through from its worker."""
+        if self.workers == 0:
+            return queue.SimpleQueue()
+        return self._get_manager().Queue()
+
+    def cancellation_token(self) -> CancellationToken:
+        """Token a job of this pool can check (process-shared in process mode)."""
+        if self.workers == 0:
+            return CancellationToken()
+        return CancellationToken(self._get_manager().Event())
+
+    def stream(self, fn: Callable[..., Any], *args: Any,
+               timeout: Optional[float] = None, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
+        """Queue a job that reports events and return an iterator over them.
+
+        ``fn`` is called with an extra ``on_event`` keyword: a callable that
+        takes one picklable event dict.  Iterating yields every event in
+        order, followed by ``{'event': 'done', 'result': <return value>}``.
+
+        Raises:
+            ComputePoolSaturated: If the pool is full (raised here, before
+                any iteration).
+        """
+        events = self._event_queue()
+        future = self.submit(fn, *args, on_event=events.put, **kwargs)
+        future.add_done_callback(lambda _future: events.put(_JOB_DONE))
+        return _drain_events(events, future, timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the executor; a later submit starts a fresh one."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            manager, self._manager = self._manager, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+        if manager is not None:
+            manager.shutdown()
+
+
+async def _drain_events(events: Any, future: concurrent.futures.Future,
+                        timeout: Optional[float]) -> AsyncIterator[dict[str, Any]]:
+    """Yield a streamed job's events, then its result.
+
+    Raises:
+        asyncio.TimeoutError: If the job does not finish within ``timeout``
+            (the job is cancelled if it has not started yet).
+        Exception: Whatever the job raised, after its earlier events.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        while True:
+            # Poll in short slices so no helper thread stays blocked on the
+            # queue (and swallows a later event) once the wait is abandoned
+            wait = _EVENT_POLL_SECONDS
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                wait = min(wait, remaining)
+            try:
+                event = await asyncio.to_thread(events.get, True, wait)
+            except queue.Empty:
+                continue
+            if event is _JOB_DONE:
+                break
+            yield event
+    finally:
+        # Timed out or the consumer went away: drop the job if it has not started
+        if not future.done():
+            future.cancel()
+    yield {'event': 'done', 'result': future.result()}
+
+
+_POOL = ComputePool()
+_SHARD_EXECUTORS: dict[int, concurrent.futures.ProcessPoolExecutor] = {}
+# Manager serving the shard cancellation events (started on first use)
+_SHARD_MANAGER: Optional[Any] = None
+_SHARD_LOCK = threading.Lock()
+
+
+def get_pool() -> ComputePool:
+    """Return the process-wide compute pool."""
+    return _POOL
+
+
+def cancellation_token() -> CancellationToken:
+    """Return a new cancellation token for a job on the process-wide pool."""
+    return _POOL.cancellation_token()
+
+
+def get_shard_executor(workers: int) -> concurrent.futures.ProcessPoolExecutor:
+    """Return the process pool (created on first use) for window shards."""
+    with _SHARD_LOCK:
+        executor = _SHARD_EXECUTORS.get(workers)
+        if executor is None:
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(config.EPHE_PATH,)
+            )
+            _SHARD_EXECUTORS[workers] = executor
+            logger.info("Shard pool started | workers=%d", workers)
+        return executor
+
+
+def shard_cancellation_token() -> CancellationToken:
+    """Return a process-shared token for the shards of one search.
+
+    The searching thread's own token may be thread-local (thread mode), so
+    it sets this one for the shards when it is cancelled.
+    """
+    global _SHARD_MANAGER
+    with _SHARD_LOCK:
+        if _SHARD_MANAGER is None:
+            _SHARD_MANAGER = multiprocessing.Manager()
+        manager = _SHARD_MANAGER
+    return CancellationToken(manager.Event())
+
+
+def shutdown_shard_executors(wait: bool = True) -> None:
+    """Stop every shard pool and the shard cancellation manager."""
+    global _SHARD_MANAGER
+    with _SHARD_LOCK:
+        executors = list(_SHARD_EXECUTORS.values())
+        _SHARD_EXECUTORS.clear()
+        manager, _SHARD_MANAGER = _SHARD_MANAGER, None
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=True)
+    if manager is not None:
+        manager.shutdown()
@@ -30,6 +30,18 @@ OPENCAGE_API_KEY: Optional[str] = os.getenv('OPENCAGE_API_KEY')
 # ----------------------------------------------------------------------------
 
 EPHE_PATH: Optional[str] = os.getenv('EPHE_PATH')
+# Spacing (days) of the sampled ephemeris grid served by backend.ephemeris
+EPHEMERIS_SAMPLE_STEP_DAYS: float = float(os.getenv('EPHEMERIS_SAMPLE_STEP_DAYS', '0.125'))
+# Number of sampled one-day blocks kept in memory (LRU)
+EPHEMERIS_CACHE_BLOCKS: int = int(os.getenv('EPHEMERIS_CACHE_BLOCKS', '256'))
+# Shared-memory segment through which workers on one host share sampled blocks; empty disables
+EPHEMERIS_SHARED_MEMORY_NAME: Optional[str] = os.getenv('EPHEMERIS_SHARED_MEMORY_NAME') or None
+# One-day blocks held by the shared segment (~2.7 KB each)
+EPHEMERIS_SHARED_MEMORY_SLOTS: int = int(os.getenv('EPHEMERIS_SHARED_MEMORY_SLOTS', '4096'))
+# Days (date + place) whose sunrise/sunset/Gulika context is kept (LRU); 0 disables
+DAY_CONTEXT_CACHE_SIZE: int = int(os.getenv('DAY_CONTEXT_CACHE_SIZE', '1024'))
+# .npy file of the arc-second varga sign index (backend.varga_index), built on first use; empty disables
+VARGA_INDEX_PATH: Optional[str] = os.getenv('VARGA_INDEX_PATH') or None
 
 # ----------------------------------------------------------------------------
 # FastAPI/Uvicorn Server Configuration
@@ -41,6 +53,71 @@ DEBUG: bool = os.getenv('DEBUG', 'false').lower() in ('true', '1', 'yes', 'on')
 ENVIRONMENT: str = os.getenv('ENVIRONMENT', 'development')
 LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
 
+# ----------------------------------------------------------------------------
+# Compute Tier (backend.compute_pool)
+# ----------------------------------------------------------------------------
+
+# Worker processes for candidate searches (default: one per CPU); 0 runs them on threads in-process
+COMPUTE_WORKERS: int = int(os.getenv('COMPUTE_WORKERS', str(os.cpu_count() or 1)))
+# Jobs allowed running or queued before /api/btr answers 503
+COMPUTE_MAX_PENDING: int = int(os.getenv('COMPUTE_MAX_PENDING', '8'))
+# Retry-After (seconds) sent with 503 responses when the pool is saturated
+COMPUTE_RETRY_AFTER_SECONDS: int = int(os.getenv('COMPUTE_RETRY_AFTER_SECONDS', '5'))
+# Worker processes one search splits its window across; 0 or 1 scans serially
+SEARCH_SHARD_WORKERS: int = int(os.getenv('SEARCH_SHARD_WORKERS', '0'))
+# Top-ranked candidates given Stage-9 (Shadbala/Ayurdaya) validation when ranking ignores it (BPHS-only ordering); 0 validates every accepted candidate
+STAGE9_TOP_K: int = int(os.getenv('STAGE9_TOP_K', '10'))
+# Compute deadline (seconds) of a background job submitted to /api/btr/jobs
+JOB_TIMEOUT_SECONDS: float = float(os.getenv('JOB_TIMEOUT_SECONDS', '600'))
+# Finished jobs are kept this long (seconds) and at most this many at once
+JOB_RETENTION_SECONDS: float = float(os.getenv('JOB_RETENTION_SECONDS', '3600'))
+JOB_MAX_RETAINED: int = int(os.getenv('JOB_MAX_RETAINED', '256'))
+# Largest dob_uncertainty_days accepted (days searched either side of the given date)
+DOB_UNCERTAINTY_MAX_DAYS: int = int(os.getenv('DOB_UNCERTAINTY_MAX_DAYS', '3'))
+# Maximum requests accepted by one /api/btr/batch call
+BATCH_MAX_ITEMS: int = int(os.getenv('BATCH_MAX_ITEMS', '100'))
+# Birth-context groups of one batch searched concurrently (keep below COMPUTE_MAX_PENDING)
+BATCH_MAX_PARALLEL_GROUPS: int = int(os.getenv('BATCH_MAX_PARALLEL_GROUPS', '4'))
+# Compute deadline (seconds) of one batch group
+BATCH_GROUP_TIMEOUT_SECONDS: float = float(os.getenv('BATCH_GROUP_TIMEOUT_SECONDS', '300'))
+
+# ----------------------------------------------------------------------------
+# Rejection Diagnostics (backend.rejection_aggregator)
+# ----------------------------------------------------------------------------
+
+# Nearest misses kept per search and returned in BTRResponse.rejections
+REJECTION_NEAREST_MISSES: int = int(os.getenv('REJECTION_NEAREST_MISSES', '25'))
+# Default page size of the opt-in full rejection dump
+REJECTION_PAGE_SIZE: int = int(os.getenv('REJECTION_PAGE_SIZE', '100'))
+
+# ----------------------------------------------------------------------------
+# Result Cache (backend.result_cache)
+# ----------------------------------------------------------------------------
+
+# Lifetime of a cached search result in seconds; 0 disables the cache
+RESULT_CACHE_TTL_SECONDS: float = float(os.getenv('RESULT_CACHE_TTL_SECONDS', '3600'))
+# Memory budget for cached results (bytes)
+RESULT_CACHE_MAX_BYTES: int = int(os.getenv('RESULT_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+# SQLite file for the persistent tier; empty keeps the cache in memory only
+RESULT_CACHE_DB_PATH: Optional[str] = os.getenv('RESULT_CACHE_DB_PATH') or None
+# Disk budget for the persistent tier (bytes)
+RESULT_CACHE_DISK_MAX_BYTES: int = int(os.getenv('RESULT_CACHE_DISK_MAX_BYTES', str(512 * 1024 * 1024)))
+
+# ----------------------------------------------------------------------------
+# Geocode Cache (backend.geocode_cache)
+# ----------------------------------------------------------------------------
+
+# Lifetime of a resolved place (seconds) and of a "not found" answer
+GEOCODE_CACHE_TTL_SECONDS: float = float(os.getenv('GEOCODE_CACHE_TTL_SECONDS', str(30 * 24 * 3600)))
+GEOCODE_NEGATIVE_TTL_SECONDS: float = float(os.getenv('GEOCODE_NEGATIVE_TTL_SECONDS', '3600'))
+# Memory budget for cached places (bytes)
+GEOCODE_CACHE_MAX_BYTES: int = int(os.getenv('GEOCODE_CACHE_MAX_BYTES', str(4 * 1024 * 1024)))
+# SQLite file for the persistent tier; empty keeps the cache in memory only
+GEOCODE_CACHE_DB_PATH: Optional[str] = os.getenv('GEOCODE_CACHE_DB_PATH') or None
+# Timeout (seconds) and connection pool size of the shared OpenCage client
+GEOCODE_HTTP_TIMEOUT: float = float(os.getenv('GEOCODE_HTTP_TIMEOUT', '10.0'))
+GEOCODE_HTTP_MAX_CONNECTIONS: int = int(os.getenv('GEOCODE_HTTP_MAX_CONNECTIONS', '20'))
+
 # ----------------------------------------------------------------------------
 # CORS Configuration
 # ----------------------------------------------------------------------------
@@ -2,12 +2,22 @@
 
 This module implements the Vimshottari Dasha calculation logic as defined
 in Brihat Parashara Hora Shastra (BPHS).
+
+Life-event verification asks which periods run at several event dates of
+the same chart.  `DashaTimeline` lays out a chart's mahadasha boundaries
+once, as a sorted list of ends in years from birth, and answers each date
+with a `bisect`; antardasha and pratyantardasha boundaries depend only on
+the ruling lords, so they are tabulated once for all charts.  `periods`
+looks up many dates at once with NumPy.  `get_dasha_at_date` is a one-off
+lookup on a throwaway timeline.
 """
 
+import bisect
 import math
 import datetime
+import numpy as np
 import swisseph as swe
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Sequence
 
 # Nakshatra lords in order (27 nakshatras, each 13°20')
 # Each nakshatra is ruled by one of 9 planets in sequence
@@ -33,6 +43,41 @@ _DASHA_PERIODS = {
     'Mercury': 17
 }
 
+# Vimshottari order of the dasha lords
+DASHA_SEQUENCE = ('Ketu', 'Venus', 'Sun', 'Moon', 'Mars', 'Rahu', 'Jupiter', 'Saturn', 'Mercury')
+# Length of the full Vimshottari cycle in years
+_CYCLE_YEARS = 120.0
+
+
+def _sub_period_ends(lord_index: int, period_years: float) -> List[float]:
+    """Ends (years from the period's start) of the 9 sub-periods of a period.
+
+    Sub-periods run in Vimshottari order from the period's own lord, each
+    lasting its lord's share (years / 120) of the period.
+    """
+    ends = []
+    elapsed = 0.0
+    for offset in range(len(DASHA_SEQUENCE)):
+        sub_lord = DASHA_SEQUENCE[(lord_index + offset) % len(DASHA_SEQUENCE)]
+        elapsed += (_DASHA_PERIODS[sub_lord] * period_years) / _CYCLE_YEARS
+        ends.append(elapsed)
+    return ends
+
+
+# Antardasha ends within each mahadasha, by mahadasha lord index
+_ANTARDASHA_ENDS = [_sub_period_ends(md, _DASHA_PERIODS[md_lord]) for md, md_lord in enumerate(DASHA_SEQUENCE)]
+# Pratyantardasha ends within each antardasha, by mahadasha lord and antardasha position
+_PRATYANTARDASHA_ENDS = [
+    [_sub_period_ends((md + position) % len(DASHA_SEQUENCE),
+                      (_DASHA_PERIODS[DASHA_SEQUENCE[(md + position) % len(DASHA_SEQUENCE)]]
+                       * _DASHA_PERIODS[md_lord]) / _CYCLE_YEARS)
+     for position in range(len(DASHA_SEQUENCE))]
+    for md, md_lord in enumerate(DASHA_SEQUENCE)
+]
+_ANTARDASHA_END_ARRAY = np.array(_ANTARDASHA_ENDS)
+_PRATYANTARDASHA_END_ARRAY = np.array(_PRATYANTARDASHA_ENDS)
+
+
 def get_moon_nakshatra(moon_longitude: float) -> int:
     """Get Moon's nakshatra number (0-26).
     
@@ -85,80 +130,138 @@ def calculate_vimshottari_dasha(jd_ut_birth: float, moon_longitude: float) -> di
         'start_index': start_index
     }
 
+def _sub_period(ends: List[float], years_into_period: float) -> tuple[int, float]:
+    """Position of the running sub-period and its start (years into the period).
+
+    A sub-period owns its end instant.  An offset past the last end (only
+    possible through rounding) falls back to the first sub-period, as the
+    original linear scan did.
+    """
+    position = bisect.bisect_left(ends, years_into_period)
+    if position == len(ends):
+        return 0, ends[-1]
+    return position, (ends[position - 1] if position else 0.0)
+
+
+def _sub_periods(ends: np.ndarray, years_into_period: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized `_sub_period` over rows of sub-period ends."""
+    position = (ends < years_into_period[:, None]).sum(axis=1)
+    overflow = position == ends.shape[1]
+    rows = np.arange(len(position))
+    start = np.where(position > 0, ends[rows, np.maximum(position - 1, 0)], 0.0)
+    return np.where(overflow, 0, position), np.where(overflow, ends[:, -1], start)
+
+
+class DashaTimeline:
+    """Vimshottari periods of one chart, answering event dates by bisection.
+
+    Mahadasha ends are kept in years from birth (the unit of the dasha
+    arithmetic) and laid out lazily, as far as the latest date asked for.
+    The first mahadasha runs only its balance at birth; as in the original
+    scan, its antardashas are laid out from birth over its full length.
+
+    Args:
+        jd_ut_birth: Julian Day of birth in UT.
+        moon_longitude: Moon's sidereal longitude at birth.
+    """
+
+    def __init__(self, jd_ut_birth: float, moon_longitude: float):
+        dasha_info = calculate_vimshottari_dasha(jd_ut_birth, moon_longitude)
+        self.jd_ut_birth = jd_ut_birth
+        self._md_lords = [dasha_info['start_index']]
+        self._md_ends = [dasha_info['first_dasha_remaining_years']]
+
+    def _extend(self, elapsed_years: float) -> None:
+        """Lay out mahadashas until one ends at or after ``elapsed_years``."""
+        while self._md_ends[-1] < elapsed_years:
+            lord = (self._md_lords[-1] + 1) % len(DASHA_SEQUENCE)
+            self._md_lords.append(lord)
+            self._md_ends.append(self._md_ends[-1] + _DASHA_PERIODS[DASHA_SEQUENCE[lord]])
+
+    def elapsed_years(self, event_date: datetime.date) -> float:
+        """Years from birth to 0h UT of a date."""
+        event_jd = swe.julday(event_date.year, event_date.month, event_date.day, 0.0)
+        return (event_jd - self.jd_ut_birth) / 365.25
+
+    def at(self, event_date: datetime.date) -> dict[str, Any]:
+        """Running mahadasha, antardasha and pratyantardasha at a date.
+
+        Returns:
+            Dict with the three lords ('mahadasha', 'antardasha',
+            'pratyantardasha') and the years elapsed within each.
+        """
+        return self.at_elapsed(self.elapsed_years(event_date))
+
+    def at_elapsed(self, elapsed_years: float) -> dict[str, Any]:
+        """`at` for an offset in years from birth."""
+        self._extend(elapsed_years)
+        index = bisect.bisect_left(self._md_ends, elapsed_years)
+        md = self._md_lords[index]
+        years_into_md = elapsed_years - self._md_ends[index - 1] if index else elapsed_years
+
+        ad_position, ad_start = _sub_period(_ANTARDASHA_ENDS[md], years_into_md)
+        years_into_ad = years_into_md - ad_start
+        pd_position, pd_start = _sub_period(_PRATYANTARDASHA_ENDS[md][ad_position], years_into_ad)
+        ad = (md + ad_position) % len(DASHA_SEQUENCE)
+        return {
+            'mahadasha': DASHA_SEQUENCE[md],
+            'antardasha': DASHA_SEQUENCE[ad],
+            'pratyantardasha': DASHA_SEQUENCE[(ad + pd_position) % len(DASHA_SEQUENCE)],
+            'years_into_mahadasha': years_into_md,
+            'years_into_antardasha': years_into_ad,
+            'years_into_pratyantardasha': years_into_ad - pd_start
+        }
+
+    def mahadashas(self, event_jds: Sequence[float]) -> List[int]:
+        """Mahadasha lord (index into DASHA_SEQUENCE) at each instant.
+
+        The scalar counterpart of `periods` for a handful of dates, where
+        NumPy's per-call overhead would dominate.
+        """
+        lords = []
+        for event_jd in event_jds:
+            elapsed_years = (event_jd - self.jd_ut_birth) / 365.25
+            self._extend(elapsed_years)
+            lords.append(self._md_lords[bisect.bisect_left(self._md_ends, elapsed_years)])
+        return lords
+
+    def periods(self, event_jds: Sequence[float]) -> np.ndarray:
+        """Running lords at many instants at once.
+
+        Args:
+            event_jds: Julian Days (UT) of the events.
+
+        Returns:
+            Integer array of shape ``(len(event_jds), 3)``: indices into
+            DASHA_SEQUENCE of the mahadasha, antardasha and pratyantardasha
+            lords, equal to `at` of the same instants.
+        """
+        elapsed = (np.asarray(event_jds, dtype=float).reshape(-1) - self.jd_ut_birth) / 365.25
+        if elapsed.size:
+            self._extend(float(elapsed.max()))
+        md_ends = np.asarray(self._md_ends)
+        index = np.searchsorted(md_ends, elapsed, side='left')
+        md = np.asarray(self._md_lords)[index]
+        years_into_md = np.where(index > 0, elapsed - md_ends[np.maximum(index - 1, 0)], elapsed)
+
+        ad_position, ad_start = _sub_periods(_ANTARDASHA_END_ARRAY[md], years_into_md)
+        pd_position, _ = _sub_periods(_PRATYANTARDASHA_END_ARRAY[md, ad_position], years_into_md - ad_start)
+        ad = (md + ad_position) % len(DASHA_SEQUENCE)
+        return np.stack([md, ad, (ad + pd_position) % len(DASHA_SEQUENCE)], axis=1)
+
+
 def get_dasha_at_date(jd_ut_birth: float, event_date: datetime.date, moon_longitude: float) -> dict[str, Any]:
     """Get running Mahadasha-Antardasha at a given event date.
     
+    Charts queried for several dates should build one `DashaTimeline`.
+
     Args:
         jd_ut_birth: Julian Day of birth in UT.
         event_date: Event date to check.
         moon_longitude: Moon's sidereal longitude at birth.
         
     Returns:
-        Dict with 'mahadasha', 'antardasha', and their start/end dates.
+        Dict with 'mahadasha', 'antardasha', 'pratyantardasha' and the
+        years elapsed within each.
     """
-    dasha_info = calculate_vimshottari_dasha(jd_ut_birth, moon_longitude)
-    
-    # Calculate elapsed years from birth
-    event_jd = swe.julday(event_date.year, event_date.month, event_date.day, 0.0)
-    elapsed_days = event_jd - jd_ut_birth
-    elapsed_years = elapsed_days / 365.25
-    
-    # Start from first dasha
-    dasha_sequence = dasha_info['dasha_sequence']
-    start_index = dasha_info['start_index']
-    remaining_years = dasha_info['first_dasha_remaining_years']
-    
-    # If elapsed time is within first dasha
-    if elapsed_years <= remaining_years:
-        mahadasha_lord = dasha_sequence[start_index]
-        mahadasha_years = _DASHA_PERIODS[mahadasha_lord]
-        years_into_mahadasha = elapsed_years
-    else:
-        # Find which Mahadasha we're in
-        current_years = remaining_years
-        dasha_index = start_index
-        
-        # Move to next dashas until we exceed elapsed_years
-        while current_years < elapsed_years:
-            dasha_index = (dasha_index + 1) % len(dasha_sequence)
-            mahadasha_lord = dasha_sequence[dasha_index]
-            mahadasha_years = _DASHA_PERIODS[mahadasha_lord]
-            if current_years + mahadasha_years >= elapsed_years:
-                # Found the Mahadasha
-                years_into_mahadasha = elapsed_years - current_years
-                break
-            current_years += mahadasha_years
-        else: 
-            # In case we overshoot (e.g. event very far in future)
-            # Loop back? Or just return last?
-            # For simplicity, assume normal lifespan range.
-            mahadasha_lord = dasha_sequence[dasha_index]
-            years_into_mahadasha = 0.0 # Should not happen with proper loop break
-            mahadasha_years = _DASHA_PERIODS[mahadasha_lord]
-            
-    
-    # Find Antardasha (sub-period within Mahadasha)
-    antardasha_sequence = dasha_sequence.copy()
-    # Rotate to start from Mahadasha lord
-    while antardasha_sequence[0] != mahadasha_lord:
-        antardasha_sequence.append(antardasha_sequence.pop(0))
-    
-    antardasha_index = 0
-    antardasha_years_elapsed = 0.0
-    
-    for i, antardasha_lord in enumerate(antardasha_sequence):
-        antardasha_years = (_DASHA_PERIODS[antardasha_lord] * mahadasha_years) / 120.0
-        if antardasha_years_elapsed + antardasha_years >= years_into_mahadasha:
-            antardasha_index = i
-            break
-        antardasha_years_elapsed += antardasha_years
-    
-    antardasha_lord = antardasha_sequence[antardasha_index]
-    # antardasha_years is already calculated in the loop
-    
-    return {
-        'mahadasha': mahadasha_lord,
-        'antardasha': antardasha_lord,
-        'years_into_mahadasha': years_into_mahadasha,
-        'years_into_antardasha': years_into_mahadasha - antardasha_years_elapsed
-    }
+    return DashaTimeline(jd_ut_birth, moon_longitude).at(event_date)
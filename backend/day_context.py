@@ -0,0 +1,137 @@
+"""Per-day astronomical context shared across requests.
+
+Sunrise, sunset, the next sunrise and Gulika depend only on the civil date and
+the place, yet each request used to resolve them several times:
+`calculate_gulika` ran `compute_sunrise_sunset` for the date and for the next
+day (up to three ``swe.rise_trans`` calls per event), and Kaala Bala ran it
+again for every accepted candidate.
+
+`DayContext` bundles those values with the weekday lord and hora boundaries
+for one (date, latitude, longitude, tz offset).  `btr_core.get_day_context`
+builds it once and keeps it in a bounded LRU (`DayContextCache`,
+``config.DAY_CONTEXT_CACHE_SIZE`` entries) shared by every request in the
+process.
+"""
+
+import datetime
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from . import config
+from .astro_utils import SUN, MOON, MARS, MERCURY, JUPITER, VENUS, SATURN, get_weekday_index
+
+# Weekday lords indexed 0=Sunday ... 6=Saturday
+WEEKDAY_LORDS = (SUN, MOON, MARS, MERCURY, JUPITER, VENUS, SATURN)
+# Hora sequence (decreasing speed); the first hora of a day belongs to its weekday lord
+HORA_SEQUENCE = (SATURN, JUPITER, MARS, SUN, VENUS, MERCURY, MOON)
+_HOUR = datetime.timedelta(hours=1)
+
+
+class DayContext:
+    """Sunrise, sunset, Gulika and weekday/hora lords of one day at one place.
+
+    Args:
+        date: Local civil date.
+        latitude: Geographic latitude (north positive).
+        longitude: Geographic longitude (east positive).
+        tz_offset: Local time zone offset from UTC in hours.
+        sunrise: Local sunrise of ``date``.
+        sunset: Local sunset of ``date``.
+        next_sunrise: Local sunrise of the following day.
+        gulika: Gulika dictionary as returned by `btr_core.calculate_gulika`.
+    """
+
+    __slots__ = ('date', 'latitude', 'longitude', 'tz_offset', 'sunrise', 'sunset',
+                 'next_sunrise', 'gulika', 'weekday_lord', 'hora_boundaries', '_hora_start')
+
+    def __init__(self,
+                 date: datetime.date,
+                 latitude: float,
+                 longitude: float,
+                 tz_offset: float,
+                 sunrise: datetime.datetime,
+                 sunset: datetime.datetime,
+                 next_sunrise: datetime.datetime,
+                 gulika: dict[str, Any]):
+        self.date = date
+        self.latitude = latitude
+        self.longitude = longitude
+        self.tz_offset = tz_offset
+        self.sunrise = sunrise
+        self.sunset = sunset
+        self.next_sunrise = next_sunrise
+        self.gulika = gulika
+        self.weekday_lord = WEEKDAY_LORDS[get_weekday_index(date.weekday())]
+        # Clock-hour horas counted from sunrise (as Hora Bala uses them)
+        self.hora_boundaries = tuple(sunrise + k * _HOUR for k in range(25))
+        self._hora_start = HORA_SEQUENCE.index(self.weekday_lord)
+
+    def hora_lord(self, moment: datetime.datetime) -> str:
+        """Lord of the hora containing a moment of this date.
+
+        Times before sunrise wrap into the last horas of the cycle, matching
+        `shadbala.calculate_hora_bala`.
+        """
+        hours = (moment - self.sunrise).total_seconds() / 3600.0
+        if hours < 0:
+            hours += 24.0
+        return HORA_SEQUENCE[(self._hora_start + int(hours)) % 7]
+
+
+def day_key(date: datetime.date, latitude: float, longitude: float, tz_offset: float) -> tuple:
+    """Cache key of a day context."""
+    return (date.toordinal(), float(latitude), float(longitude), float(tz_offset))
+
+
+class DayContextCache:
+    """Bounded LRU of day contexts.
+
+    Args:
+        max_entries: Number of days kept; 0 disables caching.
+    """
+
+    def __init__(self, max_entries: int = config.DAY_CONTEXT_CACHE_SIZE):
+        self.max_entries = max(0, max_entries)
+        self._entries: "OrderedDict[Hashable, DayContext]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], DayContext]) -> DayContext:
+        """Return the context for a key, building it on a miss."""
+        with self._lock:
+            day = self._entries.get(key)
+            if day is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return day
+        # Built outside the lock; a concurrent miss for the same day just builds it twice
+        day = build()
+        with self._lock:
+            self.misses += 1
+            if self.max_entries:
+                self._entries[key] = day
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return day
+
+    def clear(self) -> None:
+        """Drop every cached day and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+_CACHE = DayContextCache()
+
+
+def get_cache() -> DayContextCache:
+    """Return the process-wide day context cache."""
+    return _CACHE
@@ -0,0 +1,427 @@
+"""Sampled Swiss Ephemeris service.
+
+Every BTR candidate needs the same handful of ephemeris quantities: the
+sidereal longitude of each graha (Prāṇa-pada, Nisheka, vargas), its speed
+(Cheshta Bala, Ayurdaya haranas) and its declination (Ayana Bala).  Calling
+`swe.calc_ut` for each of these per candidate dominates palā-level śodhana, so
+this module samples longitude, speed and declination for all grahas on a
+coarse grid and serves any JD by cubic Hermite interpolation.
+
+Grid and accuracy:
+    Samples are taken every `config.EPHEMERIS_SAMPLE_STEP_DAYS` (3 hours by
+    default) in one-day blocks.  Hermite interpolation uses the sampled value
+    and its Swiss Ephemeris speed at both ends of each interval, so the error
+    is bounded by h⁴/384 · max|f⁗|.  For the Moon (the fastest graha) at a
+    3-hour step this is below 0.01 arc-second in longitude and declination,
+    comfortably inside the required 1 arc-second; the slower grahas and the
+    mean node are one to three orders of magnitude better.  The Lahiri
+    ayanamsa is sampled on the same grid and interpolated linearly (error
+    below 1e-9 arc-second).
+
+All longitudes returned are sidereal (Lahiri), matching `btr_core`.  The
+sidereal mode is configured globally by `btr_core` at import time.
+
+Caching:
+    Each process keeps an LRU of sampled blocks (`config.EPHEMERIS_CACHE_BLOCKS`).
+    Because positions are interpolated rather than bucketed, a cached block
+    is never stale: every body is served at the accuracy above, whatever its
+    speed.  When `config.EPHEMERIS_SHARED_MEMORY_NAME` is set, blocks are
+    also published to a `SharedBlockTable` in ``multiprocessing.shared_memory``,
+    so uvicorn and compute-pool workers on one host share one warm set of
+    samples instead of each calling Swiss Ephemeris for the same days.
+"""
+
+import logging
+import math
+import threading
+import zlib
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, Optional
+
+import numpy as np
+import swisseph as swe
+
+from . import config
+from .astro_utils import PLANET_IDS, RAHU, KETU
+
+logger = logging.getLogger("btr.ephemeris")
+
+# Bodies sampled by the service, in array order
+BODIES = list(PLANET_IDS.keys())
+
+_LONGITUDE_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+_EQUATORIAL_FLAGS = swe.FLG_EQUATORIAL | swe.FLG_SWIEPH | swe.FLG_SPEED
+
+
+class _SampleBlock:
+    """Ephemeris samples covering one day [day, day + 1]."""
+
+    __slots__ = ('day', 'lon', 'lon_speed', 'dec', 'dec_speed', 'ayanamsa', 'nodes')
+
+    def __init__(self, day: int, lon: np.ndarray, lon_speed: np.ndarray,
+                 dec: np.ndarray, dec_speed: np.ndarray, ayanamsa: np.ndarray):
+        self.day = day
+        self.lon = lon
+        self.lon_speed = lon_speed
+        self.dec = dec
+        self.dec_speed = dec_speed
+        self.ayanamsa = ayanamsa
+        # Per-node rows of plain floats for the scalar path (avoids NumPy call overhead)
+        self.nodes = [
+            (lon[:, k].tolist(), lon_speed[:, k].tolist(), dec[:, k].tolist(),
+             dec_speed[:, k].tolist(), float(ayanamsa[k]))
+            for k in range(len(ayanamsa))
+        ]
+
+
+def _hermite_weights(s):
+    """Cubic Hermite basis weights (value, then derivative) at interval fraction s."""
+    s2 = s * s
+    s3 = s2 * s
+    value_weights = (2 * s3 - 3 * s2 + 1, s3 - 2 * s2 + s, -2 * s3 + 3 * s2, s3 - s2)
+    derivative_weights = (6 * s2 - 6 * s, 3 * s2 - 4 * s + 1, -6 * s2 + 6 * s, 3 * s2 - 2 * s)
+    return value_weights, derivative_weights
+
+
+def _hermite(weights, y0, y1, d0, d1, h):
+    """Combine Hermite weights with end values y0/y1 and end slopes d0/d1."""
+    return weights[0] * y0 + weights[1] * h * d0 + weights[2] * y1 + weights[3] * h * d1
+
+
+class SharedBlockTable:
+    """Direct-mapped table of sample blocks in a named shared-memory segment.
+
+    Any process on the host that opens the same name sees the same blocks.
+    The table is lock-free: a slot holds ``[valid, day, crc32]`` followed by
+    the block's arrays, a writer clears ``valid`` before overwriting and sets
+    it last, and a reader accepts a slot only if the day matches and the
+    payload checksum verifies.  Samples are deterministic, so a torn or
+    colliding write only costs a re-sample, never a wrong position.
+
+    The segment outlives the processes that use it (it is deliberately not
+    unlinked at exit so restarting workers find it warm); `unlink` removes it.
+
+    Args:
+        name: Shared-memory segment name.
+        slots: Number of one-day blocks the table holds.
+        bodies: Bodies per block.
+        nodes: Sample nodes per block.
+    """
+
+    _MAGIC = 0x42545245  # "BTRE"
+    _VERSION = 1
+    _HEADER = 8  # int64 words: magic, version, slots, bodies, nodes, reserved
+
+    def __init__(self, name: str, slots: int, bodies: int, nodes: int):
+        self.slots = max(1, slots)
+        self.bodies = bodies
+        self.nodes = nodes
+        self._payload = 4 * bodies * nodes + nodes
+        self._slot_words = 3 + self._payload
+        size = 8 * (self._HEADER + self.slots * self._slot_words)
+        try:
+            self._shm = self._open(name, create=True, size=size)
+            created = True
+        except FileExistsError:
+            self._shm = self._open(name, create=False)
+            created = False
+        words = np.ndarray((len(self._shm.buf) // 8,), dtype=np.int64, buffer=self._shm.buf)
+        layout = (self._MAGIC, self._VERSION, self.slots, bodies, nodes)
+        if created:
+            words[1:5] = layout[1:]
+            words[0] = self._MAGIC
+        elif len(words) < size // 8 or tuple(int(v) for v in words[:5]) != layout:
+            del words  # Release the buffer export so the segment can close
+            self._shm.close()
+            raise ValueError(f"shared ephemeris segment {name!r} has a different layout")
+        table = words[self._HEADER:self._HEADER + self.slots * self._slot_words]
+        self._meta = table.reshape(self.slots, self._slot_words)[:, :3]
+        self._data = table.view(np.float64).reshape(self.slots, self._slot_words)[:, 3:]
+
+    @staticmethod
+    def _open(name: str, create: bool, size: int = 0) -> shared_memory.SharedMemory:
+        """Open a segment without registering it for unlink at process exit."""
+        try:
+            return shared_memory.SharedMemory(name=name, create=create, size=size, track=False)
+        except TypeError:
+            # Python < 3.13: the resource tracker would unlink the segment when
+            # this worker exits, so take it back out of the tracker's hands
+            shm = shared_memory.SharedMemory(name=name, create=create, size=size)
+            resource_tracker.unregister(shm._name, 'shared_memory')
+            return shm
+
+    def load(self, day: int) -> Optional[tuple[np.ndarray, ...]]:
+        """Copy of (lon, lon_speed, dec, dec_speed, ayanamsa) for a day, if published."""
+        slot = day % self.slots
+        meta = self._meta[slot]
+        if meta[0] != 1 or meta[1] != day:
+            return None
+        payload = self._data[slot].copy()
+        if zlib.crc32(payload.tobytes()) != meta[2] or meta[0] != 1 or meta[1] != day:
+            return None
+        grid = self.bodies * self.nodes
+        shape = (self.bodies, self.nodes)
+        return (payload[:grid].reshape(shape), payload[grid:2 * grid].reshape(shape),
+                payload[2 * grid:3 * grid].reshape(shape), payload[3 * grid:4 * grid].reshape(shape),
+                payload[4 * grid:])
+
+    def store(self, day: int, block: '_SampleBlock') -> None:
+        """Publish a sampled block (overwrites whatever shares its slot)."""
+        payload = np.concatenate([block.lon.ravel(), block.lon_speed.ravel(),
+                                  block.dec.ravel(), block.dec_speed.ravel(), block.ayanamsa])
+        slot = day % self.slots
+        meta = self._meta[slot]
+        meta[0] = 0
+        self._data[slot] = payload
+        meta[1] = day
+        meta[2] = zlib.crc32(payload.tobytes())
+        meta[0] = 1
+
+    def close(self) -> None:
+        """Detach from the segment (it stays available to other processes)."""
+        self._meta = self._data = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Detach and destroy the segment for every process."""
+        self.close()
+        if not hasattr(self._shm, '_track'):
+            # Python < 3.13 unregisters on unlink; balance the unregister in `_open`
+            resource_tracker.register(self._shm._name, 'shared_memory')
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class EphemerisService:
+    """Interpolating front-end to Swiss Ephemeris for all grahas.
+
+    Args:
+        step_days: Sample spacing in days; rounded so a whole number of
+            steps fits in one day.
+        max_blocks: Number of one-day sample blocks kept (LRU).
+        shared_name: Shared-memory segment to publish/read blocks through
+            (see `SharedBlockTable`); empty keeps blocks process-local.
+        shared_slots: Number of one-day blocks the shared segment holds.
+    """
+
+    def __init__(self,
+                 step_days: float = config.EPHEMERIS_SAMPLE_STEP_DAYS,
+                 max_blocks: int = config.EPHEMERIS_CACHE_BLOCKS,
+                 shared_name: Optional[str] = config.EPHEMERIS_SHARED_MEMORY_NAME,
+                 shared_slots: int = config.EPHEMERIS_SHARED_MEMORY_SLOTS):
+        if step_days <= 0:
+            raise ValueError("step_days must be positive")
+        self.steps_per_block = max(1, int(round(1.0 / step_days)))
+        self.step_days = 1.0 / self.steps_per_block
+        self.max_blocks = max(1, max_blocks)
+        self._blocks: "OrderedDict[int, _SampleBlock]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.block_hits = 0
+        self.block_misses = 0
+        self.shared_hits = 0
+        self.evictions = 0
+        self.shared: Optional[SharedBlockTable] = None
+        if shared_name:
+            try:
+                self.shared = SharedBlockTable(shared_name, shared_slots, len(BODIES), self.steps_per_block + 1)
+            except (OSError, ValueError) as e:
+                logger.warning("Shared ephemeris cache disabled (%s): %s", shared_name, e)
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+
+    def _sample_block(self, day: int) -> _SampleBlock:
+        """Call Swiss Ephemeris for every node of one day."""
+        nodes = self.steps_per_block + 1
+        shape = (len(BODIES), nodes)
+        lon = np.empty(shape)
+        lon_speed = np.empty(shape)
+        dec = np.empty(shape)
+        dec_speed = np.empty(shape)
+        ayanamsa = np.empty(nodes)
+
+        # The sidereal mode is per thread in pyswisseph; blocks are shared
+        # across threads and processes, so never sample with the caller's mode
+        swe.set_sid_mode(swe.SIDM_LAHIRI)
+        for k in range(nodes):
+            jd = day + k * self.step_days
+            try:
+                ayanamsa[k] = swe.get_ayanamsa_ut(jd)
+                for i, name in enumerate(BODIES):
+                    ecl = swe.calc_ut(jd, PLANET_IDS[name], _LONGITUDE_FLAGS)
+                    equ = swe.calc_ut(jd, PLANET_IDS[name], _EQUATORIAL_FLAGS)
+                    if ecl[1] < 0 or equ[1] < 0:
+                        raise RuntimeError(f"error code {min(ecl[1], equ[1])}")
+                    lon[i, k] = ecl[0][0]
+                    lon_speed[i, k] = ecl[0][3]
+                    dec[i, k] = equ[0][1]
+                    dec_speed[i, k] = equ[0][4]
+            except Exception as e:
+                raise RuntimeError(f"Swiss Ephemeris sampling failed at JD {jd}: {e}") from e
+
+        if not (np.all(np.isfinite(lon)) and np.all(np.isfinite(dec)) and np.all(np.isfinite(ayanamsa))):
+            raise RuntimeError(f"Swiss Ephemeris returned non-finite samples for JD {day}")
+
+        # Remove 360° wraps so neighbouring nodes are continuous.
+        lon = np.unwrap(lon, period=360.0, axis=1)
+        return _SampleBlock(day, lon, lon_speed, dec, dec_speed, ayanamsa)
+
+    def _block(self, day: int) -> _SampleBlock:
+        """Fetch the block for a day: local LRU, then shared memory, then sampling."""
+        with self._lock:
+            block = self._blocks.get(day)
+            if block is not None:
+                self._blocks.move_to_end(day)
+                self.block_hits += 1
+                return block
+        arrays = self.shared.load(day) if self.shared is not None else None
+        if arrays is not None:
+            block = _SampleBlock(day, *arrays)
+        else:
+            block = self._sample_block(day)
+            if self.shared is not None:
+                self.shared.store(day, block)
+        with self._lock:
+            if arrays is not None:
+                self.shared_hits += 1
+            else:
+                self.block_misses += 1
+            self._blocks[day] = block
+            self._blocks.move_to_end(day)
+            while len(self._blocks) > self.max_blocks:
+                self._blocks.popitem(last=False)
+                self.evictions += 1
+        return block
+
+    def prefetch(self, jd_start: float, jd_end: float) -> None:
+        """Sample every block covering [jd_start, jd_end] ahead of a search."""
+        for day in range(int(math.floor(jd_start)), int(math.floor(jd_end)) + 1):
+            self._block(day)
+
+    def clear(self) -> None:
+        """Drop all locally cached blocks (the shared table is left alone)."""
+        with self._lock:
+            self._blocks.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Block cache counters: local hits, shared-memory hits, samplings, evictions."""
+        with self._lock:
+            return {
+                'blocks': len(self._blocks),
+                'hits': self.block_hits,
+                'shared_hits': self.shared_hits,
+                'misses': self.block_misses,
+                'evictions': self.evictions,
+                'shared_enabled': self.shared is not None
+            }
+
+    # ------------------------------------------------------------------
+    # Interpolation
+    # ------------------------------------------------------------------
+
+    def _interpolate(self, jd_values: np.ndarray) -> Dict[str, np.ndarray]:
+        """Interpolate all sampled quantities; arrays are (bodies, len(jd_values))."""
+        n = len(jd_values)
+        out = {
+            'lon': np.empty((len(BODIES), n)),
+            'lon_speed': np.empty((len(BODIES), n)),
+            'dec': np.empty((len(BODIES), n)),
+            'ayanamsa': np.empty(n)
+        }
+        days = np.floor(jd_values).astype(np.int64)
+        h = self.step_days
+        for day in np.unique(days):
+            mask = days == day
+            block = self._block(int(day))
+            offset = (jd_values[mask] - day) / h
+            k = np.minimum(np.floor(offset).astype(np.int64), self.steps_per_block - 1)
+            s = offset - k
+            value_weights, derivative_weights = _hermite_weights(s)
+
+            lon_ends = (block.lon[:, k], block.lon[:, k + 1], block.lon_speed[:, k], block.lon_speed[:, k + 1])
+            out['lon'][:, mask] = _hermite(value_weights, *lon_ends, h)
+            out['lon_speed'][:, mask] = _hermite(derivative_weights, *lon_ends, h) / h
+            out['dec'][:, mask] = _hermite(
+                value_weights, block.dec[:, k], block.dec[:, k + 1],
+                block.dec_speed[:, k], block.dec_speed[:, k + 1], h
+            )
+            out['ayanamsa'][mask] = block.ayanamsa[k] + (block.ayanamsa[k + 1] - block.ayanamsa[k]) * s
+        return out
+
+    def _interpolate_one(self, jd_ut: float, value_row: int, speed_row: int,
+                         derivative: bool = False) -> tuple[list[float], float]:
+        """Scalar interpolation of one sampled quantity for all bodies.
+
+        Uses the same Hermite arithmetic as `_interpolate`, element for
+        element, so scalar and array results are identical.
+
+        Returns:
+            (per-body values or derivatives, interpolated ayanamsa)
+        """
+        day = math.floor(jd_ut)
+        block = self._block(day)
+        h = self.step_days
+        offset = (jd_ut - day) / h
+        k = min(math.floor(offset), self.steps_per_block - 1)
+        s = offset - k
+        value_weights, derivative_weights = _hermite_weights(s)
+        left = block.nodes[k]
+        right = block.nodes[k + 1]
+        ends = zip(left[value_row], right[value_row], left[speed_row], right[speed_row])
+        if derivative:
+            values = [_hermite(derivative_weights, y0, y1, d0, d1, h) / h for y0, y1, d0, d1 in ends]
+        else:
+            values = [_hermite(value_weights, y0, y1, d0, d1, h) for y0, y1, d0, d1 in ends]
+        return values, left[4] + (right[4] - left[4]) * s
+
+    def sidereal_positions_array(self, jd_ut_values) -> Dict[str, np.ndarray]:
+        """Sidereal longitudes (0–360) of all grahas for an array of JD_UT values.
+
+        Returns:
+            Dict keyed 'sun' … 'saturn', 'rahu', 'ketu' with one array each.
+        """
+        jd = np.atleast_1d(np.asarray(jd_ut_values, dtype=np.float64))
+        data = self._interpolate(jd)
+        sidereal = np.mod(data['lon'] - data['ayanamsa'], 360.0)
+        positions = {name: sidereal[i] for i, name in enumerate(BODIES)}
+        positions[KETU] = np.mod(positions[RAHU] + 180.0, 360.0)
+        return positions
+
+    def motion_arrays(self, jd_ut_values) -> tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """Longitude speeds and declinations of each graha for an array of JD_UT values.
+
+        One interpolation for both; element for element equal to `speeds` and
+        `declinations`.
+        """
+        jd = np.atleast_1d(np.asarray(jd_ut_values, dtype=np.float64))
+        data = self._interpolate(jd)
+        return dict(zip(BODIES, data['lon_speed'])), dict(zip(BODIES, data['dec']))
+
+    def sidereal_positions(self, jd_ut: float) -> Dict[str, float]:
+        """Sidereal longitudes (0–360) of all grahas at one JD_UT."""
+        longitudes, ayanamsa = self._interpolate_one(jd_ut, 0, 1)
+        positions = {name: (lon - ayanamsa) % 360.0 for name, lon in zip(BODIES, longitudes)}
+        positions[KETU] = (positions[RAHU] + 180.0) % 360.0
+        return positions
+
+    def speeds(self, jd_ut: float) -> Dict[str, float]:
+        """Ecliptic longitude speed (degrees/day) of each graha at one JD_UT."""
+        speeds, _ = self._interpolate_one(jd_ut, 0, 1, derivative=True)
+        return dict(zip(BODIES, speeds))
+
+    def declinations(self, jd_ut: float) -> Dict[str, float]:
+        """Equatorial declination (degrees) of each graha at one JD_UT."""
+        declinations, _ = self._interpolate_one(jd_ut, 2, 3)
+        return dict(zip(BODIES, declinations))
+
+
+_SERVICE = EphemerisService()
+
+
+def get_service() -> EphemerisService:
+    """Return the process-wide ephemeris service."""
+    return _SERVICE
@@ -0,0 +1,174 @@
+"""Per-request memo of tolerance-independent candidate evaluations.
+
+When the strict search finds nothing, `btr_core.search_with_fallbacks`
+widens the window to the full day and then relaxes the padekyatā
+tolerance.  Every pass covers timestamps an earlier pass already evaluated,
+and the lagna, graha longitudes, Ishta-kāla, Prāṇa-pada, special lagnas,
+Nisheka and Stage-9 strengths at a timestamp do not depend on the
+tolerances in force.  `EvaluationStore` keeps those raw values keyed by
+timestamp, so a later pass computes only timestamps it has not seen and
+re-applies its own thresholds to the stored values.
+
+A store is only valid for one birth context (date, place, time zone,
+sunrise and Gulika); `bind` clears it when the context changes.  It holds
+plain Python/NumPy values, so it pickles to and from worker processes.
+"""
+
+import datetime
+from typing import Any, Callable, Hashable, Optional
+
+import numpy as np
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def timestamp_key(dt: datetime.datetime) -> int:
+    """Integer key (microseconds since 1970-01-01) for a local naive datetime."""
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def flatten_batch(batch: dict[str, Any]) -> dict[str, np.ndarray]:
+    """Flatten one level of nested array dicts ('planets' → 'planets.sun', ...)."""
+    flat: dict[str, np.ndarray] = {}
+    for name, values in batch.items():
+        if isinstance(values, dict):
+            for inner, inner_values in values.items():
+                flat[f'{name}.{inner}'] = inner_values
+        else:
+            flat[name] = values
+    return flat
+
+
+def unflatten_batch(flat: dict[str, np.ndarray]) -> dict[str, Any]:
+    """Inverse of `flatten_batch`."""
+    batch: dict[str, Any] = {}
+    for name, values in flat.items():
+        group, _, inner = name.partition('.')
+        if inner:
+            batch.setdefault(group, {})[inner] = values
+        else:
+            batch[name] = values
+    return batch
+
+
+class EvaluationStore:
+    """Timestamp-keyed store of raw evaluations shared by the passes of one request.
+
+    Attributes:
+        computed: Timestamps evaluated afresh (grid rows and single points).
+        reused: Timestamps served from the store.
+    """
+
+    def __init__(self):
+        self._context: Optional[Hashable] = None
+        self._rows: dict[int, dict[str, Any]] = {}
+        self._points: dict[int, dict[str, Any]] = {}
+        self._stage9: dict[int, tuple[Any, Any]] = {}
+        self._instants: list[tuple[datetime.datetime, datetime.datetime, list[datetime.datetime]]] = []
+        self.computed = 0
+        self.reused = 0
+
+    def __len__(self) -> int:
+        return len(self._rows) + len(self._points)
+
+    def bind(self, context: Hashable) -> None:
+        """Attach the store to a birth context, dropping entries from any other."""
+        if context != self._context:
+            self.clear()
+            self._context = context
+
+    def clear(self) -> None:
+        """Drop every stored evaluation and reset the counters."""
+        self._context = None
+        self._rows.clear()
+        self._points.clear()
+        self._stage9.clear()
+        self._instants.clear()
+        self.computed = self.reused = 0
+
+    def batch(self,
+              keys: list[int],
+              compute: Callable[[list[int]], dict[str, Any]]) -> dict[str, Any]:
+        """Raw batch arrays for `keys`, computing only the missing rows.
+
+        Args:
+            keys: Timestamp keys, in the order the arrays should follow.
+            compute: Called with the positions (indices into ``keys``) that
+                are not stored; returns the batch dict for those positions.
+
+        Returns:
+            Batch dict of arrays aligned with ``keys`` (nested dicts preserved).
+        """
+        missing = [i for i, key in enumerate(keys) if key not in self._rows]
+        if missing:
+            fresh = flatten_batch(compute(missing))
+            for j, i in enumerate(missing):
+                self._rows[keys[i]] = {name: values[j] for name, values in fresh.items()}
+        self.computed += len(missing)
+        self.reused += len(keys) - len(missing)
+        if not keys:
+            return {}
+        rows = [self._rows[key] for key in keys]
+        return unflatten_batch({name: np.array([row[name] for row in rows]) for name in rows[0]})
+
+    def point(self, key: int, compute: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        """Raw single-instant evaluation (e.g. a padekyatā instant), computed once."""
+        value = self._points.get(key)
+        if value is None:
+            value = self._points[key] = compute()
+            self.computed += 1
+        else:
+            self.reused += 1
+        return value
+
+    def stage9(self, key: int, compute: Callable[[], tuple[Any, Any]]) -> tuple[Any, Any]:
+        """Shadbala and Āyurdāya for a timestamp, computed once."""
+        value = self._stage9.get(key)
+        if value is None:
+            value = self._stage9[key] = compute()
+        return value
+
+    def stage9_many(self,
+                    keys: list[int],
+                    compute: Callable[[list[int]], list[tuple[Any, Any]]]) -> None:
+        """Store Shadbala and Āyurdāya for several timestamps, computing the missing ones together.
+
+        Args:
+            keys: Timestamp keys.
+            compute: Called with the positions (indices into ``keys``) that
+                are not stored; returns one (shadbala, ayurdaya) pair each.
+        """
+        missing = [i for i, key in enumerate(keys) if key not in self._stage9]
+        if missing:
+            for i, value in zip(missing, compute(missing)):
+                self._stage9[keys[i]] = value
+
+    def instants(self,
+                 start: datetime.datetime,
+                 end: datetime.datetime,
+                 compute: Callable[[], list[datetime.datetime]]) -> list[datetime.datetime]:
+        """Padekyatā instants in [start, end], reusing a stored covering window."""
+        for stored_start, stored_end, stored in self._instants:
+            if stored_start <= start and end <= stored_end:
+                return [t for t in stored if start <= t <= end]
+        found = compute()
+        self._instants.append((start, end, list(found)))
+        return found
+
+    def subset(self, keys: list[int]) -> 'EvaluationStore':
+        """Store holding only the grid rows for `keys` (to ship to a shard)."""
+        part = EvaluationStore()
+        part._context = self._context
+        part._rows = {key: self._rows[key] for key in keys if key in self._rows}
+        return part
+
+    def merge(self, other: 'EvaluationStore') -> None:
+        """Adopt the entries and counters of a store filled elsewhere (a shard)."""
+        if other._context != self._context:
+            return
+        self._rows.update(other._rows)
+        self._points.update(other._points)
+        self._stage9.update(other._stage9)
+        self.computed += other.computed
+        self.reused += other.reused
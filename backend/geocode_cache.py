@@ -0,0 +1,124 @@
+"""Geocode cache with single-flight lookups.
+
+Every `/api/btr` and `/api/geocode` call resolves its place through OpenCage,
+a fixed network round trip even for a city typed a moment ago.
+`GeocodeCache` memoizes coordinates and timezone per normalized place
+string in a `ResultCache` (in-process LRU plus an optional SQLite tier at
+``config.GEOCODE_CACHE_DB_PATH``).
+
+* "Not found" answers are cached too, for the shorter
+  ``config.GEOCODE_NEGATIVE_TTL_SECONDS``, so repeated typos do not reach the
+  API.  Transport errors and other failures are never cached.
+* Concurrent lookups of the same place share one upstream request
+  (single-flight): the first caller fetches, later callers await its result.
+  If that first caller is cancelled, a waiting caller takes over the fetch.
+"""
+
+import asyncio
+import re
+import unicodedata
+from typing import Any, Awaitable, Callable, Optional
+
+from . import config
+from .result_cache import ResultCache
+
+_NOT_FOUND = {'not_found': True}
+
+
+def normalize_place(place: str) -> str:
+    """Canonical cache key for free-text place input.
+
+    Case, Unicode form and spacing are folded, so "New  Delhi , India" and
+    "new delhi, india" share one entry.
+    """
+    text = unicodedata.normalize('NFKC', place).casefold()
+    text = re.sub(r'\s*,\s*', ', ', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip(' ,')
+
+
+class GeocodeCache:
+    """Place → geocode payload cache.
+
+    Args:
+        store: Backing two-tier cache (built from config when omitted).
+        negative_ttl_seconds: Lifetime of cached "not found" answers.
+    """
+
+    def __init__(self,
+                 store: Optional[ResultCache] = None,
+                 negative_ttl_seconds: float = config.GEOCODE_NEGATIVE_TTL_SECONDS):
+        self.store = store or ResultCache(
+            max_bytes=config.GEOCODE_CACHE_MAX_BYTES,
+            ttl_seconds=config.GEOCODE_CACHE_TTL_SECONDS,
+            db_path=config.GEOCODE_CACHE_DB_PATH
+        )
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.fetches = 0
+        self.coalesced = 0
+
+    async def resolve(self,
+                      place: str,
+                      fetch: Callable[[], Awaitable[Optional[dict[str, Any]]]]) -> Optional[dict[str, Any]]:
+        """Return the cached payload for a place, fetching it once on a miss.
+
+        Args:
+            place: Free-text place description.
+            fetch: Coroutine factory performing the upstream lookup; returns
+                the payload, or None when the place does not exist.
+
+        Returns:
+            The geocode payload, or None for a (possibly cached) "not found".
+        """
+        key = normalize_place(place)
+        while True:
+            cached = self.store.get(key)
+            if cached is not None:
+                return None if cached == _NOT_FOUND else cached
+
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            self.coalesced += 1
+            # wait() neither cancels the shared lookup when this caller is
+            # cancelled nor raises when the leader was
+            await asyncio.wait((pending,))
+            if not pending.cancelled():
+                payload = pending.result()
+                return dict(payload) if payload is not None else None
+            # The leader was cancelled: look again, so one waiter takes over
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            self.fetches += 1
+            payload = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Waiters re-raise it; don't warn when there are none
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        if payload is None:
+            self.store.put(key, _NOT_FOUND, ttl_seconds=self.negative_ttl_seconds)
+        else:
+            self.store.put(key, payload)
+        future.set_result(payload)
+        return payload
+
+    def clear(self) -> None:
+        """Drop every cached place."""
+        self.store.clear()
+
+
+_CACHE = GeocodeCache()
+
+
+def get_cache() -> GeocodeCache:
+    """Return the process-wide geocode cache."""
+    return _CACHE
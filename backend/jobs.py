@@ -0,0 +1,186 @@
+"""In-process registry of background rectification jobs.
+
+`/api/btr` ties a rectification to one HTTP request: when the client gives up
+(the frontend aborts after its own timeout) the server keeps computing a
+result nobody will read.  `/api/btr/jobs` decouples the two: a job is
+submitted, polled and, if no longer wanted, cancelled.
+
+`JobManager` keeps each `Job`'s status, latest progress and final result in
+memory.  The search itself runs on the compute pool as a streamed job
+(`compute_pool.ComputePool.stream`), so progress events update the job as
+they arrive.  Every job carries a `CancellationToken`; cancelling the job
+sets it, and the search stops at its next check (see `backend.cancellation`)
+and frees its worker.
+
+Finished jobs are kept for ``config.JOB_RETENTION_SECONDS`` and at most
+``config.JOB_MAX_RETAINED`` at once; jobs still running are never dropped.
+"""
+
+import asyncio
+import datetime
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Optional
+
+from . import config
+from .cancellation import CancellationToken
+
+QUEUED = "queued"
+RUNNING = "running"
+CANCELLING = "cancelling"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = frozenset({SUCCEEDED, FAILED, CANCELLED})
+
+
+def _utc_now() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+
+
+class Job:
+    """One background rectification.
+
+    Attributes:
+        id: Job identifier (hex).
+        status: One of queued, running, cancelling, succeeded, failed, cancelled.
+        token: Cancellation token checked by the search.
+        progress: Latest progress event of the search.
+        search_pass: Latest pass event (window and tolerance being scanned).
+        candidates_found: Candidates reported by the search so far.
+        result: BTRResponse payload once succeeded.
+        error: ``{'status_code', 'detail'}`` once failed.
+    """
+
+    __slots__ = ('id', 'status', 'token', 'created_at', 'updated_at', 'finished_monotonic',
+                 'progress', 'search_pass', 'candidates_found', 'result', 'error', 'task')
+
+    def __init__(self, token: CancellationToken):
+        self.id = uuid.uuid4().hex
+        self.status = QUEUED
+        self.token = token
+        self.created_at = self.updated_at = _utc_now()
+        self.finished_monotonic: Optional[float] = None
+        self.progress: Optional[dict[str, Any]] = None
+        self.search_pass: Optional[dict[str, Any]] = None
+        self.candidates_found = 0
+        self.result: Optional[dict[str, Any]] = None
+        self.error: Optional[dict[str, Any]] = None
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def record_event(self, event: dict[str, Any]) -> None:
+        """Fold one search event into the job's state."""
+        kind = event.get('event')
+        if kind == 'progress':
+            self.progress = {k: v for k, v in event.items() if k != 'event'}
+        elif kind == 'pass':
+            self.search_pass = {k: v for k, v in event.items() if k != 'event'}
+        elif kind == 'candidate':
+            self.candidates_found += 1
+        if self.status == QUEUED:
+            self.status = RUNNING
+        self.updated_at = _utc_now()
+
+    def finish(self, status: str, result: Optional[dict[str, Any]] = None,
+               error: Optional[dict[str, Any]] = None) -> None:
+        """Record the outcome."""
+        self.status = status
+        self.result = result
+        self.error = error
+        self.updated_at = _utc_now()
+        self.finished_monotonic = time.monotonic()
+        self.task = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Public JSON view of the job."""
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'progress': self.progress,
+            'search_pass': self.search_pass,
+            'candidates_found': self.candidates_found,
+            'result': self.result,
+            'error': self.error
+        }
+
+
+class JobManager:
+    """Registry of jobs with bounded retention of finished ones.
+
+    Args:
+        retention_seconds: How long finished jobs stay readable.
+        max_retained: Maximum finished jobs kept (oldest dropped first).
+    """
+
+    def __init__(self,
+                 retention_seconds: float = config.JOB_RETENTION_SECONDS,
+                 max_retained: int = config.JOB_MAX_RETAINED):
+        self.retention_seconds = retention_seconds
+        self.max_retained = max(0, max_retained)
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, token: CancellationToken) -> Job:
+        """Register a new queued job."""
+        job = Job(token)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job, or None if unknown or expired."""
+        with self._lock:
+            self._prune()
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Request cancellation of a job; finished jobs are returned unchanged."""
+        job = self.get(job_id)
+        if job is not None and not job.finished:
+            job.token.cancel()
+            job.status = CANCELLING
+            job.updated_at = _utc_now()
+        return job
+
+    def cancel_all(self) -> None:
+        """Request cancellation of every unfinished job (server shutdown)."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            if not job.finished:
+                job.token.cancel()
+
+    def clear(self) -> None:
+        """Forget every job."""
+        with self._lock:
+            self._jobs.clear()
+
+    def _prune(self) -> None:
+        """Drop expired finished jobs, then the oldest beyond the cap (lock held)."""
+        now = time.monotonic()
+        finished = [job for job in self._jobs.values() if job.finished]
+        expired = {job.id for job in finished if now - job.finished_monotonic > self.retention_seconds}
+        excess = len(finished) - len(expired) - self.max_retained
+        if excess > 0:
+            oldest = sorted((job for job in finished if job.id not in expired),
+                            key=lambda job: job.finished_monotonic)
+            expired.update(job.id for job in oldest[:excess])
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+_MANAGER = JobManager()
+
+
+def get_manager() -> JobManager:
+    """Return the process-wide job registry."""
+    return _MANAGER
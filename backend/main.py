@@ -15,23 +15,32 @@ This module exposes two endpoints:
 
 import os
 import sys
+import asyncio
+import concurrent.futures
 import uuid
 import time
 import logging
 import datetime
+import json
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 import httpx
 
 from . import config
 from . import btr_core
+from . import compute_pool
+from . import result_cache
+from . import geocode_cache
+from . import jobs
+from .cancellation import CancellationToken, SearchCancelled
+from .rejection_aggregator import RejectionAggregator
 
 # ----------------------------------------------------------------------------
 # Logging configuration
@@ -77,6 +86,36 @@ def _log_phase(request_id: str, phase: int, title: str, detail: str, context: Op
     suffix = f" | context={context}" if context else ""
     logger.info("[req:%s] Phase %d - %s: %s%s", request_id, phase, title, detail, suffix)
 
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared OpenCage client, creating it on first use.
+
+    The client is normally created in `lifespan`.  A client is bound to the
+    event loop it was created on, so a new one is made when called from a
+    different loop (e.g. a TestClient used without lifespan).
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=config.GEOCODE_HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=config.GEOCODE_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=config.GEOCODE_HTTP_MAX_CONNECTIONS
+            )
+        )
+        _http_client_loop = loop
+    return _http_client
+
+async def _close_http_client() -> None:
+    """Close the shared OpenCage client."""
+    global _http_client, _http_client_loop
+    client, _http_client, _http_client_loop = _http_client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
@@ -97,8 +136,14 @@ async def lifespan(app: FastAPI):
                 "Swiss Ephemeris will use default paths.",
                 UserWarning
             )
+    # One pooled HTTP client serves every outbound geocode request
+    _get_http_client()
     yield
-    # Shutdown (if needed in future)
+    # Shutdown
+    await _close_http_client()
+    jobs.get_manager().cancel_all()
+    compute_pool.get_pool().shutdown(wait=False)
+    compute_pool.shutdown_shard_executors(wait=False)
 
 app = FastAPI(title="BPHS BTR Prototype", version="1.0.0", lifespan=lifespan)
 
@@ -213,6 +258,17 @@ class BTRRequest(BaseModel):
     prashna_mode: Optional[bool] = Field(False, description="Use current time for Nashta Jataka analysis")
     optional_traits: Optional[PhysicalTraitsModel] = None
     optional_events: Optional[LifeEventsModel] = None
+    include_all_rejections: bool = Field(
+        False, description="Return every rejected time (paged) instead of the nearest misses"
+    )
+    rejections_offset: int = Field(0, ge=0, description="First rejected time of the page (full dump only)")
+    rejections_limit: int = Field(
+        config.REJECTION_PAGE_SIZE, ge=1, le=1000, description="Rejected times per page (full dump only)"
+    )
+    dob_uncertainty_days: int = Field(
+        0, ge=0, le=config.DOB_UNCERTAINTY_MAX_DAYS,
+        description="Also search this many days either side of dob (uncertain registration dates)"
+    )
 
 class SpecialLagnas(BaseModel):
     bhava_lagna: float
@@ -254,7 +310,9 @@ class BTRCandidate(BaseModel):
     special_lagnas: Optional[SpecialLagnas] = None
     nisheka: Optional[Nisheka] = None
     composite_score: Optional[float] = None
+    stage9_validated: Optional[bool] = None
     shodhana_delta_palas: Optional[int] = None
+    padekyata_instant_local: Optional[str] = None
     physical_traits_scores: Optional[PhysicalTraitsScore] = None
     life_events_scores: Optional[LifeEventsScore] = None
 
@@ -278,10 +336,28 @@ class BTRResponse(BaseModel):
     candidates: List[BTRCandidate]
     best_candidate: Optional[BTRCandidate]
     rejections: Optional[List[RejectedCandidate]] = None
+    rejection_stats: Optional[Dict[str, Any]] = None
     notes: Optional[str] = None
     suggested_questions: Optional[List[Dict[str, Any]]] = None
     needs_refinement: bool = False
 
+class BTRBatchRequest(BaseModel):
+    items: List[BTRRequest] = Field(
+        ..., min_length=1, max_length=config.BATCH_MAX_ITEMS, description="Rectification requests"
+    )
+
+class BTRBatchItem(BaseModel):
+    index: int
+    status_code: int
+    response: Optional[BTRResponse] = None
+    error: Optional[Any] = None
+
+class BTRBatchResponse(BaseModel):
+    items: List[BTRBatchItem]
+    groups: int
+    searches: int
+    cache_hits: int
+
 class ClientLogEvent(BaseModel):
     """Payload for frontend/client log forwarding."""
     level: str = Field("info", description="Log level e.g. debug/info/warning/error")
@@ -451,23 +527,15 @@ def _analyze_input_completeness(request: BTRRequest) -> Dict[str, Any]:
         "missing_categories": [s["field"] for s in suggestions]
     }
 
-def _generate_bphs_specific_questions(rejections: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
+def _generate_bphs_specific_questions(rejections: RejectionAggregator) -> list[Dict[str, Any]]:
     """Generate BPHS-specific questions based on rejection patterns."""
     if not rejections:
         return []
     
     bphs_questions = []
-    reason_counts = {}
-    
-    # Analyze rejection patterns
-    for rej in rejections:
-        reason = rej.get("rejection_reason", "Unknown")
-        reason_counts[reason] = reason_counts.get(reason, 0) + 1
     
     # Find the most common rejection reasons
-    top_reasons = sorted(reason_counts.items(), key=lambda x: x[1], reverse=True)
-    
-    for reason, count in top_reasons[:3]:
+    for reason, count in rejections.top_reasons(3):
         if "trine rule" in reason.lower() and count > 5:
             # Many candidates failing BPHS 4.10 trine rule
             bphs_questions.append({
@@ -502,21 +570,8 @@ def _generate_bphs_specific_questions(rejections: list[Dict[str, Any]]) -> list[
             })
     
     # If top candidates come close to passing BPHS rules
-    min_padekyata = None
-    min_moon = None
-    min_gulika = None
-    
-    for rej in rejections:
-        dp = rej.get("delta_pp_deg")
-        dm = rej.get("delta_moon_deg")
-        dg = rej.get("delta_gulika_deg")
-        
-        if dp is not None:
-            min_padekyata = dp if min_padekyata is None else min(min_padekyata, dp)
-        if dm is not None:
-            min_moon = dm if dm is None else min(min_moon, dm)
-        if dg is not None:
-            min_gulika = dg if min_gulika is None else min(min_gulika, dg)
+    min_padekyata = rejections.min_deltas["padekyata"]
+    min_moon = rejections.min_deltas["moon"]
     
     # Suggest precision improvements
     if min_padekyata and min_padekyata < 1.0:
@@ -547,7 +602,7 @@ def _generate_bphs_specific_questions(rejections: list[Dict[str, Any]]) -> list[
     return bphs_questions
 
 def _summarize_rejections_for_response(
-    rejections: list[Dict[str, Any]],
+    rejections: RejectionAggregator,
     window_start: str,
     window_end: str,
     request: BTRRequest,
@@ -576,24 +631,12 @@ def _summarize_rejections_for_response(
         if general_q["field"] not in bphs_used_fields:
             combined_questions.append(general_q)
     
-    reason_counts: Dict[str, int] = {}
-    min_padekyata = None
-    min_moon = None
-    min_gulika = None
-    for rej in rejections:
-        reason = rej.get("rejection_reason") or "Unknown rejection"
-        reason_counts[reason] = reason_counts.get(reason, 0) + 1
-        dp = rej.get("delta_pp_deg")
-        dm = rej.get("delta_moon_deg")
-        dg = rej.get("delta_gulika_deg")
-        if dp is not None:
-            min_padekyata = dp if min_padekyata is None else min(min_padekyata, dp)
-        if dm is not None:
-            min_moon = dm if min_moon is None else min(min_moon, dm)
-        if dg is not None:
-            min_gulika = dg if min_gulika is None else min(min_gulika, dg)
+    reason_counts = dict(rejections.reason_counts)
+    min_padekyata = rejections.min_deltas["padekyata"]
+    min_moon = rejections.min_deltas["moon"]
+    min_gulika = rejections.min_deltas["gulika"]
     
-    top_reasons = sorted(reason_counts.items(), key=lambda kv: kv[1], reverse=True)
+    top_reasons = rejections.top_reasons()
     reason_str = "; ".join(f"{msg} ({count})" for msg, count in top_reasons[:3])
     delta_bits = []
     if min_padekyata is not None:
@@ -621,6 +664,9 @@ def _summarize_rejections_for_response(
             "candidates_analyzed": len(rejections),
             "bphs_violations": [reason for reason, count in top_reasons if "BPHS" in reason]
         },
+        "classification_counts": dict(rejections.classification_counts),
+        "delta_histograms": rejections.summary()["histograms"],
+        "nearest_misses": rejections.nearest_misses(),
         "suggestions": [
             "Add physical traits based on BPHS Chapter 2 for better verification",
             "Include life events validated by BPHS Chapter 12 dasha timing",
@@ -639,6 +685,9 @@ def _summarize_rejections_for_response(
 async def opencage_geocode(place: str, request_id: Optional[str] = None) -> Dict[str, Any]:
     """Resolve a place name using the OpenCage API.
 
+    Answers are memoized per normalized place in `geocode_cache` (including
+    "not found"), and requests go through the shared pooled HTTP client.
+
     Args:
         place: Free‑text place description.
         request_id: Optional correlation id for log tracing.
@@ -647,16 +696,19 @@ async def opencage_geocode(place: str, request_id: Optional[str] = None) -> Dict
         Dict with keys 'lat', 'lon', 'formatted', and optional timezone info.
     """
     log_prefix = f"[req:{request_id}] " if request_id else ""
-    api_key = config.OPENCAGE_API_KEY
-    if not api_key:
-        logger.error("%sOpenCage API key is not configured; cannot geocode '%s'", log_prefix, place)
-        raise HTTPException(status_code=500, detail="OPENCAGE_API_KEY is not configured.")
-    logger.info("%sGeocoding place '%s'", log_prefix, place)
-    url = "https://api.opencagedata.com/geocode/v1/json"
-    params = {'q': place, 'key': api_key, 'limit': 1}
-    async with httpx.AsyncClient() as client:
+
+    async def fetch() -> Optional[Dict[str, Any]]:
+        """Query OpenCage; None means the place was not found."""
+        api_key = config.OPENCAGE_API_KEY
+        if not api_key:
+            logger.error("%sOpenCage API key is not configured; cannot geocode '%s'", log_prefix, place)
+            raise HTTPException(status_code=500, detail="OPENCAGE_API_KEY is not configured.")
+        logger.info("%sGeocoding place '%s'", log_prefix, place)
+        url = "https://api.opencagedata.com/geocode/v1/json"
+        params = {'q': place, 'key': api_key, 'limit': 1}
+        client = _get_http_client()
         try:
-            resp = await client.get(url, params=params, timeout=10.0)
+            resp = await client.get(url, params=params)
         except httpx.TimeoutException:
             logger.warning("%sOpenCage API timed out for '%s'", log_prefix, place)
             raise HTTPException(status_code=504, detail="OpenCage API request timed out.")
@@ -676,7 +728,7 @@ async def opencage_geocode(place: str, request_id: Optional[str] = None) -> Dict
         
         if not data.get('results'):
             logger.warning("%sOpenCage returned no results for '%s'", log_prefix, place)
-            raise HTTPException(status_code=404, detail="Location not found.")
+            return None
         
         result = data['results'][0]
         try:
@@ -714,6 +766,13 @@ async def opencage_geocode(place: str, request_id: Optional[str] = None) -> Dict
         )
         return payload
 
+    # Cached places (and cached "not found" answers) skip the network entirely;
+    # concurrent lookups of one place share a single request.
+    payload = await geocode_cache.get_cache().resolve(place, fetch)
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Location not found.")
+    return payload
+
 # ---------------------------------------------------------------------------
 # API endpoints
 # ---------------------------------------------------------------------------
@@ -734,11 +793,13 @@ async def geocode(q: str = Query(..., description="Place name to geocode")):
     _log_phase(request_id, 1, "Geocode", "Geocode success", {"lat": geodata.get("lat"), "lon": geodata.get("lon")})
     return geodata
 
-@app.post("/api/btr", response_model=BTRResponse)
-async def btr(request: BTRRequest):
-    """Perform BPHS-based birth time rectification."""
-    request_id = uuid.uuid4().hex[:8]
-    t0 = time.perf_counter()
+async def _prepare_btr_search(request: BTRRequest, request_id: str) -> Dict[str, Any]:
+    """Resolve a rectification request into candidate-search inputs (phases 0-6).
+
+    Returns:
+        dict: 'search_kwargs' (also the result-cache key input), 'day_context',
+        'geocode', 'tz_offset_hours', 'step_minutes', 'traits' and 'events'.
+    """
     _log_phase(
         request_id,
         0,
@@ -837,9 +898,15 @@ async def btr(request: BTRRequest):
         {"start_time": start_time, "end_time": end_time, "tz_offset_hours": tz_offset_hours_to_use}
     )
 
-    # Precompute sunrise/sunset and gulika
+    # Sunrise/sunset and gulika for the birth date, shared across requests via the day cache
     try:
-        sunrise_local, sunset_local = btr_core.compute_sunrise_sunset(dob_date, latitude, longitude, tz_offset_hours_to_use)
+        day_context = btr_core.get_day_context(dob_date, latitude, longitude, tz_offset_hours_to_use)
+        # Uncertain dates: every searched day needs valid day bounds too (warms the day cache)
+        for offset in range(-request.dob_uncertainty_days, request.dob_uncertainty_days + 1):
+            if offset:
+                btr_core.get_day_context(
+                    dob_date + datetime.timedelta(days=offset), latitude, longitude, tz_offset_hours_to_use
+                )
     except RuntimeError as e:
         error_msg = str(e)
         if "Swiss Ephemeris" in error_msg:
@@ -853,6 +920,7 @@ async def btr(request: BTRRequest):
     except Exception as e:
         logger.exception("[req:%s] Unexpected sunrise/sunset error: %s", request_id, e)
         raise HTTPException(status_code=500, detail=f"Unexpected error in sunrise/sunset calculation: {str(e)}")
+    sunrise_local, sunset_local = day_context.sunrise, day_context.sunset
     
     _log_phase(
         request_id,
@@ -865,21 +933,7 @@ async def btr(request: BTRRequest):
         }
     )
     
-    try:
-        gulika_info = btr_core.calculate_gulika(dob_date, latitude, longitude, tz_offset_hours_to_use)
-    except RuntimeError as e:
-        error_msg = str(e)
-        if "Swiss Ephemeris" in error_msg:
-            logger.warning("[req:%s] Swiss Ephemeris calculation failed in Gulika (likely polar location): %s", request_id, e)
-            raise HTTPException(
-                status_code=422, 
-                detail=f"Astronomical calculation failed for Gulika (likely due to polar day/night). Error: {error_msg}"
-            )
-        logger.exception("[req:%s] Gulika calculation failed: %s", request_id, e)
-        raise HTTPException(status_code=500, detail=f"Failed to calculate Gulika: {str(e)}")
-    except Exception as e:
-        logger.exception("[req:%s] Unexpected Gulika error: %s", request_id, e)
-        raise HTTPException(status_code=500, detail=f"Unexpected error in Gulika calculation: {str(e)}")
+    gulika_info = day_context.gulika
     _log_phase(request_id, 5, "Gulika calculated", "Primary purification marker ready", gulika_info)
 
     traits_for_scoring = _normalize_traits_for_scoring(request.optional_traits)
@@ -893,8 +947,6 @@ async def btr(request: BTRRequest):
 
     # Search candidate times at BPHS-aligned resolution (2 minutes)
     step_minutes = 2
-    search_attempts: List[Dict[str, Any]] = []
-    strict_bphs_used = True
     _log_phase(
         request_id,
         6,
@@ -907,83 +959,107 @@ async def btr(request: BTRRequest):
             "collect_rejections": True
         }
     )
-    try:
-        def _run_search(window_start: str, window_end: str, strict_bphs: bool = True):
-            return btr_core.search_candidate_times(
-                dob=dob_date,
-                latitude=latitude,
-                longitude=longitude,
-                tz_offset=tz_offset_hours_to_use,
-                start_time_str=window_start,
-                end_time_str=window_end,
-                step_minutes=step_minutes,
-                strict_bphs=strict_bphs,
-                enable_shodhana=True,
-                bphs_only_ordering=True,
-                collect_rejections=True,
-                sunrise_local=sunrise_local,
-                sunset_local=sunset_local,
-                gulika_info=gulika_info,
-                optional_traits=traits_for_scoring,
-                optional_events=events_for_scoring
-            )
-
-        candidates, rejections = _run_search(start_time, end_time, strict_bphs=True)
-        search_attempts = [{
-            "window": {"start": start_time, "end": end_time},
-            "strict_bphs": True,
-            "candidates": len(candidates),
-            "rejections": len(rejections)
-        }]
+    # The strict pass and both fallbacks run as one compute job so they can
+    # share evaluations of timestamps an earlier pass already covered.
+    search_kwargs = {
+        "dob": dob_date,
+        "latitude": latitude,
+        "longitude": longitude,
+        "tz_offset": tz_offset_hours_to_use,
+        "start_time_str": start_time,
+        "end_time_str": end_time,
+        "step_minutes": step_minutes,
+        "enable_shodhana": True,
+        "bphs_only_ordering": True,
+        "sunrise_local": sunrise_local,
+        "sunset_local": sunset_local,
+        "gulika_info": gulika_info,
+        "optional_traits": traits_for_scoring,
+        "optional_events": events_for_scoring,
+        "keep_all_rejections": request.include_all_rejections
+    }
+    if request.dob_uncertainty_days:
+        search_kwargs["dob_uncertainty_days"] = request.dob_uncertainty_days
+    return {
+        "search_kwargs": search_kwargs,
+        "day_context": day_context,
+        "geocode": geocode_result,
+        "tz_offset_hours": tz_offset_hours_to_use,
+        "step_minutes": step_minutes,
+        "traits": traits_for_scoring,
+        "events": events_for_scoring
+    }
 
-        # Fallback 1: widen to full-day window if user narrowed the search
-        if not candidates and (start_time != "00:00" or end_time != "23:59"):
+def _search_cache_key(search_kwargs: Dict[str, Any]) -> str:
+    """Result-cache key for a search: engine version, inputs and result-shaping config."""
+    return result_cache.make_key(btr_core.ENGINE_VERSION, {
+        **search_kwargs,
+        # Not search arguments, but they change results (and the disk tier
+        # outlives a config change)
+        "stage9_top_k": config.STAGE9_TOP_K,
+        "ephemeris_sample_step_days": config.EPHEMERIS_SAMPLE_STEP_DAYS,
+    })
+
+def _search_failure(request_id: str,
+                    error: Exception,
+                    timeout: float = config.REQUEST_TIMEOUT) -> HTTPException:
+    """HTTP error for a candidate search that could not be queued or did not finish."""
+    if isinstance(error, compute_pool.ComputePoolSaturated):
+        logger.warning("[req:%s] Rejecting BTR request: %s", request_id, error)
+        return HTTPException(
+            status_code=503,
+            detail="Server is busy with other rectifications. Please retry shortly.",
+            headers={"Retry-After": str(config.COMPUTE_RETRY_AFTER_SECONDS)}
+        )
+    if isinstance(error, asyncio.TimeoutError):
+        logger.warning("[req:%s] BTR candidate search exceeded %.1fs", request_id, timeout)
+        return HTTPException(
+            status_code=504,
+            detail=f"Candidate search exceeded the {timeout:g}s request timeout."
+        )
+    if isinstance(error, RuntimeError):
+        logger.exception("[req:%s] BTR candidate search failed: %s", request_id, error)
+        return HTTPException(status_code=500, detail=f"Failed to search candidate times: {str(error)}")
+    logger.exception("[req:%s] Unexpected error in candidate search: %s", request_id, error)
+    return HTTPException(status_code=500, detail=f"Unexpected error in candidate search: {str(error)}")
+
+def _build_btr_response(request: BTRRequest,
+                        request_id: str,
+                        prepared: Dict[str, Any],
+                        search_result: Dict[str, Any],
+                        t0: float) -> BTRResponse:
+    """Rank, explain and package a finished candidate search (phases 6-8).
+
+    Raises:
+        HTTPException: 404 with a rejection summary when no candidate passed.
+    """
+    geocode_result = prepared["geocode"]
+    tz_offset_hours_to_use = prepared["tz_offset_hours"]
+    step_minutes = prepared["step_minutes"]
+    traits_for_scoring = prepared["traits"]
+    events_for_scoring = prepared["events"]
+
+    candidates = search_result["candidates"]
+    rejections = RejectionAggregator.from_dict(search_result["rejections"])
+    search_attempts = search_result["attempts"]
+    for previous, attempt in zip(search_attempts, search_attempts[1:]):
+        if attempt.get("note") == "expanded_window_full_day":
             _log_phase(
                 request_id,
                 6,
                 "Fallback search",
                 "No candidates found; widening to full-day window",
-                {"previous_window": {"start": start_time, "end": end_time}}
+                {"previous_window": previous["window"]}
             )
-            fallback_start, fallback_end = "00:00", "23:59"
-            candidates, rejections = _run_search(fallback_start, fallback_end, strict_bphs=True)
-            search_attempts.append({
-                "window": {"start": fallback_start, "end": fallback_end},
-                "strict_bphs": True,
-                "candidates": len(candidates),
-                "rejections": len(rejections),
-                "note": "expanded_window_full_day"
-            })
-            # Update start_time and end_time to be used in the next fallback if needed
-            start_time, end_time = fallback_start, fallback_end
-            if candidates:
-                strict_bphs_used = True
-
-        # Fallback 2: relax palā tolerance (strict_bphs=False) while keeping BPHS trine rule intact
-        if not candidates:
+        else:
             _log_phase(
                 request_id,
                 6,
                 "Fallback search",
                 "No candidates after widening; retrying with relaxed palā tolerance",
-                {"window": {"start": start_time, "end": end_time}}
+                {"window": attempt["window"]}
             )
-            candidates, rejections = _run_search(start_time, end_time, strict_bphs=False)
-            search_attempts.append({
-                "window": {"start": start_time, "end": end_time},
-                "strict_bphs": False,
-                "candidates": len(candidates),
-                "rejections": len(rejections),
-                "note": "relaxed_padekyata_tolerance"
-            })
-            if candidates:
-                strict_bphs_used = False
-    except RuntimeError as e:
-        logger.exception("[req:%s] BTR candidate search failed: %s", request_id, e)
-        raise HTTPException(status_code=500, detail=f"Failed to search candidate times: {str(e)}")
-    except Exception as e:
-        logger.exception("[req:%s] Unexpected error in candidate search: %s", request_id, e)
-        raise HTTPException(status_code=500, detail=f"Unexpected error in candidate search: {str(e)}")
+    start_time, end_time = search_result["window"]["start"], search_result["window"]["end"]
 
     # Candidates are already sorted by composite_score in search_candidate_times
     if not candidates:
@@ -1024,6 +1100,7 @@ async def btr(request: BTRRequest):
                 'purification_anchor': c.get('purification_anchor'),
                 'bphs_score': c.get('bphs_score'),
                 'shodhana_delta_palas': c.get('shodhana_delta_palas'),
+                'padekyata_instant_local': c.get('padekyata_instant_local'),
                 'verification_scores': c['verification_scores']
             }
             if 'special_lagnas' in c:
@@ -1032,6 +1109,8 @@ async def btr(request: BTRRequest):
                 candidate_dict['nisheka'] = Nisheka(**c['nisheka'])
             if 'composite_score' in c:
                 candidate_dict['composite_score'] = c['composite_score']
+            if 'stage9_validated' in c:
+                candidate_dict['stage9_validated'] = c['stage9_validated']
             if 'physical_traits_scores' in c:
                 candidate_dict['physical_traits_scores'] = PhysicalTraitsScore(**c['physical_traits_scores'])
             if 'life_events_scores' in c:
@@ -1044,8 +1123,19 @@ async def btr(request: BTRRequest):
                 detail=f"Invalid candidate data structure: {str(e)}"
             )
     
+    # Nearest misses by default; the full dump is opt-in and paged
+    if request.include_all_rejections:
+        shown_rejections = rejections.page(request.rejections_offset, request.rejections_limit)
+    else:
+        shown_rejections = rejections.nearest_misses()
+    rejection_stats = {
+        **rejections.summary(),
+        "mode": "all" if request.include_all_rejections else "nearest",
+        "offset": request.rejections_offset if request.include_all_rejections else 0,
+        "returned": len(shown_rejections)
+    }
     rejection_models: List[RejectedCandidate] = []
-    for r in rejections:
+    for r in shown_rejections:
         try:
             rejection_models.append(RejectedCandidate(**r))
         except (KeyError, ValueError, TypeError) as e:
@@ -1063,7 +1153,7 @@ async def btr(request: BTRRequest):
         "Scoring complete",
         {
             "candidate_count": len(candidate_models),
-            "rejection_count": len(rejection_models),
+            "rejection_count": len(rejections),
             "best_candidate": best_candidate.time_local if best_candidate else None
         }
     )
@@ -1153,7 +1243,7 @@ async def btr(request: BTRRequest):
                 })
 
     response = BTRResponse(
-        engine_version="bphs-btr-prototype-v1",
+        engine_version=btr_core.ENGINE_VERSION,
         geocode=geocode_result,
         search_config={
             "step_minutes": step_minutes,
@@ -1161,11 +1251,13 @@ async def btr(request: BTRRequest):
                 "start_local": start_time,
                 "end_local": end_time
             },
-            "tz_offset_hours_used": tz_offset_hours_to_use
+            "tz_offset_hours_used": tz_offset_hours_to_use,
+            **({"dates_searched": search_result["dates"]} if "dates" in search_result else {})
         },
         candidates=candidate_models,
         best_candidate=best_candidate,
         rejections=rejection_models or None,
+        rejection_stats=rejection_stats,
         notes=methodology_notes,
         suggested_questions=suggested_questions_refine,
         needs_refinement=needs_refinement
@@ -1178,7 +1270,7 @@ async def btr(request: BTRRequest):
         "BTR request succeeded",
         {
             "candidates": len(candidate_models),
-            "rejections": len(rejection_models),
+            "rejections": len(rejections),
             "best_candidate": best_candidate.time_local if best_candidate else None,
             "elapsed_seconds": round(total_elapsed, 3),
             "window": f"{start_time}-{end_time}"
@@ -1186,3 +1278,320 @@ async def btr(request: BTRRequest):
     )
 
     return response
+
+@app.post("/api/btr", response_model=BTRResponse)
+async def btr(request: BTRRequest):
+    """Perform BPHS-based birth time rectification."""
+    request_id = uuid.uuid4().hex[:8]
+    t0 = time.perf_counter()
+    prepared = await _prepare_btr_search(request, request_id)
+    search_kwargs = prepared["search_kwargs"]
+
+    # Identical resolved inputs give identical results; serve repeats from cache
+    cache = result_cache.get_cache()
+    cache_key = _search_cache_key(search_kwargs)
+    search_result = cache.get(cache_key)
+    if search_result is not None:
+        logger.info("[req:%s] Search cache hit for %s-%s",
+                    request_id, search_kwargs["start_time_str"], search_kwargs["end_time_str"])
+    else:
+        cancel_token = compute_pool.cancellation_token()
+        try:
+            search_result = await compute_pool.get_pool().run(
+                btr_core.search_with_fallbacks,
+                timeout=config.REQUEST_TIMEOUT,
+                day_context=prepared["day_context"],
+                cancel_token=cancel_token,
+                **search_kwargs
+            )
+        except Exception as e:
+            # A search that outlived its request stops instead of finishing unread
+            cancel_token.cancel()
+            raise _search_failure(request_id, e)
+        cache.put(cache_key, search_result)
+
+    return _build_btr_response(request, request_id, prepared, search_result, t0)
+
+@app.post("/api/btr/batch", response_model=BTRBatchResponse)
+async def btr_batch(batch: BTRBatchRequest):
+    """Rectify several subjects in one call.
+
+    Items born on the same date at the same place form a group that runs as
+    one compute job (`btr_core.search_group`), sharing the day context,
+    Gulika and every raw evaluation; identical items are searched once.
+    Groups run concurrently (at most ``config.BATCH_MAX_PARALLEL_GROUPS``).
+    Each item gets its own status code and response or error, so one bad
+    item does not fail the batch.
+    """
+    batch_id = uuid.uuid4().hex[:8]
+    t0 = time.perf_counter()
+    request_ids = [f"{batch_id}.{index}" for index in range(len(batch.items))]
+    prepared_items = await asyncio.gather(
+        *(_prepare_btr_search(item, request_id) for item, request_id in zip(batch.items, request_ids)),
+        return_exceptions=True
+    )
+
+    cache = result_cache.get_cache()
+    item_keys: Dict[int, str] = {}
+    search_results: Dict[str, Dict[str, Any]] = {}
+    failures: Dict[str, HTTPException] = {}
+    groups: Dict[tuple, Dict[str, Any]] = {}
+    cache_hits = 0
+    for index, prepared in enumerate(prepared_items):
+        if isinstance(prepared, BaseException):
+            continue
+        search_kwargs = prepared["search_kwargs"]
+        cache_key = _search_cache_key(search_kwargs)
+        item_keys[index] = cache_key
+        if cache_key in search_results or any(cache_key in group["searches"] for group in groups.values()):
+            continue
+        cached_result = cache.get(cache_key)
+        if cached_result is not None:
+            search_results[cache_key] = cached_result
+            cache_hits += 1
+            continue
+        birth_context = (search_kwargs["dob"], search_kwargs["latitude"],
+                         search_kwargs["longitude"], search_kwargs["tz_offset"])
+        group = groups.setdefault(birth_context, {"day_context": prepared["day_context"], "searches": {}})
+        group["searches"][cache_key] = search_kwargs
+
+    semaphore = asyncio.Semaphore(max(1, config.BATCH_MAX_PARALLEL_GROUPS))
+
+    async def run_group(group: Dict[str, Any]) -> None:
+        keys = list(group["searches"])
+        async with semaphore:
+            cancel_token = compute_pool.cancellation_token()
+            try:
+                outcomes = await compute_pool.get_pool().run(
+                    btr_core.search_group,
+                    list(group["searches"].values()),
+                    timeout=config.BATCH_GROUP_TIMEOUT_SECONDS,
+                    day_context=group["day_context"],
+                    cancel_token=cancel_token
+                )
+            except asyncio.CancelledError:
+                cancel_token.cancel()
+                raise
+            except Exception as e:
+                cancel_token.cancel()
+                failure = _search_failure(batch_id, e, config.BATCH_GROUP_TIMEOUT_SECONDS)
+                failures.update((key, failure) for key in keys)
+                return
+        for key, outcome in zip(keys, outcomes):
+            if "result" in outcome:
+                cache.put(key, outcome["result"])
+                search_results[key] = outcome["result"]
+            else:
+                failures[key] = HTTPException(
+                    status_code=500, detail=f"Failed to search candidate times: {outcome['error']}"
+                )
+
+    await asyncio.gather(*(run_group(group) for group in groups.values()))
+
+    items: List[BTRBatchItem] = []
+    for index, (request, prepared) in enumerate(zip(batch.items, prepared_items)):
+        if isinstance(prepared, BaseException):
+            if not isinstance(prepared, HTTPException):
+                logger.error("[req:%s] Unexpected preparation error: %s", request_ids[index], prepared)
+                prepared = HTTPException(status_code=500, detail=f"Unexpected error: {prepared}")
+            items.append(BTRBatchItem(index=index, status_code=prepared.status_code, error=prepared.detail))
+            continue
+        cache_key = item_keys[index]
+        failure = failures.get(cache_key)
+        if failure is None:
+            try:
+                response = _build_btr_response(
+                    request, request_ids[index], prepared, search_results[cache_key], t0
+                )
+            except HTTPException as e:
+                failure = e
+        if failure is not None:
+            items.append(BTRBatchItem(index=index, status_code=failure.status_code, error=failure.detail))
+            continue
+        items.append(BTRBatchItem(index=index, status_code=200, response=response))
+
+    searches = sum(len(group["searches"]) for group in groups.values())
+    logger.info(
+        "[req:%s] Batch complete | items=%d groups=%d searches=%d cache_hits=%d elapsed=%.2fs",
+        batch_id, len(items), len(groups), searches, cache_hits, time.perf_counter() - t0
+    )
+    return BTRBatchResponse(items=items, groups=len(groups), searches=searches, cache_hits=cache_hits)
+
+def _ndjson(event: Dict[str, Any]) -> bytes:
+    """One NDJSON line of the streaming endpoint."""
+    return (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+
+@app.post("/api/btr/stream")
+async def btr_stream(request: BTRRequest):
+    """Rectify like /api/btr, streaming NDJSON events while the search runs.
+
+    Each line is one JSON object:
+        * ``{"event": "pass", "window", "strict_bphs", "note"}`` as each
+          search pass (strict, widened, relaxed) starts;
+        * ``{"event": "progress", "step", "total_steps", "candidates", "rejections"}``;
+        * ``{"event": "candidate", "candidate"}`` as soon as a time passes;
+        * ``{"event": "shodhana", "rank", "candidate"}`` when palā-level
+          śodhana refines a top candidate;
+        * finally ``{"event": "result", "response"}`` (the /api/btr body) or
+          ``{"event": "error", "status_code", "detail"}``.
+
+    Input and capacity errors are returned as ordinary HTTP errors before
+    the stream starts.  A cached search replays its candidates at once.
+    """
+    request_id = uuid.uuid4().hex[:8]
+    t0 = time.perf_counter()
+    prepared = await _prepare_btr_search(request, request_id)
+    search_kwargs = prepared["search_kwargs"]
+
+    cache = result_cache.get_cache()
+    cache_key = _search_cache_key(search_kwargs)
+    cached_result = cache.get(cache_key)
+    events = cancel_token = None
+    if cached_result is not None:
+        logger.info("[req:%s] Search cache hit for %s-%s",
+                    request_id, search_kwargs["start_time_str"], search_kwargs["end_time_str"])
+    else:
+        cancel_token = compute_pool.cancellation_token()
+        try:
+            events = compute_pool.get_pool().stream(
+                btr_core.search_with_fallbacks,
+                timeout=config.REQUEST_TIMEOUT,
+                day_context=prepared["day_context"],
+                cancel_token=cancel_token,
+                **search_kwargs
+            )
+        except Exception as e:
+            raise _search_failure(request_id, e)
+
+    async def body():
+        search_result = cached_result
+        if events is None:
+            for candidate in search_result["candidates"]:
+                yield _ndjson({"event": "candidate", "candidate": candidate})
+        else:
+            try:
+                async for event in events:
+                    if event["event"] == "done":
+                        search_result = event["result"]
+                    else:
+                        yield _ndjson(event)
+            except Exception as e:
+                failure = _search_failure(request_id, e)
+                yield _ndjson({"event": "error", "status_code": failure.status_code, "detail": failure.detail})
+                return
+            finally:
+                # Failed, timed out or the client went away: stop the search
+                if search_result is None:
+                    cancel_token.cancel()
+            cache.put(cache_key, search_result)
+        try:
+            response = _build_btr_response(request, request_id, prepared, search_result, t0)
+        except HTTPException as e:
+            yield _ndjson({"event": "error", "status_code": e.status_code, "detail": e.detail})
+            return
+        yield _ndjson({"event": "result", "response": response.model_dump(mode="json")})
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+def _finish_job(job: jobs.Job,
+                request: BTRRequest,
+                request_id: str,
+                prepared: Dict[str, Any],
+                search_result: Dict[str, Any],
+                t0: float) -> None:
+    """Record a job's response, or its 404 when nothing passed."""
+    try:
+        response = _build_btr_response(request, request_id, prepared, search_result, t0)
+    except HTTPException as e:
+        job.finish(jobs.FAILED, error={"status_code": e.status_code, "detail": e.detail})
+        return
+    job.finish(jobs.SUCCEEDED, result=response.model_dump(mode="json"))
+
+async def _run_job(job: jobs.Job,
+                   events: Any,
+                   request: BTRRequest,
+                   request_id: str,
+                   prepared: Dict[str, Any],
+                   cache_key: str,
+                   t0: float) -> None:
+    """Drive a submitted job's search and record its outcome."""
+    search_result = None
+    try:
+        async for event in events:
+            if event["event"] == "done":
+                search_result = event["result"]
+            else:
+                job.record_event(event)
+    except (SearchCancelled, concurrent.futures.CancelledError):
+        logger.info("[req:%s] Job %s cancelled", request_id, job.id)
+        job.finish(jobs.CANCELLED)
+        return
+    except asyncio.CancelledError:
+        job.token.cancel()
+        job.finish(jobs.CANCELLED)
+        raise
+    except Exception as e:
+        job.token.cancel()
+        failure = _search_failure(request_id, e, config.JOB_TIMEOUT_SECONDS)
+        job.finish(jobs.FAILED, error={"status_code": failure.status_code, "detail": failure.detail})
+        return
+    result_cache.get_cache().put(cache_key, search_result)
+    _finish_job(job, request, request_id, prepared, search_result, t0)
+
+@app.post("/api/btr/jobs", status_code=202)
+async def create_btr_job(request: BTRRequest):
+    """Submit a rectification to run in the background.
+
+    Input and capacity errors are answered at once (400/422/503).  Otherwise
+    the job is queued and its snapshot returned with a Location header to
+    poll (`GET /api/btr/jobs/{job_id}`) or cancel (`DELETE`).
+    """
+    request_id = uuid.uuid4().hex[:8]
+    t0 = time.perf_counter()
+    prepared = await _prepare_btr_search(request, request_id)
+    search_kwargs = prepared["search_kwargs"]
+
+    cache_key = _search_cache_key(search_kwargs)
+    cached_result = result_cache.get_cache().get(cache_key)
+    if cached_result is not None:
+        job = jobs.get_manager().create(CancellationToken())
+        _finish_job(job, request, request_id, prepared, cached_result, t0)
+    else:
+        cancel_token = compute_pool.cancellation_token()
+        try:
+            events = compute_pool.get_pool().stream(
+                btr_core.search_with_fallbacks,
+                timeout=config.JOB_TIMEOUT_SECONDS,
+                day_context=prepared["day_context"],
+                cancel_token=cancel_token,
+                **search_kwargs
+            )
+        except Exception as e:
+            raise _search_failure(request_id, e)
+        job = jobs.get_manager().create(cancel_token)
+        job.task = asyncio.create_task(
+            _run_job(job, events, request, request_id, prepared, cache_key, t0)
+        )
+    logger.info("[req:%s] Job %s submitted (%s)", request_id, job.id, job.status)
+    return JSONResponse(
+        status_code=202,
+        content=job.snapshot(),
+        headers={"Location": f"/api/btr/jobs/{job.id}"}
+    )
+
+@app.get("/api/btr/jobs/{job_id}")
+async def get_btr_job(job_id: str):
+    """Status, progress and (once finished) result or error of a job."""
+    job = jobs.get_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired job: {job_id}")
+    return job.snapshot()
+
+@app.delete("/api/btr/jobs/{job_id}")
+async def cancel_btr_job(job_id: str):
+    """Cancel a job; its search stops at its next cancellation check."""
+    job = jobs.get_manager().cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired job: {job_id}")
+    logger.info("Job %s cancellation requested (%s)", job_id, job.status)
+    return job.snapshot()
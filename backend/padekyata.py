@@ -0,0 +1,128 @@
+"""Root-finding solver for Lagna–Prāṇa-pada equality (BPHS 4.6).
+
+Padekyatā holds when the lagna and the Sphuṭa Prāṇa-pada occupy the same
+degree.  Their wrapped difference ``Δ(t) = wrap(lagna(t) − prāṇa-pada(t))``
+is a smooth function of time between a few known discontinuities (the
+±180° wrap, the sunrise reset of Ishta-kāla and Sun ingresses that move the
+Prāṇa-pada base sign).  Prāṇa-pada advances 2° per palā while the lagna
+moves roughly 0.1°, so Δ sweeps the circle about once every 75 minutes and
+crosses zero at isolated instants.
+
+Instead of stepping palā by palā, `find_roots` samples Δ on a coarse
+bracket grid (vectorised), keeps the sign changes that are genuine crossings
+rather than wraps, and refines each bracket with Brent's method to a time
+tolerance far below one vipala (0.4 s).  Every root is verified against the
+function, so brackets that straddle a discontinuity are discarded.
+"""
+
+import math
+from typing import Callable
+
+import numpy as np
+
+# Bracket spacing in seconds.  Δ changes by roughly 10° per two minutes, far
+# from the 180° wrap, so no crossing can hide between two samples.
+BRACKET_STEP_SECONDS = 120.0
+# Root time tolerance in seconds (1 vipala = 0.4 s)
+ROOT_TOLERANCE_SECONDS = 0.01
+# A refined root must satisfy |Δ| below this (degrees); otherwise the bracket
+# straddled a discontinuity rather than a crossing.
+ROOT_RESIDUAL_DEGREES = 0.01
+# Sign changes with |Δ| beyond this on either side are ±180° wraps.
+WRAP_GUARD_DEGREES = 90.0
+
+
+def wrap_degrees(x):
+    """Wrap an angle (or array of angles) into [-180, 180)."""
+    return (x + 180.0) % 360.0 - 180.0
+
+
+def brent_root(f: Callable[[float], float],
+               a: float,
+               b: float,
+               fa: float,
+               fb: float,
+               xtol: float = ROOT_TOLERANCE_SECONDS,
+               max_iter: int = 100) -> float:
+    """Brent–Dekker root of f on a bracket [a, b] with f(a)·f(b) ≤ 0."""
+    if fa == 0.0:
+        return a
+    if fb == 0.0:
+        return b
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(max_iter):
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2.0 * 2.2e-16 * abs(b) + 0.5 * xtol
+        m = 0.5 * (c - b)
+        if abs(m) <= tol or fb == 0.0:
+            return b
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            # Attempt inverse quadratic interpolation / secant step
+            s = fb / fa
+            if a == c:
+                p = 2.0 * m * s
+                q = 1.0 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2.0 * p < min(3.0 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, m)
+        fb = f(b)
+    return b
+
+
+def find_roots(delta_array: Callable[[np.ndarray], np.ndarray],
+               t_start: float,
+               t_end: float,
+               bracket_step: float = BRACKET_STEP_SECONDS,
+               xtol: float = ROOT_TOLERANCE_SECONDS) -> list[float]:
+    """All zero crossings of a wrapped-angle function on [t_start, t_end].
+
+    Args:
+        delta_array: Vectorised Δ(t) in degrees, wrapped to [-180, 180).
+        t_start: Start of the interval (seconds).
+        t_end: End of the interval (seconds).
+        bracket_step: Spacing of the bracketing samples (seconds).
+        xtol: Root tolerance in seconds.
+
+    Returns:
+        Sorted root times (seconds) with |Δ| below ROOT_RESIDUAL_DEGREES.
+    """
+    if t_end < t_start:
+        return []
+    count = max(2, int(math.ceil((t_end - t_start) / bracket_step)) + 1)
+    t = np.linspace(t_start, t_end, count)
+    values = delta_array(t)
+
+    def f(x: float) -> float:
+        return float(delta_array(np.array([x]))[0])
+
+    roots = [float(x) for x, v in zip(t, values) if v == 0.0]
+    crossings = np.flatnonzero(
+        (np.sign(values[:-1]) * np.sign(values[1:]) < 0) &
+        (np.abs(values[:-1]) < WRAP_GUARD_DEGREES) &
+        (np.abs(values[1:]) < WRAP_GUARD_DEGREES)
+    )
+    for i in crossings:
+        root = brent_root(f, float(t[i]), float(t[i + 1]), float(values[i]), float(values[i + 1]), xtol)
+        if abs(f(root)) <= ROOT_RESIDUAL_DEGREES:
+            roots.append(root)
+    return sorted(roots)
@@ -0,0 +1,199 @@
+"""Bounded-memory aggregation of rejected search steps.
+
+With ``collect_rejections`` a search used to append one dict per rejected
+grid step: hundreds per pass for a full-day 2-minute scan, across up to three
+fallback passes.  `main.btr` turned every one into a `RejectedCandidate`
+model and shipped them all in `BTRResponse.rejections`, although the summary
+shown to users only needs counts per reason, the smallest deltas and a
+handful of near misses.
+
+`RejectionAggregator` keeps exactly that:
+
+    * counts per rejection reason and per non-human classification,
+    * fixed-bin histograms of the Prāṇapada, Moon and Gulika deltas,
+    * the smallest delta of each kind,
+    * the K nearest misses (smallest Prāṇapada delta, ties by time).
+
+Its size depends only on K and the number of distinct reasons, never on the
+window width.  A full record dump stays available as an opt-in
+(``keep_all=True``), served a page at a time with `page`.
+
+Aggregators built over contiguous shards of a grid `merge` into the result
+of a serial scan.  `to_dict`/`from_dict` round-trip through JSON, so the
+aggregate can sit in the result cache.
+"""
+
+import math
+from typing import Any, Iterable, Optional
+
+from . import config
+
+# Upper bin edges (degrees) of the delta histograms; the last bin is open-ended
+DELTA_BIN_EDGES = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 90.0)
+# Record field of each histogram, keyed by its name in the summary
+DELTA_FIELDS = {
+    'padekyata': 'delta_pp_deg',
+    'moon': 'delta_moon_deg',
+    'gulika': 'delta_gulika_deg'
+}
+UNKNOWN_REASON = "Unknown rejection"
+UNCLASSIFIED = "none"
+
+
+def _bin_index(value: float) -> int:
+    """Histogram bin of a delta."""
+    for index, edge in enumerate(DELTA_BIN_EDGES):
+        if value < edge:
+            return index
+    return len(DELTA_BIN_EDGES)
+
+
+def _nearest_key(record: dict[str, Any]) -> tuple[float, str]:
+    """Ordering of near misses: smallest Prāṇapada delta first, then time."""
+    delta = record.get('delta_pp_deg')
+    return (math.inf if delta is None else delta, record.get('time_local') or '')
+
+
+class RejectionAggregator:
+    """Counts, histograms and nearest misses of rejected candidate times.
+
+    Args:
+        nearest: Number of nearest misses kept (K).
+        keep_all: Also keep every record, in insertion order, for `page`.
+    """
+
+    __slots__ = ('nearest', 'keep_all', 'total', 'reason_counts', 'classification_counts',
+                 'histograms', 'min_deltas', '_nearest', '_cutoff', '_records')
+
+    def __init__(self, nearest: int = config.REJECTION_NEAREST_MISSES, keep_all: bool = False):
+        self.nearest = max(0, nearest)
+        self.keep_all = keep_all
+        self.total = 0
+        self.reason_counts: dict[str, int] = {}
+        self.classification_counts: dict[str, int] = {}
+        self.histograms = {name: [0] * (len(DELTA_BIN_EDGES) + 1) for name in DELTA_FIELDS}
+        self.min_deltas: dict[str, Optional[float]] = {name: None for name in DELTA_FIELDS}
+        # Up to 2K candidates for the K nearest misses, compacted when full
+        self._nearest: list[tuple[tuple[float, str], dict[str, Any]]] = []
+        self._cutoff: Optional[tuple[float, str]] = None
+        self._records: Optional[list[dict[str, Any]]] = [] if keep_all else None
+
+    def __len__(self) -> int:
+        return self.total
+
+    def spawn(self) -> "RejectionAggregator":
+        """Empty aggregator with the same settings (for shards and profiles)."""
+        return RejectionAggregator(self.nearest, self.keep_all)
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Count one rejected time (a `search_candidate_times` rejection dict)."""
+        self.total += 1
+        reason = record.get('rejection_reason') or UNKNOWN_REASON
+        self.reason_counts[reason] = self.reason_counts.get(reason, 0) + 1
+        classification = record.get('non_human_classification') or UNCLASSIFIED
+        self.classification_counts[classification] = self.classification_counts.get(classification, 0) + 1
+
+        for name, field in DELTA_FIELDS.items():
+            value = record.get(field)
+            if value is None:
+                continue
+            self.histograms[name][_bin_index(value)] += 1
+            current = self.min_deltas[name]
+            if current is None or value < current:
+                self.min_deltas[name] = value
+
+        if self.nearest:
+            key = _nearest_key(record)
+            if self._cutoff is None or key < self._cutoff:
+                self._nearest.append((key, record))
+                if len(self._nearest) >= 2 * self.nearest:
+                    self._compact()
+
+        if self._records is not None:
+            self._records.append(record)
+
+    def extend(self, records: Iterable[dict[str, Any]]) -> None:
+        """Count several rejected times."""
+        for record in records:
+            self.add(record)
+
+    def merge(self, other: "RejectionAggregator") -> None:
+        """Fold in the aggregate of the following grid slice."""
+        self.total += other.total
+        for reason, count in other.reason_counts.items():
+            self.reason_counts[reason] = self.reason_counts.get(reason, 0) + count
+        for classification, count in other.classification_counts.items():
+            self.classification_counts[classification] = (
+                self.classification_counts.get(classification, 0) + count
+            )
+        for name, counts in other.histograms.items():
+            self.histograms[name] = [a + b for a, b in zip(self.histograms[name], counts)]
+            value = other.min_deltas[name]
+            current = self.min_deltas[name]
+            if value is not None and (current is None or value < current):
+                self.min_deltas[name] = value
+        if self.nearest:
+            self._nearest.extend(other._nearest)
+            self._compact()
+        if self._records is not None and other._records is not None:
+            self._records.extend(other._records)
+
+    def _compact(self) -> None:
+        """Keep only the K nearest misses seen so far."""
+        self._nearest.sort(key=lambda item: item[0])
+        del self._nearest[self.nearest:]
+        if self.nearest and len(self._nearest) == self.nearest:
+            self._cutoff = self._nearest[-1][0]
+
+    def nearest_misses(self) -> list[dict[str, Any]]:
+        """The K nearest misses, closest first."""
+        self._compact()
+        return [record for _, record in self._nearest]
+
+    def page(self, offset: int = 0, limit: int = config.REJECTION_PAGE_SIZE) -> list[dict[str, Any]]:
+        """A page of every rejected record in grid order (requires ``keep_all``)."""
+        if self._records is None:
+            raise ValueError("Full rejection dump requires an aggregator built with keep_all=True")
+        return self._records[offset:offset + limit]
+
+    def summary(self) -> dict[str, Any]:
+        """Counts, histograms and smallest deltas (without any records)."""
+        return {
+            'total': self.total,
+            'reason_counts': dict(self.reason_counts),
+            'classification_counts': dict(self.classification_counts),
+            'histograms': {
+                'bin_edges_deg': list(DELTA_BIN_EDGES),
+                **{name: list(counts) for name, counts in self.histograms.items()}
+            },
+            'min_deltas': dict(self.min_deltas)
+        }
+
+    def top_reasons(self, limit: Optional[int] = None) -> list[tuple[str, int]]:
+        """Rejection reasons by descending count (first seen wins ties)."""
+        ordered = sorted(self.reason_counts.items(), key=lambda kv: kv[1], reverse=True)
+        return ordered if limit is None else ordered[:limit]
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serialisable form (see `from_dict`)."""
+        payload = self.summary()
+        payload['nearest'] = self.nearest
+        payload['nearest_misses'] = self.nearest_misses()
+        if self._records is not None:
+            payload['records'] = list(self._records)
+        return payload
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "RejectionAggregator":
+        """Rebuild an aggregator from `to_dict` output."""
+        aggregator = cls(payload['nearest'], keep_all='records' in payload)
+        aggregator.total = payload['total']
+        aggregator.reason_counts = dict(payload['reason_counts'])
+        aggregator.classification_counts = dict(payload['classification_counts'])
+        aggregator.histograms = {name: list(payload['histograms'][name]) for name in DELTA_FIELDS}
+        aggregator.min_deltas = {name: payload['min_deltas'][name] for name in DELTA_FIELDS}
+        aggregator._nearest = [(_nearest_key(record), record) for record in payload['nearest_misses']]
+        aggregator._compact()
+        if 'records' in payload:
+            aggregator._records = list(payload['records'])
+        return aggregator
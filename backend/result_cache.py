@@ -0,0 +1,238 @@
+"""Content-addressed cache for BTR search results.
+
+Identical rectification requests (frontend retries, users re-submitting a
+form) resolve to identical search inputs.  `ResultCache` stores the output of
+each search keyed on a SHA-256 of those inputs plus the engine version, so a
+repeat request skips the candidate search entirely.
+
+Tiers:
+    * Memory: LRU over encoded entries with a TTL and a byte budget
+      (``config.RESULT_CACHE_MAX_BYTES``).
+    * Disk (optional): a SQLite file at ``config.RESULT_CACHE_DB_PATH`` with
+      its own byte budget, so results survive worker restarts and are shared
+      by workers on one host.  Disk hits are promoted to memory.
+
+Values must be JSON-serialisable.  They are stored encoded, so every `get`
+returns a fresh copy that callers may mutate freely.
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from . import config
+
+logger = logging.getLogger("btr.cache")
+
+
+def _canonical(value: Any) -> Any:
+    """JSON fallback for values json cannot encode natively."""
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    raise TypeError(f"Unsupported cache key/value type: {type(value).__name__}")
+
+
+def make_key(engine_version: str, inputs: dict[str, Any]) -> str:
+    """Canonical SHA-256 key for a set of resolved inputs."""
+    payload = json.dumps(
+        {'engine_version': engine_version, 'inputs': inputs},
+        sort_keys=True, separators=(',', ':'), default=_canonical
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """Two-tier (memory LRU + optional SQLite) TTL cache.
+
+    Args:
+        max_bytes: Memory budget for encoded entries.
+        ttl_seconds: Lifetime of an entry; 0 disables caching.
+        db_path: SQLite file for the disk tier; empty/None keeps memory only.
+        disk_max_bytes: Byte budget of the disk tier.
+    """
+
+    def __init__(self,
+                 max_bytes: int = config.RESULT_CACHE_MAX_BYTES,
+                 ttl_seconds: float = config.RESULT_CACHE_TTL_SECONDS,
+                 db_path: Optional[str] = config.RESULT_CACHE_DB_PATH,
+                 disk_max_bytes: int = config.RESULT_CACHE_DISK_MAX_BYTES):
+        self.max_bytes = max(0, max_bytes)
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self.disk_max_bytes = max(0, disk_max_bytes)
+        self._entries: "OrderedDict[str, tuple[float, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            try:
+                self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, "
+                    "accessed_at REAL NOT NULL, size INTEGER NOT NULL, value BLOB NOT NULL)"
+                )
+            except sqlite3.Error as e:
+                logger.warning("Result cache disk tier disabled (%s): %s", db_path, e)
+                self._db = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and (self.max_bytes > 0 or self._db is not None)
+
+    # ------------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------------
+
+    def _store_memory(self, key: str, expires_at: float, blob: bytes) -> None:
+        if len(blob) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old[1])
+        self._entries[key] = (expires_at, blob)
+        self._bytes += len(blob)
+        while self._bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def _drop_memory(self, key: str) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old[1])
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+
+    def _load_disk(self, key: str, now: float) -> Optional[tuple[float, bytes]]:
+        try:
+            row = self._db.execute(
+                "SELECT expires_at, value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[0] <= now:
+                self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                return None
+            self._db.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+            return row[0], bytes(row[1])
+        except sqlite3.Error as e:
+            logger.warning("Result cache disk read failed: %s", e)
+            return None
+
+    def _store_disk(self, key: str, expires_at: float, blob: bytes, now: float) -> None:
+        if len(blob) > self.disk_max_bytes:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, expires_at, accessed_at, size, value) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, expires_at, now, len(blob), blob)
+            )
+            self._db.execute("DELETE FROM results WHERE expires_at <= ?", (now,))
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            if total > self.disk_max_bytes:
+                # Drop least recently used rows until the budget holds
+                excess = total - self.disk_max_bytes
+                rows = self._db.execute("SELECT key, size FROM results ORDER BY accessed_at, rowid").fetchall()
+                stale = []
+                for row_key, size in rows:
+                    if excess <= 0:
+                        break
+                    stale.append((row_key,))
+                    excess -= size
+                self._db.executemany("DELETE FROM results WHERE key = ?", stale)
+                self.evictions += len(stale)
+        except sqlite3.Error as e:
+            logger.warning("Result cache disk write failed: %s", e)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached value, or None on a miss."""
+        if not self.enabled:
+            return None
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                self._drop_memory(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            elif self._db is not None:
+                entry = self._load_disk(key, now)
+                if entry is not None:
+                    self._store_memory(key, *entry)
+                    self.hits += 1
+                    self.disk_hits += 1
+            if entry is None:
+                self.misses += 1
+                return None
+        return json.loads(entry[1])
+
+    def put(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a JSON-serialisable value under a key.
+
+        Args:
+            key: Cache key.
+            value: JSON-serialisable value.
+            ttl_seconds: Lifetime override for this entry (defaults to the cache TTL).
+        """
+        if not self.enabled:
+            return
+        blob = json.dumps(value, separators=(',', ':'), default=_canonical).encode('utf-8')
+        now = time.time()
+        expires_at = now + (self.ttl_seconds if ttl_seconds is None else ttl_seconds)
+        with self._lock:
+            self._store_memory(key, expires_at, blob)
+            if self._db is not None:
+                self._store_disk(key, expires_at, blob, now)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.disk_hits = self.evictions = 0
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM results")
+                except sqlite3.Error as e:
+                    logger.warning("Result cache disk clear failed: %s", e)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and current memory usage."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'disk_hits': self.disk_hits,
+                'evictions': self.evictions,
+                'disk_enabled': self._db is not None
+            }
+
+
+_CACHE = ResultCache()
+
+
+def get_cache() -> ResultCache:
+    """Return the process-wide result cache."""
+    return _CACHE
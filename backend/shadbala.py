@@ -27,7 +27,10 @@ from .astro_utils import (
     PLANETS, PLANET_IDS, EXALTATION_DEGREES as EXALTATION_POINTS, RELATIONSHIPS,
     get_sign_lord, angular_difference, get_weekday_index
 )
-from .vargas import calculate_shodasa_vargas
+from .chart_context import ChartContext
+from .vargas import SAPTAVARGA_DIVISIONS
+from .day_context import DayContext
+from . import ephemeris
 
 # Naisargika Bala (Natural Strength) - BPHS values in Rupas
 NAISARGIKA_BALA_RUPAS = {
@@ -95,7 +98,7 @@ def get_rashi_strength_score(planet: str, rashi_sign: int) -> float:
     # BPHS Saptavarga Bala strictly requires Compound Relationship (Panchadha Maitri).
     # Compound = Naisargika (Natural) + Tatkalika (Temporary).
     
-    # Current limitation: calculate_shodasa_vargas returns positions.
+    # Current limitation: the varga charts only carry positions.
     # So we CAN compute Tatkalika for each Varga.
     # But this function 'get_rashi_strength_score' needs context of other planets in that Varga.
     
@@ -107,7 +110,9 @@ def get_rashi_strength_score(planet: str, rashi_sign: int) -> float:
     if rel_val == 0: return 7.5 # Sama
     return 3.75 # Satru
 
-def calculate_saptavarga_bala(lagna_deg: float, planets_deg: Dict[str, float]) -> Dict[str, float]:
+def calculate_saptavarga_bala(lagna_deg: float,
+                              planets_deg: Dict[str, float],
+                              context: Optional[ChartContext] = None) -> Dict[str, float]:
     """Calculate Saptavarga Bala (Divisional Chart Strength).
     
     Charts: Rashi(D1), Hora(D2), Drekkana(D3), Saptamsa(D7), 
@@ -123,63 +128,25 @@ def calculate_saptavarga_bala(lagna_deg: float, planets_deg: Dict[str, float]) -
     
     Requires Panchadha Maitri (Compound Relationship) in EACH Varga.
     Tatkalika Mitra (Temporary Friend): Planet in 2, 3, 4, 10, 11, 12 from subject.
+
+    Args:
+        lagna_deg: Ascendant longitude.
+        planets_deg: Planetary positions.
+        context: Shared chart context (vargas and relationships are reused).
     """
-    vargas = calculate_shodasa_vargas(lagna_deg, planets_deg)
-    required_vargas = ['D-1', 'D-2', 'D-3', 'D-7', 'D-9', 'D-12', 'D-30']
+    if context is None:
+        context = ChartContext(0.0, lagna_deg, planets_deg)
+    # Only the signs are needed, except D-1 degrees for Moolatrikona
+    varga_signs = context.varga_signs_for(SAPTAVARGA_DIVISIONS)
     
     scores = {p: 0.0 for p in PLANETS}
     
-    for varga_name in required_vargas:
-        chart_positions = vargas[varga_name]
-        
+    for division, chart_signs in varga_signs.items():
         for planet in PLANETS:
-            p_deg = chart_positions[planet]
-            p_sign = int(p_deg / 30.0) % 12
-            lord = get_sign_lord(p_deg)
-            
-            # 1. Determine Natural Relationship
-            natural_rel = RELATIONSHIPS[planet].get(lord, 0) # 1, 0, -1
-            
-            # 2. Determine Temporary Relationship (Tatkalika)
-            # Planets in 2, 3, 4, 10, 11, 12 from Planet are Friends.
-            # Others (1, 5, 6, 7, 8, 9) are Enemies.
-            if lord == planet:
-                compound_rel = 'own'
-            else:
-                # Find lord's position in THIS varga
-                # Note: Lord might not be in PLANETS list (e.g. if nodes rule? No, nodes don't rule).
-                # Lords are always Sun..Saturn.
-                if lord in chart_positions:
-                    lord_deg = chart_positions[lord]
-                    lord_sign = int(lord_deg / 30.0) % 12
-                    
-                    # Count signs from Planet to Lord
-                    # e.g. Planet in 1, Lord in 2 -> count = 2.
-                    count = ((lord_sign - p_sign) % 12) + 1
-                    
-                    is_temp_friend = count in [2, 3, 4, 10, 11, 12]
-                    temp_rel_val = 1 if is_temp_friend else -1
-                    
-                    total_rel = natural_rel + temp_rel_val
-                    # Map total to status
-                    # 2 = Great Friend (1 + 1)
-                    # 1 = Friend (0 + 1) -> Actually 1+ -1 = 0? No.
-                    # BPHS Matrix:
-                    # Nat Friend + Temp Friend = Great Friend (Adhi Mitra)
-                    # Nat Neutral + Temp Friend = Friend (Mitra)
-                    # Nat Enemy + Temp Friend = Neutral (Sama)
-                    # Nat Friend + Temp Enemy = Neutral (Sama)
-                    # Nat Neutral + Temp Enemy = Enemy (Satru)
-                    # Nat Enemy + Temp Enemy = Great Enemy (Adhi Satru)
-                    
-                    if total_rel == 2: compound_rel = 'adhimitra'
-                    elif total_rel == 1: compound_rel = 'mitra'
-                    elif total_rel == 0: compound_rel = 'sama'
-                    elif total_rel == -1: compound_rel = 'satru'
-                    else: compound_rel = 'adhisatru'
-                else:
-                    # Fallback if lord position unknown (shouldn't happen for 7 planets)
-                    compound_rel = 'sama'
+            p_sign = chart_signs[planet]
+
+            # Natural + Temporary (Tatkalika) relationship to the sign lord in this varga
+            compound_rel = context.relationship(division, planet)
 
             # 3. Assign Virupas
             if compound_rel == 'own': val = 30.0
@@ -192,9 +159,9 @@ def calculate_saptavarga_bala(lagna_deg: float, planets_deg: Dict[str, float]) -
             # Special Moolatrikona check for D-1 only? 
             # BPHS usually applies Moolatrikona only in Rashi, but some extend it.
             # We will stick to Rashi chart for Moolatrikona bonus (45.0)
-            if varga_name == 'D-1' and compound_rel == 'own':
+            if division == 1 and compound_rel == 'own':
                 # Check degrees for Moolatrikona
-                deg_in_sign = p_deg % 30.0
+                deg_in_sign = context.varga(1)[planet] % 30.0
                 is_mool = False
                 if planet == SUN and p_sign == 4 and 0 <= deg_in_sign < 20: is_mool = True
                 elif planet == MOON and p_sign == 1 and 3 <= deg_in_sign < 30: is_mool = True
@@ -210,7 +177,9 @@ def calculate_saptavarga_bala(lagna_deg: float, planets_deg: Dict[str, float]) -
             
     return scores
 
-def calculate_sthaana_bala(planets_deg: Dict[str, float], lagna_deg: float) -> Dict[str, float]:
+def calculate_sthaana_bala(planets_deg: Dict[str, float],
+                           lagna_deg: float,
+                           context: Optional[ChartContext] = None) -> Dict[str, float]:
     """Calculate Sthaana Bala (Positional Strength).
     
     Components:
@@ -220,6 +189,8 @@ def calculate_sthaana_bala(planets_deg: Dict[str, float], lagna_deg: float) -> D
     4. Kendra Bala (Angle Strength)
     5. Drekkana Bala (Decanate Strength)
     """
+    if context is None:
+        context = ChartContext(0.0, lagna_deg, planets_deg)
     scores = {p: 0.0 for p in PLANETS}
     
     # 1. Uccha Bala (Exaltation) - BPHS Formula
@@ -232,23 +203,21 @@ def calculate_sthaana_bala(planets_deg: Dict[str, float], lagna_deg: float) -> D
         scores[planet] += diff / 3.0
         
     # 2. Saptavarga Bala
-    sv_scores = calculate_saptavarga_bala(lagna_deg, planets_deg)
+    sv_scores = calculate_saptavarga_bala(lagna_deg, planets_deg, context=context)
     for p in PLANETS:
         scores[p] += sv_scores[p]
         
     # 3. Oja-Yugma Bala (Odd-Even in Rashi and Navamsa)
     # BPHS: Venus/Moon in Even Signs get 15.
     # Others (Sun, Mars, Jup, Merc, Sat) in Odd Signs get 15.
-    vargas = calculate_shodasa_vargas(lagna_deg, planets_deg)
+    rashi, navamsa = context.varga_signs(1), context.varga_signs(9)
     for planet in PLANETS:
         # Check Rashi (D-1)
-        rashi_deg = vargas['D-1'][planet]
-        rashi_sign = int(rashi_deg / 30.0) % 12
+        rashi_sign = rashi[planet]
         is_rashi_odd = (rashi_sign % 2 == 0) # 0=Aries(Odd)
         
         # Check Navamsa (D-9)
-        nav_deg = vargas['D-9'][planet]
-        nav_sign = int(nav_deg / 30.0) % 12
+        nav_sign = navamsa[planet]
         is_nav_odd = (nav_sign % 2 == 0)
         
         # Female Planets (Moon, Venus) favor Even
@@ -341,7 +310,7 @@ def calculate_dig_bala(planets_deg: Dict[str, float], lagna_deg: float) -> Dict[
         
     return scores
 
-def calculate_ayana_bala(jd_ut: float) -> Dict[str, float]:
+def calculate_ayana_bala(jd_ut: float, context: Optional[ChartContext] = None) -> Dict[str, float]:
     """Calculate Ayana Bala (Equinoctial Strength).
     
     Based on Tropical Declination (Kranti).
@@ -358,23 +327,24 @@ def calculate_ayana_bala(jd_ut: float) -> Dict[str, float]:
       
     Mercury: Always 30.0 (Neutral).
     """
+    if context is not None:
+        # Kaala Bala and Cheshta Bala both need it; compute once per chart
+        return context.memo('ayana_bala', lambda: _ayana_bala(context.declinations))
+    # Equatorial declinations from the sampled ephemeris service
+    return _ayana_bala(ephemeris.get_service().declinations(jd_ut))
+
+def _ayana_bala(declinations: Dict[str, float]) -> Dict[str, float]:
+    """Ayana Bala from equatorial declinations (see calculate_ayana_bala)."""
     scores = {p: 0.0 for p in PLANETS}
     scores[MERCURY] = 30.0
     
     north_strong = [SUN, MARS, JUPITER, VENUS]
     south_strong = [MOON, SATURN]
     
-    # Flags for Equatorial coordinates (RA/Dec)
-    flags = swe.FLG_EQUATORIAL | swe.FLG_SWIEPH
-    
     for planet in PLANETS:
         if planet == MERCURY: continue
         
-        pid = PLANET_IDS[planet]
-        # Calculate equatorial position
-        res = swe.calc_ut(jd_ut, pid, flags)
-        # res[0] = [RA, Dec, Dist, ...]
-        declination = res[0][1]
+        declination = declinations[planet]
         
         abs_dec = abs(declination)
         is_north = declination >= 0
@@ -455,7 +425,9 @@ def calculate_kaala_bala(jd_ut: float,
                         planets_deg: Dict[str, float], 
                         sunrise: datetime.datetime, 
                         sunset: datetime.datetime,
-                        birth_time: datetime.datetime) -> Dict[str, Any]:
+                        birth_time: datetime.datetime,
+                        context: Optional[ChartContext] = None,
+                        day: Optional[DayContext] = None) -> Dict[str, Any]:
     """Calculate Kaala Bala (Temporal Strength).
     
     Includes:
@@ -471,8 +443,13 @@ def calculate_kaala_bala(jd_ut: float,
     6. Yuddha Bala (Planetary War) - BPHS 27.16: Should be applied to Total Shadbala, 
        but typically part of Kaala or separate adjustment. 
        We skip Yuddha in basic Kaala Bala for now as it modifies the final sum.
+
+    When ``day`` is the DayContext of the birth date, its precomputed weekday
+    and hora lords are used for Dina and Hora Bala.
     """
     scores = {p: 0.0 for p in PLANETS}
+    if day is not None and day.date != birth_time.date():
+        day = None
     
     # 1. Natonnata Bala
     is_day = sunrise <= birth_time < sunset
@@ -506,20 +483,26 @@ def calculate_kaala_bala(jd_ut: float,
         scores[p] += tribhaga[p]
         
     # 4. Ayana Bala
-    ayana = calculate_ayana_bala(jd_ut)
+    ayana = calculate_ayana_bala(jd_ut, context=context)
     for p in PLANETS:
         scores[p] += ayana[p]
         
     # 5. Varsha-Maasa-Dina-Hora
     # Dina Bala
-    dina = calculate_dina_bala(birth_time)
-    for p in PLANETS:
-        scores[p] += dina[p]
+    if day is not None:
+        scores[day.weekday_lord] += 45.0
+    else:
+        dina = calculate_dina_bala(birth_time)
+        for p in PLANETS:
+            scores[p] += dina[p]
         
     # Hora Bala
-    hora = calculate_hora_bala(birth_time, sunrise, sunset)
-    for p in PLANETS:
-        scores[p] += hora[p]
+    if day is not None and day.sunrise == sunrise:
+        scores[day.hora_lord(birth_time)] += 60.0
+    else:
+        hora = calculate_hora_bala(birth_time, sunrise, sunset)
+        for p in PLANETS:
+            scores[p] += hora[p]
         
     # Year/Month placeholders (assign to Day Lord or similar if unknown? Or 0?)
     # Standard practice without Ahargana: Assign 0 or simplified.
@@ -530,13 +513,15 @@ def calculate_kaala_bala(jd_ut: float,
 
 def calculate_cheshta_bala(jd_ut: float, 
                           planets_deg: Dict[str, float],
-                          ayana_bala_scores: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+                          ayana_bala_scores: Optional[Dict[str, float]] = None,
+                          context: Optional[ChartContext] = None) -> Dict[str, float]:
     """Calculate Cheshta Bala (Motional Strength).
     
     Args:
         jd_ut: Julian Day UT
         planets_deg: Planetary positions
         ayana_bala_scores: Pre-calculated Ayana Bala scores (required for Sun/Moon)
+        context: Shared chart context (speeds are reused)
     """
     scores = {p: 0.0 for p in PLANETS}
     
@@ -546,17 +531,11 @@ def calculate_cheshta_bala(jd_ut: float,
         scores[MOON] = ayana_bala_scores[MOON]
     
     # 2. Other Planets: Based on speed/retrogression
-    starry_planets = {
-        MARS: swe.MARS, 
-        MERCURY: swe.MERCURY, 
-        JUPITER: swe.JUPITER, 
-        VENUS: swe.VENUS, 
-        SATURN: swe.SATURN
-    }
+    starry_planets = [MARS, MERCURY, JUPITER, VENUS, SATURN]
+    speeds = context.speeds if context is not None else ephemeris.get_service().speeds(jd_ut)
     
-    for name, pid in starry_planets.items():
-        res = swe.calc_ut(jd_ut, pid)
-        speed = res[0][3]
+    for name in starry_planets:
+        speed = speeds[name]
         
         if speed < 0:
             scores[name] = 60.0 # Retrograde (Vakra)
@@ -784,7 +763,8 @@ def calculate_shadbala(jd_ut: float,
                       planets_deg: Dict[str, float],
                       birth_dt: datetime.datetime,
                       sunrise: datetime.datetime,
-                      sunset: datetime.datetime) -> Dict[str, Dict[str, float]]:
+                      sunset: datetime.datetime,
+                      context: Optional[ChartContext] = None) -> Dict[str, Dict[str, float]]:
     """Main function to calculate full Shadbala for all planets.
     
     Args:
@@ -794,18 +774,20 @@ def calculate_shadbala(jd_ut: float,
         birth_dt: Birth datetime (local)
         sunrise: Sunrise datetime (local)
         sunset: Sunset datetime (local)
+        context: Shared chart context for this candidate (built when omitted)
         
     Returns:
         Dictionary keyed by planet name containing 'total' and breakdown dict.
     """
-    sthaana = calculate_sthaana_bala(planets_deg, lagna_deg)
+    if context is None:
+        context = ChartContext(jd_ut, lagna_deg, planets_deg, birth_dt, sunrise, sunset)
+    sthaana = calculate_sthaana_bala(planets_deg, lagna_deg, context=context)
     dig = calculate_dig_bala(planets_deg, lagna_deg)
-    kaala = calculate_kaala_bala(jd_ut, planets_deg, sunrise, sunset, birth_dt)
+    kaala = calculate_kaala_bala(jd_ut, planets_deg, sunrise, sunset, birth_dt, context=context, day=context.day)
     
-    # Re-calculate Ayana Bala for Cheshta (or we could have returned it from Kaala)
-    # To keep it clean, we calculate it here to pass to Cheshta
-    ayana_bala_scores = calculate_ayana_bala(jd_ut)
-    cheshta = calculate_cheshta_bala(jd_ut, planets_deg, ayana_bala_scores)
+    # Ayana Bala doubles as Cheshta for Sun/Moon; the context already holds it from Kaala Bala
+    ayana_bala_scores = calculate_ayana_bala(jd_ut, context=context)
+    cheshta = calculate_cheshta_bala(jd_ut, planets_deg, ayana_bala_scores, context=context)
     
     naisargika = calculate_naisargika_bala()
     drig = calculate_drig_bala(planets_deg)
@@ -0,0 +1,473 @@
+"""Batched Stage-9 validation: Shadbala and Āyurdāya of many charts at once.
+
+Every accepted candidate of a search goes through Stage 9: the six balas
+(`shadbala.calculate_shadbala`) and the three longevity systems with their
+haranas (`ayurdaya.calculate_final_longevity`).  Run per candidate, that is
+a few thousand small Python operations on dicts for each chart, repeated for
+every accepted time of a grid block.
+
+Apart from sunrise/sunset and the weekday, all of it is arithmetic on the
+lagna, the graha longitudes, speeds and declinations and their varga signs.
+This module takes N charts as ``(N, bodies)`` arrays and evaluates every
+bala and every longevity system with NumPy broadcasting: one ephemeris
+interpolation for all speeds and declinations, one varga sign lookup
+(`varga_index`, or the exact engine) for all Saptavarga divisions, and the
+7 × 7 Drig Bala aspect grid as a single ``(N, 7, 7)`` array.
+
+As in `batch_eval`, every kernel mirrors its scalar counterpart operation
+for operation and sums in the same order, and the results are rounded with
+Python's ``round``, so the per-planet breakdowns returned by `evaluate_charts`
+are identical to the scalar ones, not merely close.
+"""
+
+import datetime
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from . import ephemeris, varga_index
+from .astro_utils import (
+    SUN, MOON, MARS, MERCURY, JUPITER, VENUS, SATURN, RAHU, KETU,
+    PLANETS, EXALTATION_DEGREES, RELATIONSHIPS, get_sign_lord, get_sign_lord_from_index,
+    get_weekday_index
+)
+from .ayurdaya import LAGNA, NISARGAYU_MAX_YEARS, PINDAYU_MAX_YEARS
+from .batch_eval import angular_difference
+from .chart_context import ChartContext
+from .day_context import HORA_SEQUENCE, WEEKDAY_LORDS
+from .shadbala import NAISARGIKA_BALA_RUPAS
+from .vargas import SAPTAVARGA_DIVISIONS
+
+# Column of each planet in the (N, 7) arrays
+_COLUMN = {planet: i for i, planet in enumerate(PLANETS)}
+# Column of the lord of each sign
+_SIGN_LORD = np.array([_COLUMN[get_sign_lord_from_index(sign)] for sign in range(12)])
+# Natural relationship of a planet (row) to a lord (column)
+_NATURAL = np.array([[RELATIONSHIPS[planet].get(lord, 0) for lord in PLANETS] for planet in PLANETS])
+# Saptavarga Virupas by compound relationship + 2 (adhisatru ... adhimitra)
+_COMPOUND_VIRUPAS = np.array([1.875, 3.75, 7.5, 15.0, 22.5])
+# Moolatrikona sign and degree range of each planet (Saptavarga Bala, D-1 only)
+_MOOLATRIKONA = {
+    SUN: (4, 0, 20), MOON: (1, 3, 30), MARS: (0, 0, 12), MERCURY: (5, 15, 20),
+    JUPITER: (8, 0, 10), VENUS: (6, 0, 15), SATURN: (10, 0, 20)
+}
+# Drekkana Bala: decanate in which each planet is strong
+_STRONG_DECANATE = {SUN: 0, MARS: 0, JUPITER: 0, SATURN: 1, MERCURY: 1, MOON: 2, VENUS: 2}
+# Special aspect angles (full 60 Virupas within a 10° orb)
+_SPECIAL_ASPECTS = {MARS: (90, 210), JUPITER: (120, 240), SATURN: (60, 270)}
+# Drig Bala: benefic aspects add, the others subtract
+_ASPECT_SIGN = np.array([1.0 if planet in (JUPITER, VENUS, MERCURY, MOON) else -1.0 for planet in PLANETS])
+# Tribhaga lords of the three parts of the day and of the night
+_DAY_THIRDS = np.array([_COLUMN[MERCURY], _COLUMN[SUN], _COLUMN[SATURN]])
+_NIGHT_THIRDS = np.array([_COLUMN[MOON], _COLUMN[VENUS], _COLUMN[MARS]])
+_HORA_COLUMNS = np.array([_COLUMN[lord] for lord in HORA_SEQUENCE])
+
+# Āyurdāya
+_NAVAMSA_SPAN = 3 + (20.0 / 60.0)
+_BENEFICS = (JUPITER, VENUS, MERCURY, MOON)
+_MALEFICS = (SUN, MARS, SATURN, RAHU, KETU)
+# Chakra Patha Harana fraction by house 1-12
+_HOUSE_FRACTION = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1/6.0, 1/5.0, 1/4.0, 1/3.0, 1/2.0, 1.0])
+# Combustion orbs of the planets that lose years when combust (Venus and
+# Saturn are exempt from Astangata Harana)
+_COMBUST_ORBS = {MOON: 12, MARS: 17, MERCURY: 14, JUPITER: 11}
+
+
+def planet_matrix(values: Dict[str, np.ndarray]) -> np.ndarray:
+    """Stack per-planet arrays into an ``(N, 7)`` matrix in PLANETS order."""
+    return np.column_stack([values[planet] for planet in PLANETS])
+
+
+def saptavarga_signs(longitudes: np.ndarray) -> np.ndarray:
+    """Saptavarga signs of an ``(N, 7)`` longitude matrix, shape ``(7, N, 7)``."""
+    index = varga_index.get_index()
+    if index is not None and index.covers(SAPTAVARGA_DIVISIONS):
+        return index.signs(longitudes, SAPTAVARGA_DIVISIONS)
+    return varga_index.exact_signs(longitudes, SAPTAVARGA_DIVISIONS)
+
+
+def day_arrays(birth_dts: Sequence[datetime.datetime],
+               sunrises: Sequence[datetime.datetime],
+               sunsets: Sequence[datetime.datetime]) -> Dict[str, np.ndarray]:
+    """Seconds from sunrise/sunset, day length and weekday lord of each chart."""
+    return {
+        'from_sunrise': np.array([(b - r).total_seconds() for b, r in zip(birth_dts, sunrises)]),
+        'from_sunset': np.array([(b - s).total_seconds() for b, s in zip(birth_dts, sunsets)]),
+        'day_length': np.array([(s - r).total_seconds() for r, s in zip(sunrises, sunsets)]),
+        'weekday_lord': np.array([_COLUMN[WEEKDAY_LORDS[get_weekday_index(b.weekday())]] for b in birth_dts],
+                                 dtype=np.int64)
+    }
+
+
+def _lord_bonus(columns: np.ndarray, value: float) -> np.ndarray:
+    """``(N, 7)`` array holding ``value`` in each chart's given column."""
+    bonus = np.zeros((len(columns), len(PLANETS)))
+    bonus[np.arange(len(columns)), columns] = value
+    return bonus
+
+
+def sthaana_bala(longitudes: np.ndarray, lagna_deg: np.ndarray, signs: np.ndarray) -> np.ndarray:
+    """Sthaana Bala (see shadbala.calculate_sthaana_bala).
+
+    Args:
+        longitudes: ``(N, 7)`` planet longitudes.
+        lagna_deg: ``(N,)`` ascendant longitudes.
+        signs: ``(7, N, 7)`` Saptavarga signs (`saptavarga_signs`).
+    """
+    columns = np.arange(len(PLANETS))
+    debil = np.array([(EXALTATION_DEGREES[planet] + 180.0) % 360.0 for planet in PLANETS])
+    diff = np.abs(longitudes - debil)
+    diff = np.where(diff > 180, 360 - diff, diff)
+    scores = diff / 3.0
+
+    # Saptavarga Bala, summed on its own first as the scalar code does
+    saptavarga = np.zeros_like(longitudes)
+    for division, chart in zip(SAPTAVARGA_DIVISIONS, signs):
+        lord = _SIGN_LORD[chart]
+        own = lord == columns
+        count = np.mod(np.take_along_axis(chart, lord, axis=1) - chart, 12) + 1
+        temporary = np.where(np.isin(count, (2, 3, 4, 10, 11, 12)), 1, -1)
+        values = np.where(own, 30.0, _COMPOUND_VIRUPAS[_NATURAL[columns, lord] + temporary + 2])
+        if division == 1:
+            deg_in_sign = np.mod(np.mod(longitudes, 360.0), 30.0)
+            for planet, (sign, start, end) in _MOOLATRIKONA.items():
+                col = _COLUMN[planet]
+                mool = own[:, col] & (chart[:, col] == sign) & (start <= deg_in_sign[:, col]) & (deg_in_sign[:, col] < end)
+                values[:, col] = np.where(mool, 45.0, values[:, col])
+        saptavarga = saptavarga + values
+    scores = scores + saptavarga
+
+    # Oja-Yugma: Moon and Venus favour even signs, the others odd
+    female = np.isin(columns, (_COLUMN[MOON], _COLUMN[VENUS]))
+    for chart in (signs[SAPTAVARGA_DIVISIONS.index(1)], signs[SAPTAVARGA_DIVISIONS.index(9)]):
+        odd = np.mod(chart, 2) == 0
+        scores = scores + np.where(odd != female, 15.0, 0.0)
+
+    house = (np.mod(longitudes - lagna_deg[:, None], 360.0) / 30.0).astype(np.int64) + 1
+    scores = scores + np.where(np.isin(house, (1, 4, 7, 10)), 60.0,
+                               np.where(np.isin(house, (2, 5, 8, 11)), 30.0, 15.0))
+
+    decanate = (np.mod(longitudes, 30.0) / 10.0).astype(np.int64)
+    strong = np.array([_STRONG_DECANATE[planet] for planet in PLANETS])
+    return scores + np.where(decanate == strong, 15.0, 0.0)
+
+
+def dig_bala(longitudes: np.ndarray, lagna_deg: np.ndarray) -> np.ndarray:
+    """Dig Bala (see shadbala.calculate_dig_bala)."""
+    lh = lagna_deg
+    south = np.mod(lh - 90, 360)
+    north = np.mod(lh + 90, 360)
+    targets = {SUN: south, MARS: south, JUPITER: lh, MERCURY: lh,
+               VENUS: north, MOON: north, SATURN: np.mod(lh + 180, 360)}
+    zero_points = np.column_stack([np.mod(targets[planet] + 180, 360) for planet in PLANETS])
+    return angular_difference(longitudes, zero_points) / 3.0
+
+
+def ayana_bala(declinations: np.ndarray) -> np.ndarray:
+    """Ayana Bala from an ``(N, 7)`` declination matrix (see shadbala._ayana_bala)."""
+    abs_dec = np.abs(declinations)
+    is_north = declinations >= 0
+    south_strong = np.isin(np.arange(len(PLANETS)), (_COLUMN[MOON], _COLUMN[SATURN]))
+    val = np.where(is_north != south_strong, 24.0 + abs_dec, 24.0 - abs_dec)
+    scores = np.maximum(0.0, np.minimum(60.0, val * (60.0 / 48.0)))
+    scores[:, _COLUMN[MERCURY]] = 30.0
+    return scores
+
+
+def kaala_bala(longitudes: np.ndarray, ayana: np.ndarray, days: Dict[str, np.ndarray]) -> np.ndarray:
+    """Kaala Bala (see shadbala.calculate_kaala_bala).
+
+    Args:
+        longitudes: ``(N, 7)`` planet longitudes.
+        ayana: ``(N, 7)`` Ayana Bala.
+        days: Per-chart day arrays (`day_arrays`).
+    """
+    n = len(longitudes)
+    from_sunrise, from_sunset = days['from_sunrise'], days['from_sunset']
+    is_day = (from_sunrise >= 0) & (from_sunset < 0)
+
+    # Natonnata
+    day_strong = np.isin(np.arange(len(PLANETS)), (_COLUMN[SUN], _COLUMN[JUPITER], _COLUMN[VENUS]))
+    scores = np.where(is_day[:, None] == day_strong, 60.0, 0.0)
+    scores[:, _COLUMN[MERCURY]] = 60.0
+
+    # Paksha
+    benefic_score = angular_difference(longitudes[:, _COLUMN[MOON]], longitudes[:, _COLUMN[SUN]]) / 3.0
+    malefic_score = 60.0 - benefic_score
+    paksha_benefic = np.isin(np.arange(len(PLANETS)), [_COLUMN[p] for p in (MOON, JUPITER, VENUS, MERCURY)])
+    scores = scores + np.where(paksha_benefic, benefic_score[:, None], malefic_score[:, None])
+
+    # Tribhaga
+    with np.errstate(divide='ignore', invalid='ignore'):
+        duration = days['day_length']
+        day_part = np.minimum((from_sunrise / (duration / 3.0)).astype(np.int64), 2)
+        night_len = (24 * 3600) - duration
+        elapsed = np.where(from_sunset > 0, from_sunset, night_len - (-from_sunrise))
+        night_part = np.clip((elapsed / (night_len / 3.0)).astype(np.int64), 0, 2)
+    tribhaga = _lord_bonus(np.where(is_day, _DAY_THIRDS[np.clip(day_part, 0, 2)], _NIGHT_THIRDS[night_part]), 60.0)
+    tribhaga[:, _COLUMN[JUPITER]] = 60.0
+    scores = scores + tribhaga
+
+    scores = scores + ayana
+
+    # Dina and Hora
+    scores = scores + _lord_bonus(days['weekday_lord'], 45.0)
+    hours = from_sunrise / 3600.0
+    hours = np.where(hours < 0, hours + 24.0, hours)
+    hora_start = np.array([HORA_SEQUENCE.index(lord) for lord in PLANETS])[days['weekday_lord']]
+    hora = np.mod(hora_start + hours.astype(np.int64), 7)
+    return scores + _lord_bonus(_HORA_COLUMNS[hora], 60.0)
+
+
+def cheshta_bala(ayana: np.ndarray, speeds: np.ndarray) -> np.ndarray:
+    """Cheshta Bala (see shadbala.calculate_cheshta_bala)."""
+    scores = np.where(speeds < 0, 60.0, np.where(speeds < 0.1, 15.0, 30.0))
+    for planet in (SUN, MOON):
+        scores[:, _COLUMN[planet]] = ayana[:, _COLUMN[planet]]
+    return scores
+
+
+def aspect_values(angle: np.ndarray) -> np.ndarray:
+    """Piecewise Drishti of angles (see shadbala._calculate_aspect_value)."""
+    return np.select(
+        [(angle <= 30) | (angle > 300), angle <= 60, angle <= 90, angle <= 120, angle <= 150, angle <= 180],
+        [0.0, (angle - 30) / 2.0, (angle - 60) + 15.0, 45.0 - (angle - 90) / 2.0,
+         30.0 - (angle - 120), (angle - 150) * 2.0],
+        0.0
+    )
+
+
+def drig_bala(longitudes: np.ndarray) -> np.ndarray:
+    """Drig Bala (see shadbala.calculate_drig_bala)."""
+    # angle[n, target, actor]: from each actor to each target
+    angle = np.mod(longitudes[:, :, None] - longitudes[:, None, :], 360.0)
+    drishti = aspect_values(angle)
+    for actor, (first, second) in _SPECIAL_ASPECTS.items():
+        col = _COLUMN[actor]
+        special = (np.abs(angle[:, :, col] - first) < 10.0) | (np.abs(angle[:, :, col] - second) < 10.0)
+        drishti[:, :, col] = np.maximum(drishti[:, :, col], np.where(special, 60.0, 0.0))
+    contribution = drishti * 0.25 * _ASPECT_SIGN
+    # A planet does not aspect itself
+    contribution[:, np.arange(len(PLANETS)), np.arange(len(PLANETS))] = 0.0
+    # Accumulate actor by actor, in the scalar code's order
+    scores = np.zeros(longitudes.shape)
+    for col in range(len(PLANETS)):
+        scores = scores + contribution[:, :, col]
+    return scores
+
+
+def shadbala_arrays(longitudes: np.ndarray,
+                    lagna_deg: np.ndarray,
+                    speeds: np.ndarray,
+                    declinations: np.ndarray,
+                    days: Dict[str, np.ndarray],
+                    signs: np.ndarray) -> Dict[str, np.ndarray]:
+    """The six balas and their total as ``(N, 7)`` arrays (unrounded)."""
+    ayana = ayana_bala(declinations)
+    components = {
+        'sthaana': sthaana_bala(longitudes, lagna_deg, signs),
+        'dig': dig_bala(longitudes, lagna_deg),
+        'kaala': kaala_bala(longitudes, ayana, days),
+        'cheshta': cheshta_bala(ayana, speeds),
+        'naisargika': np.broadcast_to(
+            np.array([NAISARGIKA_BALA_RUPAS[planet] * 60.0 for planet in PLANETS]), longitudes.shape
+        ),
+        'drig': drig_bala(longitudes)
+    }
+    total = components['sthaana']
+    for name in ('dig', 'kaala', 'cheshta', 'naisargika', 'drig'):
+        total = total + components[name]
+    components['total'] = total
+    return components
+
+
+def _house_from_lagna(longitudes: np.ndarray, lagna_deg: np.ndarray) -> np.ndarray:
+    """Houses 1-12 counted from the lagna (see astro_utils.get_house_from_lagna)."""
+    house = np.floor(np.mod(longitudes - lagna_deg[:, None], 360.0) / 30.0).astype(np.int64) + 1
+    return np.where(house <= 12, house, 1)
+
+
+def _system_years(longitudes: np.ndarray, max_years: Dict[str, float]) -> np.ndarray:
+    """Raw Pindayu/Nisargayu years of the planets (see ayurdaya.calculate_pindayu)."""
+    debil = np.array([(EXALTATION_DEGREES[planet] + 180.0) % 360.0 for planet in PLANETS])
+    diff = np.mod(longitudes - debil, 360.0)
+    diff = np.where(diff > 180, 360 - diff, diff)
+    min_years = np.array([max_years[planet] / 2.0 for planet in PLANETS])
+    return min_years + (diff / 180.0) * min_years
+
+
+def ayurdaya_arrays(bodies: Sequence[str],
+                    body_longitudes: np.ndarray,
+                    lagna_deg: np.ndarray,
+                    speeds: np.ndarray) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """Raw and net years of the three longevity systems.
+
+    Args:
+        bodies: Names of the ``body_longitudes`` columns (the seven planets
+            and optionally the nodes, in the charts' dict order).
+        body_longitudes: ``(N, len(bodies))`` longitudes.
+        lagna_deg: ``(N,)`` ascendant longitudes.
+        speeds: ``(N, 7)`` planet speeds.
+
+    Returns:
+        ``{system: (raw, net)}``; Pindayu and Nisargayu columns are PLANETS
+        then lagna, Amsayu columns are ``bodies`` then lagna.
+    """
+    longitudes = body_longitudes[:, [bodies.index(planet) for planet in PLANETS]]
+    lagna_years = lagna_deg / _NAVAMSA_SPAN
+
+    # Haranas (see ayurdaya.apply_haranas): the largest reduction applies
+    house = _house_from_lagna(longitudes, lagna_deg)
+    chakra = _HOUSE_FRACTION[house - 1]
+    chakra = np.where(np.isin(np.arange(len(PLANETS)), [_COLUMN[p] for p in _BENEFICS]), chakra / 2.0, chakra)
+    lord = _SIGN_LORD[np.mod((longitudes / 30.0).astype(np.int64), 12)]
+    enemy = (_NATURAL[np.arange(len(PLANETS)), lord] == -1) & (lord != np.arange(len(PLANETS)))
+    satru = np.where(~(speeds < 0) & enemy, 1/3.0, 0.0)
+    combust = np.zeros_like(longitudes)
+    sun_deg = longitudes[:, _COLUMN[SUN]]
+    for planet, orb in _COMBUST_ORBS.items():
+        diff = np.abs(longitudes[:, _COLUMN[planet]] - sun_deg)
+        diff = np.where(diff > 180, 360 - diff, diff)
+        combust[:, _COLUMN[planet]] = np.where(diff <= orb, 1/2.0, 0.0)
+    keep = 1.0 - np.maximum(np.maximum(chakra, satru), combust)
+
+    # Krurodaya: a malefic in the lagna halves the lagna's years
+    malefic_columns = [bodies.index(planet) for planet in _MALEFICS if planet in bodies]
+    krurodaya = (_house_from_lagna(body_longitudes[:, malefic_columns], lagna_deg) == 1).any(axis=1)
+
+    def with_haranas(raw: np.ndarray, planet_columns: List[int]) -> np.ndarray:
+        net = raw.copy()
+        net[:, planet_columns] = raw[:, planet_columns] * keep
+        net[:, -1] = np.where(krurodaya, raw[:, -1] * 0.5, raw[:, -1])
+        return net
+
+    planet_columns = list(range(len(PLANETS)))
+    results = {}
+    for system, max_years in (('pindayu', PINDAYU_MAX_YEARS), ('nisargayu', NISARGAYU_MAX_YEARS)):
+        raw = np.column_stack([_system_years(longitudes, max_years), lagna_years])
+        results[system] = (raw, with_haranas(raw, planet_columns))
+    raw = np.column_stack([body_longitudes / _NAVAMSA_SPAN, lagna_years])
+    results['amsayu'] = (raw, with_haranas(raw, [bodies.index(planet) for planet in PLANETS]))
+    return results
+
+
+def _column_sum(values: np.ndarray) -> np.ndarray:
+    """Row sums added column by column (the order Python's ``sum`` uses)."""
+    total = np.zeros(len(values))
+    for col in range(values.shape[1]):
+        total = total + values[:, col]
+    return total
+
+
+def evaluate_charts(jd_ut: np.ndarray,
+                    lagna_deg: np.ndarray,
+                    bodies: Sequence[str],
+                    body_longitudes: np.ndarray,
+                    birth_dts: Sequence[datetime.datetime],
+                    sunrises: Sequence[datetime.datetime],
+                    sunsets: Sequence[datetime.datetime]) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Shadbala and Āyurdāya of N charts.
+
+    Args:
+        jd_ut: ``(N,)`` Julian Days (UT) of the births.
+        lagna_deg: ``(N,)`` sidereal ascendants.
+        bodies: Names of the ``body_longitudes`` columns; must include the
+            seven planets.
+        body_longitudes: ``(N, len(bodies))`` sidereal longitudes.
+        birth_dts: Local birth datetimes.
+        sunrises: Local sunrise of each birth date.
+        sunsets: Local sunset of each birth date.
+
+    Returns:
+        One ``(shadbala, ayurdaya)`` pair per chart, equal to what
+        `shadbala.calculate_shadbala` and `ayurdaya.calculate_final_longevity`
+        (given the Shadbala rupas) return for it.
+    """
+    if not len(jd_ut):
+        return []
+    bodies = list(bodies)
+    jd_ut = np.asarray(jd_ut, dtype=float)
+    lagna_deg = np.asarray(lagna_deg, dtype=float)
+    body_longitudes = np.asarray(body_longitudes, dtype=float)
+    longitudes = body_longitudes[:, [bodies.index(planet) for planet in PLANETS]]
+    speeds, declinations = (planet_matrix(values) for values in ephemeris.get_service().motion_arrays(jd_ut))
+
+    components = shadbala_arrays(
+        longitudes, lagna_deg, speeds, declinations,
+        day_arrays(birth_dts, sunrises, sunsets), saptavarga_signs(longitudes)
+    )
+    names = ('total', 'sthaana', 'dig', 'kaala', 'cheshta', 'naisargika', 'drig')
+    values = {name: components[name].tolist() for name in names}
+    rupas = (components['total'] / 60.0).tolist()
+
+    systems = ayurdaya_arrays(bodies, body_longitudes, lagna_deg, speeds)
+    columns = {'pindayu': [*PLANETS, LAGNA], 'nisargayu': [*PLANETS, LAGNA], 'amsayu': [*bodies, LAGNA]}
+    totals = {system: _column_sum(net).tolist() for system, (_, net) in systems.items()}
+    details = {system: (raw.tolist(), net.tolist()) for system, (raw, net) in systems.items()}
+
+    results = []
+    for i, lagna in enumerate(lagna_deg.tolist()):
+        shadbala = {}
+        for j, planet in enumerate(PLANETS):
+            shadbala[planet] = {name: round(values[name][i][j], 2) for name in names}
+            shadbala[planet]['rupa'] = round(rupas[i][j], 2)
+
+        # System selection (see ayurdaya.calculate_final_longevity)
+        pindayu, nisargayu, amsayu = (totals[system][i] for system in ('pindayu', 'nisargayu', 'amsayu'))
+        selected_system = 'average'
+        final_val = (pindayu + nisargayu + amsayu) / 3.0
+        lagna_lord = get_sign_lord(lagna)
+        strengths = {planet: data['rupa'] for planet, data in shadbala.items()}
+        sun_strength = strengths.get(SUN, 0.0)
+        moon_strength = strengths.get(MOON, 0.0)
+        lagna_lord_strength = strengths.get(lagna_lord, 0.0)
+        max_strength = max(sun_strength, moon_strength, lagna_lord_strength)
+        if max_strength > 0:
+            if max_strength == sun_strength:
+                selected_system, final_val = 'pindayu', pindayu
+            elif max_strength == moon_strength:
+                selected_system, final_val = 'nisargayu', nisargayu
+            else:
+                selected_system, final_val = 'amsayu', amsayu
+
+        ayurdaya = {
+            'pindayu_years': round(pindayu, 2),
+            'nisargayu_years': round(nisargayu, 2),
+            'amsayu_years': round(amsayu, 2),
+            'final_longevity': round(final_val, 2),
+            'selected_system': selected_system,
+            'selection_reason': {
+                'sun': sun_strength,
+                'moon': moon_strength,
+                'lagna_lord': lagna_lord_strength,
+                'lagna_lord_planet': lagna_lord
+            },
+            'details': {}
+        }
+        for system, (raw, net) in details.items():
+            ayurdaya['details'][f'{system}_raw'] = dict(zip(columns[system], raw[i]))
+            ayurdaya['details'][f'{system}_net'] = dict(zip(columns[system], net[i]))
+        results.append((shadbala, ayurdaya))
+    return results
+
+
+def evaluate_contexts(contexts: Sequence[ChartContext]) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """`evaluate_charts` for chart contexts whose birth time, sunrise and sunset are set.
+
+    All contexts must carry the same bodies in the same order (as
+    `btr_core.get_planet_positions` returns them).
+    """
+    if not contexts:
+        return []
+    bodies = list(contexts[0].planets_deg)
+    if any(list(context.planets_deg) != bodies for context in contexts):
+        raise ValueError("Stage-9 batch charts must list the same bodies in the same order")
+    return evaluate_charts(
+        np.array([context.jd_ut for context in contexts]),
+        np.array([context.lagna_deg for context in contexts]),
+        bodies,
+        np.array([[context.planets_deg[name] for name in bodies] for context in contexts]),
+        [context.birth_dt for context in contexts],
+        [context.sunrise for context in contexts],
+        [context.sunset for context in contexts]
+    )
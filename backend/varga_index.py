@@ -0,0 +1,203 @@
+"""Arc-second lookup index of varga signs, memory-mapped by every worker.
+
+A body's divisional placement depends only on its sidereal longitude, and
+every Stage-9 consumer of the divisional charts except the Rashi only needs
+the *sign* a body falls in: Panchadha Maitri relationships (Saptavarga Bala)
+compare the signs of a planet and its lord, and life-event verification
+counts houses from the varga lagna's sign.  Those signs are precomputed here
+for every arc-second of the zodiac (1,296,000 entries per division, one
+``uint8`` each), so a chart's signs for any set of divisions are one gather.
+
+The table is exact, not an approximation: an entry holds the sign of the
+whole arc-second only when no varga boundary falls inside it (checked a
+hair beyond both ends).  The few arc-seconds straddling a boundary hold
+``AMBIGUOUS`` instead, and longitudes landing there are answered by the
+exact engine (`vargas.varga_longitudes`), so lookups always agree with
+``floor(varga_longitude / 30) % 12``.  Varga longitudes themselves (the
+degree within the varga sign) still come from `vargas.calculate_vargas`.
+
+The index covers the 16 Shodasa Vargas (~20 MB).  It is generated once into
+``config.VARGA_INDEX_PATH`` (on first use, or ahead of time with ``python -m
+backend.varga_index``) and loaded with ``mmap_mode='r'``: pages are read-only
+and shared through the OS page cache by all worker processes.  A load
+spot-checks the file against the exact engine and rebuilds it when the varga
+rules have changed since it was written.  With no path configured
+`get_index` returns None and callers derive signs from the exact charts
+(`chart_context.ChartContext.varga_signs_for`).
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import threading
+from typing import Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+from . import config
+from .vargas import SHODASA_DIVISIONS, varga_longitudes
+
+logger = logging.getLogger("btr.varga_index")
+
+# Entries per division: one per arc-second of the zodiac
+ARC_SECONDS = 360 * 3600
+# Entry of an arc-second containing a varga boundary (resolved exactly)
+AMBIGUOUS = 255
+# Margin (degrees) beyond each arc-second within which a boundary marks it
+# ambiguous; far above the rounding error of the longitude arithmetic
+_BOUNDARY_MARGIN = 1e-6
+# Arc-seconds compared with the exact engine when a saved index is loaded
+_SPOT_CHECKS = 4096
+
+
+def exact_signs(longitudes: np.ndarray, divisions: Sequence[int]) -> np.ndarray:
+    """Varga signs from the exact engine, shape ``(len(divisions),) + longitudes.shape``."""
+    return (np.floor(varga_longitudes(longitudes, divisions) / 30.0) % 12).astype(np.int64)
+
+
+def build_table(divisions: Sequence[int] = SHODASA_DIVISIONS) -> np.ndarray:
+    """Compute the index table, one row of ARC_SECONDS entries per division."""
+    starts = np.arange(ARC_SECONDS, dtype=float) / 3600.0
+    lower = starts - _BOUNDARY_MARGIN
+    upper = starts + (1.0 / 3600.0 + _BOUNDARY_MARGIN)
+    table = np.empty((len(divisions), ARC_SECONDS), dtype=np.uint8)
+    # One division at a time keeps the temporaries to a few arrays of ARC_SECONDS
+    for row, division in enumerate(divisions):
+        first = exact_signs(lower, (division,))[0]
+        last = exact_signs(upper, (division,))[0]
+        # Boundaries are at least 0.5° apart, so equal signs at both ends mean
+        # the whole arc-second lies in one segment
+        table[row] = np.where(first == last, first, AMBIGUOUS)
+    # Longitudes a hair below 0° wrap into the last arc-second, where the
+    # exact engine's modulo rounding decides the sign
+    table[:, [0, -1]] = AMBIGUOUS
+    return table
+
+
+class VargaIndex:
+    """Sign lookups over a (possibly memory-mapped) index table.
+
+    Args:
+        table: ``uint8`` array of shape ``(len(divisions), ARC_SECONDS)``.
+        divisions: Division of each table row.
+    """
+
+    def __init__(self, table: np.ndarray, divisions: Sequence[int] = SHODASA_DIVISIONS):
+        if table.shape != (len(divisions), ARC_SECONDS) or table.dtype != np.uint8:
+            raise ValueError(f"Varga index table has shape {table.shape} and dtype {table.dtype}, "
+                             f"expected ({len(divisions)}, {ARC_SECONDS}) uint8")
+        self.table = table
+        self.divisions = tuple(divisions)
+        self._rows = {division: row for row, division in enumerate(self.divisions)}
+
+    def covers(self, divisions: Iterable[int]) -> bool:
+        """Whether every division has a row in the index."""
+        return all(division in self._rows for division in divisions)
+
+    def signs(self, longitudes: np.ndarray, divisions: Sequence[int]) -> np.ndarray:
+        """Varga signs of an array of longitudes for several divisions.
+
+        Args:
+            longitudes: Sidereal longitudes of any shape.
+            divisions: Divisions held by the index.
+
+        Returns:
+            ``int64`` array of shape ``(len(divisions),) + longitudes.shape``,
+            equal to `exact_signs` of the same arguments.
+        """
+        deg = np.asarray(longitudes, dtype=float)
+        try:
+            rows = np.array([self._rows[division] for division in divisions], dtype=np.intp)
+        except KeyError as e:
+            raise ValueError(f"Division {e.args[0]} is not in the varga index {list(self.divisions)}") from None
+        bucket = np.floor(deg * 3600.0).astype(np.int64) % ARC_SECONDS
+        signs = self.table[rows.reshape((-1,) + (1,) * deg.ndim), bucket].astype(np.int64)
+        ambiguous = signs == AMBIGUOUS
+        if ambiguous.any():
+            # Arc-seconds straddling a boundary: ask the exact engine
+            for row, division in enumerate(divisions):
+                hits = ambiguous[row]
+                if hits.any():
+                    signs[row][hits] = exact_signs(deg[hits], (division,))[0]
+        return signs
+
+    def chart_signs(self,
+                    lagna_deg: float,
+                    planets: Dict[str, float],
+                    divisions: Sequence[int]) -> Dict[int, Dict[str, int]]:
+        """Varga signs of lagna and all planets, keyed like `vargas.calculate_vargas`."""
+        names = [*planets, 'lagna']
+        signs = self.signs(np.array([*planets.values(), lagna_deg], dtype=float), divisions).tolist()
+        return {division: dict(zip(names, row)) for division, row in zip(divisions, signs)}
+
+
+def _spot_check(index: VargaIndex) -> bool:
+    """Compare a fixed sample of arc-seconds with the exact engine."""
+    rng = np.random.default_rng(0)
+    longitudes = (rng.integers(0, ARC_SECONDS, _SPOT_CHECKS) + rng.random(_SPOT_CHECKS)) / 3600.0
+    return bool(np.array_equal(index.signs(longitudes, index.divisions),
+                               exact_signs(longitudes, index.divisions)))
+
+
+def _save(path: str, table: np.ndarray) -> None:
+    """Write the table atomically (concurrent workers may race to build it)."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.npy.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, table)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_index(path: str, divisions: Sequence[int] = SHODASA_DIVISIONS) -> VargaIndex:
+    """Memory-map the index at ``path``, (re)building it when missing or stale."""
+    try:
+        index = VargaIndex(np.load(path, mmap_mode='r'), divisions)
+        if _spot_check(index):
+            return index
+        logger.warning("Varga index %s does not match the varga rules; rebuilding", path)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.warning("Varga index %s unreadable (%s); rebuilding", path, e)
+    _save(path, build_table(divisions))
+    return VargaIndex(np.load(path, mmap_mode='r'), divisions)
+
+
+_INDEX: Optional[VargaIndex] = None
+_INDEX_PATH: Optional[str] = None
+_INDEX_LOCK = threading.Lock()
+
+
+def get_index() -> Optional[VargaIndex]:
+    """Return the process-wide index, or None when ``config.VARGA_INDEX_PATH`` is unset.
+
+    A path that cannot be read or written disables the index with a warning.
+    """
+    global _INDEX, _INDEX_PATH
+    path = config.VARGA_INDEX_PATH
+    if path != _INDEX_PATH:
+        with _INDEX_LOCK:
+            if path != _INDEX_PATH:
+                index = None
+                if path:
+                    try:
+                        index = load_index(path)
+                    except OSError as e:
+                        logger.warning("Varga index disabled (%s): %s", path, e)
+                _INDEX, _INDEX_PATH = index, path
+    return _INDEX
+
+
+if __name__ == '__main__':
+    target = sys.argv[1] if len(sys.argv) > 1 else config.VARGA_INDEX_PATH
+    if not target:
+        sys.exit("usage: python -m backend.varga_index PATH (or set VARGA_INDEX_PATH)")
+    load_index(target)
+    print(f"Varga index ready: {target}")
@@ -2,232 +2,267 @@
 
 This module implements the calculation of the 16 Divisional Charts (Shodasa Vargas)
 as defined in Brihat Parashara Hora Shastra (BPHS).
+
+Every Parashari varga maps (sign, segment of the sign) to a target sign: the
+Navamsa of the 5th segment of Leo is always the same sign, whatever the chart.
+The rules are therefore precomputed into one lookup table, ``_TARGETS``
+(division × sign × segment → target sign), instead of being re-derived per
+body through a chain of per-division branches.  `varga_longitudes`
+computes the requested divisions for arrays of charts (charts × bodies) with
+a handful of NumPy operations and a gather from that table.
+
+A single chart is only a few dozen lookups, so `calculate_vargas` reads the
+same tables from Python lists; NumPy's per-call overhead would exceed the
+work.
+
+Callers ask only for the divisions they use (`calculate_vargas`): Saptavarga
+Bala needs the 7 of ``SAPTAVARGA_DIVISIONS``, life-event verification only
+D-3, D-7, D-9 and D-10.  `calculate_shodasa_vargas` remains for callers that
+want all 16.
 """
 
+import bisect
 import math
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Iterable, Sequence
+
+import numpy as np
+
+# Largest division the lookup table covers
+MAX_DIVISION = 60
+# The 16 Parashari divisional charts
+SHODASA_DIVISIONS = (1, 2, 3, 4, 7, 9, 10, 12, 16, 20, 24, 27, 30, 40, 45, 60)
+# Divisions of Saptavarga Bala
+SAPTAVARGA_DIVISIONS = (1, 2, 3, 7, 9, 12, 30)
+
+# Divisions whose segments are irregular degree ranges mapped to a whole sign
+# (placed at 15° of it): segment upper edges for odd and even signs
+_RANGE_EDGES = {
+    # D-2 (Hora): halves of the sign
+    2: ((15.0,), (15.0,)),
+    # D-30 (Trimsamsa): Mars 5, Saturn 5, Jupiter 8, Mercury 7, Venus 5 (odd);
+    # reversed for even signs
+    30: ((5.0, 10.0, 18.0, 25.0), (5.0, 12.0, 20.0, 25.0)),
+}
+# Target signs of those segments for odd and even signs
+_RANGE_TARGETS = {
+    # Odd: Sun (Leo) then Moon (Cancer); even: Moon then Sun
+    2: ((4, 3), (3, 4)),
+    # Odd: Aries, Aquarius, Sagittarius, Gemini, Libra
+    # Even: Taurus, Virgo, Pisces, Capricorn, Scorpio
+    30: ((0, 10, 8, 2, 6), (1, 5, 11, 9, 7)),
+}
+_MAX_EDGES = max(len(edges[0]) for edges in _RANGE_EDGES.values())
+
+
+def _regular_target(division: int, sign: int, segment: int) -> int:
+    """Target sign of one segment of a regularly divided sign."""
+    is_odd = (sign % 2 == 0)  # Aries=0 (Odd), Taurus=1 (Even)
+    modality = sign % 3       # 0 Movable, 1 Fixed, 2 Dual
+    if division == 3:
+        # D-3: Drekkana (Sign, 5th, 9th)
+        return (sign + segment * 4) % 12
+    if division == 4:
+        # D-4: Chaturthamsa (Sign, 4th, 7th, 10th)
+        return (sign + segment * 3) % 12
+    if division == 7:
+        # D-7: Saptamsa (Odd: Sign, Even: 7th)
+        start_sign = sign if is_odd else (sign + 6) % 12
+    elif division == 9:
+        # D-9: Navamsa (Movable: Sign, Fixed: 9th, Dual: 5th)
+        start_sign = (sign, (sign + 8) % 12, (sign + 4) % 12)[modality]
+    elif division == 10:
+        # D-10: Dasamsa (Odd: Sign, Even: 9th)
+        start_sign = sign if is_odd else (sign + 8) % 12
+    elif division == 16:
+        # D-16: Shodasamsa (Movable: Aries, Fixed: Leo, Dual: Sagittarius)
+        start_sign = (0, 4, 8)[modality]
+    elif division == 20:
+        # D-20: Vimsamsa (Movable: Aries, Fixed: Sagittarius, Dual: Leo)
+        start_sign = (0, 8, 4)[modality]
+    elif division == 24:
+        # D-24: Siddhamsa (Odd: Leo, Even: Cancer)
+        start_sign = 4 if is_odd else 3
+    elif division == 27:
+        # D-27: Nakshatramsa (Fire: Aries, Earth: Cancer, Air: Libra, Water: Capricorn)
+        start_sign = ((sign % 4) * 3) % 12
+    elif division == 40:
+        # D-40: Khavedamsa (Odd: Aries, Even: Libra)
+        start_sign = 0 if is_odd else 6
+    elif division == 45:
+        # D-45: Akshayavedamsa (Movable: Aries, Fixed: Leo, Dual: Sagittarius)
+        start_sign = (0, 4, 8)[modality]
+    else:
+        # D-12 (Dwadasamsa), D-60 (Shashtiamsa) and any other division: start from the sign
+        start_sign = sign
+    return (start_sign + segment) % 12
+
+
+def _build_tables() -> tuple[np.ndarray, np.ndarray]:
+    """Target-sign and range-edge tables for every division up to MAX_DIVISION."""
+    targets = np.zeros((MAX_DIVISION + 1, 12, MAX_DIVISION), dtype=np.int8)
+    edges = np.full((MAX_DIVISION + 1, 12, _MAX_EDGES), np.inf)
+    for division in range(1, MAX_DIVISION + 1):
+        for sign in range(12):
+            parity = sign % 2
+            if division in _RANGE_EDGES:
+                sign_edges = _RANGE_EDGES[division][parity]
+                edges[division, sign, :len(sign_edges)] = sign_edges
+                sign_targets = _RANGE_TARGETS[division][parity]
+                targets[division, sign, :len(sign_targets)] = sign_targets
+            else:
+                targets[division, sign, :division] = [
+                    _regular_target(division, sign, segment) for segment in range(division)
+                ]
+    return targets, edges
+
+
+_TARGETS, _EDGES = _build_tables()
+_TARGET_ROWS = _TARGETS.tolist()
+
+
+class _DivisionPlan:
+    """Broadcast-ready constants for one tuple of divisions (cached)."""
+
+    __slots__ = ('division', 'division_size', 'ranged', 'any_ranged', 'rashi', 'any_rashi')
+
+    def __init__(self, divisions: tuple[int, ...]):
+        division = np.asarray(divisions, dtype=np.int64)
+        if division.size and (division.min() < 1 or division.max() > MAX_DIVISION):
+            raise ValueError(f"Divisions must be between 1 and {MAX_DIVISION}: {list(divisions)}")
+        self.division = division
+        self.division_size = 30.0 / division
+        self.ranged = np.isin(division, tuple(_RANGE_EDGES))
+        self.any_ranged = bool(self.ranged.any())
+        self.rashi = division == 1
+        self.any_rashi = bool(self.rashi.any())
+
+
+@lru_cache(maxsize=64)
+def _plan(divisions: tuple[int, ...]) -> _DivisionPlan:
+    return _DivisionPlan(divisions)
+
+
+def varga_longitudes(longitudes: np.ndarray, divisions: Sequence[int]) -> np.ndarray:
+    """Divisional longitudes of an array of longitudes for several divisions.
+
+    Args:
+        longitudes: Sidereal longitudes of any shape (one chart's bodies, or
+            charts × bodies).
+        divisions: Division numbers (1-60).
+
+    Returns:
+        Array of shape ``(len(divisions),) + longitudes.shape``.
+    """
+    deg = np.asarray(longitudes, dtype=float)
+    plan = _plan(tuple(divisions))
+    expand = (-1,) + (1,) * deg.ndim
+    division = plan.division.reshape(expand)
+    division_size = plan.division_size.reshape(expand)
+    sign = np.floor(deg / 30.0).astype(np.int64) % 12
+    deg_in_sign = deg % 30.0
+
+    # Regular divisions: equal segments, position scaled within the segment
+    segment = np.minimum(np.floor(deg_in_sign / division_size).astype(np.int64), division - 1)
+    if plan.any_ranged:
+        # Irregular ranges: count the segment edges passed
+        ranged = plan.ranged.reshape(expand)
+        range_segment = (deg_in_sign[..., None] >= _EDGES[division, sign]).sum(axis=-1)
+        segment = np.where(ranged, range_segment, segment)
+    target_deg = _TARGETS[division, sign, segment] * 30.0
+
+    varga_deg = target_deg + ((deg_in_sign % division_size) / division_size) * 30.0
+    if plan.any_ranged:
+        # Ranged divisions place the body in the middle of the target sign
+        varga_deg = np.where(ranged, target_deg + 15.0, varga_deg)
+    if plan.any_rashi:
+        # D-1 (Rashi) is the longitude itself
+        varga_deg = np.where(plan.rashi.reshape(expand), deg, varga_deg)
+    return varga_deg % 360.0
+
+
+def calculate_vargas(lagna_deg: float,
+                     planets: Dict[str, float],
+                     divisions: Iterable[int]) -> Dict[int, Dict[str, float]]:
+    """Calculate the requested divisional charts for lagna and all planets.
+
+    Args:
+        lagna_deg: Ascendant longitude in degrees.
+        planets: Dict of planet longitudes (sun, moon, mars, etc.).
+        divisions: Division numbers to build (1-60).
+
+    Returns:
+        Dict keyed by division number; each chart maps every planet and
+        'lagna' to its divisional longitude.
+    """
+    floor = math.floor
+    bodies = [(name, deg, floor(deg / 30.0) % 12, deg % 30.0)
+              for name, deg in [*planets.items(), ('lagna', lagna_deg)]]
+
+    # One chart is a few dozen lookups: read the tables directly rather than
+    # paying NumPy's per-call overhead (same arithmetic as `varga_longitudes`)
+    charts: Dict[int, Dict[str, float]] = {}
+    for division in divisions:
+        if not 1 <= division <= MAX_DIVISION:
+            raise ValueError(f"Divisions must be between 1 and {MAX_DIVISION}: {division}")
+        targets = _TARGET_ROWS[division]
+        if division == 1:
+            chart = {name: deg % 360.0 for name, deg, _, _ in bodies}
+        elif division in _RANGE_EDGES:
+            edges = _RANGE_EDGES[division]
+            chart = {
+                name: (targets[sign][bisect.bisect_right(edges[sign % 2], deg_in_sign)] * 30.0 + 15.0) % 360.0
+                for name, _, sign, deg_in_sign in bodies
+            }
+        else:
+            size = 30.0 / division
+            last = division - 1
+            chart = {
+                name: (targets[sign][min(floor(deg_in_sign / size), last)] * 30.0
+                       + ((deg_in_sign % size) / size) * 30.0) % 360.0
+                for name, _, sign, deg_in_sign in bodies
+            }
+        charts[division] = chart
+    return charts
+
 
 def calculate_divisional_chart(lagna_deg: float, planets: Dict[str, float], division: int) -> Dict[str, float]:
     """Calculate divisional chart positions for all planets.
-    
+
     BPHS Reference: Divisional charts used for specific life areas.
     Supports standard Parasara method for 16 Vargas (Shodasa Vargas).
-    
+
     Special rules handled:
     - D-2 (Hora): Sun/Moon ruled based on odd/even signs.
     - D-30 (Trimsamsa): Complex degree ranges based on odd/even signs.
     - D-1 to D-60: Standard regular divisions for others.
-    
+
     Args:
         lagna_deg: Ascendant longitude in degrees.
         planets: Dict of planet longitudes (sun, moon, mars, etc.).
         division: Division number (1-60).
-        
+
     Returns:
         Dict with divisional chart positions for lagna and all planets.
     """
-    divisional_positions = {}
-    
-    # Combine lagna into the items to process to avoid code duplication
-    items = planets.copy()
-    items['lagna'] = lagna_deg
-    
-    for name, deg in items.items():
-        sign = int(math.floor(deg / 30.0)) % 12
-        deg_in_sign = deg % 30.0
-        is_odd = (sign % 2 == 0)  # Aries=0 (Odd), Taurus=1 (Even)
-        
-        varga_deg = 0.0
-        
-        if division == 1:
-            # D-1: Rashi (Root)
-            varga_deg = deg
-            
-        elif division == 2:
-            # D-2: Hora (Parasara)
-            # Odd signs: 0-15 -> Sun (Leo), 15-30 -> Moon (Cancer)
-            # Even signs: 0-15 -> Moon (Cancer), 15-30 -> Sun (Leo)
-            is_first_half = deg_in_sign < 15.0
-            
-            if is_odd:
-                # Odd: Sun first, Moon second
-                target_sign = 4 if is_first_half else 3 # Leo=4, Cancer=3
-            else:
-                # Even: Moon first, Sun second
-                target_sign = 3 if is_first_half else 4
-                
-            # Place in middle of sign for visualization or just start?
-            # Usually vargas are mapped to a sign. We'll map to 15 deg of that sign.
-            varga_deg = (target_sign * 30.0) + 15.0
-            
-        elif division == 30:
-            # D-30: Trimsamsa (Parasara)
-            # Odd Signs: 
-            # 0-5: Mars (Aries), 5-10: Saturn (Aquarius), 10-18: Jupiter (Sagittarius), 
-            # 18-25: Mercury (Gemini), 25-30: Venus (Libra)
-            # Even Signs: 
-            # 0-5: Venus (Taurus), 5-12: Mercury (Virgo), 12-20: Jupiter (Pisces), 
-            # 20-25: Saturn (Capricorn), 25-30: Mars (Scorpio)
-            
-            target_sign = 0
-            
-            if is_odd:
-                if deg_in_sign < 5: target_sign = 0 # Aries (Mars)
-                elif deg_in_sign < 10: target_sign = 10 # Aquarius (Saturn)
-                elif deg_in_sign < 18: target_sign = 8 # Sagittarius (Jupiter)
-                elif deg_in_sign < 25: target_sign = 2 # Gemini (Mercury)
-                else: target_sign = 6 # Libra (Venus)
-            else:
-                if deg_in_sign < 5: target_sign = 1 # Taurus (Venus)
-                elif deg_in_sign < 12: target_sign = 5 # Virgo (Mercury)
-                elif deg_in_sign < 20: target_sign = 11 # Pisces (Jupiter)
-                elif deg_in_sign < 25: target_sign = 9 # Capricorn (Saturn)
-                else: target_sign = 7 # Scorpio (Mars)
-                
-            varga_deg = (target_sign * 30.0) + 15.0
-            
-        else:
-            # Standard Regular Divisions (D-3 to D-60 excluding specials)
-            division_size = 30.0 / division
-            segment = int(math.floor(deg_in_sign / division_size)) # 0 to division-1
-            if segment >= division: segment = division - 1
-            
-            target_sign = 0
-            
-            if division == 3:
-                # D-3: Drekkana (Sign, 5th, 9th)
-                target_sign = (sign + (segment * 4)) % 12
-                
-            elif division == 4:
-                # D-4: Chaturthamsa (Sign, 4th, 7th, 10th)
-                target_sign = (sign + (segment * 3)) % 12
-                
-            elif division == 7:
-                # D-7: Saptamsa (Odd: Sign, Even: 7th)
-                start_sign = sign if is_odd else (sign + 6) % 12
-                target_sign = (start_sign + segment) % 12
-                
-            elif division == 9:
-                # D-9: Navamsa (Movable: Sign, Fixed: 9th, Dual: 5th)
-                if sign % 3 == 0:   # Movable
-                    start_sign = sign
-                elif sign % 3 == 1: # Fixed
-                    start_sign = (sign + 8) % 12
-                else:               # Dual
-                    start_sign = (sign + 4) % 12
-                target_sign = (start_sign + segment) % 12
-                
-            elif division == 10:
-                # D-10: Dasamsa (Odd: Sign, Even: 9th)
-                start_sign = sign if is_odd else (sign + 8) % 12
-                target_sign = (start_sign + segment) % 12
-                
-            elif division == 12:
-                # D-12: Dwadasamsa (Start from Sign)
-                target_sign = (sign + segment) % 12
-                
-            elif division == 16:
-                # D-16: Shodasamsa (Aja-Simha-Haya: 1, 5, 9)
-                # Chara (Movable): Aries, Sthira (Fixed): Leo, Dvisvabhava (Dual): Sag
-                if sign % 3 == 0:   # Movable
-                    start_sign = 0
-                elif sign % 3 == 1: # Fixed
-                    start_sign = 4
-                else:               # Dual
-                    start_sign = 8
-                target_sign = (start_sign + segment) % 12
-                    
-            elif division == 20:
-                # D-20: Vimsamsa (Movable: Aries, Fixed: Sagittarius, Dual: Leo)
-                if sign % 3 == 0:   # Movable
-                    start_sign = 0
-                elif sign % 3 == 1: # Fixed
-                    start_sign = 8
-                else:               # Dual
-                    start_sign = 4
-                target_sign = (start_sign + segment) % 12
-                
-            elif division == 24:
-                # D-24: Siddhamsa (Odd: Leo, Even: Cancer)
-                start_sign = 4 if is_odd else 3
-                target_sign = (start_sign + segment) % 12
-                
-            elif division == 27:
-                # D-27: Nakshatramsa (Fire: Aries, Earth: Cancer, Air: Libra, Water: Capricorn)
-                element = sign % 4
-                start_sign = (element * 3) % 12
-                target_sign = (start_sign + segment) % 12
-                
-            elif division == 40:
-                # D-40: Khavedamsa (Odd: Aries, Even: Libra)
-                start_sign = 0 if is_odd else 6
-                target_sign = (start_sign + segment) % 12
-                
-            elif division == 45:
-                # D-45: Akshayavedamsa (Movable: Aries, Fixed: Leo, Dual: Sagittarius)
-                if sign % 3 == 0:   # Movable
-                    start_sign = 0
-                elif sign % 3 == 1: # Fixed
-                    start_sign = 4
-                else:               # Dual
-                    start_sign = 8
-                target_sign = (start_sign + segment) % 12
-                
-            elif division == 60:
-                # D-60: Shashtiamsa (Start from Sign)
-                target_sign = (sign + segment) % 12
-                
-            else:
-                # Generic Fallback
-                target_sign = (sign + segment) % 12
-                
-            # Calculate degree within the varga sign
-            deg_in_segment = deg_in_sign % division_size
-            varga_deg_in_sign = (deg_in_segment / division_size) * 30.0
-            varga_deg = (target_sign * 30.0) + varga_deg_in_sign
-            
-        divisional_positions[name] = varga_deg % 360.0
-    
-    return divisional_positions
+    return calculate_vargas(lagna_deg, planets, (division,))[division]
 
 def calculate_shodasa_vargas(lagna_deg: float, planets: Dict[str, float]) -> Dict[str, Dict[str, float]]:
     """Calculate all 16 Parashari Divisional Charts (Shodasa Vargas).
-    
+
     Charts calculated:
-    D-1 (Rashi), D-2 (Hora), D-3 (Drekkana), D-4 (Chaturthamsa), 
+    D-1 (Rashi), D-2 (Hora), D-3 (Drekkana), D-4 (Chaturthamsa),
     D-7 (Saptamsa), D-9 (Navamsa), D-10 (Dasamsa), D-12 (Dwadasamsa),
-    D-16 (Shodasamsa), D-20 (Vimsamsa), D-24 (Siddhamsa), 
-    D-27 (Nakshatramsa), D-30 (Trimsamsa), D-40 (Khavedamsa), 
+    D-16 (Shodasamsa), D-20 (Vimsamsa), D-24 (Siddhamsa),
+    D-27 (Nakshatramsa), D-30 (Trimsamsa), D-40 (Khavedamsa),
     D-45 (Akshayavedamsa), D-60 (Shashtiamsa).
-    
+
     Args:
         lagna_deg: Ascendant longitude.
         planets: Dictionary of planet longitudes.
-        
+
     Returns:
         Dict keyed by division name (e.g. 'D-1', 'D-9') containing chart positions.
     """
-    divisions = {
-        'D-1': 1,
-        'D-2': 2,
-        'D-3': 3,
-        'D-4': 4,
-        'D-7': 7,
-        'D-9': 9,
-        'D-10': 10,
-        'D-12': 12,
-        'D-16': 16,
-        'D-20': 20,
-        'D-24': 24,
-        'D-27': 27,
-        'D-30': 30,
-        'D-40': 40,
-        'D-45': 45,
-        'D-60': 60
-    }
-    
-    vargas = {}
-    for name, div_num in divisions.items():
-        vargas[name] = calculate_divisional_chart(lagna_deg, planets, div_num)
-        
-    return vargas
+    charts = calculate_vargas(lagna_deg, planets, SHODASA_DIVISIONS)
+    return {f'D-{division}': chart for division, chart in charts.items()}
@@ -323,6 +323,8 @@ export function ResultsDisplay({ data, onNewCalculation }: ResultsDisplayProps)
           <h3>Rejected Times (Transparency)</h3>
           <p className="rejections-note">
             Reasons per BPHS 4.8–4.11 for filtered-out times.
+            {data.rejection_stats && data.rejection_stats.mode === 'nearest' &&
+              ` Showing the ${data.rejections.length} nearest of ${data.rejection_stats.total}.`}
           </p>
           <div className="verification-table-container">
             <table className="verification-table">
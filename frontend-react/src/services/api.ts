@@ -1,9 +1,10 @@
-import type { BTRRequest, BTRResponse, Geocode, NoCandidateErrorDetail, RejectionSummary, SuggestedQuestion } from '../types';
+import type { BTRBatchResponse, BTRJob, BTRRequest, BTRResponse, BTRStreamEvent, Geocode, NoCandidateErrorDetail, RejectionSummary, SuggestedQuestion } from '../types';
 import { logClientEvent } from '../utils/clientLogger';
 
 const API_BASE = '/api';
 const DEFAULT_TIMEOUT_MS = 60_000;
 const GEOCODE_TIMEOUT_MS = 15_000;
+const BATCH_TIMEOUT_MS = 600_000;
 
 async function fetchWithTimeout(url: string, options: RequestInit = {}, timeoutMs = DEFAULT_TIMEOUT_MS) {
   const controller = new AbortController();
@@ -101,3 +102,134 @@ export async function calculateBTR(request: BTRRequest): Promise<BTRResponse> {
   logClientEvent('info', 'BTR calculation completed', { ...requestMeta, candidates: payload?.candidates?.length ?? 0 });
   return payload;
 }
+
+/**
+ * Streaming variant of calculateBTR: reports search passes, progress, each
+ * accepted candidate and śodhana refinements through onEvent as they arrive,
+ * and resolves with the final response.
+ */
+export async function calculateBTRStream(
+  request: BTRRequest,
+  onEvent: (event: BTRStreamEvent) => void
+): Promise<BTRResponse> {
+  logClientEvent('info', 'BTR stream started', { dob: request.dob, pob_text: request.pob_text });
+  const response = await fetchWithTimeout(
+    `${API_BASE}/btr/stream`,
+    {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify(request),
+    },
+    DEFAULT_TIMEOUT_MS
+  );
+  if (!response.ok || !response.body) {
+    let errorMessage = `HTTP ${response.status}: ${response.statusText}`;
+    try {
+      const error = await response.json();
+      if (typeof error.detail === 'string') {
+        errorMessage = error.detail;
+      }
+    } catch {
+      // Keep the status line
+    }
+    logClientEvent('error', 'BTR stream failed', { status: response.status, message: errorMessage });
+    throw new Error(errorMessage);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffered = '';
+  for (;;) {
+    const { value, done } = await reader.read();
+    buffered += decoder.decode(value, { stream: !done });
+    const lines = buffered.split('\n');
+    buffered = lines.pop() ?? '';
+    for (const line of lines) {
+      if (!line.trim()) continue;
+      const event = JSON.parse(line) as BTRStreamEvent;
+      onEvent(event);
+      if (event.event === 'result') {
+        logClientEvent('info', 'BTR stream completed', { candidates: event.response.candidates.length });
+        return event.response;
+      }
+      if (event.event === 'error') {
+        const message = typeof event.detail === 'string' ? event.detail : event.detail.message;
+        const err = new Error(message || 'BTR calculation failed') as Error & { status?: number };
+        err.status = event.status_code;
+        throw err;
+      }
+    }
+    if (done) break;
+  }
+  throw new Error('BTR stream ended without a result');
+}
+
+/**
+ * Rectify several subjects in one call. Each item carries its own status
+ * code and response or error; subjects sharing a birth date and place are
+ * searched together on the server.
+ */
+export async function calculateBTRBatch(requests: BTRRequest[]): Promise<BTRBatchResponse> {
+  logClientEvent('info', 'BTR batch started', { items: requests.length });
+  const response = await fetchWithTimeout(`${API_BASE}/btr/batch`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({ items: requests }),
+  }, BATCH_TIMEOUT_MS);
+  if (!response.ok) {
+    const message = `HTTP ${response.status}: ${response.statusText}`;
+    logClientEvent('error', 'BTR batch failed', { status: response.status });
+    throw new Error(message);
+  }
+  const payload: BTRBatchResponse = await response.json();
+  logClientEvent('info', 'BTR batch completed', { items: payload.items.length, groups: payload.groups });
+  return payload;
+}
+
+async function readJob(response: Response, action: string): Promise<BTRJob> {
+  if (!response.ok) {
+    let errorMessage = `HTTP ${response.status}: ${response.statusText}`;
+    try {
+      const error = await response.json();
+      if (typeof error.detail === 'string') {
+        errorMessage = error.detail;
+      }
+    } catch {
+      // Keep the status line
+    }
+    logClientEvent('error', `BTR job ${action} failed`, { status: response.status, message: errorMessage });
+    throw new Error(errorMessage);
+  }
+  return response.json();
+}
+
+/**
+ * Submit a rectification as a background job; poll it with getBTRJob and
+ * cancel it with cancelBTRJob when the result is no longer wanted.
+ */
+export async function submitBTRJob(request: BTRRequest): Promise<BTRJob> {
+  logClientEvent('info', 'BTR job submitted', { dob: request.dob, pob_text: request.pob_text });
+  const response = await fetchWithTimeout(`${API_BASE}/btr/jobs`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify(request),
+  });
+  return readJob(response, 'submit');
+}
+
+export async function getBTRJob(jobId: string): Promise<BTRJob> {
+  const response = await fetchWithTimeout(`${API_BASE}/btr/jobs/${encodeURIComponent(jobId)}`);
+  return readJob(response, 'poll');
+}
+
+export async function cancelBTRJob(jobId: string): Promise<BTRJob> {
+  logClientEvent('info', 'BTR job cancelled', { jobId });
+  const response = await fetchWithTimeout(`${API_BASE}/btr/jobs/${encodeURIComponent(jobId)}`, { method: 'DELETE' });
+  return readJob(response, 'cancel');
+}
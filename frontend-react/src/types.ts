@@ -75,6 +75,7 @@ export interface BTRRequest {
   prashna_mode?: boolean;
   optional_traits?: PhysicalTraits | null;
   optional_events?: LifeEvents | null;
+  dob_uncertainty_days?: number;
 }
 
 export interface SpecialLagnas {
@@ -122,10 +123,12 @@ export interface BTRCandidate {
    purification_anchor?: string | null;
    bphs_score?: number | null;
    shodhana_delta_palas?: number | null;
+   padekyata_instant_local?: string | null;
   verification_scores: VerificationScores;
   special_lagnas?: SpecialLagnas | null;
   nisheka?: Nisheka | null;
   composite_score?: number | null;
+  stage9_validated?: boolean | null;
   physical_traits_scores?: PhysicalTraitsScore | null;
   life_events_scores?: LifeEventsScore | null;
 }
@@ -140,6 +143,26 @@ export interface RejectedCandidate {
   rejection_reason?: string | null;
 }
 
+export interface RejectionStats {
+  total: number;
+  reason_counts: Record<string, number>;
+  classification_counts: Record<string, number>;
+  histograms: {
+    bin_edges_deg: number[];
+    padekyata: number[];
+    moon: number[];
+    gulika: number[];
+  };
+  min_deltas: {
+    padekyata?: number | null;
+    moon?: number | null;
+    gulika?: number | null;
+  };
+  mode: 'nearest' | 'all';
+  offset: number;
+  returned: number;
+}
+
 export interface RejectionSummary {
   reason_counts: Record<string, number>;
   window?: { start?: string; end?: string };
@@ -176,9 +199,46 @@ export interface BTRResponse {
   candidates: BTRCandidate[];
   best_candidate: BTRCandidate | null;
   rejections?: RejectedCandidate[] | null;
+  rejection_stats?: RejectionStats | null;
   notes?: string | null;
 }
 
+export type BTRStreamEvent =
+  | { event: 'pass'; window: { start: string; end: string }; strict_bphs: boolean; note?: string | null }
+  | { event: 'progress'; step: number; total_steps: number; candidates: number; rejections: number; date?: string }
+  | { event: 'candidate'; candidate: BTRCandidate; date?: string }
+  | { event: 'shodhana'; rank: number; candidate: BTRCandidate }
+  | { event: 'result'; response: BTRResponse }
+  | { event: 'error'; status_code: number; detail: NoCandidateErrorDetail | string };
+
+export interface BTRBatchItem {
+  index: number;
+  status_code: number;
+  response: BTRResponse | null;
+  error: NoCandidateErrorDetail | string | null;
+}
+
+export interface BTRBatchResponse {
+  items: BTRBatchItem[];
+  groups: number;
+  searches: number;
+  cache_hits: number;
+}
+
+export type BTRJobStatus = 'queued' | 'running' | 'cancelling' | 'succeeded' | 'failed' | 'cancelled';
+
+export interface BTRJob {
+  job_id: string;
+  status: BTRJobStatus;
+  created_at: string;
+  updated_at: string;
+  progress: { step: number; total_steps: number; candidates: number; rejections: number } | null;
+  search_pass: { window: { start: string; end: string }; strict_bphs: boolean; note?: string | null } | null;
+  candidates_found: number;
+  result: BTRResponse | null;
+  error: { status_code: number; detail: NoCandidateErrorDetail | string } | null;
+}
+
 export interface SuggestedQuestion {
   field: string;
   priority: number;
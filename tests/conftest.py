@@ -0,0 +1,25 @@
+"""Shared pytest fixtures."""
+
+import os
+
+import pytest
+
+# Run searches on threads: the API tests patch btr_core at module level, which
+# worker processes would not see.  Set before backend.config is imported.
+os.environ['COMPUTE_WORKERS'] = '0'
+
+from backend import day_context, geocode_cache, jobs, result_cache  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _isolate_caches():
+    """Tests patch btr_core and geocoding with fakes, so cached results must not leak between them."""
+    result_cache.get_cache().clear()
+    geocode_cache.get_cache().clear()
+    day_context.get_cache().clear()
+    jobs.get_manager().clear()
+    yield
+    result_cache.get_cache().clear()
+    geocode_cache.get_cache().clear()
+    day_context.get_cache().clear()
+    jobs.get_manager().clear()
@@ -0,0 +1,57 @@
+# Tests for closed-form ascendant solver
+
+"""Regression harness comparing AscendantSolver against swe.houses."""
+
+import random
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+from backend import btr_core
+from backend.ascendant import AscendantSolver
+
+TOLERANCE_DEG = 1e-6
+
+
+def _wrapped_error(a: float, b: float) -> float:
+    return abs((a - b + 180.0) % 360.0 - 180.0)
+
+
+class TestAscendantSolver:
+    """AscendantSolver must reproduce compute_sidereal_lagna (swe.houses)."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_swe_houses(self, seed):
+        rng = random.Random(seed)
+        for _ in range(40):
+            jd_start = rng.uniform(2415020.5, 2488069.5)
+            latitude = rng.uniform(-66.0, 66.0)
+            longitude = rng.uniform(-180.0, 180.0)
+            solver = AscendantSolver(latitude, longitude, jd_start, jd_start + 1.0)
+            # Include JDs just outside the anchored span
+            jds = [jd_start + rng.uniform(-0.05, 1.05) for _ in range(25)]
+            array_values = solver.ascendant_array(jds)
+            for jd, array_value in zip(jds, array_values):
+                expected = swe.houses(jd, latitude, longitude)[1][0]
+                assert _wrapped_error(solver.ascendant(jd), expected) < TOLERANCE_DEG
+                assert _wrapped_error(float(array_value), expected) < TOLERANCE_DEG
+
+    def test_matches_compute_sidereal_lagna_over_a_day(self):
+        latitude, longitude = 28.6139, 77.2090
+        jd_start = btr_core._datetime_to_jd_ut(btr_core.datetime.datetime(1990, 6, 15), 5.5)
+        solver = AscendantSolver(latitude, longitude, jd_start, jd_start + 1.0)
+        jds = jd_start + np.arange(0, 3600) * (24.0 / 86400.0)
+        values = solver.ascendant_array(jds)
+        for jd, value in zip(jds[::37], values[::37]):
+            expected = btr_core.compute_sidereal_lagna(float(jd), latitude, longitude)
+            assert _wrapped_error(float(value), expected) < TOLERANCE_DEG
+
+    def test_polar_latitude_raises_like_swe_houses(self):
+        solver = AscendantSolver(89.0, 0.0, 2451545.0, 2451546.0)
+        with pytest.raises(swe.Error):
+            swe.houses(2451545.5, 89.0, 0.0)
+        with pytest.raises(RuntimeError, match="Swiss Ephemeris"):
+            solver.ascendant(2451545.5)
+        with pytest.raises(RuntimeError, match="Swiss Ephemeris"):
+            solver.ascendant_array([2451545.5])
@@ -0,0 +1,195 @@
+# Tests for vectorised batch evaluation
+
+"""Tests that the NumPy batch kernels agree with the scalar BPHS pipeline."""
+
+import datetime
+import random
+
+import numpy as np
+import pytest
+
+from backend import batch_eval, btr_core
+
+
+@pytest.fixture
+def rng():
+    return random.Random(20240115)
+
+
+class TestBatchKernels:
+    """Each kernel must reproduce its scalar counterpart exactly."""
+
+    def test_ishta_madhya_sphuta_match_scalar(self, rng):
+        sunrise = datetime.datetime(2024, 1, 15, 7, 10, 33)
+        times = [sunrise + datetime.timedelta(seconds=rng.uniform(-43200, 86000)) for _ in range(500)]
+        suns = np.array([rng.uniform(0, 360) for _ in times])
+        elapsed = np.array([(t - sunrise).total_seconds() for t in times])
+
+        ghatis, palas, total_palas = batch_eval.ishta_kala_arrays(elapsed)
+        madhya = batch_eval.madhya_pranapada_array(ghatis, palas)
+        sphuta = batch_eval.sphuta_pranapada_array(total_palas, suns)
+
+        for i, t in enumerate(times):
+            g, p, tp = btr_core.calculate_ishta_kala(t, sunrise)
+            assert (int(ghatis[i]), int(palas[i]), float(total_palas[i])) == (g, p, tp)
+            assert float(madhya[i]) == btr_core.calculate_madhya_pranapada(g, p)
+            assert float(sphuta[i]) == btr_core.calculate_sphuta_pranapada(tp, float(suns[i]))
+
+    def test_special_lagnas_and_nisheka_match_scalar(self, rng):
+        n = 500
+        ghatis = np.array([rng.randrange(0, 60) for _ in range(n)])
+        palas = np.array([rng.randrange(0, 60) for _ in range(n)])
+        suns = np.array([rng.uniform(0, 360) for _ in range(n)])
+        lagnas = np.array([rng.uniform(0, 360) for _ in range(n)])
+        saturns = np.array([rng.uniform(0, 360) for _ in range(n)])
+        gulikas = np.array([rng.uniform(0, 360) for _ in range(n)])
+
+        special = batch_eval.special_lagnas_arrays(ghatis, palas, suns, lagnas)
+        nisheka = batch_eval.nisheka_arrays(saturns, gulikas, lagnas)
+
+        for i in range(n):
+            expected = btr_core.calculate_special_lagnas(
+                (int(ghatis[i]), int(palas[i]), 0.0), float(suns[i]), float(lagnas[i])
+            )
+            assert {k: float(v[i]) for k, v in special.items()} == expected
+            expected_nisheka = btr_core.calculate_nisheka_lagna(float(saturns[i]), float(gulikas[i]), float(lagnas[i]))
+            assert bool(nisheka['is_realistic'][i]) == expected_nisheka['is_realistic']
+            assert float(nisheka['gestation_score'][i]) == expected_nisheka['gestation_score']
+            assert float(nisheka['nisheka_lagna_deg'][i]) == expected_nisheka['nisheka_lagna_deg']
+
+    @pytest.mark.parametrize("strict_bphs", [False, True])
+    def test_hard_filter_verdicts_match_scalar(self, rng, strict_bphs):
+        n = 2000
+        lagnas = np.array([rng.uniform(0, 360) for _ in range(n)])
+        # Keep Prāṇa-pada, Moon and Gulika near the lagna so every branch is exercised
+        sphutas = np.mod(lagnas + [rng.uniform(-3, 3) + rng.choice((0, 120, 90)) for _ in range(n)], 360.0)
+        madhyas = np.mod(lagnas + [rng.uniform(-1, 1) for _ in range(n)], 360.0)
+        moons = np.mod(lagnas + [rng.uniform(-4, 4) for _ in range(n)], 360.0)
+        gulikas = np.mod(lagnas + [rng.uniform(-4, 4) + rng.choice((0, 180)) for _ in range(n)], 360.0)
+        total_palas = np.array([rng.uniform(0, 3600) for _ in range(n)])
+
+        tol = btr_core.STRICT_PADA_EPSILON_DEGREES if strict_bphs else 2.0
+        verdicts = batch_eval.hard_filter_arrays(
+            lagnas, sphutas, madhyas, gulikas, moons, total_palas,
+            alignment_orb=btr_core.STRICT_ORB_TOLERANCE if strict_bphs else 2.0,
+            padekyata_tolerance_sphuta=tol,
+            padekyata_tolerance_madhya=btr_core.STRICT_PADA_EPSILON_DEGREES
+        )
+
+        for i in range(n):
+            accepted, scores = btr_core.apply_bphs_hard_filters(
+                float(lagnas[i]), float(sphutas[i]), float(gulikas[i]), float(moons[i]),
+                madhya_pranapada_deg=float(madhyas[i]),
+                strict_bphs=strict_bphs,
+                total_palas=float(total_palas[i])
+            )
+            assert bool(verdicts['accepted'][i]) == accepted
+            assert bool(verdicts['passes_trine'][i]) == scores['passes_trine_rule']
+            assert bool(verdicts['passes_padekyata'][i]) == scores['passes_padekyata']
+            assert bool(verdicts['passes_purification'][i]) == scores['passes_purification']
+
+    @pytest.mark.parametrize("strict_bphs", [False, True])
+    def test_batch_verdict_equals_scalar_scores(self, rng, strict_bphs):
+        n = 2000
+        lagnas = np.array([rng.uniform(0, 360) for _ in range(n)])
+        sphutas = np.mod(lagnas + [rng.uniform(-3, 3) + rng.choice((0, 120, 90, 60, 30)) for _ in range(n)], 360.0)
+        madhyas = np.mod(lagnas + [rng.uniform(-1, 1) for _ in range(n)], 360.0)
+        moons = np.mod(lagnas + [rng.uniform(-4, 4) for _ in range(n)], 360.0)
+        gulikas = np.mod(lagnas + [rng.uniform(-4, 4) + rng.choice((0, 180)) for _ in range(n)], 360.0)
+        # Moon 210° behind the lagna's ishta-kāla motion brings in the Verse 4.9 anchor
+        total_palas = np.mod(np.mod(lagnas - np.mod(moons - 210.0, 360.0), 360.0) * 10.0 +
+                             [rng.uniform(-20, 20) for _ in range(n)], 3600.0)
+        batch = {'lagna_deg': lagnas, 'sphuta_pp': sphutas, 'madhya_pp': madhyas,
+                 'gulika_deg': gulikas, 'moon_deg': moons, 'total_palas': total_palas}
+        filters = btr_core.apply_batch_filters(batch, strict_bphs=strict_bphs)['filters']
+
+        anchors = set()
+        for i in range(n):
+            expected = btr_core.apply_bphs_hard_filters(
+                float(lagnas[i]), float(sphutas[i]), float(gulikas[i]), float(moons[i]),
+                madhya_pranapada_deg=float(madhyas[i]),
+                strict_bphs=strict_bphs,
+                total_palas=float(total_palas[i])
+            )
+            assert btr_core.batch_hard_filter_verdict(filters, i) == expected
+            anchors.add(expected[1]['purification_anchor'])
+        assert len(anchors) >= 4
+
+
+class TestEvaluateCandidateBatch:
+    """Tests for btr_core.evaluate_candidate_batch on real ephemeris data."""
+
+    def test_batch_matches_scalar_filters(self):
+        dob = datetime.date(1990, 6, 15)
+        lat, lon, tz = 28.6139, 77.2090, 5.5
+        sunrise, sunset = btr_core.compute_sunrise_sunset(dob, lat, lon, tz)
+        gulika = btr_core.calculate_gulika(dob, lat, lon, tz)
+        times = [datetime.datetime(1990, 6, 15) + datetime.timedelta(seconds=24 * k) for k in range(0, 3600, 7)]
+        gulikas = [
+            gulika['day_gulika_deg'] if sunrise <= t <= sunset else gulika['night_gulika_deg']
+            for t in times
+        ]
+        jds = [btr_core._datetime_to_jd_ut(t, tz) for t in times]
+
+        batch = btr_core.evaluate_candidate_batch(
+            jds, [(t - sunrise).total_seconds() for t in times], lat, lon, gulikas,
+            orb_tolerance=2.0, strict_bphs=False
+        )
+
+        assert len(batch['accepted']) == len(times)
+        for i, t in enumerate(times):
+            lagna = float(batch['lagna_deg'][i])
+            assert lagna == pytest.approx(btr_core.compute_sidereal_lagna(jds[i], lat, lon), abs=1e-6)
+            g, p, tp = btr_core.calculate_ishta_kala(t, sunrise)
+            sphuta = btr_core.calculate_sphuta_pranapada(tp, batch['sun_deg'][i])
+            accepted, _ = btr_core.apply_bphs_hard_filters(
+                lagna, sphuta, gulikas[i], batch['moon_deg'][i],
+                madhya_pranapada_deg=btr_core.calculate_madhya_pranapada(g, p),
+                orb_tolerance=2.0,
+                total_palas=tp
+            )
+            assert bool(batch['accepted'][i]) == accepted
+
+
+class TestToleranceProfiles:
+    """Classifying under several profiles matches one filter call per profile."""
+
+    def _inputs(self, rng, n=1000):
+        lagnas = np.array([rng.uniform(0, 360) for _ in range(n)])
+        sphutas = np.mod(lagnas + [rng.uniform(-5, 5) + rng.choice((0, 120, 90)) for _ in range(n)], 360.0)
+        madhyas = np.mod(lagnas + [rng.uniform(-1, 1) for _ in range(n)], 360.0)
+        moons = np.mod(lagnas + [rng.uniform(-6, 6) for _ in range(n)], 360.0)
+        gulikas = np.mod(lagnas + [rng.uniform(-6, 6) + rng.choice((0, 180)) for _ in range(n)], 360.0)
+        total_palas = np.array([rng.uniform(0, 3600) for _ in range(n)])
+        return lagnas, sphutas, madhyas, gulikas, moons, total_palas
+
+    def test_scalar_profiles_match_single_profile_filters(self, rng):
+        lagnas, sphutas, madhyas, gulikas, moons, total_palas = self._inputs(rng)
+        for i in range(len(lagnas)):
+            args = (float(lagnas[i]), float(sphutas[i]), float(gulikas[i]), float(moons[i]))
+            verdicts = btr_core.apply_bphs_hard_filters_profiles(
+                *args, madhya_pranapada_deg=float(madhyas[i]), total_palas=float(total_palas[i])
+            )
+            assert list(verdicts) == list(btr_core.TOLERANCE_PROFILES)
+            for name, profile in btr_core.TOLERANCE_PROFILES.items():
+                assert verdicts[name] == btr_core.apply_bphs_hard_filters(
+                    *args, madhya_pranapada_deg=float(madhyas[i]), total_palas=float(total_palas[i]), **profile
+                )
+            # Wider tolerances never reject what a stricter profile accepts
+            accepted = [verdicts[name][0] for name in ('strict', 'default', 'relaxed')]
+            assert accepted == sorted(accepted)
+
+    def test_batch_profiles_match_scalar(self, rng):
+        lagnas, sphutas, madhyas, gulikas, moons, total_palas = self._inputs(rng)
+        batch = {
+            'lagna_deg': lagnas, 'sphuta_pp': sphutas, 'madhya_pp': madhyas,
+            'gulika_deg': gulikas, 'moon_deg': moons, 'total_palas': total_palas
+        }
+        results = btr_core.apply_batch_filter_profiles(batch)
+        for name, profile in btr_core.TOLERANCE_PROFILES.items():
+            for i in range(len(lagnas)):
+                accepted, _ = btr_core.apply_bphs_hard_filters(
+                    float(lagnas[i]), float(sphutas[i]), float(gulikas[i]), float(moons[i]),
+                    madhya_pranapada_deg=float(madhyas[i]), total_palas=float(total_palas[i]), **profile
+                )
+                assert bool(results[name]['accepted'][i]) == accepted
@@ -594,6 +594,58 @@ class TestSearchCandidateTimes:
         sig = inspect.signature(btr_core.search_candidate_times)
         assert sig.parameters['bphs_only_ordering'].default is True
 
+    @pytest.mark.parametrize("strict_bphs", [True, False])
+    def test_sharded_search_matches_serial(self, strict_bphs):
+        """Sharding the window across processes must not change any result."""
+        kwargs = dict(
+            dob=datetime.date(1990, 1, 1),
+            latitude=18.5204,
+            longitude=73.8567,
+            tz_offset=5.5,
+            start_time_str="00:00",
+            end_time_str="23:59",
+            step_minutes=2,
+            strict_bphs=strict_bphs,
+            enable_shodhana=True,
+            collect_rejections=True,
+            optional_traits={'height': 'TALL', 'build': 'MEDIUM', 'complexion': 'FAIR'}
+        )
+        serial = btr_core.search_candidate_times(**kwargs, shard_workers=0)
+        sharded = btr_core.search_candidate_times(**kwargs, shard_workers=3)
+        assert sharded == serial
+
+    @pytest.mark.parametrize("shard_workers", [0, 3])
+    def test_on_event_streams_candidates_and_progress(self, shard_workers):
+        """Every returned candidate is reported once, in grid order, before the search returns."""
+        kwargs = dict(
+            dob=datetime.date(1990, 1, 1),
+            latitude=18.5204,
+            longitude=73.8567,
+            tz_offset=5.5,
+            start_time_str="00:00",
+            end_time_str="23:59",
+            step_minutes=2,
+            strict_bphs=False,
+            shard_workers=shard_workers
+        )
+        events = []
+        candidates = btr_core.search_candidate_times(**kwargs, on_event=events.append)
+        assert candidates == btr_core.search_candidate_times(**kwargs)
+
+        streamed = [e['candidate'] for e in events if e['event'] == 'candidate']
+        assert sorted(c['time_local'] for c in streamed) == sorted(c['time_local'] for c in candidates)
+        assert [c['time_local'] for c in streamed] == sorted(c['time_local'] for c in streamed)
+        progress = [e for e in events if e['event'] == 'progress']
+        assert progress and progress[-1]['step'] == progress[-1]['total_steps']
+        assert progress[-1]['candidates'] == len(candidates)
+
+    def test_shard_count_respects_minimum_shard_size(self):
+        """Small grids stay serial; large grids oversubscribe the workers."""
+        assert btr_core._shard_count(720, 0) == 1
+        assert btr_core._shard_count(720, 1) == 1
+        assert btr_core._shard_count(btr_core.SHARD_MIN_GRID_POINTS - 1, 16) == 1
+        assert btr_core._shard_count(3600, 4) == 4 * btr_core.SHARD_OVERSUBSCRIPTION
+
 
 class TestSpecialLagnas:
     """Tests for special lagnas calculations."""
@@ -1020,6 +1072,55 @@ class TestLifeEventsVerification:
         assert scores['major'] >= 0
 
 
+class TestLifeEventClasses:
+    """Life events scored once per equivalence class of candidates."""
+
+    EVENTS = {
+        'marriage': {'date': '10-05-2015'},
+        'children': [{'date': '01-01-2018'}, 'not a date'],
+        'career': [{'date': '01-06-2012'}],
+        'siblings': [{'count': 2}],
+        'parents': [{'death_date': '03-03-2020'}],
+        'major': ['05-05-2010']
+    }
+
+    def charts(self, minutes):
+        for minute in minutes:
+            dt = datetime.datetime(1990, 1, 15) + datetime.timedelta(minutes=minute)
+            jd_ut = btr_core._datetime_to_jd_ut(dt, 5.5)
+            planets = btr_core.get_planet_positions(jd_ut)
+            yield dt, jd_ut, btr_core.compute_sidereal_lagna(jd_ut, 28.6139, 77.2090), planets
+
+    def test_scores_match_per_candidate_verification(self):
+        classes = btr_core.LifeEventClasses(self.EVENTS)
+        for dt, jd_ut, lagna, planets in self.charts(range(0, 24 * 60, 7)):
+            strengths = btr_core.calculate_planetary_strengths(jd_ut, lagna, planets, dt, 28.6139, 77.2090, 5.5)
+            expected = btr_core.verify_life_events(jd_ut, lagna, planets, self.EVENTS, planets['moon'],
+                                                   shadbala_scores=strengths)
+            assert classes.verify(jd_ut, lagna, planets, planets['moon'], shadbala_scores=strengths) == expected
+        assert 0 < len(classes) < classes.candidates
+
+    def test_equivalent_candidates_scored_once(self, monkeypatch):
+        calls = []
+        real_verify = btr_core.verify_life_events
+
+        def counting_verify(*args, **kwargs):
+            calls.append(args[0])
+            return real_verify(*args, **kwargs)
+
+        monkeypatch.setattr(btr_core, 'verify_life_events', counting_verify)
+        classes = btr_core.LifeEventClasses({'major': ['05-05-2010', '07-07-2007']})
+        charts = list(self.charts(range(600, 660, 2)))
+        results = [classes.verify(jd_ut, lagna, planets, planets['moon']) for _, jd_ut, lagna, planets in charts]
+        # The mahadasha running at either event date is the same all hour
+        assert len(calls) == len(classes) == 1 and classes.candidates == 30
+        assert all(result == results[0] for result in results)
+        # Members get copies of the class scores
+        results[0]['major'] = -1.0
+        _, jd_ut, lagna, planets = charts[0]
+        assert classes.verify(jd_ut, lagna, planets, planets['moon']) == results[1]
+
+
 class TestEnhancedScoring:
     """Tests for enhanced composite scoring."""
     
@@ -1169,3 +1270,48 @@ class TestEnhancedScoring:
         for time_str in times:
             cand_dt = datetime.datetime.strptime(time_str, '%Y-%m-%dT%H:%M:%S')
             assert start_dt <= cand_dt <= end_dt
+
+
+class TestMultiDaySearch:
+    """Tests for searches over an uncertain birth date."""
+
+    PLACE = dict(latitude=18.5204, longitude=73.8567, tz_offset=5.5)
+
+    def test_days_are_ranked_together(self):
+        dates = [datetime.date(1990, 1, 1) + datetime.timedelta(days=k) for k in (1, -1, 0)]
+        contexts = [btr_core.get_day_context(d, **self.PLACE) for d in dates]
+        window = dict(start_time_str="08:00", end_time_str="14:00", step_minutes=2, strict_bphs=False)
+        events = []
+        candidates = btr_core.search_candidate_days(contexts, on_event=events.append, **window)
+
+        separate = []
+        for context in sorted(contexts, key=lambda c: c.date):
+            separate.extend(btr_core.search_candidate_times(
+                context.date, sunrise_local=context.sunrise, sunset_local=context.sunset,
+                gulika_info=context.gulika, bphs_only_ordering=False, **self.PLACE, **window
+            ))
+        separate.sort(key=lambda c: round(c['composite_score'], 2), reverse=True)
+        assert candidates == separate
+        assert {c['time_local'][:10] for c in candidates} <= {d.isoformat() for d in dates}
+        assert {e['date'] for e in events if e['event'] == 'progress'} == {d.isoformat() for d in dates}
+
+    def test_fallbacks_cover_every_day_with_a_store_per_day(self, monkeypatch):
+        calls = []
+
+        def fake_search(**kwargs):
+            calls.append(kwargs)
+            return [], []
+
+        monkeypatch.setattr(btr_core, "search_candidate_times", fake_search)
+        dob = datetime.date(1990, 1, 1)
+        result = btr_core.search_with_fallbacks(
+            "10:00", "12:00", dob=dob, dob_uncertainty_days=1, step_minutes=2, **self.PLACE
+        )
+        assert result['dates'] == ['1989-12-31', '1990-01-01', '1990-01-02']
+        assert len(result['attempts']) == 3
+        assert [c['dob'] for c in calls] == [dob + datetime.timedelta(days=k) for k in (-1, 0, 1)] * 3
+        stores = {}
+        for call in calls:
+            assert call['sunrise_local'].date() == call['dob']
+            stores.setdefault(call['dob'], set()).add(id(call['evaluation_store']))
+        assert all(len(ids) == 1 for ids in stores.values()) and len(stores) == 3
@@ -0,0 +1,147 @@
+# Tests for cancellation module
+
+"""Tests that cancellation tokens stop searches cooperatively."""
+
+import concurrent.futures
+import datetime
+import multiprocessing
+import pickle
+import threading
+import time
+
+import pytest
+
+from backend import btr_core, compute_pool
+from backend.cancellation import CancellationToken, SearchCancelled
+
+SEARCH_KWARGS = dict(
+    dob=datetime.date(2024, 1, 15), latitude=28.6139, longitude=77.2090, tz_offset=5.5,
+    start_time_str='00:00', end_time_str='23:59', strict_bphs=False
+)
+
+
+def cancelled_token():
+    token = CancellationToken()
+    token.cancel()
+    return token
+
+
+class TestCancellationToken:
+    """Flag semantics and throttled polling."""
+
+    def test_check_raises_once_cancelled(self):
+        token = CancellationToken(poll_interval=0.0)
+        token.check()
+        assert not token.cancelled
+        token.cancel()
+        assert token.cancelled
+        with pytest.raises(SearchCancelled):
+            token.check()
+
+    def test_polls_are_throttled(self):
+        token = CancellationToken(poll_interval=60.0)
+        token.check()
+        token.cancel()
+        token.check()  # within the poll interval: not polled yet
+        token._next_poll = 0.0
+        with pytest.raises(SearchCancelled):
+            token.check()
+
+    def test_manager_backed_token_pickles_into_workers(self):
+        with multiprocessing.Manager() as manager:
+            token = CancellationToken(manager.Event())
+            assert token.shareable and not CancellationToken().shareable
+            copy = pickle.loads(pickle.dumps(token))
+            token.cancel()
+            assert copy.cancelled
+
+
+class TestSearchCancellation:
+    """Searches stop at their next check."""
+
+    def test_cancelled_search_raises(self):
+        with pytest.raises(SearchCancelled):
+            btr_core.search_candidate_times(step_minutes=2, cancel_token=cancelled_token(), **SEARCH_KWARGS)
+
+    def test_cancel_from_another_thread_stops_the_scan(self):
+        token = CancellationToken(poll_interval=0.0)
+        events = []
+
+        def on_event(event):
+            events.append(event)
+            if event['event'] == 'progress':
+                token.cancel()
+
+        with pytest.raises(SearchCancelled):
+            btr_core.search_candidate_times(step_palas=1.0, enable_shodhana=True, on_event=on_event,
+                                            cancel_token=token, **SEARCH_KWARGS)
+        progress = [e for e in events if e['event'] == 'progress']
+        assert len(progress) == 1 and progress[0]['step'] < progress[0]['total_steps']
+
+    def test_sharded_search_stops_waiting_on_shards(self):
+        with multiprocessing.Manager() as manager:
+            token = CancellationToken(manager.Event())
+            token.cancel()
+            started = time.perf_counter()
+            with pytest.raises(SearchCancelled):
+                btr_core.search_candidate_times(step_minutes=2, shard_workers=3, cancel_token=token,
+                                                **SEARCH_KWARGS)
+            assert time.perf_counter() - started < 30.0
+
+    def test_thread_token_stops_running_shards(self, monkeypatch):
+        # Shard workers fork from here, so they inherit the slowed grid filtering
+        compute_pool.shutdown_shard_executors()
+        real_filters = btr_core.apply_batch_filters
+
+        def slow_filters(*args, **kwargs):
+            time.sleep(0.5)
+            return real_filters(*args, **kwargs)
+
+        submitted = []
+        real_executor = compute_pool.get_shard_executor
+
+        class RecordingExecutor:
+            def __init__(self, workers):
+                self.executor = real_executor(workers)
+
+            def submit(self, *args, **kwargs):
+                submitted.append(self.executor.submit(*args, **kwargs))
+                return submitted[-1]
+
+        monkeypatch.setattr(btr_core, 'apply_batch_filters', slow_filters)
+        monkeypatch.setattr(compute_pool, 'get_shard_executor', RecordingExecutor)
+        token = CancellationToken()
+        timer = threading.Timer(0.5, token.cancel)
+        timer.start()
+        try:
+            with pytest.raises(SearchCancelled):
+                btr_core.search_candidate_times(
+                    step_minutes=2, shard_workers=3, cancel_token=token, **SEARCH_KWARGS
+                )
+            done, _ = concurrent.futures.wait(submitted, timeout=30.0)
+            assert submitted and len(done) == len(submitted)
+            # No shard ran to completion after the search was cancelled
+            assert all(future.cancelled() or isinstance(future.exception(), SearchCancelled)
+                       for future in submitted)
+        finally:
+            timer.cancel()
+            compute_pool.shutdown_shard_executors()
+
+    def test_palashodhana_checks_the_token(self):
+        candidate = btr_core.search_candidate_times(step_minutes=2, **SEARCH_KWARGS)[0]
+        with pytest.raises(SearchCancelled):
+            btr_core.palashodhana_search(
+                candidate, SEARCH_KWARGS['dob'], SEARCH_KWARGS['latitude'], SEARCH_KWARGS['longitude'],
+                SEARCH_KWARGS['tz_offset'], None, None, max_palas=120, cancel_token=cancelled_token()
+            )
+
+    def test_fallback_chain_passes_the_token(self):
+        with pytest.raises(SearchCancelled):
+            btr_core.search_with_fallbacks('10:00', '11:00', cancel_token=cancelled_token(),
+                                           **{k: v for k, v in SEARCH_KWARGS.items()
+                                              if k not in ('start_time_str', 'end_time_str', 'strict_bphs')})
+
+    def test_uncancelled_token_changes_nothing(self):
+        token = CancellationToken()
+        assert btr_core.search_candidate_times(step_minutes=2, cancel_token=token, **SEARCH_KWARGS) == \
+            btr_core.search_candidate_times(step_minutes=2, **SEARCH_KWARGS)
@@ -0,0 +1,77 @@
+# Tests for candidate record module
+
+"""Tests for the slotted candidate records formatted at the end of a search."""
+
+import datetime
+import pickle
+
+from backend import btr_core
+from backend.candidate_record import CandidateRecord, epoch_seconds
+
+SCORES = {
+    'delta_pranapada_deg': 0.123,
+    'delta_madhya_pranapada_deg': None,
+    'passes_trine_rule': True,
+    'purification_anchor': 'gulika',
+    'degree_match': 93.85,
+    'gulika_alignment': 80.0,
+    'moon_alignment': 0.0,
+    'combined_verification': 80.0,
+    'passes_padekyata_sphuta': True,
+    'passes_padekyata_madhya': False
+}
+
+
+def make_record(dt, **kwargs):
+    return CandidateRecord(
+        epoch_seconds(dt), 123.456789, 123.333333, 200.987654, SCORES,
+        bphs_score=91.234567, heuristic_score=20.0, composite_score=69.87654,
+        special_lagnas={'bhava_lagna': 1.005, 'hora_lagna': 2.0, 'ghati_lagna': 3.0, 'varnada_lagna': 4.0},
+        nisheka={'nisheka_lagna_deg': 50.1234, 'gestation_months': 9.0012,
+                 'is_realistic': True, 'gestation_score': 100.0},
+        **kwargs
+    )
+
+
+class TestCandidateRecord:
+    """Keys and formatting."""
+
+    def test_key_matches_formatted_second(self):
+        base = datetime.datetime(1969, 12, 31, 23, 59, 59, 999999)
+        for offset in (0, 1, 500000, 10**6, 86400 * 10**6 + 7):
+            a = base + datetime.timedelta(microseconds=offset)
+            b = a.replace(microsecond=0)
+            assert epoch_seconds(a) == epoch_seconds(b)
+            assert datetime.datetime(1970, 1, 1) + datetime.timedelta(seconds=epoch_seconds(a)) == b
+
+    def test_to_dict_rounds_and_formats(self):
+        instant = datetime.datetime(2024, 1, 15, 10, 41, 7, 250000)
+        record = make_record(instant, shodhana_delta_palas=-3, instant=instant)
+        payload = record.to_dict()
+        assert payload['time_local'] == '2024-01-15T10:41:07'
+        assert payload['padekyata_instant_local'] == '2024-01-15T10:41:07.250000'
+        assert (payload['lagna_deg'], payload['pranapada_deg'], payload['bphs_score']) == (123.46, 123.33, 91.23)
+        assert payload['nisheka']['gestation_months'] == 9.0
+        assert payload['verification_scores']['degree_match'] == 93.85
+        assert payload['shodhana_delta_palas'] == -3
+        assert 'shadbala_summary' not in payload and 'life_events_scores' not in payload
+        assert record.sort_score('composite_score') == payload['composite_score']
+
+    def test_records_pickle_for_shards(self):
+        record = make_record(datetime.datetime(2024, 1, 15, 10, 0))
+        assert pickle.loads(pickle.dumps(record)).to_dict() == record.to_dict()
+
+
+class TestSearchOutput:
+    """The search still returns the public dict shape, one entry per second."""
+
+    def test_candidates_are_dicts_with_unique_times(self):
+        candidates = btr_core.search_candidate_times(
+            dob=datetime.date(2024, 1, 15), latitude=28.6139, longitude=77.2090, tz_offset=5.5,
+            start_time_str='00:00', end_time_str='23:59', step_minutes=2, strict_bphs=False
+        )
+        assert candidates and all(isinstance(c, dict) for c in candidates)
+        times = [c['time_local'] for c in candidates]
+        assert len(times) == len(set(times))
+        scores = [c['composite_score'] for c in candidates]
+        assert scores == sorted(scores, reverse=True)
@@ -0,0 +1,108 @@
+# Tests for chart context module
+
+"""Tests that the shared per-candidate ChartContext changes nothing but the work done."""
+
+import datetime
+
+import pytest
+
+from backend import btr_core, chart_context, shadbala, vargas
+from backend.astro_utils import compound_relationship
+from backend.chart_context import ChartContext
+
+BIRTH_DT = datetime.datetime(2024, 1, 15, 12, 0)
+LATITUDE, LONGITUDE, TZ_OFFSET = 28.6139, 77.2090, 5.5
+EVENTS = {
+    'marriage': {'date': '2015-05-10'},
+    'children': [{'date': '2018-01-01'}],
+    'career': [{'date': '2012-06-01'}]
+}
+
+
+@pytest.fixture
+def chart():
+    jd_ut = btr_core._datetime_to_jd_ut(BIRTH_DT, TZ_OFFSET)
+    lagna = btr_core.compute_sidereal_lagna(jd_ut, LATITUDE, LONGITUDE)
+    return jd_ut, lagna, btr_core.get_planet_positions(jd_ut)
+
+
+def stage9(jd_ut, lagna, planets, context=None):
+    strengths = btr_core.calculate_planetary_strengths(
+        jd_ut, lagna, planets, BIRTH_DT, LATITUDE, LONGITUDE, TZ_OFFSET, context=context
+    )
+    longevity = btr_core.calculate_longevity_span(
+        jd_ut, lagna, planets, shadbala_strengths=strengths, context=context
+    )
+    events = btr_core.verify_life_events(
+        jd_ut, lagna, planets, EVENTS, planets['moon'], shadbala_scores=strengths, context=context
+    )
+    return strengths, longevity, events
+
+
+class TestCompoundRelationship:
+    """Panchadha Maitri of a planet to its sign lord."""
+
+    @pytest.mark.parametrize('positions, planet, expected', [
+        ({'mars': 5.0, 'sun': 100.0}, 'mars', 'own'),
+        ({'sun': 5.0, 'mars': 65.0}, 'sun', 'adhimitra'),       # Friend, lord 3rd
+        ({'sun': 5.0, 'mars': 185.0}, 'sun', 'sama'),           # Friend, lord 7th
+        ({'saturn': 245.0, 'jupiter': 250.0}, 'saturn', 'satru'),  # Neutral, lord 1st
+        ({'saturn': 125.0, 'sun': 130.0}, 'saturn', 'adhisatru'),  # Enemy, lord 1st
+        ({'moon': 35.0, 'venus': 95.0}, 'moon', 'mitra'),         # Neutral, lord 3rd
+    ])
+    def test_relationship(self, positions, planet, expected):
+        assert compound_relationship(planet, positions) == expected
+
+
+class TestSharedContext:
+    """Sharing one context reproduces the standalone results."""
+
+    def test_stage9_outputs_unchanged(self, chart):
+        jd_ut, lagna, planets = chart
+        sunrise, sunset = btr_core.compute_sunrise_sunset(BIRTH_DT.date(), LATITUDE, LONGITUDE, TZ_OFFSET)
+        context = ChartContext(jd_ut, lagna, planets, BIRTH_DT, sunrise, sunset)
+        assert stage9(jd_ut, lagna, planets, context) == stage9(jd_ut, lagna, planets)
+
+    def test_vargas_and_ephemeris_quantities_built_once(self, chart, monkeypatch):
+        jd_ut, lagna, planets = chart
+        built = []
+        calls = {'sunrise': 0}
+        real_vargas = chart_context.calculate_vargas
+        real_sunrise = btr_core.compute_sunrise_sunset
+
+        def counting_vargas(lagna_deg, planets_deg, divisions):
+            built.extend(divisions)
+            return real_vargas(lagna_deg, planets_deg, divisions)
+
+        def counting_sunrise(*args):
+            calls['sunrise'] += 1
+            return real_sunrise(*args)
+
+        monkeypatch.setattr(chart_context, 'calculate_vargas', counting_vargas)
+        monkeypatch.setattr(btr_core, 'compute_sunrise_sunset', counting_sunrise)
+
+        context = ChartContext(jd_ut, lagna, planets, BIRTH_DT)
+        stage9(jd_ut, lagna, planets, context)
+        # One DayContext build: the birth date and the next day's sunrise
+        assert calls == {'sunrise': 2}
+        # Only Saptavarga Bala's and the verified events' divisions are built, each once
+        needed = set(vargas.SAPTAVARGA_DIVISIONS) | {3, 7, 9, 10}
+        assert len(built) == len(set(built)) and set(vargas.SAPTAVARGA_DIVISIONS) <= set(built) <= needed
+        built_once = sorted(built)
+
+        # Every later consumer reads the memoized values
+        shadbala.calculate_shadbala(jd_ut, lagna, planets, BIRTH_DT, context.sunrise, context.sunset, context=context)
+        stage9(jd_ut, lagna, planets, context)
+        assert calls == {'sunrise': 2}
+        assert sorted(built) == built_once
+
+        context.varga(16)
+        assert context.vargas_for((9, 16)) == real_vargas(lagna, planets, (9, 16))
+        assert sorted(built) == sorted(built_once + [16])
+
+    def test_ayana_bala_computed_once(self, chart):
+        jd_ut, lagna, planets = chart
+        context = ChartContext(jd_ut, lagna, planets)
+        first = shadbala.calculate_ayana_bala(jd_ut, context=context)
+        assert shadbala.calculate_ayana_bala(jd_ut, context=context) is first
+        assert first == shadbala.calculate_ayana_bala(jd_ut)
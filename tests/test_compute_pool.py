@@ -0,0 +1,170 @@
+# Tests for compute pool module
+
+"""Tests for the bounded compute tier that runs searches off the event loop."""
+
+import asyncio
+import concurrent.futures
+import datetime
+import queue
+import threading
+import time
+
+import pytest
+
+from backend import btr_core, day_context, ephemeris
+from backend.compute_pool import _EVENT_POLL_SECONDS, ComputePool, ComputePoolSaturated, _drain_events
+
+
+def _ayanamsa_and_sun(jd_ut: float) -> tuple[float, float]:
+    """Module-level (picklable) job used for the process-pool test."""
+    import swisseph as swe
+    return swe.get_ayanamsa_ut(jd_ut), btr_core.get_planet_positions(jd_ut)['sun']
+
+
+def _emit_events(count: int, on_event=None) -> int:
+    """Module-level (picklable) streaming job."""
+    for step in range(count):
+        on_event({'event': 'progress', 'step': step})
+    return count
+
+
+async def _collect(events):
+    return [event async for event in events]
+
+
+class TestComputePool:
+    """Tests for ComputePool in thread and process mode."""
+
+    def test_thread_mode_runs_off_the_event_loop(self):
+        pool = ComputePool(workers=0, max_pending=2)
+        try:
+            loop_thread = threading.get_ident()
+            worker_thread = asyncio.run(pool.run(threading.get_ident))
+            assert worker_thread != loop_thread
+            assert pool.pending == 0
+        finally:
+            pool.shutdown()
+
+    def test_saturation_raises_and_releases(self):
+        pool = ComputePool(workers=0, max_pending=1)
+        gate = threading.Event()
+        try:
+            future = pool.submit(gate.wait, 5.0)
+            with pytest.raises(ComputePoolSaturated):
+                pool.submit(lambda: None)
+            gate.set()
+            future.result(timeout=5.0)
+            # The slot is released once the running job finishes
+            assert pool.submit(lambda: 42).result(timeout=5.0) == 42
+        finally:
+            gate.set()
+            pool.shutdown()
+
+    def test_timeout_raises(self):
+        pool = ComputePool(workers=0, max_pending=1)
+        gate = threading.Event()
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                asyncio.run(pool.run(gate.wait, 5.0, timeout=0.05))
+        finally:
+            gate.set()
+            pool.shutdown()
+
+    def test_process_mode_workers_use_sidereal_configuration(self):
+        jd = 2451545.0
+        pool = ComputePool(workers=1, max_pending=2)
+        try:
+            ayanamsa, sun = pool.submit(_ayanamsa_and_sun, jd).result(timeout=60.0)
+        finally:
+            pool.shutdown()
+        expected_ayanamsa, expected_sun = _ayanamsa_and_sun(jd)
+        assert ayanamsa == pytest.approx(expected_ayanamsa, abs=1e-9)
+        assert sun == pytest.approx(expected_sun, abs=1e-9)
+
+    def test_thread_mode_workers_use_sidereal_configuration(self):
+        jd = 2451545.0
+        pool = ComputePool(workers=0, max_pending=2)
+        try:
+            ayanamsa, sun = pool.submit(_ayanamsa_and_sun, jd).result(timeout=60.0)
+        finally:
+            pool.shutdown()
+        expected_ayanamsa, expected_sun = _ayanamsa_and_sun(jd)
+        assert ayanamsa == pytest.approx(expected_ayanamsa, abs=1e-9)
+        assert sun == pytest.approx(expected_sun, abs=1e-9)
+
+    def test_thread_mode_search_matches_direct_call(self):
+        kwargs = dict(dob=datetime.date(1990, 6, 15), latitude=28.61, longitude=77.20, tz_offset=5.5,
+                      start_time_str='06:00', end_time_str='12:00', step_minutes=2, strict_bphs=False)
+        direct = btr_core.search_candidate_times(**kwargs)
+        # Sample every block again, on the worker thread
+        ephemeris.get_service().clear()
+        day_context.get_cache().clear()
+        pool = ComputePool(workers=0, max_pending=1)
+        try:
+            threaded = pool.submit(btr_core.search_candidate_times, **kwargs).result(timeout=120.0)
+        finally:
+            pool.shutdown()
+        assert direct and threaded == direct
+
+    def test_stream_yields_events_then_result(self):
+        pool = ComputePool(workers=0, max_pending=2)
+        try:
+            events = asyncio.run(_collect(pool.stream(_emit_events, 3)))
+        finally:
+            pool.shutdown()
+        assert events == [{'event': 'progress', 'step': i} for i in range(3)] + [{'event': 'done', 'result': 3}]
+        assert pool.pending == 0
+
+    def test_stream_reraises_job_errors_after_events(self):
+        def failing(on_event=None):
+            on_event({'event': 'progress', 'step': 0})
+            raise RuntimeError("Swiss Ephemeris failed")
+
+        pool = ComputePool(workers=0, max_pending=1)
+        seen = []
+
+        async def consume():
+            async for event in pool.stream(failing):
+                seen.append(event)
+
+        try:
+            with pytest.raises(RuntimeError):
+                asyncio.run(consume())
+        finally:
+            pool.shutdown()
+        assert seen == [{'event': 'progress', 'step': 0}]
+
+    def test_stream_saturation_raises_before_iteration(self):
+        pool = ComputePool(workers=0, max_pending=1)
+        gate = threading.Event()
+        try:
+            pool.submit(gate.wait, 5.0)
+            with pytest.raises(ComputePoolSaturated):
+                pool.stream(_emit_events, 1)
+        finally:
+            gate.set()
+            pool.shutdown()
+
+    def test_stream_timeout_leaves_no_reader_on_the_queue(self):
+        events = queue.SimpleQueue()
+        future = concurrent.futures.Future()
+
+        async def consume():
+            return [event async for event in _drain_events(events, future, 0.05)]
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(consume())
+        # An abandoned blocking read would swallow the next event
+        events.put({'event': 'late'})
+        time.sleep(3 * _EVENT_POLL_SECONDS)
+        assert events.get_nowait() == {'event': 'late'}
+        assert future.cancelled()
+
+    def test_process_mode_streams_through_manager_queue(self):
+        pool = ComputePool(workers=1, max_pending=2)
+        try:
+            events = asyncio.run(_collect(pool.stream(_emit_events, 2, timeout=60.0)))
+        finally:
+            pool.shutdown()
+        assert [event['event'] for event in events] == ['progress', 'progress', 'done']
+        assert events[-1]['result'] == 2
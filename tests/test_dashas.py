@@ -0,0 +1,64 @@
+# Tests for dashas module
+
+"""Tests for the Vimshottari dasha timeline."""
+
+import datetime
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+from backend import dashas
+from backend.dashas import DASHA_SEQUENCE, DashaTimeline
+
+JD_BIRTH = 2447892.25
+
+
+class TestDashaTimeline:
+    """Bisected lookups of mahadasha, antardasha and pratyantardasha."""
+
+    def test_periods_from_birth(self):
+        # Moon at 0° Aries: a full Ketu mahadasha (7 years) runs from birth
+        timeline = DashaTimeline(JD_BIRTH, 0.0)
+        start = timeline.at_elapsed(0.001)
+        assert (start['mahadasha'], start['antardasha'], start['pratyantardasha']) == ('Ketu', 'Ketu', 'Ketu')
+        # Ketu/Ketu lasts 7 * 7 / 120 years; its first pratyantardasha 7/120 of that
+        first_pd = 7.0 * 7.0 / 120.0 * 7.0 / 120.0
+        assert timeline.at_elapsed(first_pd + 1e-6)['pratyantardasha'] == 'Venus'
+        assert timeline.at_elapsed(7.0 * 7.0 / 120.0 + 1e-6)['antardasha'] == 'Venus'
+
+    def test_period_owns_its_end(self):
+        timeline = DashaTimeline(JD_BIRTH, 0.0)
+        assert timeline.at_elapsed(7.0)['mahadasha'] == 'Ketu'
+        after = timeline.at_elapsed(7.0 + 1e-9)
+        assert (after['mahadasha'], after['antardasha']) == ('Venus', 'Venus')
+
+    def test_balance_of_first_mahadasha(self):
+        # Halfway through Bharani (Venus): 10 of Venus' 20 years remain
+        timeline = DashaTimeline(JD_BIRTH, 360.0 / 27.0 * 1.5)
+        assert timeline.at_elapsed(9.99)['mahadasha'] == 'Venus'
+        assert timeline.at_elapsed(10.01)['mahadasha'] == 'Sun'
+
+    def test_sub_periods_fill_their_period(self):
+        for md, lord in enumerate(DASHA_SEQUENCE):
+            assert dashas._ANTARDASHA_ENDS[md][-1] == pytest.approx(dashas._DASHA_PERIODS[lord])
+            for position, ad_end in enumerate(dashas._ANTARDASHA_ENDS[md]):
+                ad_start = dashas._ANTARDASHA_ENDS[md][position - 1] if position else 0.0
+                assert dashas._PRATYANTARDASHA_ENDS[md][position][-1] == pytest.approx(ad_end - ad_start)
+
+    def test_vectorized_lookup_matches_dates(self):
+        timeline = DashaTimeline(JD_BIRTH, 217.4)
+        dates = [datetime.date(1990, 1, 15) + datetime.timedelta(days=int(d))
+                 for d in np.random.default_rng(5).integers(-400, 150 * 365, 200)]
+        jds = [swe.julday(d.year, d.month, d.day, 0.0) for d in dates]
+        periods = timeline.periods(jds)
+        assert periods.shape == (len(dates), 3)
+        assert timeline.mahadashas(jds) == periods[:, 0].tolist()
+        for row, date in zip(periods.tolist(), dates):
+            expected = timeline.at(date)
+            assert [DASHA_SEQUENCE[i] for i in row] == \
+                [expected['mahadasha'], expected['antardasha'], expected['pratyantardasha']]
+
+    def test_one_off_lookup_matches_timeline(self):
+        date = datetime.date(2015, 5, 10)
+        assert dashas.get_dasha_at_date(JD_BIRTH, date, 123.4) == DashaTimeline(JD_BIRTH, 123.4).at(date)
@@ -0,0 +1,111 @@
+# Tests for day context module
+
+"""Tests for the cross-request sunrise/sunset/Gulika day context cache."""
+
+import datetime
+
+import pytest
+
+from backend import btr_core, day_context, shadbala
+from backend.day_context import DayContext, DayContextCache
+
+DOB = datetime.date(2024, 1, 15)
+LATITUDE, LONGITUDE, TZ_OFFSET = 28.6139, 77.2090, 5.5
+
+
+@pytest.fixture
+def rise_set_calls(monkeypatch):
+    """Count `compute_sunrise_sunset` calls made through btr_core."""
+    calls = []
+    real = btr_core.compute_sunrise_sunset
+
+    def counting(date_local, *args):
+        calls.append(date_local)
+        return real(date_local, *args)
+
+    monkeypatch.setattr(btr_core, 'compute_sunrise_sunset', counting)
+    return calls
+
+
+class TestDayContext:
+    """The cached context reproduces the standalone calculations."""
+
+    def test_matches_sunrise_sunset_and_gulika(self):
+        day = btr_core.get_day_context(DOB, LATITUDE, LONGITUDE, TZ_OFFSET)
+        assert (day.sunrise, day.sunset) == btr_core.compute_sunrise_sunset(DOB, LATITUDE, LONGITUDE, TZ_OFFSET)
+        assert day.next_sunrise == btr_core.compute_sunrise_sunset(
+            DOB + datetime.timedelta(days=1), LATITUDE, LONGITUDE, TZ_OFFSET
+        )[0]
+        assert day.gulika == btr_core.calculate_gulika(DOB, LATITUDE, LONGITUDE, TZ_OFFSET)
+        assert day.weekday_lord == 'moon'  # Monday
+        assert len(day.hora_boundaries) == 25
+
+    def test_hora_and_dina_lords_match_shadbala(self):
+        day = btr_core.get_day_context(DOB, LATITUDE, LONGITUDE, TZ_OFFSET)
+        midnight = datetime.datetime.combine(DOB, datetime.time())
+        for minutes in range(0, 24 * 60, 17):
+            moment = midnight + datetime.timedelta(minutes=minutes)
+            hora = shadbala.calculate_hora_bala(moment, day.sunrise, day.sunset)
+            assert hora[day.hora_lord(moment)] == 60.0
+        assert shadbala.calculate_dina_bala(midnight)[day.weekday_lord] == 45.0
+
+    def test_rise_set_resolved_once_across_lookups(self, rise_set_calls):
+        first = btr_core.get_day_context(DOB, LATITUDE, LONGITUDE, TZ_OFFSET)
+        assert btr_core.get_day_context(DOB, LATITUDE, LONGITUDE, TZ_OFFSET) is first
+        assert rise_set_calls == [DOB, DOB + datetime.timedelta(days=1)]
+        btr_core.get_day_context(DOB, LATITUDE, LONGITUDE, 5.75)
+        assert len(rise_set_calls) == 4
+
+
+class TestDayContextCache:
+    """Bounded LRU behaviour."""
+
+    @staticmethod
+    def make(date):
+        sunrise = datetime.datetime.combine(date, datetime.time(6))
+        return DayContext(date, 0.0, 0.0, 0.0, sunrise, sunrise.replace(hour=18),
+                          sunrise + datetime.timedelta(days=1), {})
+
+    def test_evicts_least_recently_used(self):
+        cache = DayContextCache(max_entries=2)
+        days = [DOB + datetime.timedelta(days=i) for i in range(3)]
+        for date in days[:2]:
+            cache.get(date, lambda date=date: self.make(date))
+        cache.get(days[0], lambda: pytest.fail("should be cached"))
+        cache.get(days[2], lambda: self.make(days[2]))
+        rebuilt = []
+        cache.get(days[1], lambda: rebuilt.append(1) or self.make(days[1]))
+        assert rebuilt == [1]
+        assert cache.stats() == {'entries': 2, 'hits': 1, 'misses': 4}
+
+    def test_failures_are_not_cached(self):
+        cache = DayContextCache(max_entries=4)
+
+        def fail():
+            raise RuntimeError("Swiss Ephemeris failed to compute rise (error -1)")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                cache.get('polar', fail)
+        assert cache.stats()['entries'] == 0
+
+
+class TestSearchUsesDayContext:
+    """Searches and Stage 9 share the birth date's context."""
+
+    def test_search_resolves_rise_set_once(self, rise_set_calls):
+        kwargs = dict(dob=DOB, latitude=LATITUDE, longitude=LONGITUDE, tz_offset=TZ_OFFSET,
+                      start_time_str='00:00', end_time_str='23:59', step_minutes=2, strict_bphs=False,
+                      optional_events={'marriage': {'date': '2015-05-10'}})
+        candidates = btr_core.search_candidate_times(**kwargs)
+        assert candidates
+        # Gulika, every accepted candidate's Kaala Bala and palā śodhana share one build
+        assert rise_set_calls == [DOB, DOB + datetime.timedelta(days=1)]
+        assert day_context.get_cache().stats()['entries'] == 1
+
+        day = btr_core.get_day_context(DOB, LATITUDE, LONGITUDE, TZ_OFFSET)
+        uncached = btr_core.search_candidate_times(
+            sunrise_local=day.sunrise, sunset_local=day.sunset,
+            gulika_info=btr_core.calculate_gulika(DOB, LATITUDE, LONGITUDE, TZ_OFFSET), **kwargs
+        )
+        assert uncached == candidates
@@ -0,0 +1,129 @@
+# Tests for sampled ephemeris service
+
+"""Tests that interpolated ephemeris values stay within the documented bound."""
+
+import random
+import uuid
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+from backend import btr_core  # noqa: F401  (sets Lahiri sidereal mode)
+from backend import ephemeris
+from backend.astro_utils import PLANET_IDS
+
+ARCSECOND = 1.0 / 3600.0
+
+
+def _wrapped_error(a: float, b: float) -> float:
+    return abs((a - b + 180.0) % 360.0 - 180.0)
+
+
+@pytest.fixture
+def jds():
+    rng = random.Random(42)
+    # Spread over 1900-2100 plus a dense cluster inside a single day
+    spread = [rng.uniform(2415020.5, 2488069.5) for _ in range(150)]
+    dense = [2447962.5 + rng.random() for _ in range(50)]
+    return spread + dense
+
+
+class TestEphemerisService:
+    """Tests for backend.ephemeris.EphemerisService."""
+
+    def test_longitudes_within_one_arcsecond(self, jds):
+        service = ephemeris.EphemerisService()
+        for jd in jds:
+            positions = service.sidereal_positions(jd)
+            ayanamsa = swe.get_ayanamsa_ut(jd)
+            for name, pid in PLANET_IDS.items():
+                expected = (swe.calc_ut(jd, pid)[0][0] - ayanamsa) % 360.0
+                assert _wrapped_error(positions[name], expected) < ARCSECOND, (name, jd)
+            assert _wrapped_error(positions['ketu'], (positions['rahu'] + 180.0) % 360.0) < 1e-9
+
+    def test_moon_error_well_below_bound(self, jds):
+        service = ephemeris.EphemerisService()
+        worst = max(
+            _wrapped_error(
+                service.sidereal_positions(jd)['moon'],
+                (swe.calc_ut(jd, swe.MOON)[0][0] - swe.get_ayanamsa_ut(jd)) % 360.0
+            )
+            for jd in jds
+        )
+        assert worst < 0.05 * ARCSECOND
+
+    def test_speeds_and_declinations(self, jds):
+        service = ephemeris.EphemerisService()
+        flags = swe.FLG_EQUATORIAL | swe.FLG_SWIEPH
+        for jd in jds[:60]:
+            speeds = service.speeds(jd)
+            declinations = service.declinations(jd)
+            for name, pid in PLANET_IDS.items():
+                assert speeds[name] == pytest.approx(swe.calc_ut(jd, pid)[0][3], abs=1e-3)
+                assert declinations[name] == pytest.approx(swe.calc_ut(jd, pid, flags)[0][1], abs=ARCSECOND)
+
+    def test_array_matches_scalar(self, jds):
+        service = ephemeris.EphemerisService()
+        arrays = service.sidereal_positions_array(np.array(jds))
+        for i, jd in enumerate(jds):
+            scalar = service.sidereal_positions(jd)
+            assert {name: float(values[i]) for name, values in arrays.items()} == scalar
+
+    def test_block_cache_is_bounded(self):
+        service = ephemeris.EphemerisService(max_blocks=3)
+        service.prefetch(2451545.0, 2451550.0)
+        assert len(service._blocks) == 3
+        assert service.block_misses == 6
+        service.sidereal_positions(2451550.25)
+        assert service.block_hits == 1
+        assert service.stats()['evictions'] == 3
+
+    def test_invalid_step_rejected(self):
+        with pytest.raises(ValueError):
+            ephemeris.EphemerisService(step_days=0)
+
+
+@pytest.fixture
+def shared_name():
+    name = f"btr_test_{uuid.uuid4().hex[:12]}"
+    yield name
+    try:
+        ephemeris.SharedBlockTable(name, 16, len(ephemeris.BODIES), 9).unlink()
+    except (OSError, ValueError):
+        pass
+
+
+class TestSharedBlockTable:
+    """Blocks published to shared memory are reused by other services."""
+
+    def test_second_service_reads_published_blocks(self, shared_name):
+        first = ephemeris.EphemerisService(shared_name=shared_name, shared_slots=16)
+        first.prefetch(2451545.0, 2451547.0)
+        second = ephemeris.EphemerisService(shared_name=shared_name, shared_slots=16)
+        for jd in (2451545.1, 2451546.7, 2451547.3):
+            assert second.sidereal_positions(jd) == first.sidereal_positions(jd)
+            assert second.speeds(jd) == first.speeds(jd)
+        assert second.stats()['misses'] == 0
+        assert second.stats()['shared_hits'] == 3
+
+    def test_corrupt_slot_is_resampled(self, shared_name):
+        first = ephemeris.EphemerisService(shared_name=shared_name, shared_slots=16)
+        first.prefetch(2451545.0, 2451545.0)
+        first.shared._data[2451545 % 16][0] += 1.0  # Payload no longer matches its checksum
+
+        second = ephemeris.EphemerisService(shared_name=shared_name, shared_slots=16)
+        reference = ephemeris.EphemerisService()
+        assert second.sidereal_positions(2451545.5) == reference.sidereal_positions(2451545.5)
+        assert second.stats()['misses'] == 1
+        # The resampled block was republished intact
+        third = ephemeris.EphemerisService(shared_name=shared_name, shared_slots=16)
+        third.sidereal_positions(2451545.5)
+        assert third.stats()['shared_hits'] == 1
+
+    def test_layout_mismatch_falls_back_to_local_cache(self, shared_name):
+        ephemeris.EphemerisService(shared_name=shared_name, shared_slots=16)
+        service = ephemeris.EphemerisService(shared_name=shared_name, shared_slots=8)
+        assert service.shared is None
+        service.sidereal_positions(2451545.5)
+        assert service.stats()['misses'] == 1
@@ -0,0 +1,162 @@
+# Tests for evaluation store module
+
+"""Tests for per-request evaluation reuse across the search fallback passes."""
+
+import datetime
+
+import numpy as np
+
+from backend import btr_core
+from backend.evaluation_store import EvaluationStore, timestamp_key
+
+SEARCH_KWARGS = {
+    'dob': datetime.date(2024, 1, 15),
+    'latitude': 28.6139,
+    'longitude': 77.2090,
+    'tz_offset': 5.5,
+    'step_minutes': 2,
+    'enable_shodhana': True,
+    'collect_rejections': True
+}
+# search_with_fallbacks sets collect_rejections itself
+GROUP_KWARGS = {k: v for k, v in SEARCH_KWARGS.items() if k != 'collect_rejections'}
+
+
+class TestEvaluationStore:
+    """Tests for the timestamp-keyed store."""
+
+    def test_batch_computes_only_missing_rows(self):
+        store = EvaluationStore()
+        requested = []
+
+        def compute(positions):
+            requested.append(list(positions))
+            return {'lagna_deg': np.array([float(p) for p in positions]),
+                    'planets': {'sun': np.array([10.0 * p for p in positions])}}
+
+        store.batch([1, 2], compute)
+        batch = store.batch([0, 1, 2, 3], compute)
+        assert requested == [[0, 1], [0, 3]]
+        assert batch['lagna_deg'].tolist() == [0.0, 0.0, 1.0, 3.0]
+        assert batch['planets']['sun'].tolist() == [0.0, 0.0, 10.0, 30.0]
+        assert (store.computed, store.reused) == (4, 2)
+
+    def test_stage9_many_computes_only_missing(self):
+        store = EvaluationStore()
+        requested = []
+
+        def compute(positions):
+            requested.append(list(positions))
+            return [({'sun': position}, {'final_longevity': position}) for position in positions]
+
+        store.stage9_many([5, 6], compute)
+        store.stage9_many([4, 5, 7], compute)
+        assert requested == [[0, 1], [0, 2]]
+        assert store.stage9(7, lambda: None) == ({'sun': 2}, {'final_longevity': 2})
+
+    def test_bind_clears_entries_from_another_context(self):
+        store = EvaluationStore()
+        store.bind(('delhi',))
+        store.point(timestamp_key(datetime.datetime(2024, 1, 15, 12)), lambda: {'lagna_deg': 1.0})
+        store.bind(('delhi',))
+        assert len(store) == 1
+        store.bind(('mumbai',))
+        assert len(store) == 0
+
+
+class TestSearchReuse:
+    """Fallback passes over a shared store match fresh searches."""
+
+    def test_widened_and_relaxed_passes_reuse_evaluations(self):
+        store = EvaluationStore()
+        btr_core.search_candidate_times(
+            start_time_str='10:00', end_time_str='12:00', strict_bphs=True,
+            evaluation_store=store, **SEARCH_KWARGS
+        )
+        narrow_computed = store.computed
+
+        widened = btr_core.search_candidate_times(
+            start_time_str='00:00', end_time_str='23:59', strict_bphs=True,
+            evaluation_store=store, **SEARCH_KWARGS
+        )
+        # The 61 grid points of 10:00-12:00 are not evaluated again
+        assert store.reused >= 61
+        assert widened == btr_core.search_candidate_times(
+            start_time_str='00:00', end_time_str='23:59', strict_bphs=True, **SEARCH_KWARGS
+        )
+
+        computed_before_relaxed = store.computed
+        relaxed = btr_core.search_candidate_times(
+            start_time_str='00:00', end_time_str='23:59', strict_bphs=False,
+            evaluation_store=store, **SEARCH_KWARGS
+        )
+        # Same window: every grid timestamp and padekyatā instant is already stored
+        assert store.computed == computed_before_relaxed
+        assert narrow_computed > 0
+        assert relaxed == btr_core.search_candidate_times(
+            start_time_str='00:00', end_time_str='23:59', strict_bphs=False, **SEARCH_KWARGS
+        )
+
+    def test_fallback_chain_shares_one_store(self, monkeypatch):
+        calls = []
+
+        def fake_search(**kwargs):
+            calls.append(kwargs)
+            return [], [{'time_local': kwargs['start_time_str']}]
+
+        monkeypatch.setattr(btr_core, 'search_candidate_times', fake_search)
+        result = btr_core.search_with_fallbacks('10:00', '12:00', dob=datetime.date(2024, 1, 15))
+
+        assert [(c['start_time_str'], c['end_time_str'], c['strict_bphs']) for c in calls] == [
+            ('10:00', '12:00', True), ('00:00', '23:59', True), ('00:00', '23:59', False)
+        ]
+        assert len({id(c['evaluation_store']) for c in calls}) == 1
+        assert [a.get('note') for a in result['attempts']] == [
+            None, 'expanded_window_full_day', 'relaxed_padekyata_tolerance'
+        ]
+        assert result['window'] == {'start': '00:00', 'end': '23:59'}
+        assert result['strict_bphs_used'] is True
+
+    def test_profile_searches_match_separate_searches(self):
+        store = EvaluationStore()
+        by_profile = btr_core.search_tolerance_profiles(
+            ('strict', 'default', 'relaxed'),
+            start_time_str='09:00', end_time_str='13:00',
+            evaluation_store=store, **SEARCH_KWARGS
+        )
+        # Grid points and śodhana palā steps are evaluated once, by the first profile
+        assert store.computed == len(store) and store.reused >= 2 * 121
+        for name, profile in btr_core.TOLERANCE_PROFILES.items():
+            assert by_profile[name] == btr_core.search_candidate_times(
+                start_time_str='09:00', end_time_str='13:00', **profile, **SEARCH_KWARGS
+            )
+
+    def test_search_group_matches_separate_searches(self):
+        searches = [
+            dict(start_time_str='09:00', end_time_str='11:00', **GROUP_KWARGS),
+            dict(start_time_str='10:00', end_time_str='12:00',
+                 optional_traits={'height': 'TALL', 'build': 'MEDIUM', 'complexion': 'FAIR'}, **GROUP_KWARGS)
+        ]
+        outcomes = btr_core.search_group(searches)
+        assert [outcome['result'] for outcome in outcomes] == [
+            btr_core.search_with_fallbacks(**search) for search in searches
+        ]
+
+    def test_search_group_shares_store_and_isolates_failures(self, monkeypatch):
+        stores = []
+
+        def fake_search(**kwargs):
+            stores.append(kwargs['evaluation_store'])
+            if kwargs['start_time_str'] == '13:00':
+                raise RuntimeError("Swiss Ephemeris failure")
+            return [{'time_local': kwargs['start_time_str']}], []
+
+        monkeypatch.setattr(btr_core, 'search_candidate_times', fake_search)
+        outcomes = btr_core.search_group([
+            dict(start_time_str='10:00', end_time_str='12:00', **GROUP_KWARGS),
+            dict(start_time_str='13:00', end_time_str='14:00', **GROUP_KWARGS),
+            dict(start_time_str='15:00', end_time_str='16:00', **GROUP_KWARGS)
+        ])
+        assert len({id(store) for store in stores}) == 1
+        assert outcomes[1] == {'error': "Swiss Ephemeris failure"}
+        assert [outcomes[i]['result']['candidates'][0]['time_local'] for i in (0, 2)] == ['10:00', '15:00']
@@ -0,0 +1,167 @@
+# Tests for geocode cache module
+
+"""Tests for geocode memoization, negative caching and single-flight lookups."""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from backend import main as backend_main
+from backend.geocode_cache import GeocodeCache, normalize_place
+from backend.result_cache import ResultCache
+
+DELHI = {'lat': 28.61, 'lon': 77.21, 'formatted': 'Delhi, India', 'tz_offset_hours': 5.5,
+         'timezone_name': 'Asia/Kolkata'}
+
+
+def _cache(tmp_path=None) -> GeocodeCache:
+    db_path = str(tmp_path / 'geocode.sqlite') if tmp_path else None
+    return GeocodeCache(ResultCache(max_bytes=1 << 20, ttl_seconds=3600, db_path=db_path),
+                        negative_ttl_seconds=60)
+
+
+class TestNormalizePlace:
+    """Tests for place key normalization."""
+
+    def test_case_spacing_and_commas_fold(self):
+        assert normalize_place("  New   Delhi ,India ") == "new delhi, india"
+        assert normalize_place("NEW DELHI, INDIA,") == "new delhi, india"
+        assert normalize_place("Ｄelhi") == "delhi"  # NFKC full-width folding
+
+
+class TestGeocodeCache:
+    """Tests for GeocodeCache.resolve."""
+
+    def test_hit_skips_fetch(self):
+        cache = _cache()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return dict(DELHI)
+
+        async def scenario():
+            first = await cache.resolve("Delhi, India", fetch)
+            second = await cache.resolve("delhi ,india", fetch)
+            return first, second
+
+        first, second = asyncio.run(scenario())
+        assert first == second == DELHI
+        assert len(calls) == 1
+
+    def test_not_found_is_cached_but_errors_are_not(self):
+        cache = _cache()
+        calls = []
+
+        async def missing():
+            calls.append('missing')
+            return None
+
+        async def failing():
+            calls.append('failing')
+            raise HTTPException(status_code=503, detail="down")
+
+        async def scenario():
+            assert await cache.resolve("Atlantis", missing) is None
+            assert await cache.resolve("atlantis", missing) is None
+            for _ in range(2):
+                with pytest.raises(HTTPException):
+                    await cache.resolve("Delhi", failing)
+
+        asyncio.run(scenario())
+        assert calls == ['missing', 'failing', 'failing']
+
+    def test_concurrent_lookups_share_one_fetch(self):
+        cache = _cache()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return dict(DELHI)
+
+        async def scenario():
+            return await asyncio.gather(*(cache.resolve("Delhi", fetch) for _ in range(5)))
+
+        results = asyncio.run(scenario())
+        assert all(r == DELHI for r in results)
+        assert len(calls) == 1
+        assert cache.coalesced == 4
+
+    def test_concurrent_waiters_see_leader_error(self):
+        cache = _cache()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            raise HTTPException(status_code=504, detail="timeout")
+
+        async def scenario():
+            return await asyncio.gather(*(cache.resolve("Delhi", fetch) for _ in range(3)),
+                                        return_exceptions=True)
+
+        results = asyncio.run(scenario())
+        assert all(isinstance(r, HTTPException) and r.status_code == 504 for r in results)
+
+    def test_waiter_takes_over_when_leader_is_cancelled(self):
+        cache = _cache()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return dict(DELHI)
+
+        async def scenario():
+            leader = asyncio.create_task(cache.resolve("Delhi", fetch))
+            await asyncio.sleep(0.01)
+            waiter = asyncio.create_task(cache.resolve("delhi", fetch))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await waiter
+
+        assert asyncio.run(scenario()) == DELHI
+        assert len(calls) == 2
+        assert cache.coalesced == 1
+
+    def test_sqlite_tier_survives_restart(self, tmp_path):
+        async def fetch():
+            return dict(DELHI)
+
+        async def never():
+            raise AssertionError("should be served from disk")
+
+        asyncio.run(_cache(tmp_path).resolve("Delhi", fetch))
+        assert asyncio.run(_cache(tmp_path).resolve("DELHI", never)) == DELHI
+
+
+class TestOpenCageGeocode:
+    """Tests for main.opencage_geocode using the shared client and cache."""
+
+    def test_repeat_lookup_makes_one_request(self, monkeypatch):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={'results': [{
+                'geometry': {'lat': 28.61, 'lng': 77.21},
+                'formatted': 'Delhi, India',
+                'annotations': {'timezone': {'offset_sec': 19800, 'name': 'Asia/Kolkata'}}
+            }]})
+
+        monkeypatch.setattr(backend_main.config, "OPENCAGE_API_KEY", "test-key")
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(backend_main, "_get_http_client", lambda: client)
+
+        async def scenario():
+            first = await backend_main.opencage_geocode("Delhi, India")
+            second = await backend_main.opencage_geocode("delhi, india")
+            await client.aclose()
+            return first, second
+
+        first, second = asyncio.run(scenario())
+        assert first == second == DELHI
+        assert len(requests) == 1
@@ -0,0 +1,44 @@
+# Tests for jobs module
+
+"""Tests for the background job registry."""
+
+from backend import jobs
+from backend.cancellation import CancellationToken
+
+
+class TestJobManager:
+    """Job state, cancellation and retention."""
+
+    def test_events_update_progress(self):
+        job = jobs.JobManager().create(CancellationToken())
+        assert job.status == jobs.QUEUED
+        job.record_event({"event": "pass", "start": "10:00", "end": "11:00", "strict_bphs": True})
+        job.record_event({"event": "progress", "step": 3, "total_steps": 9, "candidates": 0, "rejections": 3})
+        job.record_event({"event": "candidate", "candidate": {}})
+        snapshot = job.snapshot()
+        assert snapshot["status"] == jobs.RUNNING
+        assert snapshot["progress"]["step"] == 3 and snapshot["search_pass"]["start"] == "10:00"
+        assert snapshot["candidates_found"] == 1
+
+    def test_cancel_sets_token_and_leaves_finished_jobs(self):
+        manager = jobs.JobManager()
+        running, done = manager.create(CancellationToken()), manager.create(CancellationToken())
+        done.finish(jobs.SUCCEEDED, result={})
+        assert manager.cancel(running.id).status == jobs.CANCELLING and running.token.cancelled
+        assert manager.cancel(done.id).status == jobs.SUCCEEDED and not done.token.cancelled
+        assert manager.cancel("missing") is None
+
+    def test_finished_jobs_are_pruned(self):
+        manager = jobs.JobManager(retention_seconds=3600, max_retained=2)
+        created = [manager.create(CancellationToken()) for _ in range(4)]
+        for job in created[:3]:
+            job.finish(jobs.FAILED, error={})
+        manager.create(CancellationToken())
+        assert manager.get(created[0].id) is None
+        assert all(manager.get(job.id) is not None for job in created[1:])
+
+        expiring = jobs.JobManager(retention_seconds=0, max_retained=10)
+        job = expiring.create(CancellationToken())
+        job.finish(jobs.CANCELLED)
+        job.finished_monotonic -= 1
+        assert expiring.get(job.id) is None
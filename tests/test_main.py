@@ -3,11 +3,13 @@
 """Tests for the FastAPI main module."""
 
 import datetime
+import json
+import time
 
 import pytest
 from fastapi.testclient import TestClient
 
-from backend import btr_core
+from backend import btr_core, compute_pool, day_context, ephemeris, result_cache
 from backend import main as backend_main
 from backend.main import app
 
@@ -267,6 +269,101 @@ class TestAPIStructure:
         summary = detail.get("rejection_summary") or {}
         assert summary["reason_counts"]["Fails BPHS 4.6 padekyata"] == 1
         assert detail["tz_offset_hours_used"] == 5.5
+
+    def test_btr_repeat_request_served_from_cache(self, client, monkeypatch):
+        """Identical requests should run the candidate search only once."""
+        async def fake_geocode(place: str, request_id=None):
+            return {"lat": 28.61, "lon": 77.20, "formatted": "Delhi", "tz_offset_hours": 5.5}
+
+        monkeypatch.setattr(backend_main, "opencage_geocode", fake_geocode)
+        monkeypatch.setattr(
+            btr_core,
+            "compute_sunrise_sunset",
+            lambda *args, **kwargs: (
+                datetime.datetime(2024, 1, 15, 7, 0, 0),
+                datetime.datetime(2024, 1, 15, 17, 30, 0)
+            )
+        )
+        monkeypatch.setattr(
+            btr_core,
+            "calculate_gulika",
+            lambda *args, **kwargs: {"day_gulika_deg": 100.0, "night_gulika_deg": 280.0}
+        )
+        calls = []
+
+        def fake_search(**kwargs):
+            calls.append(kwargs)
+            return [{
+                "time_local": "2024-01-15T12:00:00",
+                "lagna_deg": 10.0,
+                "pranapada_deg": 10.0,
+                "delta_pp_deg": 0.0,
+                "passes_trine_rule": True,
+                "purification_anchor": "pranapada",
+                "bphs_score": 100.0,
+                "composite_score": 90.0,
+                "verification_scores": {"degree_match": 100.0}
+            }], []
+
+        monkeypatch.setattr(btr_core, "search_candidate_times", lambda **kwargs: fake_search(**kwargs))
+
+        request_data = {
+            "dob": "15-01-2024",
+            "pob_text": "Delhi",
+            "tz_offset_hours": 5.5,
+            "approx_tob": {"mode": "approx", "center": "12:00", "window_hours": 2.0}
+        }
+        first = client.post("/api/btr", json=request_data)
+        second = client.post("/api/btr", json=request_data)
+        assert first.status_code == second.status_code == 200
+        assert len(calls) == 1
+        assert first.json()["candidates"] == second.json()["candidates"]
+
+    def test_search_cache_key_tracks_result_shaping_config(self, monkeypatch):
+        """Cached results must not outlive a change to Stage-9 depth or ephemeris sampling."""
+        search_kwargs = {"date_str": "2024-01-15", "latitude": 28.61, "longitude": 77.20}
+        key = backend_main._search_cache_key(search_kwargs)
+        monkeypatch.setattr(backend_main.config, "STAGE9_TOP_K", backend_main.config.STAGE9_TOP_K + 1)
+        top_k_key = backend_main._search_cache_key(search_kwargs)
+        monkeypatch.setattr(backend_main.config, "EPHEMERIS_SAMPLE_STEP_DAYS", 0.5)
+        step_key = backend_main._search_cache_key(search_kwargs)
+        assert len({key, top_k_key, step_key}) == 3
+
+    def test_btr_returns_503_when_compute_pool_saturated(self, client, monkeypatch):
+        """A saturated compute pool should shed load with 503 + Retry-After."""
+        async def fake_geocode(place: str, request_id=None):
+            return {"lat": 28.61, "lon": 77.20, "formatted": "Delhi", "tz_offset_hours": 5.5}
+
+        monkeypatch.setattr(backend_main, "opencage_geocode", fake_geocode)
+        monkeypatch.setattr(
+            btr_core,
+            "compute_sunrise_sunset",
+            lambda *args, **kwargs: (
+                datetime.datetime(2024, 1, 15, 7, 0, 0),
+                datetime.datetime(2024, 1, 15, 17, 30, 0)
+            )
+        )
+        monkeypatch.setattr(
+            btr_core,
+            "calculate_gulika",
+            lambda *args, **kwargs: {"day_gulika_deg": 100.0, "night_gulika_deg": 280.0}
+        )
+
+        class SaturatedPool:
+            async def run(self, fn, *args, timeout=None, **kwargs):
+                raise backend_main.compute_pool.ComputePoolSaturated("full")
+
+        monkeypatch.setattr(backend_main.compute_pool, "get_pool", lambda: SaturatedPool())
+
+        request_data = {
+            "dob": "15-01-2024",
+            "pob_text": "Delhi",
+            "tz_offset_hours": 5.5,
+            "approx_tob": {"mode": "unknown", "center": None, "window_hours": None}
+        }
+        response = client.post("/api/btr", json=request_data)
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == str(backend_main.config.COMPUTE_RETRY_AFTER_SECONDS)
     
     def test_btr_with_time_range_override(self, client):
         """Test BTR endpoint with time range override."""
@@ -401,3 +498,311 @@ class TestAPIStructure:
         # Assert 422 Unprocessable Entity (semantic error)
         assert response.status_code == 422
         assert "Astronomical calculation failed" in response.json()["detail"]
+
+
+class TestBTRStreamEndpoint:
+    """Tests for the NDJSON streaming variant of /api/btr."""
+
+    REQUEST = {
+        "dob": "15-01-2024",
+        "pob_text": "Delhi",
+        "tz_offset_hours": 5.5,
+        "approx_tob": {"mode": "approx", "center": "12:00", "window_hours": 2.0}
+    }
+    CANDIDATE = {
+        "time_local": "2024-01-15T12:00:00",
+        "lagna_deg": 10.0,
+        "pranapada_deg": 10.0,
+        "delta_pp_deg": 0.0,
+        "passes_trine_rule": True,
+        "bphs_score": 100.0,
+        "composite_score": 90.0,
+        "verification_scores": {"degree_match": 100.0}
+    }
+
+    @pytest.fixture
+    def patched(self, monkeypatch):
+        """Fake geocoding and day bounds; returns the list of search calls."""
+        async def fake_geocode(place: str, request_id=None):
+            return {"lat": 28.61, "lon": 77.20, "formatted": "Delhi", "tz_offset_hours": 5.5}
+
+        monkeypatch.setattr(backend_main, "opencage_geocode", fake_geocode)
+        monkeypatch.setattr(
+            btr_core,
+            "compute_sunrise_sunset",
+            lambda *args, **kwargs: (
+                datetime.datetime(2024, 1, 15, 7, 0, 0),
+                datetime.datetime(2024, 1, 15, 17, 30, 0)
+            )
+        )
+        return []
+
+    @staticmethod
+    def events(response):
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        return [json.loads(line) for line in response.text.splitlines()]
+
+    def test_stream_emits_progress_candidates_then_result(self, client, monkeypatch, patched):
+        def fake_search(on_event=None, **kwargs):
+            patched.append(kwargs)
+            on_event({"event": "progress", "step": 1, "total_steps": 2, "candidates": 0, "rejections": 1})
+            on_event({"event": "candidate", "candidate": self.CANDIDATE})
+            return [self.CANDIDATE], []
+
+        monkeypatch.setattr(btr_core, "search_candidate_times", fake_search)
+        events = self.events(client.post("/api/btr/stream", json=self.REQUEST))
+        assert [e["event"] for e in events] == ["pass", "progress", "candidate", "result"]
+        assert events[2]["candidate"]["time_local"] == "2024-01-15T12:00:00"
+        assert events[-1]["response"]["best_candidate"]["time_local"] == "2024-01-15T12:00:00"
+
+        # The finished search is cached: a repeat replays its candidates without searching
+        replay = self.events(client.post("/api/btr/stream", json=self.REQUEST))
+        assert [e["event"] for e in replay] == ["candidate", "result"]
+        assert len(patched) == 1
+        assert replay[-1]["response"]["candidates"] == events[-1]["response"]["candidates"]
+
+    def test_stream_reports_no_candidates_as_error_event(self, client, monkeypatch, patched):
+        monkeypatch.setattr(btr_core, "search_candidate_times", lambda **kwargs: ([], []))
+        events = self.events(client.post("/api/btr/stream", json=self.REQUEST))
+        assert [e["event"] for e in events].count("pass") == 3
+        assert events[-1]["event"] == "error"
+        assert events[-1]["status_code"] == 404
+        assert events[-1]["detail"]["code"] == "NO_CANDIDATES"
+
+    def test_stream_input_errors_are_plain_http_errors(self, client):
+        response = client.post("/api/btr/stream", json=dict(self.REQUEST, dob="2024/01/15"))
+        assert response.status_code == 400
+
+
+class TestBTRJobsEndpoint:
+    """Tests for background rectification jobs."""
+
+    REQUEST = TestBTRStreamEndpoint.REQUEST
+    CANDIDATE = TestBTRStreamEndpoint.CANDIDATE
+
+    @pytest.fixture
+    def jobs_client(self, monkeypatch):
+        """Client kept open across requests, so job tasks keep running between polls."""
+        async def fake_geocode(place: str, request_id=None):
+            return {"lat": 28.61, "lon": 77.20, "formatted": "Delhi", "tz_offset_hours": 5.5}
+
+        monkeypatch.setattr(backend_main, "opencage_geocode", fake_geocode)
+        monkeypatch.setattr(
+            btr_core,
+            "compute_sunrise_sunset",
+            lambda *args, **kwargs: (
+                datetime.datetime(2024, 1, 15, 7, 0, 0),
+                datetime.datetime(2024, 1, 15, 17, 30, 0)
+            )
+        )
+        with TestClient(app) as client:
+            yield client
+
+    @staticmethod
+    def poll(client, job_id, until):
+        for _ in range(200):
+            snapshot = client.get(f"/api/btr/jobs/{job_id}").json()
+            if snapshot["status"] in until:
+                return snapshot
+            time.sleep(0.05)
+        raise AssertionError(f"job stuck in {snapshot['status']}")
+
+    def test_job_runs_to_success(self, jobs_client, monkeypatch):
+        def fake_search(on_event=None, **kwargs):
+            on_event({"event": "progress", "step": 1, "total_steps": 2, "candidates": 1, "rejections": 0})
+            on_event({"event": "candidate", "candidate": self.CANDIDATE})
+            return [self.CANDIDATE], []
+
+        monkeypatch.setattr(btr_core, "search_candidate_times", fake_search)
+        response = jobs_client.post("/api/btr/jobs", json=self.REQUEST)
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        assert response.headers["location"] == f"/api/btr/jobs/{job_id}"
+
+        snapshot = self.poll(jobs_client, job_id, {"succeeded", "failed"})
+        assert snapshot["status"] == "succeeded"
+        assert snapshot["candidates_found"] == 1
+        assert snapshot["progress"]["total_steps"] == 2
+        assert snapshot["result"]["best_candidate"]["time_local"] == "2024-01-15T12:00:00"
+
+        # The finished search is cached: resubmitting completes at once
+        again = jobs_client.post("/api/btr/jobs", json=self.REQUEST).json()
+        assert again["status"] == "succeeded"
+
+    def test_cancel_stops_the_search(self, jobs_client, monkeypatch):
+        seen = {}
+
+        def endless_search(cancel_token=None, on_event=None, **kwargs):
+            seen["token"] = cancel_token
+            while True:
+                on_event({"event": "progress", "step": 0, "total_steps": 1, "candidates": 0, "rejections": 0})
+                cancel_token.check()
+                time.sleep(0.01)
+
+        monkeypatch.setattr(btr_core, "search_candidate_times", endless_search)
+        job_id = jobs_client.post("/api/btr/jobs", json=self.REQUEST).json()["job_id"]
+        self.poll(jobs_client, job_id, {"running"})
+        assert jobs_client.delete(f"/api/btr/jobs/{job_id}").json()["status"] in ("cancelling", "cancelled")
+        snapshot = self.poll(jobs_client, job_id, {"cancelled", "failed", "succeeded"})
+        assert snapshot["status"] == "cancelled"
+        assert seen["token"].cancelled
+
+    def test_no_candidates_job_fails_with_404_detail(self, jobs_client, monkeypatch):
+        monkeypatch.setattr(btr_core, "search_candidate_times", lambda **kwargs: ([], []))
+        job_id = jobs_client.post("/api/btr/jobs", json=self.REQUEST).json()["job_id"]
+        snapshot = self.poll(jobs_client, job_id, {"succeeded", "failed"})
+        assert snapshot["status"] == "failed"
+        assert snapshot["error"]["status_code"] == 404
+
+    def test_unknown_job_is_404(self, jobs_client):
+        assert jobs_client.get("/api/btr/jobs/nope").status_code == 404
+        assert jobs_client.delete("/api/btr/jobs/nope").status_code == 404
+
+
+class TestBTRBatchEndpoint:
+    """Tests for batch rectification."""
+
+    CANDIDATE = TestBTRStreamEndpoint.CANDIDATE
+
+    @pytest.fixture
+    def searches(self, client, monkeypatch):
+        """Fake geocoding per place and a search recording its calls."""
+        places = {
+            "Delhi": {"lat": 28.61, "lon": 77.20, "formatted": "Delhi", "tz_offset_hours": 5.5},
+            "Pune": {"lat": 18.52, "lon": 73.86, "formatted": "Pune", "tz_offset_hours": 5.5}
+        }
+
+        async def fake_geocode(place: str, request_id=None):
+            return places[place]
+
+        calls = []
+
+        def fake_search(**kwargs):
+            calls.append(kwargs)
+            return [dict(self.CANDIDATE, time_local=f"{kwargs['dob'].isoformat()}T{kwargs['start_time_str']}:00")], []
+
+        monkeypatch.setattr(backend_main, "opencage_geocode", fake_geocode)
+        monkeypatch.setattr(
+            btr_core,
+            "compute_sunrise_sunset",
+            lambda *args, **kwargs: (
+                datetime.datetime(2024, 1, 15, 7, 0, 0),
+                datetime.datetime(2024, 1, 15, 17, 30, 0)
+            )
+        )
+        monkeypatch.setattr(btr_core, "search_candidate_times", fake_search)
+        return calls
+
+    @staticmethod
+    def item(place="Delhi", dob="15-01-2024", center="12:00"):
+        return {
+            "dob": dob,
+            "pob_text": place,
+            "tz_offset_hours": 5.5,
+            "approx_tob": {"mode": "approx", "center": center, "window_hours": 1.0}
+        }
+
+    def test_groups_share_a_store_and_items_fail_alone(self, client, searches):
+        batch = [
+            self.item(center="10:00"),
+            self.item(center="14:00"),
+            self.item(center="10:00"),
+            self.item(place="Pune"),
+            self.item(dob="2024/01/15")
+        ]
+        response = client.post("/api/btr/batch", json={"items": batch})
+        assert response.status_code == 200
+        payload = response.json()
+        assert (payload["groups"], payload["searches"], payload["cache_hits"]) == (2, 3, 0)
+        assert [item["status_code"] for item in payload["items"]] == [200, 200, 200, 200, 400]
+        assert [item["index"] for item in payload["items"]] == list(range(5))
+        assert payload["items"][0]["response"] == payload["items"][2]["response"]
+        assert payload["items"][1]["response"]["best_candidate"]["time_local"] == "2024-01-15T13:00:00"
+
+        # One store per birth context
+        stores = {(c["latitude"], c["start_time_str"]): id(c["evaluation_store"]) for c in searches}
+        assert stores[(28.61, "09:00")] == stores[(28.61, "13:00")] != stores[(18.52, "11:00")]
+
+        # Finished searches are cached for later batches and single requests
+        again = client.post("/api/btr/batch", json={"items": batch[:2]}).json()
+        assert (again["groups"], again["cache_hits"]) == (0, 2)
+        assert len(searches) == 3
+
+    def test_group_failure_is_reported_per_item(self, client, searches, monkeypatch):
+        class SaturatedPool:
+            async def run(self, fn, *args, timeout=None, **kwargs):
+                raise backend_main.compute_pool.ComputePoolSaturated("full")
+
+        monkeypatch.setattr(backend_main.compute_pool, "get_pool", lambda: SaturatedPool())
+        payload = client.post("/api/btr/batch", json={"items": [self.item(), self.item(center="15:00")]}).json()
+        assert [item["status_code"] for item in payload["items"]] == [503, 503]
+
+    def test_batch_size_is_validated(self, client):
+        assert client.post("/api/btr/batch", json={"items": []}).status_code == 422
+
+
+class TestUncertainDateSearch:
+    """Tests for dob_uncertainty_days."""
+
+    def test_candidates_from_neighbouring_days_are_ranked(self, client, monkeypatch):
+        async def fake_geocode(place: str, request_id=None):
+            return {"lat": 28.61, "lon": 77.20, "formatted": "Delhi", "tz_offset_hours": 5.5}
+
+        def fake_search(**kwargs):
+            score = 95.0 if kwargs["dob"] == datetime.date(2024, 1, 14) else 80.0
+            return [dict(TestBTRStreamEndpoint.CANDIDATE, time_local=f"{kwargs['dob'].isoformat()}T12:00:00",
+                         composite_score=score, bphs_score=score)], []
+
+        monkeypatch.setattr(backend_main, "opencage_geocode", fake_geocode)
+        monkeypatch.setattr(
+            btr_core,
+            "compute_sunrise_sunset",
+            lambda date, *args, **kwargs: (
+                datetime.datetime.combine(date, datetime.time(7, 0)),
+                datetime.datetime.combine(date, datetime.time(17, 30))
+            )
+        )
+        monkeypatch.setattr(btr_core, "search_candidate_times", fake_search)
+        request = dict(TestBTRStreamEndpoint.REQUEST, dob_uncertainty_days=1)
+        payload = client.post("/api/btr", json=request).json()
+        assert payload["search_config"]["dates_searched"] == ["2024-01-14", "2024-01-15", "2024-01-16"]
+        assert [c["time_local"][:10] for c in payload["candidates"]] == ["2024-01-14", "2024-01-15", "2024-01-16"]
+        assert payload["best_candidate"]["time_local"] == "2024-01-14T12:00:00"
+
+    def test_uncertainty_is_bounded(self, client):
+        request = dict(TestBTRStreamEndpoint.REQUEST, dob_uncertainty_days=backend_main.config.DOB_UNCERTAINTY_MAX_DAYS + 1)
+        assert client.post("/api/btr", json=request).status_code == 422
+
+
+class TestComputeModes:
+    """/api/btr answers the same whether searches run on threads or in worker processes."""
+
+    REQUEST = {
+        "dob": "15-06-1990",
+        "pob_text": "Delhi",
+        "tz_offset_hours": 5.5,
+        "approx_tob": {"mode": "approx", "center": "09:00", "window_hours": 3.0}
+    }
+
+    def test_process_mode_matches_thread_mode(self, client, monkeypatch):
+        async def fake_geocode(place: str, request_id=None):
+            return {"lat": 28.61, "lon": 77.20, "formatted": "Delhi", "tz_offset_hours": 5.5}
+
+        monkeypatch.setattr(backend_main, "opencage_geocode", fake_geocode)
+        # Each mode samples the ephemeris itself (a forked worker would
+        # otherwise inherit the blocks sampled on the API's threads)
+        ephemeris.get_service().clear()
+        threaded = client.post("/api/btr", json=self.REQUEST)
+
+        result_cache.get_cache().clear()
+        day_context.get_cache().clear()
+        ephemeris.get_service().clear()
+        pool = compute_pool.ComputePool(workers=1, max_pending=2)
+        monkeypatch.setattr(compute_pool, "_POOL", pool)
+        try:
+            in_process = client.post("/api/btr", json=self.REQUEST)
+        finally:
+            pool.shutdown()
+        assert threaded.status_code == in_process.status_code == 200
+        assert threaded.json()["candidates"]
+        assert in_process.json()["candidates"] == threaded.json()["candidates"]
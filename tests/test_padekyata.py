@@ -0,0 +1,155 @@
+# Tests for root-finding padekyatā solver
+
+"""Tests that the padekyatā solver finds every exact lagna = Prāṇa-pada instant."""
+
+import datetime
+import math
+
+import numpy as np
+import pytest
+
+from backend import btr_core, padekyata
+
+# One vipala is 0.4 s; Prāṇa-pada moves 2° per palā, so 0.4 s ≈ 0.033°
+VIPALA_DEGREES = 2.0 / 60.0
+
+
+def _delta(t: datetime.datetime, sunrise: datetime.datetime, lat: float, lon: float, tz: float) -> float:
+    jd = btr_core._datetime_to_jd_ut(t, tz)
+    lagna = btr_core.compute_sidereal_lagna(jd, lat, lon)
+    _, _, total_palas = btr_core.calculate_ishta_kala(t, sunrise)
+    sphuta = btr_core.calculate_sphuta_pranapada(total_palas, btr_core.get_planet_positions(jd)['sun'])
+    return btr_core.astro_utils.angular_difference(lagna, sphuta)
+
+
+class TestFindRoots:
+    """Tests for the generic bracketing + Brent solver."""
+
+    def test_finds_every_crossing_and_skips_wraps(self):
+        # Sawtooth-like wrapped angle: crosses zero every 4500 s, wraps in between
+        def delta(t):
+            return padekyata.wrap_degrees(-0.08 * t + 10.0 * np.sin(t / 3000.0))
+
+        roots = padekyata.find_roots(delta, 0.0, 86400.0)
+        t = np.arange(0.0, 86400.0, 1.0)
+        values = delta(t)
+        expected = np.sum((np.sign(values[:-1]) != np.sign(values[1:])) & (np.abs(values[:-1]) < 90.0))
+        assert len(roots) == expected
+        for root in roots:
+            assert abs(float(delta(np.array([root]))[0])) < 1e-3
+
+    def test_discontinuity_is_not_a_root(self):
+        # Step from -5° to +5° at t = 100 s: a sign change without a crossing
+        def delta(t):
+            return np.where(t < 100.0, -5.0, 5.0)
+
+        assert padekyata.find_roots(delta, 0.0, 300.0) == []
+
+    def test_brent_matches_closed_form(self):
+        root = padekyata.brent_root(math.cos, 0.0, 3.0, 1.0, math.cos(3.0), xtol=1e-9)
+        assert root == pytest.approx(math.pi / 2.0, abs=1e-9)
+
+
+class TestFindPadekyataInstants:
+    """Tests for btr_core.find_padekyata_instants on real ephemeris data."""
+
+    def test_instants_are_exact_and_match_dense_scan(self):
+        dob = datetime.date(2024, 1, 1)
+        lat, lon, tz = 28.6139, 77.2090, 5.5
+        sunrise, _ = btr_core.compute_sunrise_sunset(dob, lat, lon, tz)
+        start = datetime.datetime(2024, 1, 1, 0, 0)
+        end = start + datetime.timedelta(hours=12)
+
+        instants = btr_core.find_padekyata_instants(start, end, sunrise, tz, lat, lon)
+
+        assert instants == sorted(instants)
+        assert all(start <= t <= end for t in instants)
+        for t in instants:
+            assert _delta(t, sunrise, lat, lon, tz) < VIPALA_DEGREES / 10.0
+
+        # Dense palā scan: every local minimum of |Δ| below one palā of travel
+        # must correspond to a solver instant within one palā.
+        times = [start + datetime.timedelta(seconds=6 * k) for k in range(int(12 * 3600 / 6) + 1)]
+        deltas = np.array([_delta(t, sunrise, lat, lon, tz) for t in times])
+        minima = [
+            times[i] for i in range(1, len(times) - 1)
+            if deltas[i] <= deltas[i - 1] and deltas[i] <= deltas[i + 1] and deltas[i] < 1.0
+        ]
+        assert len(minima) == len(instants)
+        for m, t in zip(minima, instants):
+            assert abs((m - t).total_seconds()) <= btr_core.PALA_SECONDS
+
+    def test_palashodhana_returns_exact_instant(self):
+        dob = datetime.date(2024, 1, 1)
+        lat, lon, tz = 28.6139, 77.2090, 5.5
+        sunrise, _ = btr_core.compute_sunrise_sunset(dob, lat, lon, tz)
+        gulika = btr_core.calculate_gulika(dob, lat, lon, tz)
+        base = {'time_local': '2024-01-01T10:00:00', 'lagna_deg': 0.0, 'pranapada_deg': 90.0}
+
+        result = btr_core.palashodhana_search(
+            base, dob, lat, lon, tz, sunrise, gulika, max_palas=120
+        )
+
+        # Crossings recur every ~75 minutes, so ±120 palās always holds one
+        assert result['shodhana_success']
+        assert result['shodhana_mode'] == 'root_finding'
+        assert isinstance(result['shodhana_delta_palas'], int)
+        assert result['shodhana_delta_palas'] <= 120
+        assert result['delta_pp_deg'] < VIPALA_DEGREES
+        exact = datetime.datetime.fromisoformat(result['padekyata_instant_local'])
+        assert exact.strftime('%Y-%m-%dT%H:%M:%S') == result['time_local']
+
+
+class TestSearchShodhana:
+    """Per-step śodhana reports every crossing palā-by-palā stepping found, once per root."""
+
+    KWARGS = dict(dob=datetime.date(1990, 6, 15), latitude=28.6139, longitude=77.2090, tz_offset=5.5,
+                  start_time_str='06:00', end_time_str='12:00', step_minutes=2, strict_bphs=False,
+                  enable_shodhana=True)
+    # The palā-by-palā śodhana search (before padekyatā roots) under these inputs
+    PALA_STEP_TIMES = ['06:00:00', '06:00:24', '07:15:12', '07:16:00', '07:34:00', '07:34:48',
+                       '08:49:36', '08:50:00', '10:04:48', '10:05:12', '11:20:00', '11:20:24']
+
+    @staticmethod
+    def roots(candidates):
+        return [datetime.datetime.fromisoformat(c['padekyata_instant_local'])
+                for c in candidates if 'padekyata_instant_local' in c]
+
+    def assert_covers_stepping(self, candidates, stepping):
+        """Each stepping time is still a candidate or lies on the crossing of a reported root."""
+        pala = datetime.timedelta(seconds=btr_core.PALA_SECONDS)
+        roots = self.roots(candidates)
+        times = {c['time_local'] for c in candidates}
+        for time_local in stepping:
+            t = datetime.datetime.fromisoformat(time_local)
+            assert time_local in times or any(abs(root - t) <= pala for root in roots), time_local
+
+    def test_pala_steps_match_stepping_search(self, monkeypatch):
+        monkeypatch.setattr(btr_core, 'find_padekyata_instants', lambda *args, **kwargs: [])
+        candidates = btr_core.search_candidate_times(**self.KWARGS)
+        assert sorted(c['time_local'][11:] for c in candidates) == self.PALA_STEP_TIMES
+
+    def test_relaxed_search_loses_no_crossings(self):
+        candidates = btr_core.search_candidate_times(**self.KWARGS)
+        self.assert_covers_stepping(candidates, [f"1990-06-15T{t}" for t in self.PALA_STEP_TIMES])
+        # Instants refine the grid time nearest to them to the exact lagna = Prāṇa-pada second
+        exact = [c for c in candidates if 'padekyata_instant_local' in c]
+        assert exact and all(c['delta_pp_deg'] < VIPALA_DEGREES for c in exact)
+
+    def test_crossing_reported_once(self):
+        # A palā step of one grid time and the root of the next lie on one crossing
+        candidates = btr_core.search_candidate_times(**dict(self.KWARGS, latitude=28.61, longitude=77.20))
+        pala = datetime.timedelta(seconds=btr_core.PALA_SECONDS)
+        roots = self.roots(candidates)
+        steps = [datetime.datetime.fromisoformat(c['time_local']) for c in candidates
+                 if c.get('shodhana_delta_palas') is not None and 'padekyata_instant_local' not in c]
+        assert roots and steps
+        assert not any(abs(root - t) <= pala for root in roots for t in steps)
+        assert all(c['shodhana_delta_palas'] >= 0 for c in candidates if 'shodhana_delta_palas' in c)
+
+    @pytest.mark.parametrize('strict_bphs', [False, True])
+    def test_covers_every_stepping_crossing(self, monkeypatch, strict_bphs):
+        kwargs = dict(self.KWARGS, start_time_str='00:00', end_time_str='23:59', strict_bphs=strict_bphs)
+        with_roots = btr_core.search_candidate_times(**kwargs)
+        monkeypatch.setattr(btr_core, 'find_padekyata_instants', lambda *args, **kwargs: [])
+        self.assert_covers_stepping(with_roots, [c['time_local'] for c in btr_core.search_candidate_times(**kwargs)])
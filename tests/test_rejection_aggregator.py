@@ -0,0 +1,172 @@
+# Tests for rejection aggregator module
+
+"""Tests for the bounded rejection aggregate that replaces per-step rejection lists."""
+
+import datetime
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import btr_core, config
+from backend import main as backend_main
+from backend.rejection_aggregator import RejectionAggregator
+
+REASONS = ("Fails BPHS 4.6 padekyata", "Fails BPHS 4.10 trine rule", None)
+SEARCH_KWARGS = dict(
+    dob=datetime.date(2024, 1, 15), latitude=28.6139, longitude=77.2090, tz_offset=5.5,
+    start_time_str='00:00', end_time_str='23:59', step_minutes=2, strict_bphs=True
+)
+
+
+def make_rejections(count):
+    """Synthetic rejection dicts with repeating deltas (so ties occur)."""
+    start = datetime.datetime(2024, 1, 15)
+    return [{
+        'time_local': (start + datetime.timedelta(minutes=2 * i)).strftime('%Y-%m-%dT%H:%M:%S'),
+        'delta_pp_deg': None if i % 11 == 0 else round((i * 7.3) % 40, 2),
+        'delta_moon_deg': round((i * 3.1) % 180, 2),
+        'delta_gulika_deg': None,
+        'non_human_classification': 'pakshi' if i % 5 == 0 else None,
+        'rejection_reason': REASONS[i % 3]
+    } for i in range(count)]
+
+
+class TestRejectionAggregator:
+    """Counts, nearest misses and serialisation."""
+
+    def test_counts_and_minimums(self):
+        records = make_rejections(300)
+        aggregator = RejectionAggregator(nearest=10)
+        aggregator.extend(records)
+        summary = aggregator.summary()
+        assert summary['total'] == len(aggregator) == 300
+        assert summary['reason_counts'] == {
+            "Fails BPHS 4.6 padekyata": 100, "Fails BPHS 4.10 trine rule": 100, "Unknown rejection": 100
+        }
+        assert summary['classification_counts'] == {'pakshi': 60, 'none': 240}
+        assert summary['min_deltas']['padekyata'] == min(r['delta_pp_deg'] for r in records if r['delta_pp_deg'] is not None)
+        assert summary['min_deltas']['gulika'] is None
+        assert sum(summary['histograms']['moon']) == 300
+        assert sum(summary['histograms']['padekyata']) == sum(r['delta_pp_deg'] is not None for r in records)
+
+    def test_nearest_misses_are_bounded_and_ordered(self):
+        records = make_rejections(500)
+        aggregator = RejectionAggregator(nearest=7)
+        aggregator.extend(records)
+        expected = sorted(
+            (r for r in records if r['delta_pp_deg'] is not None),
+            key=lambda r: (r['delta_pp_deg'], r['time_local'])
+        )[:7]
+        assert aggregator.nearest_misses() == expected
+        assert len(aggregator._nearest) <= 7
+
+    def test_merged_slices_match_one_pass(self):
+        records = make_rejections(400)
+        whole = RejectionAggregator(nearest=5, keep_all=True)
+        whole.extend(records)
+        merged = whole.spawn()
+        for lo in range(0, 400, 130):
+            part = merged.spawn()
+            part.extend(records[lo:lo + 130])
+            merged.merge(part)
+        assert merged.to_dict() == whole.to_dict()
+
+    def test_json_round_trip(self):
+        aggregator = RejectionAggregator(nearest=4)
+        aggregator.extend(make_rejections(50))
+        payload = json.loads(json.dumps(aggregator.to_dict()))
+        assert 'records' not in payload
+        restored = RejectionAggregator.from_dict(payload)
+        assert restored.to_dict() == aggregator.to_dict()
+        assert restored.top_reasons(1) == aggregator.top_reasons(1)
+
+    def test_full_dump_is_opt_in_and_paged(self):
+        records = make_rejections(30)
+        with pytest.raises(ValueError):
+            RejectionAggregator().page()
+        aggregator = RejectionAggregator(keep_all=True)
+        aggregator.extend(records)
+        assert aggregator.page(10, 8) == records[10:18]
+        assert aggregator.page(25, 100) == records[25:]
+
+
+class TestSearchAggregation:
+    """Searches fill the aggregator with exactly the rejections they used to list."""
+
+    def test_matches_rejection_list(self):
+        candidates, listed = btr_core.search_candidate_times(collect_rejections=True, **SEARCH_KWARGS)
+        aggregator = RejectionAggregator(nearest=10, keep_all=True)
+        found, returned = btr_core.search_candidate_times(rejection_aggregator=aggregator, **SEARCH_KWARGS)
+        assert returned is aggregator and found == candidates
+        assert aggregator.page(0, len(listed) + 1) == listed
+
+        expected = RejectionAggregator(nearest=10)
+        expected.extend(listed)
+        assert aggregator.summary() == expected.summary()
+        assert aggregator.nearest_misses() == expected.nearest_misses()
+
+    def test_sharded_aggregate_matches_serial(self):
+        serial = RejectionAggregator(keep_all=True)
+        sharded = RejectionAggregator(keep_all=True)
+        btr_core.search_candidate_times(rejection_aggregator=serial, shard_workers=0, **SEARCH_KWARGS)
+        btr_core.search_candidate_times(rejection_aggregator=sharded, shard_workers=3, **SEARCH_KWARGS)
+        assert sharded.to_dict() == serial.to_dict()
+
+
+class TestAPIRejections:
+    """/api/btr ships nearest misses by default and pages the full dump on request."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        async def fake_geocode(place: str, request_id=None):
+            return {"lat": 28.61, "lon": 77.20, "formatted": "Delhi", "tz_offset_hours": 5.5}
+
+        def fake_search(**kwargs):
+            return [{
+                "time_local": "2024-01-15T12:00:00",
+                "lagna_deg": 10.0,
+                "pranapada_deg": 10.0,
+                "delta_pp_deg": 0.0,
+                "passes_trine_rule": True,
+                "bphs_score": 100.0,
+                "composite_score": 90.0,
+                "verification_scores": {"degree_match": 100.0}
+            }], [dict(r, lagna_deg=1.0, pranapada_deg=2.0, passes_trine_rule=False, passes_purification=False)
+                 for r in make_rejections(400)]
+
+        monkeypatch.setattr(backend_main, "opencage_geocode", fake_geocode)
+        monkeypatch.setattr(
+            btr_core,
+            "compute_sunrise_sunset",
+            lambda *args, **kwargs: (datetime.datetime(2024, 1, 15, 7, 0), datetime.datetime(2024, 1, 15, 17, 30))
+        )
+        monkeypatch.setattr(btr_core, "search_candidate_times", fake_search)
+        return TestClient(backend_main.app)
+
+    @staticmethod
+    def request(**extra):
+        return {
+            "dob": "15-01-2024",
+            "pob_text": "Delhi",
+            "tz_offset_hours": 5.5,
+            "approx_tob": {"mode": "approx", "center": "12:00", "window_hours": 2.0},
+            **extra
+        }
+
+    def test_nearest_misses_by_default(self, client):
+        payload = client.post("/api/btr", json=self.request()).json()
+        stats = payload["rejection_stats"]
+        assert stats["total"] == 400 and stats["mode"] == "nearest"
+        assert len(payload["rejections"]) == stats["returned"] == config.REJECTION_NEAREST_MISSES
+        deltas = [r["delta_pp_deg"] for r in payload["rejections"]]
+        assert deltas == sorted(deltas)
+
+    def test_full_dump_pages(self, client):
+        payload = client.post("/api/btr", json=self.request(
+            include_all_rejections=True, rejections_offset=390, rejections_limit=50
+        )).json()
+        assert payload["rejection_stats"]["mode"] == "all"
+        assert [r["time_local"] for r in payload["rejections"]] == [
+            r["time_local"] for r in make_rejections(400)[390:]
+        ]
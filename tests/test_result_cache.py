@@ -0,0 +1,85 @@
+# Tests for result cache module
+
+"""Tests for the content-addressed BTR search result cache."""
+
+import datetime
+
+from backend import result_cache
+from backend.result_cache import ResultCache
+
+
+def _value(n: int) -> dict:
+    return {'candidates': [{'time_local': f'2024-01-15T10:{n:02d}:00', 'lagna_deg': float(n)}], 'rejections': []}
+
+
+class TestMakeKey:
+    """Tests for canonical key construction."""
+
+    def test_key_ignores_dict_order_and_tracks_engine_version(self):
+        inputs = {'dob': datetime.date(2024, 1, 15), 'latitude': 28.61, 'traits': {'a': 1, 'b': 2}}
+        reordered = {'traits': {'b': 2, 'a': 1}, 'latitude': 28.61, 'dob': datetime.date(2024, 1, 15)}
+        assert result_cache.make_key('v1', inputs) == result_cache.make_key('v1', reordered)
+        assert result_cache.make_key('v1', inputs) != result_cache.make_key('v2', inputs)
+        assert result_cache.make_key('v1', inputs) != result_cache.make_key('v1', {**inputs, 'latitude': 28.62})
+
+
+class TestResultCache:
+    """Tests for the memory and SQLite tiers."""
+
+    def test_hit_returns_copy_and_counts(self):
+        cache = ResultCache(max_bytes=1 << 20, ttl_seconds=60, db_path=None)
+        assert cache.get('k') is None
+        cache.put('k', _value(1))
+        first = cache.get('k')
+        first['candidates'].clear()
+        assert cache.get('k') == _value(1)
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses'], stats['entries']) == (2, 1, 1)
+
+    def test_lru_eviction_respects_byte_budget(self):
+        size = len(result_cache.json.dumps(_value(1), separators=(',', ':')))
+        cache = ResultCache(max_bytes=2 * size, ttl_seconds=60, db_path=None)
+        cache.put('a', _value(1))
+        cache.put('b', _value(2))
+        cache.get('a')  # 'b' becomes least recently used
+        cache.put('c', _value(3))
+        assert cache.get('b') is None
+        assert cache.get('a') == _value(1)
+        assert cache.get('c') == _value(3)
+        assert cache.stats()['bytes'] <= 2 * size
+        assert cache.evictions == 1
+
+    def test_ttl_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(result_cache.time, 'time', lambda: now[0])
+        cache = ResultCache(max_bytes=1 << 20, ttl_seconds=10, db_path=None)
+        cache.put('k', _value(1))
+        now[0] += 9.0
+        assert cache.get('k') == _value(1)
+        now[0] += 2.0
+        assert cache.get('k') is None
+
+    def test_zero_ttl_disables_cache(self):
+        cache = ResultCache(max_bytes=1 << 20, ttl_seconds=0, db_path=None)
+        cache.put('k', _value(1))
+        assert cache.get('k') is None
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        db_path = str(tmp_path / 'results.sqlite')
+        ResultCache(max_bytes=1 << 20, ttl_seconds=60, db_path=db_path).put('k', _value(4))
+
+        restarted = ResultCache(max_bytes=1 << 20, ttl_seconds=60, db_path=db_path)
+        assert restarted.get('k') == _value(4)
+        assert restarted.disk_hits == 1
+        # Promoted to memory: the second read does not touch disk
+        assert restarted.get('k') == _value(4)
+        assert restarted.disk_hits == 1
+
+    def test_disk_tier_byte_budget(self, tmp_path):
+        size = len(result_cache.json.dumps(_value(1), separators=(',', ':')))
+        cache = ResultCache(max_bytes=0, ttl_seconds=60, db_path=str(tmp_path / 'r.sqlite'),
+                            disk_max_bytes=2 * size)
+        for n in range(4):
+            cache.put(f'k{n}', _value(n))
+        assert cache.get('k0') is None
+        assert cache.get('k3') == _value(3)
@@ -1,6 +1,8 @@
 
 import pytest
-from backend import btr_core
+import numpy as np
+
+from backend import btr_core, vargas
 
 class TestShodasaVargas:
     """Tests for full 16-Varga (Shodasa Vargas) implementation."""
@@ -115,3 +117,41 @@ class TestShodasaVargas:
         # 60 degrees (1st Shodasamsa of Gemini) -> Sagittarius
         res = btr_core.calculate_divisional_chart(0.0, {'p': 60.5}, 16)
         assert int(res['p'] / 30.0) == 8 # Sagittarius
+
+
+class TestVargaTables:
+    """The table-driven engine: demand-driven charts and the array path."""
+
+    PLANETS = {'sun': 120.3, 'moon': 181.2, 'mars': 60.1, 'mercury': 90.7, 'jupiter': 240.2,
+               'venus': 300.9, 'saturn': 30.4, 'rahu': 150.5, 'ketu': 330.5}
+
+    def test_only_requested_divisions_are_built(self):
+        charts = vargas.calculate_vargas(45.0, self.PLANETS, vargas.SAPTAVARGA_DIVISIONS)
+        assert list(charts) == list(vargas.SAPTAVARGA_DIVISIONS)
+        shodasa = vargas.calculate_shodasa_vargas(45.0, self.PLANETS)
+        for division, chart in charts.items():
+            assert chart == shodasa[f'D-{division}']
+
+    def test_array_path_matches_single_charts(self):
+        rng = np.random.default_rng(7)
+        longitudes = rng.uniform(0.0, 360.0, size=(50, 10))
+        # Segment and range boundaries exactly
+        longitudes[0] = [0.0, 5.0, 12.0, 15.0, 20.0, 25.0, 30.0, 100.0 / 3.0, 359.999999, 210.0]
+        divisions = vargas.SHODASA_DIVISIONS + (5, 8, 11)
+        arrays = vargas.varga_longitudes(longitudes, divisions)
+        assert arrays.shape == (len(divisions), 50, 10)
+        for index, row in enumerate(longitudes.tolist()):
+            planets = {f'p{k}': value for k, value in enumerate(row[:-1])}
+            charts = vargas.calculate_vargas(row[-1], planets, divisions)
+            for d_index, division in enumerate(divisions):
+                assert list(charts[division].values()) == arrays[d_index, index].tolist()
+
+    def test_trimsamsa_ranges(self):
+        # Odd sign (Aries): 10-18° is Jupiter's Sagittarius; even sign (Taurus): 5-12° is Mercury's Virgo
+        assert vargas.varga_longitudes(np.array([17.9, 30.0 + 11.9]), (30,)).tolist() == [[255.0, 165.0]]
+
+    def test_division_out_of_range(self):
+        with pytest.raises(ValueError):
+            vargas.calculate_vargas(0.0, {}, (61,))
+        with pytest.raises(ValueError):
+            vargas.varga_longitudes(np.zeros(3), (0,))
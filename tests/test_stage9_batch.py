@@ -0,0 +1,191 @@
+# Tests for stage9 batch module
+
+"""Tests that batched Stage-9 validation equals the per-chart Shadbala and Āyurdāya."""
+
+import datetime
+
+import numpy as np
+import pytest
+
+from backend import btr_core, shadbala, stage9_batch, varga_index
+from backend.chart_context import ChartContext
+from backend.vargas import SAPTAVARGA_DIVISIONS
+
+LATITUDE, LONGITUDE, TZ_OFFSET = 28.6139, 77.2090, 5.5
+BASE_DT = datetime.datetime(2024, 1, 15)
+
+
+def random_contexts(count, seed):
+    """Charts over three days with births by day, before sunrise and after sunset."""
+    rng = np.random.default_rng(seed)
+    contexts = []
+    for _ in range(count):
+        birth_dt = BASE_DT + datetime.timedelta(seconds=int(rng.integers(0, 3 * 86400)))
+        jd_ut = btr_core._datetime_to_jd_ut(birth_dt, TZ_OFFSET)
+        sunrise = datetime.datetime.combine(birth_dt.date(), datetime.time(5)) + \
+            datetime.timedelta(seconds=int(rng.integers(0, 7200)))
+        sunset = sunrise + datetime.timedelta(seconds=int(rng.integers(9 * 3600, 15 * 3600)))
+        contexts.append(ChartContext(jd_ut, float(rng.random() * 360.0), btr_core.get_planet_positions(jd_ut),
+                                     birth_dt, sunrise=sunrise, sunset=sunset))
+    return contexts
+
+
+def boundary_contexts():
+    """Planets on sign, aspect and Moolatrikona edges."""
+    birth_dt = BASE_DT.replace(hour=12)
+    jd_ut = btr_core._datetime_to_jd_ut(birth_dt, TZ_OFFSET)
+    layouts = [
+        {'sun': 0.0, 'moon': 30.0, 'mars': 60.0, 'mercury': 90.0, 'jupiter': 120.0,
+         'venus': 150.0, 'saturn': 180.0, 'rahu': 300.0, 'ketu': 120.0},
+        {'sun': 125.0, 'moon': 40.0, 'mars': 5.0, 'mercury': 167.0, 'jupiter': 245.0,
+         'venus': 190.0, 'saturn': 305.0, 'rahu': 10.0, 'ketu': 190.0},
+        {'sun': 359.9999999999999, 'moon': 210.0, 'mars': 100.0, 'mercury': 10.0, 'jupiter': 130.0,
+         'venus': 20.0, 'saturn': 70.0, 'rahu': 29.999999999999996, 'ketu': 209.99999999999997},
+    ]
+    return [ChartContext(jd_ut, lagna, planets, birth_dt,
+                         sunrise=BASE_DT.replace(hour=7, minute=14), sunset=BASE_DT.replace(hour=17, minute=41))
+            for planets in layouts for lagna in (0.0, 90.0, 300.0, 125.0)]
+
+
+def scalar_stage9(context):
+    strengths = btr_core.calculate_planetary_strengths(
+        context.jd_ut, context.lagna_deg, context.planets_deg, context.birth_dt,
+        LATITUDE, LONGITUDE, TZ_OFFSET, context=context
+    )
+    longevity = btr_core.calculate_longevity_span(
+        context.jd_ut, context.lagna_deg, context.planets_deg, shadbala_strengths=strengths, context=context
+    )
+    return strengths, longevity
+
+
+class TestEvaluateCharts:
+    """Batched results are identical to the scalar ones."""
+
+    def test_random_charts_match_scalar(self):
+        contexts = random_contexts(300, seed=3)
+        assert stage9_batch.evaluate_contexts(contexts) == [scalar_stage9(c) for c in contexts]
+
+    def test_boundary_charts_match_scalar(self):
+        contexts = boundary_contexts()
+        assert stage9_batch.evaluate_contexts(contexts) == [scalar_stage9(c) for c in contexts]
+
+    def test_varga_index_signs_match_scalar(self, tmp_path, monkeypatch):
+        index = varga_index.load_index(str(tmp_path / 'index.npy'), SAPTAVARGA_DIVISIONS)
+        monkeypatch.setattr(varga_index, 'get_index', lambda: index)
+        contexts = random_contexts(50, seed=4) + boundary_contexts()
+        assert stage9_batch.evaluate_contexts(contexts) == [scalar_stage9(c) for c in contexts]
+
+    def test_no_charts(self):
+        assert stage9_batch.evaluate_contexts([]) == []
+
+    def test_bodies_must_match(self):
+        first, second = random_contexts(2, seed=5)
+        second.planets_deg = dict(reversed(second.planets_deg.items()))
+        with pytest.raises(ValueError):
+            stage9_batch.evaluate_contexts([first, second])
+
+    def test_sunrise_resolved_from_day_context(self):
+        context = random_contexts(1, seed=6)[0]
+        context.sunrise = context.sunset = None
+        expected = ChartContext(context.jd_ut, context.lagna_deg, context.planets_deg, context.birth_dt)
+        assert btr_core.calculate_stage9_batch([context], LATITUDE, LONGITUDE, TZ_OFFSET) == \
+            [scalar_stage9(expected)]
+
+
+class TestSearchIntegration:
+    """Grid scans validate each block's accepted times in one batch."""
+
+    # Every accepted candidate validated, as without deferral
+    KWARGS = dict(dob=datetime.date(2024, 1, 15), latitude=LATITUDE, longitude=LONGITUDE,
+                  tz_offset=TZ_OFFSET, start_time_str='00:00', end_time_str='23:59',
+                  step_minutes=2, strict_bphs=False, enable_shodhana=False, stage9_top_k=0)
+
+    def test_grid_path_skips_per_chart_stage9(self, monkeypatch):
+        def per_chart(*args, **kwargs):
+            raise AssertionError("per-chart Shadbala on the grid path")
+
+        monkeypatch.setattr(shadbala, 'calculate_shadbala', per_chart)
+        candidates = btr_core.search_candidate_times(**self.KWARGS)
+        assert candidates and all('shadbala_summary' in c for c in candidates)
+
+    def test_search_matches_per_chart_stage9(self, monkeypatch):
+        batched = btr_core.search_candidate_times(**self.KWARGS)
+        monkeypatch.setattr(stage9_batch, 'evaluate_contexts',
+                            lambda contexts: [scalar_stage9(context) for context in contexts])
+        assert btr_core.search_candidate_times(**self.KWARGS) == batched
+
+
+class TestDeferredValidation:
+    """Under BPHS-only ordering Stage 9 runs for the top-ranked candidates only."""
+
+    KWARGS = dict(dob=datetime.date(2024, 1, 15), latitude=LATITUDE, longitude=LONGITUDE,
+                  tz_offset=TZ_OFFSET, start_time_str='00:00', end_time_str='23:59',
+                  step_minutes=0.4, strict_bphs=False, orb_tolerance=6.0)
+    # Śodhana instants rank among the grid times here
+    SHODHANA = dict(step_minutes=2, orb_tolerance=2.0, enable_shodhana=True)
+
+    @pytest.mark.parametrize('overrides', [{}, SHODHANA])
+    def test_top_k_match_eager_search(self, overrides):
+        kwargs = dict(self.KWARGS, **overrides,
+                      optional_events={'marriage': '2015-06-01', 'career': '2010-01-01'})
+        eager = btr_core.search_candidate_times(**kwargs, stage9_top_k=0)
+        deferred = btr_core.search_candidate_times(**kwargs, stage9_top_k=5)
+        assert len(eager) > 5 and all('shadbala_summary' in c for c in eager)
+        assert deferred[:5] == eager[:5]
+        assert [c['time_local'] for c in deferred] == [c['time_local'] for c in eager]
+        assert not any('shadbala_summary' in c or 'ayurdaya_summary' in c for c in deferred[5:])
+
+    @pytest.mark.parametrize('overrides', [{}, SHODHANA])
+    def test_composite_consistent_across_top_k(self, overrides):
+        kwargs = dict(self.KWARGS, **overrides,
+                      optional_events={'marriage': '2015-06-01', 'career': '2010-01-01'})
+        eager = btr_core.search_candidate_times(**kwargs, stage9_top_k=0)
+        deferred = btr_core.search_candidate_times(**kwargs, stage9_top_k=5)
+        assert len(deferred) > 5
+        # Every published composite is the eager one; unvalidated candidates publish none
+        for eager_candidate, deferred_candidate in zip(eager, deferred):
+            if deferred_candidate.get('stage9_validated', True):
+                assert deferred_candidate['composite_score'] == eager_candidate['composite_score']
+                assert deferred_candidate['heuristic_score'] == eager_candidate['heuristic_score']
+            else:
+                assert deferred_candidate['composite_score'] is None
+                assert deferred_candidate['heuristic_score'] is None
+                assert 'life_events_scores' not in deferred_candidate
+        assert [c.get('stage9_validated', True) for c in deferred] == [True] * 5 + [False] * (len(deferred) - 5)
+
+    def test_only_top_k_charts_validated(self, monkeypatch):
+        validated = []
+        real_evaluate = stage9_batch.evaluate_contexts
+
+        def counting_evaluate(contexts):
+            validated.extend(contexts)
+            return real_evaluate(contexts)
+
+        monkeypatch.setattr(stage9_batch, 'evaluate_contexts', counting_evaluate)
+        monkeypatch.setattr(btr_core.config, 'STAGE9_TOP_K', 3)
+        candidates = btr_core.search_candidate_times(**self.KWARGS, enable_shodhana=True)
+        assert len(candidates) > 3 and len(validated) == 3
+        assert [c['time_local'] for c in candidates if 'shadbala_summary' in c] == \
+            [c['time_local'] for c in candidates[:3]]
+
+    def test_composite_ordering_validates_everything(self):
+        kwargs = dict(self.KWARGS, bphs_only_ordering=False)
+        assert btr_core.search_candidate_times(**kwargs, stage9_top_k=2) == \
+            btr_core.search_candidate_times(**kwargs, stage9_top_k=0)
+
+    def test_sharded_matches_serial(self):
+        kwargs = dict(self.KWARGS, **self.SHODHANA, stage9_top_k=4)
+        assert btr_core.search_candidate_times(**kwargs, shard_workers=3) == \
+            btr_core.search_candidate_times(**kwargs, shard_workers=0)
+
+    def test_on_demand_validation_matches_eager_candidates(self):
+        eager = btr_core.search_candidate_times(**dict(self.KWARGS, **self.SHODHANA), stage9_top_k=0)
+        for candidate in eager:
+            candidate_local = datetime.datetime.fromisoformat(
+                candidate.get('padekyata_instant_local') or candidate['time_local']
+            )
+            validation = btr_core.validate_candidate(
+                self.KWARGS['dob'], LATITUDE, LONGITUDE, TZ_OFFSET, candidate_local
+            )
+            assert validation['shadbala_summary'] == candidate['shadbala_summary']
+            assert validation['ayurdaya_summary'] == candidate['ayurdaya_summary']
@@ -0,0 +1,105 @@
+# Tests for varga index module
+
+"""Tests that the arc-second varga sign index agrees exactly with the varga engine."""
+
+import numpy as np
+import pytest
+
+from backend import btr_core, chart_context, varga_index, vargas
+from backend.chart_context import ChartContext
+from backend.varga_index import AMBIGUOUS, ARC_SECONDS
+
+from .test_chart_context import BIRTH_DT, stage9
+
+# Saptavarga Bala's divisions, D-10 for career verification and D-60
+DIVISIONS = (1, 2, 3, 7, 9, 10, 12, 30, 60)
+
+
+@pytest.fixture(scope='module')
+def index_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('varga_index') / 'index.npy')
+    varga_index.load_index(path, DIVISIONS)
+    return path
+
+
+@pytest.fixture
+def index(index_path):
+    return varga_index.load_index(index_path, DIVISIONS)
+
+
+def boundary_longitudes():
+    """Segment edges of every division, and their immediate neighbours."""
+    edges = [np.arange(0.0, 360.0, 30.0 / division) for division in DIVISIONS]
+    edges.append((np.array([5.0, 10.0, 12.0, 15.0, 18.0, 20.0, 25.0]) + 30.0 * np.arange(12)[:, None]).ravel())
+    edges = np.concatenate(edges)
+    return np.concatenate([edges, np.nextafter(edges, -1.0), np.nextafter(edges, 400.0),
+                           edges - 1e-9, edges + 1e-9, [359.9999999999999, 360.0, 725.5]])
+
+
+class TestVargaIndex:
+    """Lookups, ambiguity fallback and persistence."""
+
+    def test_table_layout(self, index):
+        assert index.table.shape == (len(DIVISIONS), ARC_SECONDS) and index.table.dtype == np.uint8
+        assert isinstance(index.table, np.memmap) and not index.table.flags.writeable
+        # Rashi boundaries fall on arc-second edges: the two arc-seconds around each are ambiguous
+        assert (index.table[0] == AMBIGUOUS).sum() == 2 * 12
+
+    def test_random_longitudes_match_engine(self, index):
+        longitudes = np.random.default_rng(7).random((500, 10)) * 360.0
+        assert np.array_equal(index.signs(longitudes, DIVISIONS), varga_index.exact_signs(longitudes, DIVISIONS))
+
+    def test_boundaries_match_engine(self, index):
+        longitudes = boundary_longitudes()
+        assert np.array_equal(index.signs(longitudes, DIVISIONS), varga_index.exact_signs(longitudes, DIVISIONS))
+
+    def test_chart_signs_match_divisional_charts(self, index):
+        planets = {'sun': 120.0, 'moon': 15.0, 'mars': 0.0, 'saturn': 29.999999999999996, 'ketu': 359.5}
+        expected = {division: {name: int(deg / 30.0) % 12 for name, deg in chart.items()}
+                    for division, chart in vargas.calculate_vargas(45.0, planets, (9, 30)).items()}
+        assert index.chart_signs(45.0, planets, (9, 30)) == expected
+
+    def test_division_not_indexed(self, index):
+        assert index.covers((1, 9)) and not index.covers((9, 16))
+        with pytest.raises(ValueError):
+            index.signs(np.array([10.0]), (16,))
+
+    def test_saved_index_is_reused(self, index_path, monkeypatch):
+        def no_build(*args):
+            raise AssertionError("index rebuilt")
+
+        monkeypatch.setattr(varga_index, 'build_table', no_build)
+        varga_index.load_index(index_path, DIVISIONS)
+
+    def test_stale_index_is_rebuilt(self, tmp_path):
+        path = str(tmp_path / 'stale.npy')
+        np.save(path, np.zeros((2, ARC_SECONDS), dtype=np.uint8))
+        index = varga_index.load_index(path, (9, 60))
+        assert (index.table[0] != 0).any() and list(tmp_path.iterdir()) == [tmp_path / 'stale.npy']
+
+    def test_disabled_without_path(self, monkeypatch):
+        monkeypatch.setattr(varga_index.config, 'VARGA_INDEX_PATH', None)
+        assert varga_index.get_index() is None
+
+
+class TestChartContextSigns:
+    """Stage 9 reads signs from the index without changing its results."""
+
+    def test_stage9_outputs_unchanged(self, index, monkeypatch):
+        jd_ut = btr_core._datetime_to_jd_ut(BIRTH_DT, 5.5)
+        lagna = btr_core.compute_sidereal_lagna(jd_ut, 28.6139, 77.2090)
+        planets = btr_core.get_planet_positions(jd_ut)
+        expected = stage9(jd_ut, lagna, planets, ChartContext(jd_ut, lagna, planets, BIRTH_DT))
+
+        built = []
+        real_vargas = chart_context.calculate_vargas
+
+        def counting_vargas(lagna_deg, planets_deg, divisions):
+            built.extend(divisions)
+            return real_vargas(lagna_deg, planets_deg, divisions)
+
+        monkeypatch.setattr(varga_index, 'get_index', lambda: index)
+        monkeypatch.setattr(chart_context, 'calculate_vargas', counting_vargas)
+        assert stage9(jd_ut, lagna, planets, ChartContext(jd_ut, lagna, planets, BIRTH_DT)) == expected
+        # Only the Rashi's degrees (Moolatrikona) still come from a divisional chart
+        assert built == [1]